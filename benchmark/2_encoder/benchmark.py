@@ -0,0 +1,324 @@
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+
+import sergeant
+
+from . import payloads
+
+
+def get_encoders(
+    serializer_names,
+    compressor_names,
+):
+    encoders = []
+    for serializer_name in serializer_names:
+        for compressor_name in compressor_names:
+            try:
+                encoder = sergeant.encoder.encoder.Encoder(
+                    compressor_name=compressor_name,
+                    serializer_name=serializer_name,
+                )
+            except ImportError as exception:
+                print(
+                    f'skipping {serializer_name}/{compressor_name}: {exception}',
+                    file=sys.stderr,
+                )
+
+                continue
+
+            encoders.append(
+                (
+                    serializer_name,
+                    compressor_name or 'none',
+                    encoder,
+                )
+            )
+
+    return encoders
+
+
+def measure_time(
+    function,
+    repeat,
+):
+    timer = timeit.Timer(
+        stmt=function,
+    )
+    number, _ = timer.autorange()
+    best_time = min(
+        timer.repeat(
+            repeat=repeat,
+            number=number,
+        )
+    )
+
+    return best_time / number * 1e9
+
+
+def measure_peak_allocated_bytes(
+    function,
+):
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_allocated_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak_allocated_bytes
+
+
+def run(
+    payload_names,
+    encoders,
+    repeat,
+):
+    results = []
+    for payload_name in payload_names:
+        task = sergeant.objects.Task(
+            kwargs=payloads.PAYLOADS[payload_name](),
+        )
+
+        for serializer_name, compressor_name, encoder in encoders:
+            encoded_task = encoder.encode(
+                data=task,
+            )
+
+            def encode():
+                return encoder.encode(
+                    data=task,
+                )
+
+            def decode():
+                return encoder.decode(
+                    data=encoded_task,
+                ).kwargs
+
+            if decode() != task.kwargs:
+                raise ValueError(f'{serializer_name}/{compressor_name} did not round trip {payload_name}')
+
+            results.append(
+                {
+                    'payload': payload_name,
+                    'serializer': serializer_name,
+                    'compressor': compressor_name,
+                    'encode_ns_per_op': measure_time(
+                        function=encode,
+                        repeat=repeat,
+                    ),
+                    'decode_ns_per_op': measure_time(
+                        function=decode,
+                        repeat=repeat,
+                    ),
+                    'bytes_per_task': len(encoded_task),
+                    'encode_peak_allocated_bytes': measure_peak_allocated_bytes(
+                        function=encode,
+                    ),
+                    'decode_peak_allocated_bytes': measure_peak_allocated_bytes(
+                        function=decode,
+                    ),
+                }
+            )
+
+    return results
+
+
+def get_result_key(
+    result,
+):
+    return (
+        result['payload'],
+        result['serializer'],
+        result['compressor'],
+    )
+
+
+def print_results(
+    results,
+    baseline_results,
+):
+    baseline_results_by_key = {
+        get_result_key(baseline_result): baseline_result
+        for baseline_result in baseline_results
+    }
+
+    columns = [
+        'payload',
+        'serializer',
+        'compressor',
+        'encode ns/op',
+        'decode ns/op',
+        'bytes/task',
+        'encode peak B',
+        'decode peak B',
+    ]
+    if baseline_results_by_key:
+        columns += [
+            'encode vs base',
+            'decode vs base',
+            'bytes vs base',
+        ]
+
+    rows = []
+    for result in results:
+        row = [
+            result['payload'],
+            result['serializer'],
+            result['compressor'],
+            f'{result["encode_ns_per_op"]:,.0f}',
+            f'{result["decode_ns_per_op"]:,.0f}',
+            f'{result["bytes_per_task"]:,}',
+            f'{result["encode_peak_allocated_bytes"]:,}',
+            f'{result["decode_peak_allocated_bytes"]:,}',
+        ]
+
+        if baseline_results_by_key:
+            baseline_result = baseline_results_by_key.get(get_result_key(result))
+            for field_name in [
+                'encode_ns_per_op',
+                'decode_ns_per_op',
+                'bytes_per_task',
+            ]:
+                if baseline_result is None or not baseline_result[field_name]:
+                    row.append('-')
+                else:
+                    row.append(f'{result[field_name] / baseline_result[field_name]:.2f}x')
+
+        rows.append(row)
+
+    column_widths = [
+        max(
+            len(column),
+            *[
+                len(row[column_index])
+                for row in rows
+            ],
+        )
+        for column_index, column in enumerate(columns)
+    ]
+    print(
+        ' | '.join(
+            column.ljust(column_width)
+            for column, column_width in zip(columns, column_widths)
+        )
+    )
+    print(
+        '-+-'.join(
+            '-' * column_width
+            for column_width in column_widths
+        )
+    )
+    for row in rows:
+        print(
+            ' | '.join(
+                value.ljust(column_width)
+                for value, column_width in zip(row, column_widths)
+            )
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Sergeant Encoder Benchmark',
+    )
+    parser.add_argument(
+        '--payloads',
+        help='Payload shapes to benchmark',
+        nargs='+',
+        choices=list(payloads.PAYLOADS),
+        default=list(payloads.PAYLOADS),
+        dest='payloads',
+    )
+    parser.add_argument(
+        '--serializers',
+        help='Serializers to benchmark',
+        nargs='+',
+        choices=list(sergeant.encoder.encoder.Encoder.serializers),
+        default=list(sergeant.encoder.encoder.Encoder.serializers),
+        dest='serializers',
+    )
+    parser.add_argument(
+        '--compressors',
+        help='Compressors to benchmark, none stands for no compression',
+        nargs='+',
+        choices=[
+            'none',
+            *sergeant.encoder.encoder.Encoder.compressors,
+        ],
+        default=[
+            'none',
+            *sergeant.encoder.encoder.Encoder.compressors,
+        ],
+        dest='compressors',
+    )
+    parser.add_argument(
+        '--repeat',
+        help='Number of timing repetitions, the best one is reported',
+        type=int,
+        default=3,
+        dest='repeat',
+    )
+    parser.add_argument(
+        '--output',
+        help='Path of a JSON file to write the results to',
+        type=str,
+        required=False,
+        dest='output',
+    )
+    parser.add_argument(
+        '--baseline',
+        help='Path of a JSON results file of a previous run to compare against',
+        type=str,
+        required=False,
+        dest='baseline',
+    )
+    args = parser.parse_args()
+
+    encoders = get_encoders(
+        serializer_names=args.serializers,
+        compressor_names=[
+            None if compressor_name == 'none' else compressor_name
+            for compressor_name in args.compressors
+        ],
+    )
+    results = run(
+        payload_names=args.payloads,
+        encoders=encoders,
+        repeat=args.repeat,
+    )
+
+    baseline_results = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline_results = json.load(baseline_file)['results']
+
+    print_results(
+        results=results,
+        baseline_results=baseline_results,
+    )
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(
+                obj={
+                    'metadata': {
+                        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                        'python_implementation': platform.python_implementation(),
+                        'python_version': platform.python_version(),
+                        'platform': platform.platform(),
+                        'machine': platform.machine(),
+                    },
+                    'results': results,
+                },
+                fp=output_file,
+                indent=4,
+            )
+
+
+if __name__ == '__main__':
+    main()
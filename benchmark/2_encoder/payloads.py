@@ -0,0 +1,62 @@
+import datetime
+
+
+def small_dict():
+    return {
+        'url': 'https://example.com/some/page',
+        'depth': 2,
+        'retries': 0,
+        'follow_redirects': True,
+    }
+
+
+def large_list():
+    return {
+        'ids': list(range(10000)),
+        'names': [
+            f'name_{i}'
+            for i in range(1000)
+        ],
+    }
+
+
+def bytes_blob():
+    return {
+        'content': bytes(range(256)) * 256,
+        'content_type': 'application/octet-stream',
+    }
+
+
+def datetimes():
+    return {
+        'dates': [
+            datetime.datetime(2022, 1, 1) + datetime.timedelta(
+                minutes=i,
+            )
+            for i in range(100)
+        ],
+    }
+
+
+def nested_tuples():
+    return {
+        'coordinates': tuple(
+            (
+                i,
+                (
+                    i * 2,
+                    i * 3,
+                ),
+            )
+            for i in range(200)
+        ),
+    }
+
+
+PAYLOADS = {
+    'small_dict': small_dict,
+    'large_list': large_list,
+    'bytes_blob': bytes_blob,
+    'datetimes': datetimes,
+    'nested_tuples': nested_tuples,
+}
@@ -0,0 +1,726 @@
+import argparse
+import datetime
+import json
+import multiprocessing
+import platform
+import sys
+import time
+
+from . import stand_ins
+
+
+QUEUE_NAME = 'sergeant_benchmark'
+LOCK_NAME = 'sergeant_benchmark'
+PAYLOAD_SIZE = 128
+
+
+def get_payload(
+    process_index,
+    item_index,
+):
+    return f'{process_index}.{item_index}.'.encode().ljust(PAYLOAD_SIZE, b'x')
+
+
+def produce(
+    connector_name,
+    connector_params,
+    process_index,
+    number_of_items,
+    batch_size,
+    delayed_ratio,
+    delay,
+    barrier,
+    results_queue,
+):
+    connector = stand_ins.create_connector(
+        connector_name=connector_name,
+        connector_params=connector_params,
+    )
+    number_of_delayed_batches = 0
+    latencies = []
+
+    barrier.wait()
+    start_time = time.time()
+
+    number_of_pushed_items = 0
+    number_of_batches = 0
+    while number_of_pushed_items < number_of_items:
+        items = [
+            get_payload(
+                process_index=process_index,
+                item_index=item_index,
+            )
+            for item_index in range(
+                number_of_pushed_items,
+                min(number_of_pushed_items + batch_size, number_of_items),
+            )
+        ]
+
+        consumable_from = None
+        if number_of_delayed_batches < delayed_ratio * (number_of_batches + 1):
+            consumable_from = time.time() + delay
+            number_of_delayed_batches += 1
+
+        operation_start_time = time.perf_counter()
+        if batch_size == 1:
+            connector.queue_push(
+                queue_name=QUEUE_NAME,
+                item=items[0],
+                consumable_from=consumable_from,
+            )
+        else:
+            connector.queue_push_bulk(
+                queue_name=QUEUE_NAME,
+                items=items,
+                consumable_from=consumable_from,
+            )
+        latencies.append(time.perf_counter() - operation_start_time)
+
+        number_of_pushed_items += len(items)
+        number_of_batches += 1
+
+    results_queue.put(
+        (
+            'produce',
+            start_time,
+            time.time(),
+            latencies,
+        )
+    )
+
+
+def consume(
+    connector_name,
+    connector_params,
+    total_number_of_items,
+    batch_size,
+    consumed_items,
+    barrier,
+    results_queue,
+):
+    connector = stand_ins.create_connector(
+        connector_name=connector_name,
+        connector_params=connector_params,
+    )
+    latencies = []
+
+    barrier.wait()
+    start_time = time.time()
+
+    while consumed_items.value < total_number_of_items:
+        operation_start_time = time.perf_counter()
+        if batch_size == 1:
+            item = connector.queue_pop(
+                queue_name=QUEUE_NAME,
+            )
+            items = [item] if item is not None else []
+        else:
+            items = connector.queue_pop_bulk(
+                queue_name=QUEUE_NAME,
+                number_of_items=batch_size,
+            )
+        operation_time = time.perf_counter() - operation_start_time
+
+        if not items:
+            time.sleep(0.001)
+
+            continue
+
+        latencies.append(operation_time)
+        with consumed_items.get_lock():
+            consumed_items.value += len(items)
+
+    results_queue.put(
+        (
+            'consume',
+            start_time,
+            time.time(),
+            latencies,
+        )
+    )
+
+
+def set_keys(
+    connector_name,
+    connector_params,
+    process_index,
+    number_of_items,
+    batch_size,
+    barrier,
+    results_queue,
+):
+    connector = stand_ins.create_connector(
+        connector_name=connector_name,
+        connector_params=connector_params,
+    )
+    keys = [
+        f'sergeant_benchmark.{process_index}.{item_index}'
+        for item_index in range(number_of_items)
+    ]
+    latencies = []
+
+    barrier.wait()
+    start_time = time.time()
+
+    for chunk_start in range(0, number_of_items, batch_size):
+        keys_chunk = keys[chunk_start:chunk_start + batch_size]
+        value = get_payload(
+            process_index=process_index,
+            item_index=chunk_start,
+        )
+
+        operation_start_time = time.perf_counter()
+        if batch_size == 1:
+            connector.key_set(
+                key=keys_chunk[0],
+                value=value,
+            )
+        else:
+            connector.key_set_bulk(
+                items=dict.fromkeys(keys_chunk, value),
+            )
+        latencies.append(time.perf_counter() - operation_start_time)
+
+    end_time = time.time()
+
+    for chunk_start in range(0, number_of_items, 500):
+        connector.key_delete_bulk(
+            keys=keys[chunk_start:chunk_start + 500],
+        )
+
+    results_queue.put(
+        (
+            'key_set',
+            start_time,
+            end_time,
+            latencies,
+        )
+    )
+
+
+def lock_and_release(
+    connector_name,
+    connector_params,
+    number_of_items,
+    barrier,
+    results_queue,
+):
+    connector = stand_ins.create_connector(
+        connector_name=connector_name,
+        connector_params=connector_params,
+    )
+    latencies = []
+
+    barrier.wait()
+    start_time = time.time()
+
+    for _ in range(number_of_items):
+        lock = connector.lock(
+            name=LOCK_NAME,
+        )
+
+        operation_start_time = time.perf_counter()
+        lock.acquire(
+            timeout=60.0,
+            check_interval=0.001,
+        )
+        lock.release()
+        latencies.append(time.perf_counter() - operation_start_time)
+
+    results_queue.put(
+        (
+            'lock',
+            start_time,
+            time.time(),
+            latencies,
+        )
+    )
+
+
+def get_percentile(
+    sorted_values,
+    percentile,
+):
+    if not sorted_values:
+        return 0.0
+
+    return sorted_values[round(percentile / 100 * (len(sorted_values) - 1))]
+
+
+def summarize(
+    operation_results,
+    number_of_items,
+):
+    start_time = min(
+        start_time
+        for start_time, _, _ in operation_results
+    )
+    end_time = max(
+        end_time
+        for _, end_time, _ in operation_results
+    )
+    latencies = sorted(
+        latency
+        for _, _, process_latencies in operation_results
+        for latency in process_latencies
+    )
+
+    return {
+        'items_per_second': number_of_items / max(end_time - start_time, 1e-9),
+        'operations': len(latencies),
+        'p50_ms': get_percentile(latencies, 50) * 1000,
+        'p99_ms': get_percentile(latencies, 99) * 1000,
+    }
+
+
+def run_processes(
+    processes,
+    barrier,
+    results_queue,
+):
+    for process in processes:
+        process.start()
+
+    barrier.wait()
+
+    operations_results = {}
+    for _ in processes:
+        operation, start_time, end_time, latencies = results_queue.get()
+        operations_results.setdefault(operation, []).append(
+            (
+                start_time,
+                end_time,
+                latencies,
+            )
+        )
+
+    for process in processes:
+        process.join()
+
+    return operations_results
+
+
+def run_scenario(
+    scenario,
+    connector_name,
+    connector_params,
+    number_of_processes,
+    number_of_items,
+    batch_size,
+    delayed_ratio,
+    delay,
+):
+    connector = stand_ins.create_connector(
+        connector_name=connector_name,
+        connector_params=connector_params,
+    )
+    connector.queue_delete(
+        queue_name=QUEUE_NAME,
+    )
+
+    results_queue = multiprocessing.Queue()
+    processes = []
+    if scenario == 'queue':
+        barrier = multiprocessing.Barrier(
+            parties=number_of_processes * 2 + 1,
+        )
+        consumed_items = multiprocessing.Value('q', 0)
+        for process_index in range(number_of_processes):
+            processes.append(
+                multiprocessing.Process(
+                    target=produce,
+                    kwargs={
+                        'connector_name': connector_name,
+                        'connector_params': connector_params,
+                        'process_index': process_index,
+                        'number_of_items': number_of_items,
+                        'batch_size': batch_size,
+                        'delayed_ratio': delayed_ratio,
+                        'delay': delay,
+                        'barrier': barrier,
+                        'results_queue': results_queue,
+                    },
+                )
+            )
+            processes.append(
+                multiprocessing.Process(
+                    target=consume,
+                    kwargs={
+                        'connector_name': connector_name,
+                        'connector_params': connector_params,
+                        'total_number_of_items': number_of_items * number_of_processes,
+                        'batch_size': batch_size,
+                        'consumed_items': consumed_items,
+                        'barrier': barrier,
+                        'results_queue': results_queue,
+                    },
+                )
+            )
+    elif scenario == 'keys':
+        barrier = multiprocessing.Barrier(
+            parties=number_of_processes + 1,
+        )
+        for process_index in range(number_of_processes):
+            processes.append(
+                multiprocessing.Process(
+                    target=set_keys,
+                    kwargs={
+                        'connector_name': connector_name,
+                        'connector_params': connector_params,
+                        'process_index': process_index,
+                        'number_of_items': number_of_items,
+                        'batch_size': batch_size,
+                        'barrier': barrier,
+                        'results_queue': results_queue,
+                    },
+                )
+            )
+    elif scenario == 'lock':
+        barrier = multiprocessing.Barrier(
+            parties=number_of_processes + 1,
+        )
+        for _ in range(number_of_processes):
+            processes.append(
+                multiprocessing.Process(
+                    target=lock_and_release,
+                    kwargs={
+                        'connector_name': connector_name,
+                        'connector_params': connector_params,
+                        'number_of_items': number_of_items,
+                        'barrier': barrier,
+                        'results_queue': results_queue,
+                    },
+                )
+            )
+    else:
+        raise ValueError(f'scenario {scenario} is not supported')
+
+    operations_results = run_processes(
+        processes=processes,
+        barrier=barrier,
+        results_queue=results_queue,
+    )
+
+    results = []
+    for operation, operation_results in operations_results.items():
+        result = {
+            'connector': connector_name,
+            'operation': operation,
+            'processes': number_of_processes,
+            'batch_size': batch_size,
+            'delayed_ratio': delayed_ratio,
+        }
+        result.update(
+            summarize(
+                operation_results=operation_results,
+                number_of_items=number_of_items * number_of_processes,
+            )
+        )
+        results.append(result)
+
+    return results
+
+
+def get_result_key(
+    result,
+):
+    return (
+        result['connector'],
+        result['operation'],
+        result['processes'],
+        result['batch_size'],
+        result['delayed_ratio'],
+    )
+
+
+def print_results(
+    results,
+    baseline_results,
+):
+    baseline_results_by_key = {
+        get_result_key(baseline_result): baseline_result
+        for baseline_result in baseline_results
+    }
+
+    columns = [
+        'connector',
+        'operation',
+        'processes',
+        'batch',
+        'delayed',
+        'items/s',
+        'p50 ms',
+        'p99 ms',
+    ]
+    if baseline_results_by_key:
+        columns += [
+            'items/s vs base',
+            'p99 vs base',
+        ]
+
+    rows = []
+    for result in results:
+        row = [
+            result['connector'],
+            result['operation'],
+            str(result['processes']),
+            str(result['batch_size']),
+            f'{result["delayed_ratio"]:.2f}',
+            f'{result["items_per_second"]:,.0f}',
+            f'{result["p50_ms"]:.3f}',
+            f'{result["p99_ms"]:.3f}',
+        ]
+
+        if baseline_results_by_key:
+            baseline_result = baseline_results_by_key.get(get_result_key(result))
+            for field_name in [
+                'items_per_second',
+                'p99_ms',
+            ]:
+                if baseline_result is None or not baseline_result[field_name]:
+                    row.append('-')
+                else:
+                    row.append(f'{result[field_name] / baseline_result[field_name]:.2f}x')
+
+        rows.append(row)
+
+    column_widths = [
+        max(
+            len(column),
+            *[
+                len(row[column_index])
+                for row in rows
+            ],
+        )
+        for column_index, column in enumerate(columns)
+    ]
+    print(
+        ' | '.join(
+            column.ljust(column_width)
+            for column, column_width in zip(columns, column_widths)
+        )
+    )
+    print(
+        '-+-'.join(
+            '-' * column_width
+            for column_width in column_widths
+        )
+    )
+    for row in rows:
+        print(
+            ' | '.join(
+                value.ljust(column_width)
+                for value, column_width in zip(row, column_widths)
+            )
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Sergeant Connector Benchmark',
+    )
+    parser.add_argument(
+        '--connectors',
+        help='Connectors to benchmark. Redis and Mongo are skipped when no server binary or port is available',
+        nargs='+',
+        choices=[
+            'local',
+            'redis',
+            'mongo',
+        ],
+        default=[
+            'local',
+            'redis',
+            'mongo',
+        ],
+        dest='connectors',
+    )
+    parser.add_argument(
+        '--scenarios',
+        help='Scenarios to run: queue push and pop, key_set, lock acquire and release',
+        nargs='+',
+        choices=[
+            'queue',
+            'keys',
+            'lock',
+        ],
+        default=[
+            'queue',
+            'keys',
+            'lock',
+        ],
+        dest='scenarios',
+    )
+    parser.add_argument(
+        '--processes',
+        help='Numbers of processes to run. The queue scenario runs this many producers and this many consumers',
+        type=int,
+        nargs='+',
+        default=[
+            1,
+            4,
+        ],
+        dest='processes',
+    )
+    parser.add_argument(
+        '--batch-sizes',
+        help='Numbers of items per push, pop and key_set call',
+        type=int,
+        nargs='+',
+        default=[
+            1,
+            100,
+        ],
+        dest='batch_sizes',
+    )
+    parser.add_argument(
+        '--delayed-ratios',
+        help='Ratios of delayed batches pushed in the queue scenario',
+        type=float,
+        nargs='+',
+        default=[
+            0.0,
+            0.5,
+        ],
+        dest='delayed_ratios',
+    )
+    parser.add_argument(
+        '--delay',
+        help='Number of seconds delayed items wait before they are consumable',
+        type=float,
+        default=0.1,
+        dest='delay',
+    )
+    parser.add_argument(
+        '--items',
+        help='Number of items every process handles',
+        type=int,
+        default=10000,
+        dest='items',
+    )
+    parser.add_argument(
+        '--lock-items',
+        help='Number of lock acquisitions every process makes',
+        type=int,
+        default=200,
+        dest='lock_items',
+    )
+    parser.add_argument(
+        '--redis-port',
+        help='Port of a running redis server on localhost. A redis-server binary is launched when omitted',
+        type=int,
+        required=False,
+        dest='redis_port',
+    )
+    parser.add_argument(
+        '--mongo-port',
+        help='Port of a running mongod replica set member on localhost. A mongod binary is launched when omitted',
+        type=int,
+        required=False,
+        dest='mongo_port',
+    )
+    parser.add_argument(
+        '--mongo-replica-set',
+        help='Replica set name of the mongod server',
+        type=str,
+        default='sergeant_benchmark',
+        dest='mongo_replica_set',
+    )
+    parser.add_argument(
+        '--output',
+        help='Path of a JSON file to write the results to',
+        type=str,
+        required=False,
+        dest='output',
+    )
+    parser.add_argument(
+        '--baseline',
+        help='Path of a JSON results file of a previous run to compare against',
+        type=str,
+        required=False,
+        dest='baseline',
+    )
+    args = parser.parse_args()
+
+    results = []
+    for connector_name in args.connectors:
+        with stand_ins.stand_in(
+            connector_name=connector_name,
+            redis_port=args.redis_port,
+            mongo_port=args.mongo_port,
+            mongo_replica_set=args.mongo_replica_set,
+        ) as connector_params:
+            if connector_params is None:
+                print(
+                    f'skipping {connector_name}: no server is available',
+                    file=sys.stderr,
+                )
+
+                continue
+
+            for scenario in args.scenarios:
+                for number_of_processes in args.processes:
+                    if scenario == 'lock':
+                        results += run_scenario(
+                            scenario=scenario,
+                            connector_name=connector_name,
+                            connector_params=connector_params,
+                            number_of_processes=number_of_processes,
+                            number_of_items=args.lock_items,
+                            batch_size=1,
+                            delayed_ratio=0.0,
+                            delay=args.delay,
+                        )
+
+                        continue
+
+                    for batch_size in args.batch_sizes:
+                        delayed_ratios = args.delayed_ratios
+                        if scenario != 'queue':
+                            delayed_ratios = [
+                                0.0,
+                            ]
+
+                        for delayed_ratio in delayed_ratios:
+                            results += run_scenario(
+                                scenario=scenario,
+                                connector_name=connector_name,
+                                connector_params=connector_params,
+                                number_of_processes=number_of_processes,
+                                number_of_items=args.items,
+                                batch_size=batch_size,
+                                delayed_ratio=delayed_ratio,
+                                delay=args.delay,
+                            )
+
+    baseline_results = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline_results = json.load(baseline_file)['results']
+
+    print_results(
+        results=results,
+        baseline_results=baseline_results,
+    )
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(
+                obj={
+                    'metadata': {
+                        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                        'python_implementation': platform.python_implementation(),
+                        'python_version': platform.python_version(),
+                        'platform': platform.platform(),
+                        'machine': platform.machine(),
+                        'cpu_count': multiprocessing.cpu_count(),
+                    },
+                    'results': results,
+                },
+                fp=output_file,
+                indent=4,
+            )
+
+
+if __name__ == '__main__':
+    main()
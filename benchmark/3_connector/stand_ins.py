@@ -0,0 +1,199 @@
+import contextlib
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+
+import sergeant
+
+
+def get_free_port():
+    with socket.socket() as free_socket:
+        free_socket.bind(
+            (
+                '127.0.0.1',
+                0,
+            )
+        )
+
+        return free_socket.getsockname()[1]
+
+
+def wait_for_connector(
+    connector_name,
+    connector_params,
+    timeout,
+):
+    time_to_stop = time.time() + timeout
+    while True:
+        try:
+            create_connector(
+                connector_name=connector_name,
+                connector_params=connector_params,
+            ).queue_length(
+                queue_name='__benchmark_ping__',
+                include_delayed=True,
+            )
+
+            return
+        except Exception:
+            if time.time() > time_to_stop:
+                raise
+
+            time.sleep(0.2)
+
+
+def create_connector(
+    connector_name,
+    connector_params,
+):
+    if connector_name == 'local':
+        return sergeant.connector.local.Connector(**connector_params)
+    elif connector_name == 'redis':
+        return sergeant.connector.redis.Connector(**connector_params)
+    elif connector_name == 'mongo':
+        return sergeant.connector.mongo.Connector(**connector_params)
+    else:
+        raise ValueError(f'connector {connector_name} is not supported')
+
+
+@contextlib.contextmanager
+def local_stand_in():
+    with tempfile.TemporaryDirectory(
+        prefix='sergeant_benchmark_',
+    ) as temporary_directory:
+        yield {
+            'file_path': os.path.join(temporary_directory, 'benchmark.sqlite3'),
+        }
+
+
+@contextlib.contextmanager
+def redis_stand_in(
+    port,
+):
+    server_process = None
+    if port is None:
+        redis_server_path = shutil.which('redis-server')
+        if redis_server_path is None:
+            yield None
+
+            return
+
+        port = get_free_port()
+        server_process = subprocess.Popen(
+            args=[
+                redis_server_path,
+                '--port',
+                str(port),
+                '--save',
+                '',
+                '--appendonly',
+                'no',
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    connector_params = {
+        'nodes': [
+            {
+                'host': '127.0.0.1',
+                'port': port,
+                'password': None,
+                'database': 0,
+            },
+        ],
+    }
+
+    try:
+        wait_for_connector(
+            connector_name='redis',
+            connector_params=connector_params,
+            timeout=10.0,
+        )
+
+        yield connector_params
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.wait()
+
+
+@contextlib.contextmanager
+def mongo_stand_in(
+    port,
+    replica_set,
+):
+    server_process = None
+    with tempfile.TemporaryDirectory(
+        prefix='sergeant_benchmark_',
+    ) as temporary_directory:
+        if port is None:
+            mongod_path = shutil.which('mongod')
+            if mongod_path is None:
+                yield None
+
+                return
+
+            port = get_free_port()
+            server_process = subprocess.Popen(
+                args=[
+                    mongod_path,
+                    '--dbpath',
+                    temporary_directory,
+                    '--port',
+                    str(port),
+                    '--bind_ip',
+                    '127.0.0.1',
+                    '--replSet',
+                    replica_set,
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+        connector_params = {
+            'nodes': [
+                {
+                    'host': '127.0.0.1',
+                    'port': port,
+                    'replica_set': replica_set,
+                },
+            ],
+        }
+
+        try:
+            wait_for_connector(
+                connector_name='mongo',
+                connector_params=connector_params,
+                timeout=30.0,
+            )
+
+            yield connector_params
+        finally:
+            if server_process is not None:
+                server_process.terminate()
+                server_process.wait()
+
+
+def stand_in(
+    connector_name,
+    redis_port,
+    mongo_port,
+    mongo_replica_set,
+):
+    if connector_name == 'local':
+        return local_stand_in()
+    elif connector_name == 'redis':
+        return redis_stand_in(
+            port=redis_port,
+        )
+    elif connector_name == 'mongo':
+        return mongo_stand_in(
+            port=mongo_port,
+            replica_set=mongo_replica_set,
+        )
+    else:
+        raise ValueError(f'connector {connector_name} is not supported')
@@ -5,5 +5,6 @@ from . import encoder
 from . import executor
 from . import killer
 from . import logging
+from . import metrics
 from . import objects
 from . import worker
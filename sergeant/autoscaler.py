@@ -0,0 +1,129 @@
+import math
+import typing
+
+
+class Autoscaler:
+    def __init__(
+        self,
+        min_workers: int,
+        max_workers: int,
+        target_backlog_per_worker: float,
+        target_drain_time: typing.Optional[float] = None,
+        hysteresis: float = 0.2,
+        cooldown: float = 30.0,
+    ) -> None:
+        if min_workers < 1:
+            raise ValueError('min_workers must be at least 1')
+
+        if max_workers < min_workers:
+            raise ValueError('max_workers must not be lower than min_workers')
+
+        if target_backlog_per_worker <= 0:
+            raise ValueError('target_backlog_per_worker must be positive')
+
+        if target_drain_time is not None and target_drain_time <= 0:
+            raise ValueError('target_drain_time must be positive')
+
+        if not 0.0 <= hysteresis < 1.0:
+            raise ValueError('hysteresis must be between 0.0 and 1.0')
+
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.target_backlog_per_worker = target_backlog_per_worker
+        self.target_drain_time = target_drain_time
+        self.hysteresis = hysteresis
+        self.cooldown = cooldown
+
+        self.last_scaling_time: typing.Optional[float] = None
+        self.last_sample: typing.Optional[typing.Tuple[float, int]] = None
+
+    def clamp(
+        self,
+        number_of_workers: int,
+    ) -> int:
+        return min(
+            max(
+                number_of_workers,
+                self.min_workers,
+            ),
+            self.max_workers,
+        )
+
+    def get_drain_rate(
+        self,
+        number_of_enqueued_tasks: int,
+        now: float,
+    ) -> typing.Optional[float]:
+        last_sample = self.last_sample
+        self.last_sample = (
+            now,
+            number_of_enqueued_tasks,
+        )
+
+        if last_sample is None:
+            return None
+
+        last_sample_time, last_number_of_enqueued_tasks = last_sample
+        if now <= last_sample_time:
+            return None
+
+        return (last_number_of_enqueued_tasks - number_of_enqueued_tasks) / (now - last_sample_time)
+
+    def get_load(
+        self,
+        number_of_enqueued_tasks: int,
+        number_of_workers: int,
+        drain_rate: typing.Optional[float],
+    ) -> float:
+        load = number_of_enqueued_tasks / (number_of_workers * self.target_backlog_per_worker)
+
+        if self.target_drain_time is not None and drain_rate is not None and drain_rate > 0:
+            drain_time = number_of_enqueued_tasks / drain_rate
+            load = max(
+                load,
+                drain_time / self.target_drain_time,
+            )
+
+        return load
+
+    def get_desired_number_of_workers(
+        self,
+        number_of_enqueued_tasks: int,
+        number_of_workers: int,
+        now: float,
+    ) -> int:
+        drain_rate = self.get_drain_rate(
+            number_of_enqueued_tasks=number_of_enqueued_tasks,
+            now=now,
+        )
+
+        clamped_number_of_workers = self.clamp(
+            number_of_workers=number_of_workers,
+        )
+        if clamped_number_of_workers != number_of_workers:
+            self.last_scaling_time = now
+
+            return clamped_number_of_workers
+
+        if self.last_scaling_time is not None and now - self.last_scaling_time < self.cooldown:
+            return number_of_workers
+
+        load = self.get_load(
+            number_of_enqueued_tasks=number_of_enqueued_tasks,
+            number_of_workers=number_of_workers,
+            drain_rate=drain_rate,
+        )
+
+        desired_number_of_workers = number_of_workers
+        if load > 1.0 + self.hysteresis:
+            desired_number_of_workers = self.clamp(
+                number_of_workers=math.ceil(number_of_workers * load),
+            )
+        elif load < 1.0 - self.hysteresis and number_of_workers > self.min_workers:
+            if load * number_of_workers / (number_of_workers - 1) <= 1.0:
+                desired_number_of_workers = number_of_workers - 1
+
+        if desired_number_of_workers != number_of_workers:
+            self.last_scaling_time = now
+
+        return desired_number_of_workers
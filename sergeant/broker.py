@@ -1,7 +1,11 @@
+import math
+import threading
+import time
 import typing
 
 from . import connector
 from . import encoder
+from . import metrics
 from . import objects
 
 
@@ -10,9 +14,21 @@ class Broker:
         self,
         connector: connector.Connector,
         encoder: encoder.encoder.Encoder,
+        outbox_max_items: int = 0,
+        outbox_flush_interval: float = 0.0,
+        metrics: typing.Optional[metrics.Metrics] = None,
     ) -> None:
         self.connector = connector
         self.encoder = encoder
+        self.metrics = metrics
+
+        self.outbox_max_items = outbox_max_items
+        self.outbox_flush_interval = outbox_flush_interval
+        self.outbox: typing.Dict[typing.Tuple[str, str, typing.Optional[float]], typing.List[bytes]] = {}
+        self.outbox_size = 0
+        self.outbox_flush_time = 0.0
+        self.outbox_flush_timer: typing.Optional[threading.Timer] = None
+        self.outbox_lock = threading.Lock()
 
     def purge_tasks(
         self,
@@ -34,6 +50,18 @@ class Broker:
 
         return number_of_enqueued_tasks
 
+    def encode_task(
+        self,
+        task: objects.Task,
+    ) -> bytes:
+        encoded_task = task.get_original_payload()
+        if encoded_task is None:
+            encoded_task = self.encoder.encode(
+                data=task,
+            )
+
+        return encoded_task
+
     def push_task(
         self,
         task_name: str,
@@ -41,10 +69,39 @@ class Broker:
         priority: str = 'NORMAL',
         consumable_from: typing.Optional[float] = None,
     ) -> bool:
-        encoded_item = self.encoder.encode(
-            data=task,
+        encoded_item = self.encode_task(
+            task=task,
         )
 
+        if self.outbox_max_items > 0:
+            if consumable_from is not None and self.outbox_flush_interval > 0:
+                consumable_from = math.ceil(consumable_from / self.outbox_flush_interval) * self.outbox_flush_interval
+
+            with self.outbox_lock:
+                if self.outbox_size == 0:
+                    self.outbox_flush_time = time.monotonic() + self.outbox_flush_interval
+                    self.schedule_outbox_flush()
+
+                self.outbox.setdefault(
+                    (
+                        task_name,
+                        priority,
+                        consumable_from,
+                    ),
+                    [],
+                ).append(encoded_item)
+                self.outbox_size += 1
+
+                outbox_is_due = self.outbox_size >= self.outbox_max_items or time.monotonic() >= self.outbox_flush_time
+
+            if outbox_is_due:
+                try:
+                    self.flush_outbox()
+                except Exception:
+                    pass
+
+            return True
+
         pushed = self.connector.queue_push(
             queue_name=task_name,
             item=encoded_item,
@@ -63,8 +120,8 @@ class Broker:
     ) -> bool:
         encoded_tasks = []
         for task in tasks:
-            encoded_task = self.encoder.encode(
-                data=task,
+            encoded_task = self.encode_task(
+                task=task,
             )
 
             encoded_tasks.append(encoded_task)
@@ -79,12 +136,74 @@ class Broker:
 
         return True
 
+    def schedule_outbox_flush(
+        self,
+    ) -> None:
+        if self.outbox_flush_interval <= 0 or self.outbox_flush_timer is not None:
+            return
+
+        self.outbox_flush_timer = threading.Timer(
+            interval=self.outbox_flush_interval,
+            function=self.flush_outbox_on_timer,
+        )
+        self.outbox_flush_timer.daemon = True
+        self.outbox_flush_timer.start()
+
+    def flush_outbox_on_timer(
+        self,
+    ) -> None:
+        with self.outbox_lock:
+            self.outbox_flush_timer = None
+
+        try:
+            self.flush_outbox()
+        except Exception:
+            pass
+
+    def flush_outbox(
+        self,
+    ) -> bool:
+        with self.outbox_lock:
+            outbox_groups = list(self.outbox.items())
+            self.outbox = {}
+            self.outbox_size = 0
+
+        try:
+            while outbox_groups:
+                outbox_key, encoded_tasks = outbox_groups[0]
+                task_name, priority, consumable_from = outbox_key
+                self.connector.queue_push_bulk(
+                    queue_name=task_name,
+                    items=encoded_tasks,
+                    priority=priority,
+                    consumable_from=consumable_from,
+                )
+                outbox_groups.pop(0)
+        except Exception:
+            with self.outbox_lock:
+                for outbox_key, encoded_tasks in outbox_groups:
+                    self.outbox.setdefault(outbox_key, []).extend(encoded_tasks)
+                    self.outbox_size += len(encoded_tasks)
+
+                self.schedule_outbox_flush()
+
+            raise
+
+        return True
+
     def pop_tasks(
         self,
         task_name: str,
         number_of_tasks: int,
+        timeout: typing.Optional[float] = None,
     ) -> typing.List[objects.Task]:
-        if number_of_tasks == 1:
+        if timeout is not None:
+            tasks = self.connector.queue_pop_bulk_blocking(
+                queue_name=task_name,
+                number_of_items=number_of_tasks,
+                timeout=timeout,
+            )
+        elif number_of_tasks == 1:
             task = self.connector.queue_pop(
                 queue_name=task_name,
             )
@@ -98,15 +217,52 @@ class Broker:
                 number_of_items=number_of_tasks,
             )
 
-        decoded_tasks = [
-            self.encoder.decode(
+        decode_start_time = time.perf_counter()
+        decoded_tasks = []
+        for task in tasks:
+            decoded_task = self.encoder.decode(
                 data=task,
             )
-            for task in tasks
-        ]
+            decoded_task.set_original_payload(
+                payload=task,
+            )
+            decoded_tasks.append(decoded_task)
+
+        if self.metrics is not None and decoded_tasks:
+            self.metrics.observe_pulled_tasks(
+                tasks=decoded_tasks,
+                decode_time=(time.perf_counter() - decode_start_time) / len(decoded_tasks),
+            )
+
+        if self.connector.reliable:
+            for task, decoded_task in zip(tasks, decoded_tasks):
+                decoded_task.set_leased_item(
+                    leased_item=task,
+                )
 
         return decoded_tasks
 
+    def acknowledge_tasks(
+        self,
+        task_name: str,
+        tasks: typing.Iterable[objects.Task],
+    ) -> bool:
+        self.flush_outbox()
+
+        leased_items = []
+        for task in tasks:
+            leased_item = task.pop_leased_item()
+            if leased_item is not None:
+                leased_items.append(leased_item)
+
+        if not leased_items:
+            return False
+
+        return self.connector.queue_acknowledge_bulk(
+            queue_name=task_name,
+            items=leased_items,
+        )
+
     def retry(
         self,
         task_name: str,
@@ -179,6 +335,63 @@ class Broker:
 
         return key_was_set
 
+    def delete_keys(
+        self,
+        names: typing.Iterable[str],
+    ) -> int:
+        names = list(names)
+        if not names:
+            return 0
+
+        number_of_deleted_keys = self.connector.key_delete_bulk(
+            keys=names,
+        )
+
+        return number_of_deleted_keys
+
+    def get_keys(
+        self,
+        names: typing.Iterable[str],
+    ) -> typing.Dict[str, typing.Any]:
+        names = list(names)
+        if not names:
+            return {}
+
+        values = self.connector.key_get_bulk(
+            keys=names,
+        )
+
+        decode = self.encoder.decode
+        decoded_values = {
+            name: decode(
+                data=value,
+            ) if value else value
+            for name, value in zip(names, values)
+        }
+
+        return decoded_values
+
+    def set_keys(
+        self,
+        values: typing.Dict[str, typing.Any],
+    ) -> int:
+        if not values:
+            return 0
+
+        encode = self.encoder.encode
+        encoded_values = {
+            name: encode(
+                data=value,
+            )
+            for name, value in values.items()
+        }
+
+        number_of_new_keys = self.connector.key_set_bulk(
+            items=encoded_values,
+        )
+
+        return number_of_new_keys
+
     def lock(
         self,
         name: str,
@@ -186,3 +399,297 @@ class Broker:
         return self.connector.lock(
             name=name,
         )
+
+
+class AsyncBroker:
+    def __init__(
+        self,
+        connector: connector.AsyncConnector,
+        encoder: encoder.encoder.Encoder,
+        metrics: typing.Optional[metrics.Metrics] = None,
+    ) -> None:
+        self.connector = connector
+        self.encoder = encoder
+        self.metrics = metrics
+
+    async def purge_tasks(
+        self,
+        task_name: str,
+    ) -> bool:
+        return await self.connector.queue_delete(
+            queue_name=task_name,
+        )
+
+    async def number_of_enqueued_tasks(
+        self,
+        task_name: str,
+        include_delayed: bool,
+    ) -> int:
+        number_of_enqueued_tasks = await self.connector.queue_length(
+            queue_name=task_name,
+            include_delayed=include_delayed,
+        )
+
+        return number_of_enqueued_tasks
+
+    def encode_task(
+        self,
+        task: objects.Task,
+    ) -> bytes:
+        encoded_task = task.get_original_payload()
+        if encoded_task is None:
+            encoded_task = self.encoder.encode(
+                data=task,
+            )
+
+        return encoded_task
+
+    async def push_task(
+        self,
+        task_name: str,
+        task: objects.Task,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        encoded_item = self.encode_task(
+            task=task,
+        )
+
+        pushed = await self.connector.queue_push(
+            queue_name=task_name,
+            item=encoded_item,
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+        return pushed
+
+    async def push_tasks(
+        self,
+        task_name: str,
+        tasks: typing.Iterable[objects.Task],
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        encoded_tasks = []
+        for task in tasks:
+            encoded_task = self.encode_task(
+                task=task,
+            )
+
+            encoded_tasks.append(encoded_task)
+
+        if encoded_tasks:
+            await self.connector.queue_push_bulk(
+                queue_name=task_name,
+                items=encoded_tasks,
+                priority=priority,
+                consumable_from=consumable_from,
+            )
+
+        return True
+
+    async def pop_tasks(
+        self,
+        task_name: str,
+        number_of_tasks: int,
+    ) -> typing.List[objects.Task]:
+        if number_of_tasks == 1:
+            task = await self.connector.queue_pop(
+                queue_name=task_name,
+            )
+            if not task:
+                return []
+            else:
+                tasks = [task]
+        else:
+            tasks = await self.connector.queue_pop_bulk(
+                queue_name=task_name,
+                number_of_items=number_of_tasks,
+            )
+
+        decode_start_time = time.perf_counter()
+        decoded_tasks = []
+        for task in tasks:
+            decoded_task = self.encoder.decode(
+                data=task,
+            )
+            decoded_task.set_original_payload(
+                payload=task,
+            )
+            decoded_tasks.append(decoded_task)
+
+        if self.metrics is not None and decoded_tasks:
+            self.metrics.observe_pulled_tasks(
+                tasks=decoded_tasks,
+                decode_time=(time.perf_counter() - decode_start_time) / len(decoded_tasks),
+            )
+
+        if self.connector.reliable:
+            for task, decoded_task in zip(tasks, decoded_tasks):
+                decoded_task.set_leased_item(
+                    leased_item=task,
+                )
+
+        return decoded_tasks
+
+    async def acknowledge_tasks(
+        self,
+        task_name: str,
+        tasks: typing.Iterable[objects.Task],
+    ) -> bool:
+        leased_items = []
+        for task in tasks:
+            leased_item = task.pop_leased_item()
+            if leased_item is not None:
+                leased_items.append(leased_item)
+
+        if not leased_items:
+            return False
+
+        return await self.connector.queue_acknowledge_bulk(
+            queue_name=task_name,
+            items=leased_items,
+        )
+
+    async def retry(
+        self,
+        task_name: str,
+        task: objects.Task,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        task.run_count += 1
+
+        return await self.push_task(
+            task_name=task_name,
+            task=task,
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def requeue(
+        self,
+        task_name: str,
+        task: objects.Task,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        return await self.push_task(
+            task_name=task_name,
+            task=task,
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def delete_key(
+        self,
+        name: str,
+    ) -> bool:
+        key_was_deleted = await self.connector.key_delete(
+            key=name,
+        )
+
+        return key_was_deleted
+
+    async def get_key(
+        self,
+        name: str,
+    ) -> typing.Any:
+        value = await self.connector.key_get(
+            key=name,
+        )
+        if not value:
+            return value
+
+        decoded_value = self.encoder.decode(
+            data=value,
+        )
+
+        return decoded_value
+
+    async def set_key(
+        self,
+        name: str,
+        value: typing.Any,
+    ) -> bool:
+        encoded_value = self.encoder.encode(
+            data=value,
+        )
+
+        key_was_set = await self.connector.key_set(
+            key=name,
+            value=encoded_value,
+        )
+
+        return key_was_set
+
+    async def delete_keys(
+        self,
+        names: typing.Iterable[str],
+    ) -> int:
+        names = list(names)
+        if not names:
+            return 0
+
+        number_of_deleted_keys = await self.connector.key_delete_bulk(
+            keys=names,
+        )
+
+        return number_of_deleted_keys
+
+    async def get_keys(
+        self,
+        names: typing.Iterable[str],
+    ) -> typing.Dict[str, typing.Any]:
+        names = list(names)
+        if not names:
+            return {}
+
+        values = await self.connector.key_get_bulk(
+            keys=names,
+        )
+
+        decode = self.encoder.decode
+        decoded_values = {
+            name: decode(
+                data=value,
+            ) if value else value
+            for name, value in zip(names, values)
+        }
+
+        return decoded_values
+
+    async def set_keys(
+        self,
+        values: typing.Dict[str, typing.Any],
+    ) -> int:
+        if not values:
+            return 0
+
+        encode = self.encoder.encode
+        encoded_values = {
+            name: encode(
+                data=value,
+            )
+            for name, value in values.items()
+        }
+
+        number_of_new_keys = await self.connector.key_set_bulk(
+            items=encoded_values,
+        )
+
+        return number_of_new_keys
+
+    def lock(
+        self,
+        name: str,
+    ) -> connector.AsyncLock:
+        return self.connector.lock(
+            name=name,
+        )
+
+    async def close(
+        self,
+    ) -> None:
+        await self.connector.close()
@@ -5,6 +5,8 @@ import typing_extensions
 
 import logging
 
+from . import metrics
+
 
 @dataclasses.dataclass(
     frozen=True,
@@ -38,8 +40,13 @@ class Logging:
     frozen=True,
 )
 class Encoder:
-    compressor: typing.Optional[typing_extensions.Literal['bzip2', 'gzip', 'lzma', 'zlib', 'dummy']] = None
+    compressor: typing.Optional[typing_extensions.Literal['bzip2', 'gzip', 'lz4', 'lzma', 'zlib', 'zstd', 'dummy']] = None
     serializer: typing_extensions.Literal['msgpack', 'pickle'] = 'pickle'
+    compressor_params: typing.Dict[str, typing.Any] = dataclasses.field(
+        default_factory=dict,
+    )
+    compression_threshold: int = 0
+    self_describing: bool = False
 
 
 @dataclasses.dataclass(
@@ -65,6 +72,26 @@ class Starvation:
     time_with_no_tasks: int
 
 
+@dataclasses.dataclass(
+    frozen=True,
+)
+class Outbox:
+    max_items: int = 100
+    flush_interval: float = 0.1
+
+
+@dataclasses.dataclass(
+    frozen=True,
+)
+class Metrics:
+    enabled: bool = True
+    buckets: typing.Tuple[float, ...] = metrics.DEFAULT_BUCKETS
+    sinks: typing.List[metrics.Sink] = dataclasses.field(
+        default_factory=list,
+    )
+    export_interval: float = 60.0
+
+
 @dataclasses.dataclass(
     frozen=True,
 )
@@ -82,6 +109,10 @@ class WorkerConfig:
     max_retries: int = 0
     tasks_per_transaction: int = 1
     number_of_threads: int = 1
+    number_of_concurrent_tasks: int = 100
+    number_of_processes: int = 1
+    blocking_pop: bool = False
+    prefetch_depth: int = 0
     encoder: Encoder = dataclasses.field(
         default_factory=Encoder,
     )
@@ -92,6 +123,10 @@ class WorkerConfig:
         default_factory=Logging,
     )
     starvation: typing.Optional[Starvation] = None
+    outbox: typing.Optional[Outbox] = None
+    metrics: Metrics = dataclasses.field(
+        default_factory=Metrics,
+    )
 
     def replace(
         self,
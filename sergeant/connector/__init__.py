@@ -1,8 +1,16 @@
 from . import _connector
+from . import asynchronous_local
+from . import asynchronous_mongo
+from . import asynchronous_redis
 from . import local
 from . import mongo
+from . import node_selector
+from . import placement
 from . import redis
 
 
+AsyncConnector = _connector.AsyncConnector
+AsyncLock = _connector.AsyncLock
 Connector = _connector.Connector
+LeasedItem = _connector.LeasedItem
 Lock = _connector.Lock
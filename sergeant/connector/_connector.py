@@ -1,6 +1,37 @@
 import typing
 
 
+class LeasedItem(
+    bytes,
+):
+    node_index: int
+    lease_id: int
+
+    def __new__(
+        cls,
+        item: bytes,
+        node_index: int,
+        lease_id: int,
+    ) -> 'LeasedItem':
+        leased_item = super().__new__(cls, item)
+        leased_item.node_index = node_index
+        leased_item.lease_id = lease_id
+
+        return leased_item
+
+    def __reduce__(
+        self,
+    ) -> typing.Tuple[typing.Any, ...]:
+        return (
+            LeasedItem,
+            (
+                bytes(self),
+                self.node_index,
+                self.lease_id,
+            ),
+        )
+
+
 class Lock:
     def acquire(
         self,
@@ -33,6 +64,8 @@ class Lock:
 
 
 class Connector:
+    reliable: bool = False
+
     def key_set(
         self,
         key: str,
@@ -52,6 +85,30 @@ class Connector:
     ) -> bool:
         raise NotImplementedError()
 
+    def key_set_bulk(
+        self,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        raise NotImplementedError()
+
+    def key_get_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> typing.List[typing.Optional[bytes]]:
+        raise NotImplementedError()
+
+    def key_delete_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> int:
+        raise NotImplementedError()
+
+    def key_migrate(
+        self,
+        batch_size: int = 1000,
+    ) -> int:
+        raise NotImplementedError()
+
     def queue_pop(
         self,
         queue_name: str,
@@ -65,6 +122,21 @@ class Connector:
     ) -> typing.List[bytes]:
         raise NotImplementedError()
 
+    def queue_pop_bulk_blocking(
+        self,
+        queue_name: str,
+        number_of_items: int,
+        timeout: float,
+    ) -> typing.List[bytes]:
+        raise NotImplementedError()
+
+    def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+    ) -> bool:
+        raise NotImplementedError()
+
     def queue_push(
         self,
         queue_name: str,
@@ -101,3 +173,137 @@ class Connector:
         name: str,
     ) -> Lock:
         raise NotImplementedError()
+
+
+class AsyncLock:
+    async def acquire(
+        self,
+        timeout: typing.Optional[float] = None,
+        check_interval: float = 1.0,
+        ttl: int = 60,
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def release(
+        self,
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def is_locked(
+        self,
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def set_ttl(
+        self,
+        ttl: int,
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def get_ttl(
+        self,
+    ) -> typing.Optional[int]:
+        raise NotImplementedError()
+
+
+class AsyncConnector:
+    reliable: bool = False
+
+    async def key_set(
+        self,
+        key: str,
+        value: bytes,
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def key_get(
+        self,
+        key: str,
+    ) -> typing.Optional[bytes]:
+        raise NotImplementedError()
+
+    async def key_delete(
+        self,
+        key: str,
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def key_set_bulk(
+        self,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        raise NotImplementedError()
+
+    async def key_get_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> typing.List[typing.Optional[bytes]]:
+        raise NotImplementedError()
+
+    async def key_delete_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> int:
+        raise NotImplementedError()
+
+    async def queue_pop(
+        self,
+        queue_name: str,
+    ) -> typing.Optional[bytes]:
+        raise NotImplementedError()
+
+    async def queue_pop_bulk(
+        self,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[bytes]:
+        raise NotImplementedError()
+
+    async def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def queue_push(
+        self,
+        queue_name: str,
+        item: bytes,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def queue_push_bulk(
+        self,
+        queue_name: str,
+        items: typing.Iterable[bytes],
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        raise NotImplementedError()
+
+    async def queue_length(
+        self,
+        queue_name: str,
+        include_delayed: bool,
+    ) -> int:
+        raise NotImplementedError()
+
+    async def queue_delete(
+        self,
+        queue_name: str,
+    ) -> bool:
+        raise NotImplementedError()
+
+    def lock(
+        self,
+        name: str,
+    ) -> AsyncLock:
+        raise NotImplementedError()
+
+    async def close(
+        self,
+    ) -> None:
+        raise NotImplementedError()
@@ -0,0 +1,232 @@
+import asyncio
+import functools
+import typing
+
+from . import _connector
+from . import local
+
+
+async def run_in_executor(
+    function: typing.Callable[..., typing.Any],
+    **kwargs: typing.Any,
+) -> typing.Any:
+    return await asyncio.get_event_loop().run_in_executor(
+        None,
+        functools.partial(
+            function,
+            **kwargs,
+        ),
+    )
+
+
+class Lock(
+    _connector.AsyncLock,
+):
+    def __init__(
+        self,
+        lock: local.Lock,
+    ) -> None:
+        self.lock = lock
+
+    async def acquire(
+        self,
+        timeout: typing.Optional[float] = None,
+        check_interval: float = 1.0,
+        ttl: int = 60,
+    ) -> bool:
+        return await run_in_executor(
+            self.lock.acquire,
+            timeout=timeout,
+            check_interval=check_interval,
+            ttl=ttl,
+        )
+
+    async def release(
+        self,
+    ) -> bool:
+        return await run_in_executor(
+            self.lock.release,
+        )
+
+    async def is_locked(
+        self,
+    ) -> bool:
+        return await run_in_executor(
+            self.lock.is_locked,
+        )
+
+    async def set_ttl(
+        self,
+        ttl: int,
+    ) -> bool:
+        return await run_in_executor(
+            self.lock.set_ttl,
+            ttl=ttl,
+        )
+
+    async def get_ttl(
+        self,
+    ) -> typing.Optional[int]:
+        return await run_in_executor(
+            self.lock.get_ttl,
+        )
+
+
+class Connector(
+    _connector.AsyncConnector,
+):
+    def __init__(
+        self,
+        file_path: str,
+    ) -> None:
+        self.connector = local.Connector(
+            file_path=file_path,
+        )
+
+    async def key_set(
+        self,
+        key: str,
+        value: bytes,
+    ) -> bool:
+        return await run_in_executor(
+            self.connector.key_set,
+            key=key,
+            value=value,
+        )
+
+    async def key_get(
+        self,
+        key: str,
+    ) -> typing.Optional[bytes]:
+        return await run_in_executor(
+            self.connector.key_get,
+            key=key,
+        )
+
+    async def key_delete(
+        self,
+        key: str,
+    ) -> bool:
+        return await run_in_executor(
+            self.connector.key_delete,
+            key=key,
+        )
+
+    async def key_set_bulk(
+        self,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        return await run_in_executor(
+            self.connector.key_set_bulk,
+            items=items,
+        )
+
+    async def key_get_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> typing.List[typing.Optional[bytes]]:
+        return await run_in_executor(
+            self.connector.key_get_bulk,
+            keys=keys,
+        )
+
+    async def key_delete_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> int:
+        return await run_in_executor(
+            self.connector.key_delete_bulk,
+            keys=keys,
+        )
+
+    async def queue_pop(
+        self,
+        queue_name: str,
+    ) -> typing.Optional[bytes]:
+        return await run_in_executor(
+            self.connector.queue_pop,
+            queue_name=queue_name,
+        )
+
+    async def queue_pop_bulk(
+        self,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[bytes]:
+        return await run_in_executor(
+            self.connector.queue_pop_bulk,
+            queue_name=queue_name,
+            number_of_items=number_of_items,
+        )
+
+    async def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+    ) -> bool:
+        return False
+
+    async def queue_push(
+        self,
+        queue_name: str,
+        item: bytes,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        return await run_in_executor(
+            self.connector.queue_push,
+            queue_name=queue_name,
+            item=item,
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def queue_push_bulk(
+        self,
+        queue_name: str,
+        items: typing.Iterable[bytes],
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        return await run_in_executor(
+            self.connector.queue_push_bulk,
+            queue_name=queue_name,
+            items=list(items),
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def queue_length(
+        self,
+        queue_name: str,
+        include_delayed: bool,
+    ) -> int:
+        return await run_in_executor(
+            self.connector.queue_length,
+            queue_name=queue_name,
+            include_delayed=include_delayed,
+        )
+
+    async def queue_delete(
+        self,
+        queue_name: str,
+    ) -> bool:
+        return await run_in_executor(
+            self.connector.queue_delete,
+            queue_name=queue_name,
+        )
+
+    def lock(
+        self,
+        name: str,
+    ) -> Lock:
+        return Lock(
+            lock=self.connector.lock(
+                name=name,
+            ),
+        )
+
+    async def close(
+        self,
+    ) -> None:
+        pass
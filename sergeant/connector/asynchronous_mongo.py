@@ -0,0 +1,576 @@
+import asyncio
+import datetime
+import functools
+import math
+import pymongo
+import pymongo.errors
+import time
+import typing
+
+from . import _connector
+from . import node_selector
+from . import placement
+
+
+class Lock(
+    _connector.AsyncLock,
+):
+    def __init__(
+        self,
+        locks_collection: typing.Any,
+        name: str,
+    ) -> None:
+        self.locks_collection = locks_collection
+        self.name = name
+
+        self.acquired = False
+
+    async def acquire(
+        self,
+        timeout: typing.Optional[float] = None,
+        check_interval: float = 1.0,
+        ttl: int = 60,
+    ) -> bool:
+        if timeout is not None:
+            time_to_stop = time.time() + timeout
+
+        while True:
+            try:
+                await self.locks_collection.insert_one(
+                    document={
+                        'name': self.name,
+                        'expireAt': datetime.datetime.utcnow() + datetime.timedelta(
+                            seconds=ttl,
+                        ),
+                    },
+                )
+                self.acquired = True
+
+                return True
+            except pymongo.errors.DuplicateKeyError:
+                if timeout is not None and time.time() > time_to_stop:
+                    return False
+
+                await asyncio.sleep(check_interval)
+
+    async def release(
+        self,
+    ) -> bool:
+        if self.acquired:
+            delete_one_result = await self.locks_collection.delete_one(
+                filter={
+                    'name': self.name,
+                },
+            )
+
+            self.acquired = False
+
+            return delete_one_result.deleted_count == 1
+        else:
+            return False
+
+    async def is_locked(
+        self,
+    ) -> bool:
+        number_of_existing_keys = await self.locks_collection.count_documents(
+            filter={
+                'name': self.name,
+            },
+        )
+
+        return number_of_existing_keys == 1
+
+    async def set_ttl(
+        self,
+        ttl: int,
+    ) -> bool:
+        update_one_result = await self.locks_collection.update_one(
+            filter={
+                'name': self.name,
+            },
+            update={
+                '$set': {
+                    'expireAt': datetime.datetime.utcnow() + datetime.timedelta(
+                        seconds=ttl,
+                    ),
+                },
+            },
+        )
+
+        return update_one_result.modified_count == 1
+
+    async def get_ttl(
+        self,
+    ) -> typing.Optional[int]:
+        now_date = datetime.datetime.utcnow()
+
+        lock_document = await self.locks_collection.find_one(
+            filter={
+                'name': self.name,
+            },
+        )
+        if not lock_document:
+            return None
+
+        if lock_document['expireAt'] <= now_date:
+            return None
+        else:
+            expire_time_delta = lock_document['expireAt'] - now_date
+
+            return math.ceil(expire_time_delta.total_seconds())
+
+
+class Connector(
+    _connector.AsyncConnector,
+):
+    def __init__(
+        self,
+        nodes: typing.List[typing.Dict[str, typing.Any]],
+        key_placement: str = 'modulo',
+        virtual_nodes: int = 160,
+        node_selection: str = 'round_robin',
+        node_selection_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> None:
+        import motor.motor_asyncio
+
+        self.connections = [
+            motor.motor_asyncio.AsyncIOMotorClient(
+                host=node['host'],
+                port=node['port'],
+                replicaSet=node['replica_set'],
+            )
+            for node in nodes
+        ]
+        self.number_of_connections = len(self.connections)
+
+        node_names = [
+            f'{node["host"]}:{node["port"]}'
+            for node in nodes
+        ]
+        self.key_placement = placement.create_placement(
+            key_placement=key_placement,
+            node_names=node_names,
+            virtual_nodes=virtual_nodes,
+        )
+        self.node_selector = node_selector.create_node_selector(
+            node_selection=node_selection,
+            number_of_nodes=self.number_of_connections,
+            node_selection_params=node_selection_params,
+        )
+
+    def group_keys_by_connection(
+        self,
+        keys: typing.Iterable[str],
+    ) -> typing.Dict[int, typing.List[str]]:
+        keys_by_connection: typing.Dict[int, typing.List[str]] = {}
+        for key in keys:
+            key_server_location = self.key_placement.get_node_index(
+                key=key,
+            )
+            keys_by_connection.setdefault(key_server_location, []).append(key)
+
+        return keys_by_connection
+
+    async def key_set(
+        self,
+        key: str,
+        value: bytes,
+    ) -> bool:
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
+
+        update_one_result = await self.connections[key_server_location].sergeant.keys.update_one(
+            filter={
+                'key': key,
+            },
+            update={
+                '$set': {
+                    'key': key,
+                    'value': value,
+                },
+            },
+            upsert=True,
+        )
+
+        return update_one_result.upserted_id is not None
+
+    async def key_get(
+        self,
+        key: str,
+    ) -> typing.Optional[bytes]:
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
+
+        document = await self.connections[key_server_location].sergeant.keys.find_one(
+            filter={
+                'key': key,
+            },
+        )
+        if document:
+            return document['value']
+        else:
+            return None
+
+    async def key_delete(
+        self,
+        key: str,
+    ) -> bool:
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
+
+        delete_one_result = await self.connections[key_server_location].sergeant.keys.delete_one(
+            filter={
+                'key': key,
+            },
+        )
+
+        return delete_one_result.deleted_count > 0
+
+    async def key_set_bulk(
+        self,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=items.keys(),
+        )
+
+        bulk_write_results = await asyncio.gather(
+            *(
+                self.connections[key_server_location].sergeant.keys.bulk_write(
+                    requests=[
+                        pymongo.UpdateOne(
+                            filter={
+                                'key': key,
+                            },
+                            update={
+                                '$set': {
+                                    'key': key,
+                                    'value': items[key],
+                                },
+                            },
+                            upsert=True,
+                        )
+                        for key in keys
+                    ],
+                    ordered=False,
+                )
+                for key_server_location, keys in keys_by_connection.items()
+            )
+        )
+
+        return sum(
+            bulk_write_result.upserted_count
+            for bulk_write_result in bulk_write_results
+        )
+
+    async def key_get_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> typing.List[typing.Optional[bytes]]:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=keys,
+        )
+
+        values: typing.Dict[str, bytes] = {}
+        for key_server_location, connection_keys in keys_by_connection.items():
+            documents = self.connections[key_server_location].sergeant.keys.find(
+                filter={
+                    'key': {
+                        '$in': connection_keys,
+                    },
+                },
+                projection={
+                    'key': 1,
+                    'value': 1,
+                },
+            )
+            async for document in documents:
+                values[document['key']] = document['value']
+
+        return [
+            values.get(key)
+            for key in keys
+        ]
+
+    async def key_delete_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> int:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=keys,
+        )
+
+        delete_many_results = await asyncio.gather(
+            *(
+                self.connections[key_server_location].sergeant.keys.delete_many(
+                    filter={
+                        'key': {
+                            '$in': connection_keys,
+                        },
+                    },
+                )
+                for key_server_location, connection_keys in keys_by_connection.items()
+            )
+        )
+
+        return sum(
+            delete_many_result.deleted_count
+            for delete_many_result in delete_many_results
+        )
+
+    async def pop_bulk_from_connection(
+        self,
+        connection: typing.Any,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[bytes]:
+        values = []
+
+        async with await connection.start_session() as mongo_session:
+            async with mongo_session.start_transaction():
+                results_cursor = connection.sergeant.task_queue.find(
+                    filter={
+                        'queue_name': queue_name,
+                        'priority': {
+                            '$lte': time.time(),
+                        },
+                    },
+                    projection={
+                        '_id': 1,
+                        'value': 1,
+                    },
+                    sort=[
+                        (
+                            'priority',
+                            pymongo.ASCENDING,
+                        ),
+                    ],
+                    session=mongo_session,
+                ).limit(
+                    number_of_items,
+                )
+
+                ids = []
+                async for result in results_cursor:
+                    ids.append(result['_id'])
+                    values.append(result['value'])
+
+                await connection.sergeant.task_queue.delete_many(
+                    filter={
+                        '_id': {
+                            '$in': ids,
+                        },
+                    },
+                    session=mongo_session,
+                )
+
+        return values
+
+    async def queue_pop(
+        self,
+        queue_name: str,
+    ) -> typing.Optional[bytes]:
+        values = await self.queue_pop_bulk(
+            queue_name=queue_name,
+            number_of_items=1,
+        )
+        if values:
+            return values[0]
+        else:
+            return None
+
+    async def queue_pop_bulk(
+        self,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[bytes]:
+        values: typing.List[bytes] = []
+
+        for node_index in self.node_selector.get_pop_node_indices(
+            queue_name=queue_name,
+        ):
+            node_values = await self.node_selector.execute_async(
+                node_index=node_index,
+                function=functools.partial(
+                    self.pop_bulk_from_connection,
+                    connection=self.connections[node_index],
+                    queue_name=queue_name,
+                    number_of_items=number_of_items - len(values),
+                ),
+            )
+            self.node_selector.record_pop(
+                node_index=node_index,
+                queue_name=queue_name,
+                number_of_items=len(node_values),
+            )
+
+            values += node_values
+            if len(values) == number_of_items:
+                return values
+
+        return values
+
+    async def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+    ) -> bool:
+        return False
+
+    async def push_items(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+        priority: str,
+        consumable_from: typing.Optional[float],
+    ) -> bool:
+        if consumable_from is not None:
+            priority_value = consumable_from
+        elif priority == 'HIGH':
+            priority_value = 0.0
+        elif priority == 'NORMAL':
+            priority_value = 1.0
+        else:
+            priority_value = 1.0
+
+        documents = [
+            {
+                'queue_name': queue_name,
+                'priority': priority_value,
+                'value': item,
+            }
+            for item in items
+        ]
+
+        push_exception: typing.Optional[BaseException] = None
+
+        for node_index in self.node_selector.get_push_node_indices():
+            try:
+                insert_many_result = await self.node_selector.execute_async(
+                    node_index=node_index,
+                    function=functools.partial(
+                        self.connections[node_index].sergeant.task_queue.insert_many,
+                        documents=documents,
+                        ordered=False,
+                    ),
+                )
+            except Exception as exception:
+                push_exception = exception
+
+                continue
+
+            self.node_selector.record_push(
+                node_index=node_index,
+                queue_name=queue_name,
+                number_of_items=len(items),
+            )
+
+            return insert_many_result.acknowledged
+
+        if push_exception is not None:
+            raise push_exception
+
+        return False
+
+    async def queue_push(
+        self,
+        queue_name: str,
+        item: bytes,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        return await self.push_items(
+            queue_name=queue_name,
+            items=[
+                item,
+            ],
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def queue_push_bulk(
+        self,
+        queue_name: str,
+        items: typing.Iterable[bytes],
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        return await self.push_items(
+            queue_name=queue_name,
+            items=list(items),
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def queue_length(
+        self,
+        queue_name: str,
+        include_delayed: bool,
+    ) -> int:
+        if include_delayed:
+            queue_filter: typing.Dict[str, typing.Any] = {
+                'queue_name': queue_name,
+            }
+        else:
+            queue_filter = {
+                'queue_name': queue_name,
+                'priority': {
+                    '$lte': time.time(),
+                },
+            }
+
+        queue_lengths = await asyncio.gather(
+            *(
+                connection.sergeant.task_queue.count_documents(
+                    filter=queue_filter,
+                )
+                for connection in self.connections
+            )
+        )
+
+        return sum(queue_lengths)
+
+    async def queue_delete(
+        self,
+        queue_name: str,
+    ) -> bool:
+        delete_many_results = await asyncio.gather(
+            *(
+                connection.sergeant.task_queue.delete_many(
+                    filter={
+                        'queue_name': queue_name,
+                    },
+                )
+                for connection in self.connections
+            )
+        )
+
+        deleted_count = sum(
+            delete_many_result.deleted_count
+            for delete_many_result in delete_many_results
+        )
+
+        return deleted_count > 0
+
+    def lock(
+        self,
+        name: str,
+    ) -> Lock:
+        key_server_location = self.key_placement.get_node_index(
+            key=name,
+        )
+        connection = self.connections[key_server_location]
+
+        return Lock(
+            locks_collection=connection.sergeant.locks,
+            name=name,
+        )
+
+    async def close(
+        self,
+    ) -> None:
+        for connection in self.connections:
+            connection.close()
@@ -0,0 +1,683 @@
+import asyncio
+import functools
+import redis.asyncio
+import time
+import typing
+
+from . import _connector
+from . import node_selector
+from . import placement
+from . import redis_scripts
+
+
+class Lock(
+    _connector.AsyncLock,
+):
+    def __init__(
+        self,
+        redis_connection: redis.asyncio.Redis,
+        name: str,
+    ) -> None:
+        self.redis_connection = redis_connection
+        self.name = f'__lock__.{name}'
+
+        self.acquired = False
+
+    async def acquire(
+        self,
+        timeout: typing.Optional[float] = None,
+        check_interval: float = 1.0,
+        ttl: int = 60,
+    ) -> bool:
+        if timeout is not None:
+            time_to_stop = time.time() + timeout
+
+        while True:
+            if await self.redis_connection.set(
+                name=self.name,
+                value=b'',
+                nx=True,
+                ex=ttl,
+            ):
+                self.acquired = True
+
+                return True
+
+            if timeout is not None and time.time() > time_to_stop:
+                return False
+
+            await asyncio.sleep(check_interval)
+
+    async def release(
+        self,
+    ) -> bool:
+        if self.acquired:
+            keys_removed = await self.redis_connection.delete(self.name)
+
+            self.acquired = False
+
+            return keys_removed == 1
+        else:
+            return False
+
+    async def is_locked(
+        self,
+    ) -> bool:
+        number_of_existing_keys = await self.redis_connection.exists(self.name)
+
+        return number_of_existing_keys == 1
+
+    async def set_ttl(
+        self,
+        ttl: int,
+    ) -> bool:
+        timeout_was_set = await self.redis_connection.expire(
+            name=self.name,
+            time=ttl,
+        ) == 1
+
+        return timeout_was_set
+
+    async def get_ttl(
+        self,
+    ) -> typing.Optional[int]:
+        ttl_in_seconds = await self.redis_connection.ttl(
+            name=self.name,
+        )
+        if ttl_in_seconds >= 0:
+            return ttl_in_seconds
+        else:
+            return None
+
+
+class QueueRedis(
+    redis.asyncio.Redis,
+):
+    def __init__(
+        self,
+        *args: typing.Any,
+        visibility_timeout: typing.Optional[float] = None,
+        node_index: int = 0,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.visibility_timeout = visibility_timeout
+        self.node_index = node_index
+
+        self.queue_pop_script = self.register_script(
+            script=redis_scripts.queue_pop_script,
+        )
+        self.delayed_queue_pop_bulk_script = self.register_script(
+            script=redis_scripts.delayed_queue_pop_bulk_script,
+        )
+        self.reliable_queue_pop_bulk_script = self.register_script(
+            script=redis_scripts.reliable_queue_pop_bulk_script,
+        )
+
+    async def queue_length(
+        self,
+        queue_name: str,
+        include_delayed: bool,
+    ) -> int:
+        pipeline = self.pipeline()
+        pipeline.llen(
+            name=queue_name,
+        )
+
+        if include_delayed:
+            pipeline.zcard(
+                name=f'{queue_name}.delayed',
+            )
+        else:
+            pipeline.zcount(
+                name=f'{queue_name}.delayed',
+                min=0,
+                max=time.time(),
+            )
+
+        if self.visibility_timeout is not None:
+            pipeline.zcount(
+                name=f'{queue_name}.processing',
+                min=0,
+                max=time.time(),
+            )
+
+        return sum(await pipeline.execute())
+
+    async def queue_delete(
+        self,
+        queue_name: str,
+    ) -> int:
+        return await self.delete(
+            queue_name,
+            f'{queue_name}.delayed',
+            f'{queue_name}.processing',
+            f'{queue_name}.leases',
+        )
+
+    async def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        lease_ids: typing.List[int],
+    ) -> int:
+        pipeline = self.pipeline()
+        pipeline.zrem(
+            f'{queue_name}.processing',
+            *lease_ids,
+        )
+        pipeline.hdel(
+            f'{queue_name}.leases',
+            *lease_ids,
+        )
+        number_of_acknowledged_items, _ = await pipeline.execute()
+
+        return number_of_acknowledged_items
+
+    async def reliable_queue_pop_bulk(
+        self,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[typing.Any]:
+        now = time.time()
+
+        leased_items = await self.reliable_queue_pop_bulk_script(
+            keys=[
+                queue_name,
+                f'{queue_name}.delayed',
+                f'{queue_name}.processing',
+                f'{queue_name}.leases',
+                f'__lease_id__.{queue_name}',
+            ],
+            args=[
+                number_of_items,
+                now,
+                now + typing.cast(float, self.visibility_timeout),
+            ],
+        )
+
+        return [
+            _connector.LeasedItem(
+                item=item,
+                node_index=self.node_index,
+                lease_id=lease_id,
+            )
+            for lease_id, item in zip(
+                leased_items[::2],
+                leased_items[1::2],
+            )
+        ]
+
+    async def queue_push_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        if consumable_from is None:
+            if priority == 'HIGH':
+                return await self.lpush(queue_name, *items) > 0
+            else:
+                return await self.rpush(queue_name, *items) > 0
+        else:
+            number_of_added_items = await self.zadd(
+                name=f'{queue_name}.delayed',
+                mapping={
+                    item: consumable_from
+                    for item in items
+                },
+                nx=True,
+            )
+
+            return typing.cast(int, number_of_added_items) > 0
+
+    async def queue_pop(
+        self,
+        queue_name: str,
+    ) -> typing.Optional[typing.Any]:
+        if self.visibility_timeout is not None:
+            items = await self.reliable_queue_pop_bulk(
+                queue_name=queue_name,
+                number_of_items=1,
+            )
+            if items:
+                return items[0]
+            else:
+                return None
+
+        return await self.queue_pop_script(
+            keys=[
+                queue_name,
+                f'{queue_name}.delayed',
+            ],
+            args=[
+                time.time(),
+            ],
+        )
+
+    async def queue_pop_bulk(
+        self,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[typing.Any]:
+        if self.visibility_timeout is not None:
+            return await self.reliable_queue_pop_bulk(
+                queue_name=queue_name,
+                number_of_items=number_of_items,
+            )
+
+        popped_items = await self.lpop(
+            name=queue_name,
+            count=number_of_items,
+        )
+        items = typing.cast(typing.List[typing.Any], popped_items or [])
+
+        if len(items) == number_of_items:
+            return items
+        else:
+            delayed_items_to_pull = number_of_items - len(items)
+            delayed_items = await self.delayed_queue_pop_bulk_script(
+                keys=[
+                    f'{queue_name}.delayed',
+                ],
+                args=[
+                    delayed_items_to_pull,
+                    time.time(),
+                ],
+            )
+
+            return items + delayed_items
+
+
+class Connector(
+    _connector.AsyncConnector,
+):
+    def __init__(
+        self,
+        nodes: typing.List[typing.Dict[str, typing.Any]],
+        visibility_timeout: typing.Optional[float] = None,
+        key_placement: str = 'modulo',
+        virtual_nodes: int = 160,
+        node_selection: str = 'round_robin',
+        node_selection_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> None:
+        self.reliable = visibility_timeout is not None
+
+        self.connections = [
+            QueueRedis(
+                visibility_timeout=visibility_timeout,
+                node_index=node_index,
+                host=node['host'],
+                port=node['port'],
+                password=node['password'],
+                db=node['database'],
+                retry_on_timeout=True,
+                socket_keepalive=True,
+                socket_connect_timeout=10,
+                socket_timeout=60,
+                single_connection_client=False,
+            )
+            for node_index, node in enumerate(nodes)
+        ]
+        self.number_of_connections = len(self.connections)
+
+        node_names = [
+            f'{node["host"]}:{node["port"]}/{node["database"]}'
+            for node in nodes
+        ]
+        self.key_placement = placement.create_placement(
+            key_placement=key_placement,
+            node_names=node_names,
+            virtual_nodes=virtual_nodes,
+        )
+        self.node_selector = node_selector.create_node_selector(
+            node_selection=node_selection,
+            number_of_nodes=self.number_of_connections,
+            node_selection_params=node_selection_params,
+        )
+
+    def group_keys_by_connection(
+        self,
+        keys: typing.Iterable[str],
+    ) -> typing.Dict[int, typing.List[str]]:
+        keys_by_connection: typing.Dict[int, typing.List[str]] = {}
+        for key in keys:
+            key_server_location = self.key_placement.get_node_index(
+                key=key,
+            )
+            keys_by_connection.setdefault(key_server_location, []).append(key)
+
+        return keys_by_connection
+
+    async def key_set(
+        self,
+        key: str,
+        value: bytes,
+    ) -> bool:
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
+
+        old_value = await self.connections[key_server_location].getset(
+            name=key,
+            value=value,
+        )
+
+        return old_value is None
+
+    async def key_get(
+        self,
+        key: str,
+    ) -> typing.Optional[bytes]:
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
+
+        value = await self.connections[key_server_location].get(
+            name=key,
+        )
+
+        return typing.cast(typing.Optional[bytes], value)
+
+    async def key_delete(
+        self,
+        key: str,
+    ) -> bool:
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
+
+        return await self.connections[key_server_location].delete(key) > 0
+
+    async def set_keys_on_connection(
+        self,
+        connection: QueueRedis,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        pipeline = connection.pipeline(
+            transaction=False,
+        )
+        for key, value in items.items():
+            pipeline.getset(
+                name=key,
+                value=value,
+            )
+
+        return sum(
+            1
+            for old_value in await pipeline.execute()
+            if old_value is None
+        )
+
+    async def key_set_bulk(
+        self,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=items.keys(),
+        )
+
+        results = await asyncio.gather(
+            *(
+                self.set_keys_on_connection(
+                    connection=self.connections[key_server_location],
+                    items={
+                        key: items[key]
+                        for key in keys
+                    },
+                )
+                for key_server_location, keys in keys_by_connection.items()
+            )
+        )
+
+        return sum(results)
+
+    async def key_get_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> typing.List[typing.Optional[bytes]]:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=keys,
+        )
+
+        results = await asyncio.gather(
+            *(
+                self.connections[key_server_location].mget(
+                    keys=connection_keys,
+                )
+                for key_server_location, connection_keys in keys_by_connection.items()
+            )
+        )
+
+        values: typing.Dict[str, typing.Optional[bytes]] = {}
+        for connection_keys, connection_values in zip(
+            keys_by_connection.values(),
+            results,
+        ):
+            values.update(
+                zip(
+                    connection_keys,
+                    typing.cast(typing.List[typing.Optional[bytes]], connection_values),
+                )
+            )
+
+        return [
+            values[key]
+            for key in keys
+        ]
+
+    async def key_delete_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> int:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=keys,
+        )
+
+        results = await asyncio.gather(
+            *(
+                self.connections[key_server_location].delete(*connection_keys)
+                for key_server_location, connection_keys in keys_by_connection.items()
+            )
+        )
+
+        return sum(results)
+
+    async def queue_pop(
+        self,
+        queue_name: str,
+    ) -> typing.Optional[bytes]:
+        items = await self.queue_pop_bulk(
+            queue_name=queue_name,
+            number_of_items=1,
+        )
+        if items:
+            return items[0]
+        else:
+            return None
+
+    async def queue_pop_bulk(
+        self,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[bytes]:
+        items: typing.List[bytes] = []
+        pop_exception: typing.Optional[BaseException] = None
+
+        for node_index in self.node_selector.get_pop_node_indices(
+            queue_name=queue_name,
+        ):
+            try:
+                node_items = await self.node_selector.execute_async(
+                    node_index=node_index,
+                    function=functools.partial(
+                        self.connections[node_index].queue_pop_bulk,
+                        queue_name=queue_name,
+                        number_of_items=number_of_items - len(items),
+                    ),
+                )
+            except Exception as exception:
+                pop_exception = exception
+
+                continue
+
+            self.node_selector.record_pop(
+                node_index=node_index,
+                queue_name=queue_name,
+                number_of_items=len(node_items),
+            )
+            items += node_items
+            if len(items) == number_of_items:
+                break
+
+        if not items and pop_exception is not None:
+            raise pop_exception
+
+        return items
+
+    async def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+    ) -> bool:
+        if not self.reliable:
+            return False
+
+        lease_ids_by_connection: typing.Dict[int, typing.List[int]] = {}
+        for item in items:
+            if isinstance(item, _connector.LeasedItem):
+                lease_ids_by_connection.setdefault(item.node_index, []).append(item.lease_id)
+
+        results = await asyncio.gather(
+            *(
+                self.connections[node_index].queue_acknowledge_bulk(
+                    queue_name=queue_name,
+                    lease_ids=lease_ids,
+                )
+                for node_index, lease_ids in lease_ids_by_connection.items()
+            )
+        )
+
+        return sum(results) > 0
+
+    async def push_items(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+        priority: str,
+        consumable_from: typing.Optional[float],
+    ) -> bool:
+        push_exception: typing.Optional[BaseException] = None
+
+        for node_index in self.node_selector.get_push_node_indices():
+            try:
+                pushed = await self.node_selector.execute_async(
+                    node_index=node_index,
+                    function=functools.partial(
+                        self.connections[node_index].queue_push_bulk,
+                        queue_name=queue_name,
+                        items=items,
+                        priority=priority,
+                        consumable_from=consumable_from,
+                    ),
+                )
+            except Exception as exception:
+                push_exception = exception
+
+                continue
+
+            self.node_selector.record_push(
+                node_index=node_index,
+                queue_name=queue_name,
+                number_of_items=len(items),
+            )
+
+            return pushed
+
+        if push_exception is not None:
+            raise push_exception
+
+        return False
+
+    async def queue_push(
+        self,
+        queue_name: str,
+        item: bytes,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        return await self.push_items(
+            queue_name=queue_name,
+            items=[
+                item,
+            ],
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def queue_push_bulk(
+        self,
+        queue_name: str,
+        items: typing.Iterable[bytes],
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        return await self.push_items(
+            queue_name=queue_name,
+            items=list(items),
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def queue_length(
+        self,
+        queue_name: str,
+        include_delayed: bool,
+    ) -> int:
+        results = await asyncio.gather(
+            *(
+                connection.queue_length(
+                    queue_name=queue_name,
+                    include_delayed=include_delayed,
+                )
+                for connection in self.connections
+            )
+        )
+
+        return sum(results)
+
+    async def queue_delete(
+        self,
+        queue_name: str,
+    ) -> bool:
+        results = await asyncio.gather(
+            *(
+                connection.queue_delete(
+                    queue_name=queue_name,
+                )
+                for connection in self.connections
+            )
+        )
+
+        return sum(results) > 0
+
+    def lock(
+        self,
+        name: str,
+    ) -> Lock:
+        key_server_location = self.key_placement.get_node_index(
+            key=name,
+        )
+        redis_connection = self.connections[key_server_location]
+
+        return Lock(
+            redis_connection=redis_connection,
+            name=name,
+        )
+
+    async def close(
+        self,
+    ) -> None:
+        for connection in self.connections:
+            await connection.connection_pool.disconnect()
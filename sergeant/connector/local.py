@@ -1,20 +1,26 @@
+import contextlib
 import math
+import os
 import sqlite3
+import threading
 import time
 import typing
 
 from . import _connector
 
 
+thread_connections = threading.local()
+
+
 class Lock(
     _connector.Lock,
 ):
     def __init__(
         self,
-        connection: sqlite3.Connection,
+        connector: 'Connector',
         name: str,
     ) -> None:
-        self.connection = connection
+        self.connector = connector
         self.name = name
 
         self.acquired = False
@@ -33,7 +39,7 @@ class Lock(
         while True:
             try:
                 expire_at = time.time() + ttl
-                self.connection.execute(
+                self.connector.connection.execute(
                     '''
                         INSERT INTO locks (name, expireAt)
                         VALUES(?, ?);
@@ -55,7 +61,7 @@ class Lock(
     def release(
         self,
     ) -> bool:
-        self.connection.execute(
+        self.connector.connection.execute(
             '''
                 DELETE FROM locks WHERE expireAt < ?;
             ''',
@@ -65,7 +71,7 @@ class Lock(
         )
 
         if self.acquired:
-            cursor = self.connection.execute(
+            cursor = self.connector.connection.execute(
                 '''
                     DELETE FROM locks WHERE name = ?;
                 ''',
@@ -82,7 +88,7 @@ class Lock(
     def is_locked(
         self,
     ) -> bool:
-        cursor = self.connection.execute(
+        cursor = self.connector.connection.execute(
             '''
                 SELECT * FROM locks
                 WHERE name = ? AND expireAt > ?;
@@ -104,7 +110,7 @@ class Lock(
         ttl: int,
     ) -> bool:
         now = time.time()
-        cursor = self.connection.execute(
+        cursor = self.connector.connection.execute(
             '''
                 UPDATE locks
                 SET expireAt = ?
@@ -123,7 +129,7 @@ class Lock(
         self,
     ) -> typing.Optional[int]:
         now = time.time()
-        cursor = self.connection.execute(
+        cursor = self.connector.connection.execute(
             '''
                 SELECT expireAt FROM locks
                 WHERE name = ?;
@@ -152,21 +158,17 @@ class Lock(
 class Connector(
     _connector.Connector,
 ):
+    max_variables_per_statement: int = 500
+    cached_statements: int = 256
+
     def __init__(
         self,
         file_path: str,
     ) -> None:
-        self.connection = sqlite3.connect(
-            database=file_path,
-            check_same_thread=False,
-            isolation_level=None,
-            timeout=10.0,
-        )
+        self.file_path = file_path
+
         self.connection.executescript(
             '''
-                PRAGMA journal_mode = OFF;
-                PRAGMA synchronous = FULL;
-
                 CREATE TABLE IF NOT EXISTS task_queue (queue_name TEXT, priority REAL, value BLOB);
                 CREATE INDEX IF NOT EXISTS queue_by_priority ON task_queue (queue_name, priority);
 
@@ -178,6 +180,53 @@ class Connector(
                 CREATE INDEX IF NOT EXISTS lock_by_expireAt ON locks (expireAt);
             '''
         )
+        self.queue_push_condition = threading.Condition()
+
+    @property
+    def connection(
+        self,
+    ) -> sqlite3.Connection:
+        connections = getattr(thread_connections, 'connections', None)
+        if connections is None or thread_connections.pid != os.getpid():
+            connections = {}
+            thread_connections.connections = connections
+            thread_connections.pid = os.getpid()
+
+        connection = connections.get(self.file_path)
+        if connection is not None:
+            return connection
+
+        connection = sqlite3.connect(
+            database=self.file_path,
+            isolation_level=None,
+            timeout=10.0,
+            cached_statements=self.cached_statements,
+        )
+        connection.executescript(
+            '''
+                PRAGMA journal_mode = WAL;
+                PRAGMA synchronous = NORMAL;
+            '''
+        )
+        connections[self.file_path] = connection
+
+        return connection
+
+    @contextlib.contextmanager
+    def immediate_transaction(
+        self,
+    ) -> typing.Iterator[sqlite3.Connection]:
+        connection = self.connection
+
+        connection.execute('BEGIN IMMEDIATE;')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK;')
+
+            raise
+
+        connection.execute('COMMIT;')
 
     def key_set(
         self,
@@ -246,63 +295,160 @@ class Connector(
 
         return cursor.rowcount == 1
 
+    def key_set_bulk(
+        self,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        with self.immediate_transaction() as connection:
+            cursor = connection.executemany(
+                '''
+                    INSERT OR IGNORE INTO keys (name, value)
+                    VALUES(?, ?);
+                ''',
+                items.items(),
+            )
+            number_of_new_keys = cursor.rowcount
+
+            connection.executemany(
+                '''
+                    UPDATE keys
+                    SET value = ?
+                    WHERE name = ?;
+                ''',
+                (
+                    (
+                        value,
+                        key,
+                    )
+                    for key, value in items.items()
+                ),
+            )
+
+        return number_of_new_keys
+
+    def key_get_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> typing.List[typing.Optional[bytes]]:
+        values: typing.Dict[str, bytes] = {}
+        for chunk_start in range(0, len(keys), self.max_variables_per_statement):
+            keys_chunk = keys[chunk_start:chunk_start + self.max_variables_per_statement]
+            cursor = self.connection.execute(
+                f'''
+                    SELECT name, value FROM keys WHERE name IN ({', '.join('?' * len(keys_chunk))});
+                ''',
+                keys_chunk,
+            )
+            values.update(cursor.fetchall())
+
+        return [
+            values.get(key)
+            for key in keys
+        ]
+
+    def key_delete_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> int:
+        deleted_count = 0
+        for chunk_start in range(0, len(keys), self.max_variables_per_statement):
+            keys_chunk = keys[chunk_start:chunk_start + self.max_variables_per_statement]
+            cursor = self.connection.execute(
+                f'''
+                    DELETE FROM keys WHERE name IN ({', '.join('?' * len(keys_chunk))});
+                ''',
+                keys_chunk,
+            )
+            deleted_count += cursor.rowcount
+
+        return deleted_count
+
+    def key_migrate(
+        self,
+        batch_size: int = 1000,
+    ) -> int:
+        return 0
+
     def queue_pop(
         self,
         queue_name: str,
     ) -> typing.Optional[bytes]:
-        cursor = self.connection.execute(
-            '''
-                DELETE FROM task_queue
-                WHERE rowid in (
-                    SELECT rowid FROM task_queue
-                    WHERE queue_name = ? AND priority <= ?
-                    LIMIT 1
-                )
-                RETURNING value;
-            ''',
-            (
-                queue_name,
-                time.time(),
-            ),
+        items = self.queue_pop_bulk(
+            queue_name=queue_name,
+            number_of_items=1,
         )
-
-        result = cursor.fetchone()
-        if result is None:
-            return None
+        if items:
+            return items[0]
         else:
-            return result[0]
+            return None
 
     def queue_pop_bulk(
         self,
         queue_name: str,
         number_of_items: int,
     ) -> typing.List[bytes]:
-        cursor = self.connection.execute(
-            '''
-                DELETE FROM task_queue
-                WHERE rowid in (
-                    SELECT rowid FROM task_queue
+        with self.immediate_transaction() as connection:
+            rows = connection.execute(
+                '''
+                    SELECT rowid, value FROM task_queue
                     WHERE queue_name = ? AND priority <= ?
-                    LIMIT ?
-                )
-                RETURNING value;
-            ''',
-            (
-                queue_name,
-                time.time(),
-                number_of_items,
-            ),
-        )
+                    ORDER BY priority
+                    LIMIT ?;
+                ''',
+                (
+                    queue_name,
+                    time.time(),
+                    number_of_items,
+                ),
+            ).fetchall()
+            connection.executemany(
+                '''
+                    DELETE FROM task_queue WHERE rowid = ?;
+                ''',
+                (
+                    (
+                        rowid,
+                    )
+                    for rowid, _ in rows
+                ),
+            )
+
+        return [
+            value
+            for _, value in rows
+        ]
+
+    def queue_pop_bulk_blocking(
+        self,
+        queue_name: str,
+        number_of_items: int,
+        timeout: float,
+    ) -> typing.List[bytes]:
+        time_to_stop = time.time() + timeout
 
-        results = []
         while True:
-            result = cursor.fetchone()
-            if result is None:
-                break
+            items = self.queue_pop_bulk(
+                queue_name=queue_name,
+                number_of_items=number_of_items,
+            )
+            if items:
+                return items
+
+            time_left = time_to_stop - time.time()
+            if time_left <= 0:
+                return []
 
-            results.append(result[0])
+            with self.queue_push_condition:
+                self.queue_push_condition.wait(
+                    timeout=min(time_left, 0.05),
+                )
 
-        return results
+    def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+    ) -> bool:
+        return False
 
     def queue_push(
         self,
@@ -332,6 +478,9 @@ class Connector(
             ),
         )
 
+        with self.queue_push_condition:
+            self.queue_push_condition.notify_all()
+
         return cursor.rowcount == 0
 
     def queue_push_bulk(
@@ -350,20 +499,24 @@ class Connector(
         else:
             priority_value = 1.0
 
-        cursor = self.connection.executemany(
-            '''
-                INSERT INTO task_queue (queue_name, priority, value)
-                VALUES(?, ?, ?);
-            ''',
-            (
+        with self.immediate_transaction() as connection:
+            cursor = connection.executemany(
+                '''
+                    INSERT INTO task_queue (queue_name, priority, value)
+                    VALUES(?, ?, ?);
+                ''',
                 (
-                    queue_name,
-                    priority_value,
-                    item,
-                )
-                for item in items
-            ),
-        )
+                    (
+                        queue_name,
+                        priority_value,
+                        item,
+                    )
+                    for item in items
+                ),
+            )
+
+        with self.queue_push_condition:
+            self.queue_push_condition.notify_all()
 
         return cursor.rowcount > 0
 
@@ -420,6 +573,6 @@ class Connector(
         name: str,
     ) -> Lock:
         return Lock(
-            connection=self.connection,
+            connector=self,
             name=name,
         )
@@ -1,14 +1,18 @@
-import binascii
+import concurrent.futures
 import datetime
+import functools
 import math
 import pymongo
+import pymongo.change_stream
 import pymongo.collection
 import pymongo.errors
-import random
+import threading
 import time
 import typing
 
 from . import _connector
+from . import node_selector
+from . import placement
 
 
 class Lock(
@@ -130,6 +134,10 @@ class Connector(
     def __init__(
         self,
         nodes: typing.List[typing.Dict[str, typing.Any]],
+        key_placement: str = 'modulo',
+        virtual_nodes: int = 160,
+        node_selection: str = 'round_robin',
+        node_selection_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
     ) -> None:
         self.connections = []
 
@@ -202,23 +210,30 @@ class Connector(
             )
 
         self.number_of_connections = len(self.connections)
-        self.current_connection_index = random.randint(0, self.number_of_connections - 1)
 
-    @property
-    def next_connection(
-        self,
-    ) -> pymongo.MongoClient:
-        current_connection = self.connections[self.current_connection_index]
-        self.current_connection_index = (self.current_connection_index + 1) % self.number_of_connections
-
-        return current_connection
+        node_names = [
+            f'{node["host"]}:{node["port"]}'
+            for node in nodes
+        ]
+        self.key_placement = placement.create_placement(
+            key_placement=key_placement,
+            node_names=node_names,
+            virtual_nodes=virtual_nodes,
+        )
+        self.node_selector = node_selector.create_node_selector(
+            node_selection=node_selection,
+            number_of_nodes=self.number_of_connections,
+            node_selection_params=node_selection_params,
+        )
 
     def key_set(
         self,
         key: str,
         value: bytes,
     ) -> bool:
-        key_server_location = binascii.crc32(key.encode()) % self.number_of_connections
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
 
         update_one_result = self.connections[key_server_location].sergeant.keys.update_one(
             filter={
@@ -241,7 +256,9 @@ class Connector(
         self,
         key: str,
     ) -> typing.Optional[bytes]:
-        key_server_location = binascii.crc32(key.encode()) % self.number_of_connections
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
 
         document = self.connections[key_server_location].sergeant.keys.find_one(
             filter={
@@ -257,7 +274,9 @@ class Connector(
         self,
         key: str,
     ) -> bool:
-        key_server_location = binascii.crc32(key.encode()) % self.number_of_connections
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
 
         delete_one_result = self.connections[key_server_location].sergeant.keys.delete_one(
             filter={
@@ -267,94 +286,412 @@ class Connector(
 
         return delete_one_result.deleted_count > 0
 
-    def queue_pop(
+    def group_keys_by_connection(
         self,
-        queue_name: str,
-    ) -> typing.Optional[bytes]:
-        for i in range(self.number_of_connections):
-            document = self.next_connection.sergeant.task_queue.find_one_and_delete(
+        keys: typing.Iterable[str],
+    ) -> typing.Dict[int, typing.List[str]]:
+        keys_by_connection: typing.Dict[int, typing.List[str]] = {}
+        for key in keys:
+            key_server_location = self.key_placement.get_node_index(
+                key=key,
+            )
+            keys_by_connection.setdefault(key_server_location, []).append(key)
+
+        return keys_by_connection
+
+    def key_set_bulk(
+        self,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=items.keys(),
+        )
+
+        number_of_new_keys = 0
+        for key_server_location, keys in keys_by_connection.items():
+            bulk_write_result = self.connections[key_server_location].sergeant.keys.bulk_write(
+                requests=[
+                    pymongo.UpdateOne(
+                        filter={
+                            'key': key,
+                        },
+                        update={
+                            '$set': {
+                                'key': key,
+                                'value': items[key],
+                            },
+                        },
+                        upsert=True,
+                    )
+                    for key in keys
+                ],
+                ordered=False,
+            )
+            number_of_new_keys += bulk_write_result.upserted_count
+
+        return number_of_new_keys
+
+    def key_get_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> typing.List[typing.Optional[bytes]]:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=keys,
+        )
+
+        values: typing.Dict[str, bytes] = {}
+        for key_server_location, connection_keys in keys_by_connection.items():
+            documents = self.connections[key_server_location].sergeant.keys.find(
                 filter={
-                    'queue_name': queue_name,
-                    'priority': {
-                        '$lte': time.time(),
+                    'key': {
+                        '$in': connection_keys,
                     },
                 },
                 projection={
+                    'key': 1,
                     'value': 1,
                 },
-                sort=[
-                    (
-                        'priority',
-                        pymongo.ASCENDING,
-                    ),
+            )
+            for document in documents:
+                values[document['key']] = document['value']
+
+        return [
+            values.get(key)
+            for key in keys
+        ]
+
+    def key_delete_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> int:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=keys,
+        )
+
+        deleted_count = 0
+        for key_server_location, connection_keys in keys_by_connection.items():
+            delete_many_result = self.connections[key_server_location].sergeant.keys.delete_many(
+                filter={
+                    'key': {
+                        '$in': connection_keys,
+                    },
+                },
+            )
+            deleted_count += delete_many_result.deleted_count
+
+        return deleted_count
+
+    def migrate_keys_from_connection(
+        self,
+        connection: pymongo.MongoClient,
+        documents: typing.List[typing.Dict[str, typing.Any]],
+    ) -> int:
+        documents_by_connection: typing.Dict[int, typing.List[typing.Dict[str, typing.Any]]] = {}
+        for document in documents:
+            key_server_location = self.key_placement.get_node_index(
+                key=document['key'],
+            )
+            documents_by_connection.setdefault(key_server_location, []).append(document)
+
+        for key_server_location, connection_documents in documents_by_connection.items():
+            self.connections[key_server_location].sergeant.keys.bulk_write(
+                requests=[
+                    pymongo.UpdateOne(
+                        filter={
+                            'key': document['key'],
+                        },
+                        update={
+                            '$setOnInsert': {
+                                'key': document['key'],
+                                'value': document['value'],
+                            },
+                        },
+                        upsert=True,
+                    )
+                    for document in connection_documents
                 ],
+                ordered=False,
             )
-            if document:
-                return document['value']
 
-        return None
+        connection.sergeant.keys.delete_many(
+            filter={
+                '_id': {
+                    '$in': [
+                        document['_id']
+                        for document in documents
+                    ],
+                },
+            },
+        )
 
-    def queue_pop_bulk(
+        return len(documents)
+
+    def key_migrate(
+        self,
+        batch_size: int = 1000,
+    ) -> int:
+        number_of_migrated_keys = 0
+
+        for connection_index, connection in enumerate(self.connections):
+            documents_to_migrate = []
+            documents = connection.sergeant.keys.find(
+                filter={},
+                projection={
+                    '_id': 1,
+                    'key': 1,
+                    'value': 1,
+                },
+                batch_size=batch_size,
+            )
+            for document in documents:
+                key_server_location = self.key_placement.get_node_index(
+                    key=document['key'],
+                )
+                if key_server_location == connection_index:
+                    continue
+
+                documents_to_migrate.append(document)
+                if len(documents_to_migrate) == batch_size:
+                    number_of_migrated_keys += self.migrate_keys_from_connection(
+                        connection=connection,
+                        documents=documents_to_migrate,
+                    )
+                    documents_to_migrate = []
+
+            if documents_to_migrate:
+                number_of_migrated_keys += self.migrate_keys_from_connection(
+                    connection=connection,
+                    documents=documents_to_migrate,
+                )
+
+        return number_of_migrated_keys
+
+    def pop_from_connection(
         self,
+        connection: pymongo.MongoClient,
+        queue_name: str,
+    ) -> typing.Optional[bytes]:
+        document = connection.sergeant.task_queue.find_one_and_delete(
+            filter={
+                'queue_name': queue_name,
+                'priority': {
+                    '$lte': time.time(),
+                },
+            },
+            projection={
+                'value': 1,
+            },
+            sort=[
+                (
+                    'priority',
+                    pymongo.ASCENDING,
+                ),
+            ],
+        )
+        if document:
+            return document['value']
+        else:
+            return None
+
+    def pop_bulk_from_connection(
+        self,
+        connection: pymongo.MongoClient,
         queue_name: str,
         number_of_items: int,
     ) -> typing.List[bytes]:
         values = []
-        current_count = number_of_items
 
-        for i in range(self.number_of_connections):
-            connection = self.next_connection
-            with connection.start_session() as mongo_session:
-                with mongo_session.start_transaction():
-                    results_cursor = connection.sergeant.task_queue.find(
-                        filter={
-                            'queue_name': queue_name,
-                            'priority': {
-                                '$lte': time.time(),
-                            },
+        with connection.start_session() as mongo_session:
+            with mongo_session.start_transaction():
+                results_cursor = connection.sergeant.task_queue.find(
+                    filter={
+                        'queue_name': queue_name,
+                        'priority': {
+                            '$lte': time.time(),
                         },
-                        projection={
-                            '_id': 1,
-                            'value': 1,
+                    },
+                    projection={
+                        '_id': 1,
+                        'value': 1,
+                    },
+                    sort=[
+                        (
+                            'priority',
+                            pymongo.ASCENDING,
+                        ),
+                    ],
+                    session=mongo_session,
+                ).limit(
+                    limit=number_of_items,
+                )
+
+                ids = []
+                for result in results_cursor:
+                    ids.append(result['_id'])
+                    values.append(result['value'])
+
+                connection.sergeant.task_queue.delete_many(
+                    filter={
+                        '_id': {
+                            '$in': ids,
                         },
-                        sort=[
-                            (
-                                'priority',
-                                pymongo.ASCENDING,
-                            ),
-                        ],
-                        session=mongo_session,
-                    ).limit(
-                        limit=current_count,
-                    )
+                    },
+                    session=mongo_session,
+                )
 
-                    ids = []
-                    for result in results_cursor:
-                        ids.append(result['_id'])
-                        values.append(result['value'])
+        return values
 
-                    connection.sergeant.task_queue.delete_many(
-                        filter={
-                            '_id': {
-                                '$in': ids,
+    def queue_pop(
+        self,
+        queue_name: str,
+    ) -> typing.Optional[bytes]:
+        for node_index in self.node_selector.get_pop_node_indices(
+            queue_name=queue_name,
+        ):
+            value = self.node_selector.execute(
+                node_index=node_index,
+                function=functools.partial(
+                    self.pop_from_connection,
+                    connection=self.connections[node_index],
+                    queue_name=queue_name,
+                ),
+            )
+            self.node_selector.record_pop(
+                node_index=node_index,
+                queue_name=queue_name,
+                number_of_items=1 if value else 0,
+            )
+            if value:
+                return value
+
+        return None
+
+    def queue_pop_bulk(
+        self,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[bytes]:
+        values: typing.List[bytes] = []
+
+        for node_index in self.node_selector.get_pop_node_indices(
+            queue_name=queue_name,
+        ):
+            node_values = self.node_selector.execute(
+                node_index=node_index,
+                function=functools.partial(
+                    self.pop_bulk_from_connection,
+                    connection=self.connections[node_index],
+                    queue_name=queue_name,
+                    number_of_items=number_of_items - len(values),
+                ),
+            )
+            self.node_selector.record_pop(
+                node_index=node_index,
+                queue_name=queue_name,
+                number_of_items=len(node_values),
+            )
+
+            values += node_values
+            if len(values) == number_of_items:
+                return values
+
+        return values
+
+    def wait_for_queue_push(
+        self,
+        change_stream: pymongo.change_stream.CollectionChangeStream,
+        item_was_pushed: threading.Event,
+        time_to_stop: float,
+    ) -> None:
+        while not item_was_pushed.is_set() and time.time() < time_to_stop:
+            if change_stream.try_next() is not None:
+                item_was_pushed.set()
+
+    def queue_pop_bulk_blocking(
+        self,
+        queue_name: str,
+        number_of_items: int,
+        timeout: float,
+    ) -> typing.List[bytes]:
+        items = self.queue_pop_bulk(
+            queue_name=queue_name,
+            number_of_items=number_of_items,
+        )
+        if items:
+            return items
+
+        change_streams = [
+            connection.sergeant.task_queue.watch(
+                pipeline=[
+                    {
+                        '$match': {
+                            'operationType': 'insert',
+                            'fullDocument.queue_name': queue_name,
+                            'fullDocument.priority': {
+                                '$lte': time.time(),
                             },
                         },
-                        session=mongo_session,
+                    },
+                ],
+                max_await_time_ms=100,
+            )
+            for connection in self.connections
+        ]
+
+        try:
+            items = self.queue_pop_bulk(
+                queue_name=queue_name,
+                number_of_items=number_of_items,
+            )
+            if items:
+                return items
+
+            item_was_pushed = threading.Event()
+            time_to_stop = time.time() + timeout
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.number_of_connections,
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.wait_for_queue_push,
+                        change_stream=change_stream,
+                        item_was_pushed=item_was_pushed,
+                        time_to_stop=time_to_stop,
                     )
+                    for change_stream in change_streams
+                ]
+                item_was_pushed.wait(
+                    timeout=timeout,
+                )
 
-            if len(values) == number_of_items:
-                return values
+            for future in futures:
+                future.result()
+        finally:
+            for change_stream in change_streams:
+                change_stream.close()
 
-            current_count = number_of_items - len(values)
+        if item_was_pushed.is_set():
+            return self.queue_pop_bulk(
+                queue_name=queue_name,
+                number_of_items=number_of_items,
+            )
+        else:
+            return []
 
-        return values
+    def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+    ) -> bool:
+        return False
 
-    def queue_push(
+    def push_items(
         self,
         queue_name: str,
-        item: bytes,
-        priority: str = 'NORMAL',
-        consumable_from: typing.Optional[float] = None,
+        items: typing.List[bytes],
+        priority: str,
+        consumable_from: typing.Optional[float],
     ) -> bool:
         if consumable_from is not None:
             priority_value = consumable_from
@@ -365,45 +702,74 @@ class Connector(
         else:
             priority_value = 1.0
 
-        insert_one_result = self.next_connection.sergeant.task_queue.insert_one(
-            document={
+        documents = [
+            {
                 'queue_name': queue_name,
                 'priority': priority_value,
                 'value': item,
             }
-        )
+            for item in items
+        ]
 
-        return insert_one_result.acknowledged
+        push_exception: typing.Optional[BaseException] = None
 
-    def queue_push_bulk(
+        for node_index in self.node_selector.get_push_node_indices():
+            try:
+                insert_many_result = self.node_selector.execute(
+                    node_index=node_index,
+                    function=functools.partial(
+                        self.connections[node_index].sergeant.task_queue.insert_many,
+                        documents=documents,
+                        ordered=False,
+                    ),
+                )
+            except Exception as exception:
+                push_exception = exception
+
+                continue
+
+            self.node_selector.record_push(
+                node_index=node_index,
+                queue_name=queue_name,
+                number_of_items=len(items),
+            )
+
+            return insert_many_result.acknowledged
+
+        if push_exception is not None:
+            raise push_exception
+
+        return False
+
+    def queue_push(
         self,
         queue_name: str,
-        items: typing.Iterable[bytes],
+        item: bytes,
         priority: str = 'NORMAL',
         consumable_from: typing.Optional[float] = None,
     ) -> bool:
-        if consumable_from is not None:
-            priority_value = consumable_from
-        elif priority == 'HIGH':
-            priority_value = 0.0
-        elif priority == 'NORMAL':
-            priority_value = 1.0
-        else:
-            priority_value = 1.0
-
-        insert_many_result = self.next_connection.sergeant.task_queue.insert_many(
-            documents=[
-                {
-                    'queue_name': queue_name,
-                    'priority': priority_value,
-                    'value': item,
-                }
-                for item in items
+        return self.push_items(
+            queue_name=queue_name,
+            items=[
+                item,
             ],
-            ordered=False,
+            priority=priority,
+            consumable_from=consumable_from,
         )
 
-        return insert_many_result.acknowledged
+    def queue_push_bulk(
+        self,
+        queue_name: str,
+        items: typing.Iterable[bytes],
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        return self.push_items(
+            queue_name=queue_name,
+            items=list(items),
+            priority=priority,
+            consumable_from=consumable_from,
+        )
 
     def queue_length(
         self,
@@ -412,15 +778,15 @@ class Connector(
     ) -> int:
         queue_length = 0
 
-        for i in range(self.number_of_connections):
+        for connection in self.connections:
             if include_delayed:
-                queue_length += self.next_connection.sergeant.task_queue.count_documents(
+                queue_length += connection.sergeant.task_queue.count_documents(
                     filter={
                         'queue_name': queue_name,
                     },
                 )
             else:
-                queue_length += self.next_connection.sergeant.task_queue.count_documents(
+                queue_length += connection.sergeant.task_queue.count_documents(
                     filter={
                         'queue_name': queue_name,
                         'priority': {
@@ -451,7 +817,9 @@ class Connector(
         self,
         name: str,
     ) -> Lock:
-        key_server_location = binascii.crc32(name.encode()) % self.number_of_connections
+        key_server_location = self.key_placement.get_node_index(
+            key=name,
+        )
         connection = self.connections[key_server_location]
 
         return Lock(
@@ -0,0 +1,367 @@
+import random
+import threading
+import time
+import typing
+
+
+class NodeSelector:
+    name: str
+
+    def __init__(
+        self,
+        number_of_nodes: int,
+    ) -> None:
+        self.number_of_nodes = number_of_nodes
+
+    def get_push_node_indices(
+        self,
+    ) -> typing.List[int]:
+        raise NotImplementedError()
+
+    def get_pop_node_indices(
+        self,
+        queue_name: str,
+    ) -> typing.List[int]:
+        raise NotImplementedError()
+
+    def record_latency(
+        self,
+        node_index: int,
+        latency: float,
+    ) -> None:
+        raise NotImplementedError()
+
+    def record_failure(
+        self,
+        node_index: int,
+    ) -> None:
+        raise NotImplementedError()
+
+    def record_push(
+        self,
+        node_index: int,
+        queue_name: str,
+        number_of_items: int,
+    ) -> None:
+        raise NotImplementedError()
+
+    def record_pop(
+        self,
+        node_index: int,
+        queue_name: str,
+        number_of_items: int,
+    ) -> None:
+        raise NotImplementedError()
+
+    def record_queue_length(
+        self,
+        node_index: int,
+        queue_name: str,
+        queue_length: int,
+    ) -> None:
+        raise NotImplementedError()
+
+    def execute(
+        self,
+        node_index: int,
+        function: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        start_time = time.perf_counter()
+
+        try:
+            result = function()
+        except Exception:
+            self.record_failure(
+                node_index=node_index,
+            )
+
+            raise
+
+        self.record_latency(
+            node_index=node_index,
+            latency=time.perf_counter() - start_time,
+        )
+
+        return result
+
+    async def execute_async(
+        self,
+        node_index: int,
+        function: typing.Callable[[], typing.Awaitable[typing.Any]],
+    ) -> typing.Any:
+        start_time = time.perf_counter()
+
+        try:
+            result = await function()
+        except Exception:
+            self.record_failure(
+                node_index=node_index,
+            )
+
+            raise
+
+        self.record_latency(
+            node_index=node_index,
+            latency=time.perf_counter() - start_time,
+        )
+
+        return result
+
+
+class RoundRobinNodeSelector(
+    NodeSelector,
+):
+    name: str = 'round_robin'
+
+    def __init__(
+        self,
+        number_of_nodes: int,
+    ) -> None:
+        super().__init__(
+            number_of_nodes=number_of_nodes,
+        )
+
+        self.current_node_index = random.randint(0, self.number_of_nodes - 1)
+
+    def get_next_node_index(
+        self,
+    ) -> int:
+        current_node_index = self.current_node_index
+        self.current_node_index = (self.current_node_index + 1) % self.number_of_nodes
+
+        return current_node_index
+
+    def get_push_node_indices(
+        self,
+    ) -> typing.List[int]:
+        return [
+            self.get_next_node_index(),
+        ]
+
+    def get_pop_node_indices(
+        self,
+        queue_name: str,
+    ) -> typing.List[int]:
+        first_node_index = self.get_next_node_index()
+
+        return list(range(first_node_index, self.number_of_nodes)) + list(range(0, first_node_index))
+
+    def record_latency(
+        self,
+        node_index: int,
+        latency: float,
+    ) -> None:
+        pass
+
+    def record_failure(
+        self,
+        node_index: int,
+    ) -> None:
+        pass
+
+    def record_push(
+        self,
+        node_index: int,
+        queue_name: str,
+        number_of_items: int,
+    ) -> None:
+        pass
+
+    def record_pop(
+        self,
+        node_index: int,
+        queue_name: str,
+        number_of_items: int,
+    ) -> None:
+        pass
+
+    def record_queue_length(
+        self,
+        node_index: int,
+        queue_name: str,
+        queue_length: int,
+    ) -> None:
+        pass
+
+
+class HealthAwareNodeSelector(
+    NodeSelector,
+):
+    name: str = 'health_aware'
+
+    def __init__(
+        self,
+        number_of_nodes: int,
+        latency_smoothing: float = 0.2,
+        failure_threshold: int = 3,
+        circuit_breaker_timeout: float = 10.0,
+        empty_pop_backoff: float = 1.0,
+        minimum_latency: float = 0.0005,
+    ) -> None:
+        super().__init__(
+            number_of_nodes=number_of_nodes,
+        )
+
+        self.latency_smoothing = latency_smoothing
+        self.failure_threshold = failure_threshold
+        self.circuit_breaker_timeout = circuit_breaker_timeout
+        self.empty_pop_backoff = empty_pop_backoff
+        self.minimum_latency = minimum_latency
+
+        self.latencies = [0.0] * self.number_of_nodes
+        self.consecutive_failures = [0] * self.number_of_nodes
+        self.circuit_open_until = [0.0] * self.number_of_nodes
+        self.queue_lengths: typing.Dict[str, typing.List[int]] = {}
+        self.empty_until: typing.Dict[str, typing.List[float]] = {}
+
+        self.lock = threading.Lock()
+
+    def get_available_node_indices(
+        self,
+    ) -> typing.List[int]:
+        now = time.monotonic()
+
+        available_node_indices = [
+            node_index
+            for node_index in range(self.number_of_nodes)
+            if self.circuit_open_until[node_index] <= now
+        ]
+        if not available_node_indices:
+            return list(range(self.number_of_nodes))
+
+        return available_node_indices
+
+    def get_push_node_indices(
+        self,
+    ) -> typing.List[int]:
+        with self.lock:
+            available_node_indices = self.get_available_node_indices()
+            weights = [
+                1.0 / max(self.latencies[node_index], self.minimum_latency)
+                for node_index in available_node_indices
+            ]
+            fallback_node_indices = sorted(
+                available_node_indices,
+                key=self.latencies.__getitem__,
+            )
+
+        first_node_index = random.choices(
+            population=available_node_indices,
+            weights=weights,
+        )[0]
+        fallback_node_indices.remove(first_node_index)
+
+        return [first_node_index] + fallback_node_indices
+
+    def get_pop_node_indices(
+        self,
+        queue_name: str,
+    ) -> typing.List[int]:
+        now = time.monotonic()
+
+        with self.lock:
+            available_node_indices = self.get_available_node_indices()
+
+            empty_until = self.empty_until.get(queue_name)
+            if empty_until is not None:
+                non_empty_node_indices = [
+                    node_index
+                    for node_index in available_node_indices
+                    if empty_until[node_index] <= now
+                ]
+                if non_empty_node_indices:
+                    available_node_indices = non_empty_node_indices
+
+            queue_lengths = self.queue_lengths.get(queue_name)
+
+        random.shuffle(available_node_indices)
+        if queue_lengths is not None:
+            available_node_indices.sort(
+                key=queue_lengths.__getitem__,
+                reverse=True,
+            )
+
+        return available_node_indices
+
+    def record_latency(
+        self,
+        node_index: int,
+        latency: float,
+    ) -> None:
+        with self.lock:
+            if self.latencies[node_index] == 0.0:
+                self.latencies[node_index] = latency
+            else:
+                self.latencies[node_index] += self.latency_smoothing * (latency - self.latencies[node_index])
+
+            self.consecutive_failures[node_index] = 0
+            self.circuit_open_until[node_index] = 0.0
+
+    def record_failure(
+        self,
+        node_index: int,
+    ) -> None:
+        with self.lock:
+            self.consecutive_failures[node_index] += 1
+            if self.consecutive_failures[node_index] >= self.failure_threshold:
+                self.circuit_open_until[node_index] = time.monotonic() + self.circuit_breaker_timeout
+
+    def record_push(
+        self,
+        node_index: int,
+        queue_name: str,
+        number_of_items: int,
+    ) -> None:
+        with self.lock:
+            self.queue_lengths.setdefault(queue_name, [0] * self.number_of_nodes)[node_index] += number_of_items
+            self.empty_until.setdefault(queue_name, [0.0] * self.number_of_nodes)[node_index] = 0.0
+
+    def record_pop(
+        self,
+        node_index: int,
+        queue_name: str,
+        number_of_items: int,
+    ) -> None:
+        with self.lock:
+            queue_lengths = self.queue_lengths.setdefault(queue_name, [0] * self.number_of_nodes)
+            empty_until = self.empty_until.setdefault(queue_name, [0.0] * self.number_of_nodes)
+
+            if number_of_items == 0:
+                queue_lengths[node_index] = 0
+                empty_until[node_index] = time.monotonic() + self.empty_pop_backoff
+            else:
+                queue_lengths[node_index] = max(queue_lengths[node_index] - number_of_items, 0)
+                empty_until[node_index] = 0.0
+
+    def record_queue_length(
+        self,
+        node_index: int,
+        queue_name: str,
+        queue_length: int,
+    ) -> None:
+        with self.lock:
+            self.queue_lengths.setdefault(queue_name, [0] * self.number_of_nodes)[node_index] = queue_length
+
+            empty_until = self.empty_until.setdefault(queue_name, [0.0] * self.number_of_nodes)
+            if queue_length == 0:
+                empty_until[node_index] = time.monotonic() + self.empty_pop_backoff
+            else:
+                empty_until[node_index] = 0.0
+
+
+def create_node_selector(
+    node_selection: str,
+    number_of_nodes: int,
+    node_selection_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+) -> NodeSelector:
+    if node_selection == 'round_robin':
+        return RoundRobinNodeSelector(
+            number_of_nodes=number_of_nodes,
+        )
+    elif node_selection == 'health_aware':
+        return HealthAwareNodeSelector(
+            number_of_nodes=number_of_nodes,
+            **(node_selection_params or {}),
+        )
+    else:
+        raise ValueError(f'node selection {node_selection} is not supported')
@@ -0,0 +1,112 @@
+import binascii
+import bisect
+import hashlib
+import typing
+
+
+class Placement:
+    name: str
+
+    def __init__(
+        self,
+        node_names: typing.List[str],
+    ) -> None:
+        self.node_names = node_names
+        self.number_of_nodes = len(node_names)
+
+    def get_node_index(
+        self,
+        key: str,
+    ) -> int:
+        raise NotImplementedError()
+
+
+class ModuloPlacement(
+    Placement,
+):
+    name: str = 'modulo'
+
+    def get_node_index(
+        self,
+        key: str,
+    ) -> int:
+        return binascii.crc32(key.encode()) % self.number_of_nodes
+
+
+class ConsistentHashingPlacement(
+    Placement,
+):
+    name: str = 'consistent_hashing'
+
+    def __init__(
+        self,
+        node_names: typing.List[str],
+        virtual_nodes: int = 160,
+    ) -> None:
+        super().__init__(
+            node_names=node_names,
+        )
+
+        ring = sorted(
+            (
+                self.hash(
+                    value=f'{node_name}#{virtual_node}',
+                ),
+                node_index,
+            )
+            for node_index, node_name in enumerate(node_names)
+            for virtual_node in range(virtual_nodes)
+        )
+        self.ring_hashes = [
+            ring_hash
+            for ring_hash, node_index in ring
+        ]
+        self.ring_node_indices = [
+            node_index
+            for ring_hash, node_index in ring
+        ]
+
+    def hash(
+        self,
+        value: str,
+    ) -> int:
+        return int.from_bytes(
+            bytes=hashlib.blake2b(
+                value.encode(),
+                digest_size=8,
+            ).digest(),
+            byteorder='big',
+        )
+
+    def get_node_index(
+        self,
+        key: str,
+    ) -> int:
+        ring_position = bisect.bisect(
+            self.ring_hashes,
+            self.hash(
+                value=key,
+            ),
+        )
+        if ring_position == len(self.ring_hashes):
+            ring_position = 0
+
+        return self.ring_node_indices[ring_position]
+
+
+def create_placement(
+    key_placement: str,
+    node_names: typing.List[str],
+    virtual_nodes: int = 160,
+) -> Placement:
+    if key_placement == 'modulo':
+        return ModuloPlacement(
+            node_names=node_names,
+        )
+    elif key_placement == 'consistent_hashing':
+        return ConsistentHashingPlacement(
+            node_names=node_names,
+            virtual_nodes=virtual_nodes,
+        )
+    else:
+        raise ValueError(f'key placement {key_placement} is not supported')
@@ -1,10 +1,15 @@
-import binascii
-import random
+import concurrent.futures
+import functools
+import os
 import redis
+import threading
 import time
 import typing
 
 from . import _connector
+from . import node_selector
+from . import placement
+from . import redis_scripts
 
 
 class Lock(
@@ -98,23 +103,26 @@ class QueueRedis(
     def __init__(
         self,
         *args: typing.Any,
+        visibility_timeout: typing.Optional[float] = None,
+        node_index: int = 0,
         **kwargs: typing.Any,
     ) -> None:
         super().__init__(*args, **kwargs)
 
-        self.delayed_queue_pop_bulk_script = self.register_script(
-            script='''
-                local number_of_items_to_pop = tonumber(ARGV[1])
-
-                local zpopped_items = redis.call("ZRANGEBYSCORE", KEYS[1], 0, ARGV[2], "LIMIT", 0, number_of_items_to_pop)
+        self.visibility_timeout = visibility_timeout
+        self.node_index = node_index
 
-                local zset_number_of_elements = table.getn(zpopped_items)
-                if zset_number_of_elements > 0 then
-                    redis.call("ZREMRANGEBYRANK", KEYS[1], 0, zset_number_of_elements - 1)
-                end
-
-                return zpopped_items
-            ''',
+        self.queue_pop_script = self.register_script(
+            script=redis_scripts.queue_pop_script,
+        )
+        self.delayed_queue_pop_bulk_script = self.register_script(
+            script=redis_scripts.delayed_queue_pop_bulk_script,
+        )
+        self.reliable_queue_pop_bulk_script = self.register_script(
+            script=redis_scripts.reliable_queue_pop_bulk_script,
+        )
+        self.lease_items_script = self.register_script(
+            script=redis_scripts.lease_items_script,
         )
 
     def queue_length(
@@ -138,6 +146,13 @@ class QueueRedis(
                 max=time.time(),
             )
 
+        if self.visibility_timeout is not None:
+            pipeline.zcount(
+                name=f'{queue_name}.processing',
+                min=0,
+                max=time.time(),
+            )
+
         return sum(pipeline.execute())
 
     def queue_delete(
@@ -147,44 +162,160 @@ class QueueRedis(
         return self.delete(
             queue_name,
             f'{queue_name}.delayed',
+            f'{queue_name}.processing',
+            f'{queue_name}.leases',
         )
 
-    def queue_pop(
+    def queue_acknowledge_bulk(
         self,
         queue_name: str,
-    ) -> typing.Optional[typing.Any]:
-        item = self.lpop(
-            name=queue_name,
+        lease_ids: typing.List[int],
+    ) -> int:
+        pipeline = self.pipeline()
+        pipeline.zrem(
+            f'{queue_name}.processing',
+            *lease_ids,
+        )
+        pipeline.hdel(
+            f'{queue_name}.leases',
+            *lease_ids,
         )
-        if item:
-            return item
+        number_of_acknowledged_items, _ = pipeline.execute()
+
+        return number_of_acknowledged_items
+
+    def create_leased_items(
+        self,
+        leased_items: typing.List[typing.Any],
+    ) -> typing.List[_connector.LeasedItem]:
+        return [
+            _connector.LeasedItem(
+                item=item,
+                node_index=self.node_index,
+                lease_id=lease_id,
+            )
+            for lease_id, item in zip(
+                leased_items[::2],
+                leased_items[1::2],
+            )
+        ]
 
-        result = self.zpopmin(
-            name=f'{queue_name}.delayed',
-            count=1,
+    def reliable_queue_pop_bulk(
+        self,
+        queue_name: str,
+        number_of_items: int,
+    ) -> typing.List[typing.Any]:
+        now = time.time()
+
+        return self.create_leased_items(
+            leased_items=self.reliable_queue_pop_bulk_script(
+                keys=[
+                    queue_name,
+                    f'{queue_name}.delayed',
+                    f'{queue_name}.processing',
+                    f'{queue_name}.leases',
+                    f'__lease_id__.{queue_name}',
+                ],
+                args=[
+                    number_of_items,
+                    now,
+                    now + typing.cast(float, self.visibility_timeout),
+                ],
+            ),
         )
-        if not result:
-            return None
-        else:
-            delayed_item, delayed_item_score = result[0]
 
-        if delayed_item_score <= time.time():
-            return delayed_item
+    def queue_push_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> bool:
+        if consumable_from is None:
+            if priority == 'HIGH':
+                return self.lpush(queue_name, *items) > 0
+            else:
+                return self.rpush(queue_name, *items) > 0
         else:
-            self.zadd(
+            return self.zadd(
                 name=f'{queue_name}.delayed',
                 mapping={
-                    delayed_item: delayed_item_score,
+                    item: consumable_from
+                    for item in items
                 },
+                nx=True,
+            ) > 0
+
+    def queue_pop(
+        self,
+        queue_name: str,
+    ) -> typing.Optional[typing.Any]:
+        if self.visibility_timeout is not None:
+            items = self.reliable_queue_pop_bulk(
+                queue_name=queue_name,
+                number_of_items=1,
             )
+            if items:
+                return items[0]
+            else:
+                return None
+
+        return self.queue_pop_script(
+            keys=[
+                queue_name,
+                f'{queue_name}.delayed',
+            ],
+            args=[
+                time.time(),
+            ],
+        )
 
+    def queue_pop_blocking(
+        self,
+        queue_name: str,
+        timeout: float,
+    ) -> typing.Optional[typing.Any]:
+        result = self.blpop(
+            keys=[
+                queue_name,
+            ],
+            timeout=timeout,
+        )
+        if not result:
             return None
 
+        list_name, item = result
+
+        if self.visibility_timeout is not None:
+            leased_items = self.create_leased_items(
+                leased_items=self.lease_items_script(
+                    keys=[
+                        f'{queue_name}.processing',
+                        f'{queue_name}.leases',
+                        f'__lease_id__.{queue_name}',
+                    ],
+                    args=[
+                        time.time() + self.visibility_timeout,
+                        item,
+                    ],
+                ),
+            )
+
+            return leased_items[0]
+
+        return item
+
     def queue_pop_bulk(
         self,
         queue_name: str,
         number_of_items: int,
     ) -> typing.List[typing.Any]:
+        if self.visibility_timeout is not None:
+            return self.reliable_queue_pop_bulk(
+                queue_name=queue_name,
+                number_of_items=number_of_items,
+            )
+
         items = self.lpop(
             name=queue_name,
             count=number_of_items,
@@ -210,12 +341,23 @@ class QueueRedis(
 class Connector(
     _connector.Connector,
 ):
+    max_parallel_operations_per_node: int = 8
+
     def __init__(
         self,
         nodes: typing.List[typing.Dict[str, typing.Any]],
+        visibility_timeout: typing.Optional[float] = None,
+        key_placement: str = 'modulo',
+        virtual_nodes: int = 160,
+        node_selection: str = 'round_robin',
+        node_selection_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
     ) -> None:
+        self.reliable = visibility_timeout is not None
+
         self.connections = [
             QueueRedis(
+                visibility_timeout=visibility_timeout,
+                node_index=node_index,
                 host=node['host'],
                 port=node['port'],
                 password=node['password'],
@@ -226,26 +368,82 @@ class Connector(
                 socket_timeout=60,
                 single_connection_client=False,
             )
-            for node in nodes
+            for node_index, node in enumerate(nodes)
         ]
         self.number_of_connections = len(self.connections)
-        self.current_connection_index = random.randint(0, self.number_of_connections - 1)
 
-    @property
-    def next_connection(
+        self.executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.executor_pid = os.getpid()
+        self.executor_lock = threading.Lock()
+
+        node_names = [
+            f'{node["host"]}:{node["port"]}/{node["database"]}'
+            for node in nodes
+        ]
+        self.key_placement = placement.create_placement(
+            key_placement=key_placement,
+            node_names=node_names,
+            virtual_nodes=virtual_nodes,
+        )
+        self.node_selector = node_selector.create_node_selector(
+            node_selection=node_selection,
+            number_of_nodes=self.number_of_connections,
+            node_selection_params=node_selection_params,
+        )
+
+    def execute_in_parallel(
         self,
-    ) -> QueueRedis:
-        current_connection = self.connections[self.current_connection_index]
-        self.current_connection_index = (self.current_connection_index + 1) % self.number_of_connections
+        functions: typing.Sequence[typing.Callable[[], typing.Any]],
+    ) -> typing.List[concurrent.futures.Future]:
+        if not functions:
+            return []
+
+        first_function, *other_functions = functions
 
-        return current_connection
+        other_futures = []
+        if other_functions:
+            executor = self.get_executor()
+            other_futures = [
+                executor.submit(function)
+                for function in other_functions
+            ]
+
+        first_future: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            first_future.set_result(first_function())
+        except Exception as exception:
+            first_future.set_exception(exception)
+
+        concurrent.futures.wait(
+            fs=other_futures,
+        )
+
+        return [
+            first_future,
+            *other_futures,
+        ]
+
+    def get_executor(
+        self,
+    ) -> concurrent.futures.ThreadPoolExecutor:
+        with self.executor_lock:
+            if self.executor is None or self.executor_pid != os.getpid():
+                self.executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.number_of_connections * self.max_parallel_operations_per_node,
+                    thread_name_prefix='sergeant_redis_connector',
+                )
+                self.executor_pid = os.getpid()
+
+            return self.executor
 
     def key_set(
         self,
         key: str,
         value: bytes,
     ) -> bool:
-        key_server_location = binascii.crc32(key.encode()) % self.number_of_connections
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
 
         old_value = self.connections[key_server_location].getset(
             name=key,
@@ -258,7 +456,9 @@ class Connector(
         self,
         key: str,
     ) -> typing.Optional[bytes]:
-        key_server_location = binascii.crc32(key.encode()) % self.number_of_connections
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
 
         return self.connections[key_server_location].get(
             name=key,
@@ -268,21 +468,235 @@ class Connector(
         self,
         key: str,
     ) -> bool:
-        key_server_location = binascii.crc32(key.encode()) % self.number_of_connections
+        key_server_location = self.key_placement.get_node_index(
+            key=key,
+        )
 
         return self.connections[key_server_location].delete(key) > 0
 
+    def group_keys_by_connection(
+        self,
+        keys: typing.Iterable[str],
+    ) -> typing.Dict[int, typing.List[str]]:
+        keys_by_connection: typing.Dict[int, typing.List[str]] = {}
+        for key in keys:
+            key_server_location = self.key_placement.get_node_index(
+                key=key,
+            )
+            keys_by_connection.setdefault(key_server_location, []).append(key)
+
+        return keys_by_connection
+
+    def set_keys_on_connection(
+        self,
+        connection: QueueRedis,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        pipeline = connection.pipeline(
+            transaction=False,
+        )
+        for key, value in items.items():
+            pipeline.getset(
+                name=key,
+                value=value,
+            )
+
+        return sum(
+            1
+            for old_value in pipeline.execute()
+            if old_value is None
+        )
+
+    def key_set_bulk(
+        self,
+        items: typing.Dict[str, bytes],
+    ) -> int:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=items.keys(),
+        )
+
+        futures = self.execute_in_parallel(
+            functions=[
+                functools.partial(
+                    self.set_keys_on_connection,
+                    connection=self.connections[key_server_location],
+                    items={
+                        key: items[key]
+                        for key in keys
+                    },
+                )
+                for key_server_location, keys in keys_by_connection.items()
+            ],
+        )
+
+        return sum(
+            future.result()
+            for future in futures
+        )
+
+    def key_get_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> typing.List[typing.Optional[bytes]]:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=keys,
+        )
+
+        futures = self.execute_in_parallel(
+            functions=[
+                functools.partial(
+                    self.connections[key_server_location].mget,
+                    keys=connection_keys,
+                )
+                for key_server_location, connection_keys in keys_by_connection.items()
+            ],
+        )
+
+        values: typing.Dict[str, typing.Optional[bytes]] = {}
+        for connection_keys, future in zip(
+            keys_by_connection.values(),
+            futures,
+        ):
+            values.update(
+                zip(
+                    connection_keys,
+                    future.result(),
+                )
+            )
+
+        return [
+            values[key]
+            for key in keys
+        ]
+
+    def key_delete_bulk(
+        self,
+        keys: typing.List[str],
+    ) -> int:
+        keys_by_connection = self.group_keys_by_connection(
+            keys=keys,
+        )
+
+        futures = self.execute_in_parallel(
+            functions=[
+                functools.partial(
+                    self.connections[key_server_location].delete,
+                    *connection_keys,
+                )
+                for key_server_location, connection_keys in keys_by_connection.items()
+            ],
+        )
+
+        return sum(
+            future.result()
+            for future in futures
+        )
+
+    def migrate_keys_from_connection(
+        self,
+        connection: QueueRedis,
+        keys: typing.List[str],
+    ) -> int:
+        items_by_connection: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+        for key, value in zip(keys, connection.mget(keys)):
+            if value is None:
+                continue
+
+            key_server_location = self.key_placement.get_node_index(
+                key=key,
+            )
+            items_by_connection.setdefault(key_server_location, {})[key] = value
+
+        for key_server_location, items in items_by_connection.items():
+            pipeline = self.connections[key_server_location].pipeline(
+                transaction=False,
+            )
+            for key, value in items.items():
+                pipeline.set(
+                    name=key,
+                    value=value,
+                    nx=True,
+                )
+            pipeline.execute()
+
+        connection.delete(*keys)
+
+        return sum(
+            len(items)
+            for items in items_by_connection.values()
+        )
+
+    def key_migrate(
+        self,
+        batch_size: int = 1000,
+    ) -> int:
+        number_of_migrated_keys = 0
+
+        for connection_index, connection in enumerate(self.connections):
+            keys_to_migrate = []
+            for key in connection.scan_iter(
+                count=batch_size,
+                _type='STRING',
+            ):
+                key = key.decode()
+                if key.startswith('__lock__.') or key.startswith('__lease_id__.'):
+                    continue
+
+                key_server_location = self.key_placement.get_node_index(
+                    key=key,
+                )
+                if key_server_location == connection_index:
+                    continue
+
+                keys_to_migrate.append(key)
+                if len(keys_to_migrate) == batch_size:
+                    number_of_migrated_keys += self.migrate_keys_from_connection(
+                        connection=connection,
+                        keys=keys_to_migrate,
+                    )
+                    keys_to_migrate = []
+
+            if keys_to_migrate:
+                number_of_migrated_keys += self.migrate_keys_from_connection(
+                    connection=connection,
+                    keys=keys_to_migrate,
+                )
+
+        return number_of_migrated_keys
+
     def queue_pop(
         self,
         queue_name: str,
     ) -> typing.Optional[bytes]:
-        for i in range(self.number_of_connections):
-            item = self.next_connection.queue_pop(
+        pop_exception: typing.Optional[BaseException] = None
+
+        for node_index in self.node_selector.get_pop_node_indices(
+            queue_name=queue_name,
+        ):
+            try:
+                item = self.node_selector.execute(
+                    node_index=node_index,
+                    function=functools.partial(
+                        self.connections[node_index].queue_pop,
+                        queue_name=queue_name,
+                    ),
+                )
+            except Exception as exception:
+                pop_exception = exception
+
+                continue
+
+            self.node_selector.record_pop(
+                node_index=node_index,
                 queue_name=queue_name,
+                number_of_items=1 if item else 0,
             )
             if item:
                 return item
 
+        if pop_exception is not None:
+            raise pop_exception
+
         return None
 
     def queue_pop_bulk(
@@ -290,21 +704,265 @@ class Connector(
         queue_name: str,
         number_of_items: int,
     ) -> typing.List[bytes]:
-        items = []
-        current_count = number_of_items
+        items: typing.List[bytes] = []
+        pop_exception: typing.Optional[BaseException] = None
+
+        node_indices = self.node_selector.get_pop_node_indices(
+            queue_name=queue_name,
+        )
+
+        first_node_future, *queue_length_futures = self.execute_in_parallel(
+            functions=[
+                functools.partial(
+                    self.node_selector.execute,
+                    node_index=node_indices[0],
+                    function=functools.partial(
+                        self.connections[node_indices[0]].queue_pop_bulk,
+                        queue_name=queue_name,
+                        number_of_items=number_of_items,
+                    ),
+                ),
+            ] + [
+                functools.partial(
+                    self.node_selector.execute,
+                    node_index=node_index,
+                    function=functools.partial(
+                        self.connections[node_index].queue_length,
+                        queue_name=queue_name,
+                        include_delayed=False,
+                    ),
+                )
+                for node_index in node_indices[1:]
+            ],
+        )
+
+        if first_node_future.exception() is None:
+            items += first_node_future.result()
+            self.node_selector.record_pop(
+                node_index=node_indices[0],
+                queue_name=queue_name,
+                number_of_items=len(items),
+            )
+        else:
+            pop_exception = first_node_future.exception()
+
+        number_of_items_left = number_of_items - len(items)
+        pop_node_indices = []
+        pop_functions = []
+        for node_index, queue_length_future in zip(
+            node_indices[1:],
+            queue_length_futures,
+        ):
+            if queue_length_future.exception() is not None:
+                pop_exception = queue_length_future.exception()
 
-        for i in range(self.number_of_connections):
-            items += self.next_connection.queue_pop_bulk(
+                continue
+
+            self.node_selector.record_queue_length(
+                node_index=node_index,
                 queue_name=queue_name,
-                number_of_items=current_count,
+                queue_length=queue_length_future.result(),
+            )
+
+            number_of_items_to_pop = min(
+                queue_length_future.result(),
+                number_of_items_left,
             )
-            if len(items) == number_of_items:
-                return items
+            if number_of_items_to_pop > 0:
+                pop_node_indices.append(node_index)
+                pop_functions.append(
+                    functools.partial(
+                        self.node_selector.execute,
+                        node_index=node_index,
+                        function=functools.partial(
+                            self.connections[node_index].queue_pop_bulk,
+                            queue_name=queue_name,
+                            number_of_items=number_of_items_to_pop,
+                        ),
+                    )
+                )
+                number_of_items_left -= number_of_items_to_pop
+
+        if pop_functions:
+            for node_index, future in zip(
+                pop_node_indices,
+                self.execute_in_parallel(
+                    functions=pop_functions,
+                ),
+            ):
+                if future.exception() is None:
+                    items += future.result()
+                    self.node_selector.record_pop(
+                        node_index=node_index,
+                        queue_name=queue_name,
+                        number_of_items=len(future.result()),
+                    )
+                else:
+                    pop_exception = future.exception()
 
-            current_count = number_of_items - len(items)
+        if not items and pop_exception is not None:
+            raise pop_exception
 
         return items
 
+    def queue_pop_bulk_blocking(
+        self,
+        queue_name: str,
+        number_of_items: int,
+        timeout: float,
+    ) -> typing.List[bytes]:
+        items = self.queue_pop_bulk(
+            queue_name=queue_name,
+            number_of_items=number_of_items,
+        )
+        if items:
+            return items
+
+        if self.number_of_connections == 1:
+            item = self.connections[0].queue_pop_blocking(
+                queue_name=queue_name,
+                timeout=timeout,
+            )
+            if item:
+                return [item]
+            else:
+                return []
+
+        blocking_connections = [
+            QueueRedis(
+                visibility_timeout=connection.visibility_timeout,
+                node_index=connection.node_index,
+                connection_pool=connection.connection_pool,
+                single_connection_client=True,
+            )
+            for connection in self.connections
+        ]
+
+        try:
+            blocking_connection_ids = [
+                blocking_connection.client_id()
+                for blocking_connection in blocking_connections
+            ]
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.number_of_connections,
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        blocking_connection.queue_pop_blocking,
+                        queue_name=queue_name,
+                        timeout=timeout,
+                    )
+                    for blocking_connection in blocking_connections
+                ]
+                concurrent.futures.wait(
+                    fs=futures,
+                    timeout=None,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+
+                for connection, blocking_connection_id, future in zip(
+                    self.connections,
+                    blocking_connection_ids,
+                    futures,
+                ):
+                    while not future.done():
+                        connection.client_unblock(
+                            client_id=blocking_connection_id,
+                        )
+                        concurrent.futures.wait(
+                            fs=[
+                                future,
+                            ],
+                            timeout=0.01,
+                        )
+        finally:
+            for blocking_connection in blocking_connections:
+                blocking_connection.close()
+
+        items = []
+        for future in futures:
+            if future.exception() is None:
+                item = future.result()
+                if item:
+                    items.append(item)
+
+        if not items:
+            for future in futures:
+                future.result()
+
+        return items
+
+    def queue_acknowledge_bulk(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+    ) -> bool:
+        if not self.reliable:
+            return False
+
+        lease_ids_by_connection: typing.Dict[int, typing.List[int]] = {}
+        for item in items:
+            if isinstance(item, _connector.LeasedItem):
+                lease_ids_by_connection.setdefault(item.node_index, []).append(item.lease_id)
+
+        futures = self.execute_in_parallel(
+            functions=[
+                functools.partial(
+                    self.connections[node_index].queue_acknowledge_bulk,
+                    queue_name=queue_name,
+                    lease_ids=lease_ids,
+                )
+                for node_index, lease_ids in lease_ids_by_connection.items()
+            ],
+        )
+
+        acknowledged_count = sum(
+            future.result()
+            for future in futures
+        )
+
+        return acknowledged_count > 0
+
+    def push_items(
+        self,
+        queue_name: str,
+        items: typing.List[bytes],
+        priority: str,
+        consumable_from: typing.Optional[float],
+    ) -> bool:
+        push_exception: typing.Optional[BaseException] = None
+
+        for node_index in self.node_selector.get_push_node_indices():
+            try:
+                pushed = self.node_selector.execute(
+                    node_index=node_index,
+                    function=functools.partial(
+                        self.connections[node_index].queue_push_bulk,
+                        queue_name=queue_name,
+                        items=items,
+                        priority=priority,
+                        consumable_from=consumable_from,
+                    ),
+                )
+            except Exception as exception:
+                push_exception = exception
+
+                continue
+
+            self.node_selector.record_push(
+                node_index=node_index,
+                queue_name=queue_name,
+                number_of_items=len(items),
+            )
+
+            return pushed
+
+        if push_exception is not None:
+            raise push_exception
+
+        return False
+
     def queue_push(
         self,
         queue_name: str,
@@ -312,19 +970,14 @@ class Connector(
         priority: str = 'NORMAL',
         consumable_from: typing.Optional[float] = None,
     ) -> bool:
-        if consumable_from is None:
-            if priority == 'HIGH':
-                return self.next_connection.lpush(queue_name, item) > 0
-            else:
-                return self.next_connection.rpush(queue_name, item) > 0
-        else:
-            return self.next_connection.zadd(
-                name=f'{queue_name}.delayed',
-                mapping={
-                    item: consumable_from,
-                },
-                nx=True,
-            ) > 0
+        return self.push_items(
+            queue_name=queue_name,
+            items=[
+                item,
+            ],
+            priority=priority,
+            consumable_from=consumable_from,
+        )
 
     def queue_push_bulk(
         self,
@@ -333,46 +986,52 @@ class Connector(
         priority: str = 'NORMAL',
         consumable_from: typing.Optional[float] = None,
     ) -> bool:
-        if consumable_from is None:
-            if priority == 'HIGH':
-                return self.next_connection.lpush(queue_name, *items) > 0
-            else:
-                return self.next_connection.rpush(queue_name, *items) > 0
-        else:
-            return self.next_connection.zadd(
-                name=f'{queue_name}.delayed',
-                mapping={
-                    item: consumable_from
-                    for item in items
-                },
-                nx=True,
-            ) > 0
+        return self.push_items(
+            queue_name=queue_name,
+            items=list(items),
+            priority=priority,
+            consumable_from=consumable_from,
+        )
 
     def queue_length(
         self,
         queue_name: str,
         include_delayed: bool,
     ) -> int:
-        queue_length = 0
-
-        for connection in self.connections:
-            queue_length += connection.queue_length(
-                queue_name=queue_name,
-                include_delayed=include_delayed,
-            )
+        futures = self.execute_in_parallel(
+            functions=[
+                functools.partial(
+                    connection.queue_length,
+                    queue_name=queue_name,
+                    include_delayed=include_delayed,
+                )
+                for connection in self.connections
+            ],
+        )
 
-        return queue_length
+        return sum(
+            future.result()
+            for future in futures
+        )
 
     def queue_delete(
         self,
         queue_name: str,
     ) -> bool:
-        deleted_count = 0
+        futures = self.execute_in_parallel(
+            functions=[
+                functools.partial(
+                    connection.queue_delete,
+                    queue_name=queue_name,
+                )
+                for connection in self.connections
+            ],
+        )
 
-        for connection in self.connections:
-            deleted_count += connection.queue_delete(
-                queue_name=queue_name,
-            )
+        deleted_count = sum(
+            future.result()
+            for future in futures
+        )
 
         return deleted_count > 0
 
@@ -380,7 +1039,9 @@ class Connector(
         self,
         name: str,
     ) -> Lock:
-        key_server_location = binascii.crc32(name.encode()) % self.number_of_connections
+        key_server_location = self.key_placement.get_node_index(
+            key=name,
+        )
         redis_connection = self.connections[key_server_location]
 
         return Lock(
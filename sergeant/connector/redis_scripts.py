@@ -0,0 +1,92 @@
+queue_pop_script = '''
+    local item = redis.call("LPOP", KEYS[1])
+    if item then
+        return item
+    end
+
+    local zpopped_items = redis.call("ZRANGEBYSCORE", KEYS[2], 0, ARGV[1], "LIMIT", 0, 1)
+    if table.getn(zpopped_items) > 0 then
+        redis.call("ZREM", KEYS[2], zpopped_items[1])
+
+        return zpopped_items[1]
+    end
+
+    return nil
+'''
+
+delayed_queue_pop_bulk_script = '''
+    local number_of_items_to_pop = tonumber(ARGV[1])
+
+    local zpopped_items = redis.call("ZRANGEBYSCORE", KEYS[1], 0, ARGV[2], "LIMIT", 0, number_of_items_to_pop)
+
+    local zset_number_of_elements = table.getn(zpopped_items)
+    if zset_number_of_elements > 0 then
+        redis.call("ZREMRANGEBYRANK", KEYS[1], 0, zset_number_of_elements - 1)
+    end
+
+    return zpopped_items
+'''
+
+reliable_queue_pop_bulk_script = '''
+    local number_of_items_to_pop = tonumber(ARGV[1])
+    local items = {}
+
+    local expired_lease_ids = redis.call("ZRANGEBYSCORE", KEYS[3], 0, ARGV[2], "LIMIT", 0, number_of_items_to_pop)
+    if table.getn(expired_lease_ids) > 0 then
+        local expired_items = redis.call("HMGET", KEYS[4], unpack(expired_lease_ids))
+        for index = 1, table.getn(expired_lease_ids) do
+            if expired_items[index] then
+                table.insert(items, expired_items[index])
+            end
+        end
+
+        redis.call("ZREM", KEYS[3], unpack(expired_lease_ids))
+        redis.call("HDEL", KEYS[4], unpack(expired_lease_ids))
+    end
+
+    if table.getn(items) < number_of_items_to_pop then
+        local lpopped_items = redis.call("LPOP", KEYS[1], number_of_items_to_pop - table.getn(items))
+        if lpopped_items then
+            for _, item in ipairs(lpopped_items) do
+                table.insert(items, item)
+            end
+        end
+    end
+
+    if table.getn(items) < number_of_items_to_pop then
+        local zpopped_items = redis.call("ZRANGEBYSCORE", KEYS[2], 0, ARGV[2], "LIMIT", 0, number_of_items_to_pop - table.getn(items))
+
+        local zset_number_of_elements = table.getn(zpopped_items)
+        if zset_number_of_elements > 0 then
+            redis.call("ZREMRANGEBYRANK", KEYS[2], 0, zset_number_of_elements - 1)
+
+            for _, item in ipairs(zpopped_items) do
+                table.insert(items, item)
+            end
+        end
+    end
+
+    local leased_items = {}
+    for _, item in ipairs(items) do
+        local lease_id = redis.call("INCR", KEYS[5])
+        redis.call("ZADD", KEYS[3], ARGV[3], lease_id)
+        redis.call("HSET", KEYS[4], lease_id, item)
+        table.insert(leased_items, lease_id)
+        table.insert(leased_items, item)
+    end
+
+    return leased_items
+'''
+
+lease_items_script = '''
+    local leased_items = {}
+    for index = 2, table.getn(ARGV) do
+        local lease_id = redis.call("INCR", KEYS[3])
+        redis.call("ZADD", KEYS[1], ARGV[1], lease_id)
+        redis.call("HSET", KEYS[2], lease_id, ARGV[index])
+        table.insert(leased_items, lease_id)
+        table.insert(leased_items, ARGV[index])
+    end
+
+    return leased_items
+'''
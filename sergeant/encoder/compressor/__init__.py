@@ -1,5 +1,7 @@
 from . import _compressor
 from . import bzip2
 from . import gzip
+from . import lz4
 from . import lzma
 from . import zlib
+from . import zstd
@@ -1,5 +1,6 @@
 class Compressor:
     name: str
+    id: int
 
     def compress(
         self,
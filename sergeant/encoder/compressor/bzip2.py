@@ -7,6 +7,7 @@ class Compressor(
     _compressor.Compressor,
 ):
     name: str = 'bzip2'
+    id: int = 1
 
     def compress(
         self,
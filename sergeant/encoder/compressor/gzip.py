@@ -7,6 +7,7 @@ class Compressor(
     _compressor.Compressor,
 ):
     name: str = 'gzip'
+    id: int = 2
 
     def compress(
         self,
@@ -0,0 +1,59 @@
+import threading
+
+from . import _compressor
+
+
+class Compressor(
+    _compressor.Compressor,
+):
+    name: str = 'lz4'
+    id: int = 6
+
+    def __init__(
+        self,
+        level: int = 0,
+    ) -> None:
+        import lz4.frame
+
+        self.lz4_frame = lz4.frame
+        self.level = level
+        self.contexts = threading.local()
+
+    def compress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        compression_context = getattr(self.contexts, 'compressor', None)
+        if compression_context is None:
+            compression_context = self.lz4_frame.LZ4FrameCompressor(
+                compression_level=self.level,
+            )
+            self.contexts.compressor = compression_context
+
+        compressed_object = b''.join(
+            (
+                compression_context.begin(
+                    source_size=len(data),
+                ),
+                compression_context.compress(data),
+                compression_context.flush(),
+            )
+        )
+
+        return compressed_object
+
+    def decompress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        decompression_context = getattr(self.contexts, 'decompressor', None)
+        if decompression_context is None:
+            decompression_context = self.lz4_frame.LZ4FrameDecompressor()
+            self.contexts.decompressor = decompression_context
+
+        try:
+            decompressed_object = decompression_context.decompress(data)
+        finally:
+            decompression_context.reset()
+
+        return decompressed_object
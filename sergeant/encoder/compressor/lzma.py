@@ -7,6 +7,7 @@ class Compressor(
     _compressor.Compressor,
 ):
     name: str = 'lzma'
+    id: int = 3
 
     def compress(
         self,
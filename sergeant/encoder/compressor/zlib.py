@@ -7,6 +7,7 @@ class Compressor(
     _compressor.Compressor,
 ):
     name: str = 'zlib'
+    id: int = 4
 
     def compress(
         self,
@@ -0,0 +1,72 @@
+import threading
+import typing
+
+from . import _compressor
+
+
+class Compressor(
+    _compressor.Compressor,
+):
+    name: str = 'zstd'
+    id: int = 5
+
+    def __init__(
+        self,
+        level: int = 3,
+        dictionary: typing.Optional[bytes] = None,
+    ) -> None:
+        import zstandard
+
+        self.zstandard = zstandard
+        self.level = level
+        self.dictionary = None
+        if dictionary is not None:
+            self.dictionary = zstandard.ZstdCompressionDict(dictionary)
+            self.dictionary.precompute_compress(
+                level=level,
+            )
+
+        self.contexts = threading.local()
+
+    @staticmethod
+    def train_dictionary(
+        samples: typing.Iterable[bytes],
+        dictionary_size: int = 16384,
+    ) -> bytes:
+        import zstandard
+
+        return zstandard.train_dictionary(
+            dict_size=dictionary_size,
+            samples=list(samples),
+        ).as_bytes()
+
+    def compress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        compression_context = getattr(self.contexts, 'compressor', None)
+        if compression_context is None:
+            compression_context = self.zstandard.ZstdCompressor(
+                level=self.level,
+                dict_data=self.dictionary,
+            )
+            self.contexts.compressor = compression_context
+
+        compressed_object = compression_context.compress(data)
+
+        return compressed_object
+
+    def decompress(
+        self,
+        data: bytes,
+    ) -> bytes:
+        decompression_context = getattr(self.contexts, 'decompressor', None)
+        if decompression_context is None:
+            decompression_context = self.zstandard.ZstdDecompressor(
+                dict_data=self.dictionary,
+            )
+            self.contexts.decompressor = decompression_context
+
+        decompressed_object = decompression_context.decompress(data)
+
+        return decompressed_object
@@ -1,3 +1,4 @@
+import struct
 import typing
 import typing_extensions
 
@@ -5,6 +6,14 @@ from . import compressor
 from . import serializer
 
 
+UNCOMPRESSED_FLAG = b'\x00'
+COMPRESSED_FLAG = b'\x01'
+HEADER_MAGIC = b'\xc1'
+NO_COMPRESSOR_ID = 0
+
+header_struct = struct.Struct('<cBB')
+
+
 class Encoder:
     serializers: typing.Dict[str, typing.Type[serializer._serializer.Serializer]] = {
         serializer.msgpack.Serializer.name: serializer.msgpack.Serializer,
@@ -13,20 +22,70 @@ class Encoder:
     compressors: typing.Dict[str, typing.Type[compressor._compressor.Compressor]] = {
         compressor.bzip2.Compressor.name: compressor.bzip2.Compressor,
         compressor.gzip.Compressor.name: compressor.gzip.Compressor,
+        compressor.lz4.Compressor.name: compressor.lz4.Compressor,
         compressor.lzma.Compressor.name: compressor.lzma.Compressor,
         compressor.zlib.Compressor.name: compressor.zlib.Compressor,
+        compressor.zstd.Compressor.name: compressor.zstd.Compressor,
     }
 
     def __init__(
         self,
-        compressor_name: typing.Optional[typing_extensions.Literal['bzip2', 'gzip', 'lzma', 'zlib', 'dummy']],
+        compressor_name: typing.Optional[typing_extensions.Literal['bzip2', 'gzip', 'lz4', 'lzma', 'zlib', 'zstd', 'dummy']],
         serializer_name: typing_extensions.Literal['msgpack', 'pickle'],
+        compressor_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        compression_threshold: int = 0,
+        self_describing: bool = False,
     ) -> None:
         self.compressor = None
         if compressor_name:
-            self.compressor = self.compressors[compressor_name]()
+            self.compressor = self.compressors[compressor_name](**(compressor_params or {}))
 
         self.serializer = self.serializers[serializer_name]()
+        self.compression_threshold = compression_threshold
+        self.self_describing = self_describing
+
+        self.serializers_by_id = {
+            serializer_class.id: serializer_class
+            for serializer_class in self.serializers.values()
+        }
+        self.compressors_by_id = {
+            compressor_class.id: compressor_class
+            for compressor_class in self.compressors.values()
+        }
+        self.codec_serializers = {
+            self.serializer.id: self.serializer,
+        }
+        self.codec_compressors = {}
+        if self.compressor:
+            self.codec_compressors[self.compressor.id] = self.compressor
+
+    def get_codec_serializer(
+        self,
+        serializer_id: int,
+    ) -> serializer._serializer.Serializer:
+        codec_serializer = self.codec_serializers.get(serializer_id)
+        if codec_serializer is None:
+            if serializer_id not in self.serializers_by_id:
+                raise ValueError(f'unknown serializer id {serializer_id}')
+
+            codec_serializer = self.serializers_by_id[serializer_id]()
+            self.codec_serializers[serializer_id] = codec_serializer
+
+        return codec_serializer
+
+    def get_codec_compressor(
+        self,
+        compressor_id: int,
+    ) -> compressor._compressor.Compressor:
+        codec_compressor = self.codec_compressors.get(compressor_id)
+        if codec_compressor is None:
+            if compressor_id not in self.compressors_by_id:
+                raise ValueError(f'unknown compressor id {compressor_id}')
+
+            codec_compressor = self.compressors_by_id[compressor_id]()
+            self.codec_compressors[compressor_id] = codec_compressor
+
+        return codec_compressor
 
     def encode(
         self,
@@ -36,10 +95,31 @@ class Encoder:
             data=data,
         )
 
+        if self.self_describing:
+            compressor_id = NO_COMPRESSOR_ID
+            if self.compressor and len(serialized_data) >= self.compression_threshold:
+                serialized_data = self.compressor.compress(
+                    data=serialized_data,
+                )
+                compressor_id = self.compressor.id
+
+            return header_struct.pack(
+                HEADER_MAGIC,
+                self.serializer.id,
+                compressor_id,
+            ) + serialized_data
+
         if self.compressor:
-            serialized_data = self.compressor.compress(
-                data=serialized_data,
-            )
+            if self.compression_threshold <= 0:
+                serialized_data = self.compressor.compress(
+                    data=serialized_data,
+                )
+            elif len(serialized_data) < self.compression_threshold:
+                serialized_data = UNCOMPRESSED_FLAG + serialized_data
+            else:
+                serialized_data = COMPRESSED_FLAG + self.compressor.compress(
+                    data=serialized_data,
+                )
 
         return serialized_data
 
@@ -47,11 +127,35 @@ class Encoder:
         self,
         data: bytes,
     ) -> typing.Any:
-        if self.compressor:
-            data = self.compressor.decompress(
+        if data[:1] == HEADER_MAGIC and len(data) >= header_struct.size:
+            _, serializer_id, compressor_id = header_struct.unpack_from(data)
+            data = data[header_struct.size:]
+
+            if compressor_id != NO_COMPRESSOR_ID:
+                data = self.get_codec_compressor(
+                    compressor_id=compressor_id,
+                ).decompress(
+                    data=data,
+                )
+
+            return self.get_codec_serializer(
+                serializer_id=serializer_id,
+            ).unserialize(
                 data=data,
             )
 
+        if self.compressor:
+            if self.compression_threshold <= 0:
+                data = self.compressor.decompress(
+                    data=data,
+                )
+            elif data[:1] == COMPRESSED_FLAG:
+                data = self.compressor.decompress(
+                    data=data[1:],
+                )
+            else:
+                data = data[1:]
+
         unserialized_data = self.serializer.unserialize(
             data=data,
         )
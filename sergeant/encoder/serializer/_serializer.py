@@ -3,6 +3,7 @@ import typing
 
 class Serializer:
     name: str
+    id: int
 
     def serialize(
         self,
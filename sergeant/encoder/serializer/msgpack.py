@@ -1,15 +1,32 @@
 import datetime
 import msgpack
+import struct
+import threading
 import typing
 
 from . import _serializer
 from ... import objects
 
 
+TASK_EXT_TYPE = 1
+DATETIME_EXT_TYPE = 2
+TUPLE_EXT_TYPE = 3
+
+task_header_struct = struct.Struct('<dQi')
+datetime_struct = struct.Struct('<d')
+
+legacy_extension_markers = (
+    b'\xa8__task__',
+    b'\xac__datetime__',
+    b'\xa9__tuple__',
+)
+
+
 class Serializer(
     _serializer.Serializer,
 ):
     name: str = 'msgpack'
+    id: int = 2
 
     def __init__(
         self,
@@ -20,6 +37,105 @@ class Serializer(
             use_bin_type=True,
             strict_types=True,
         )
+        self.nested_packers = threading.local()
+
+    def pack_nested(
+        self,
+        data: typing.Any,
+    ) -> bytes:
+        free_packers = getattr(self.nested_packers, 'free_packers', None)
+        if free_packers is None:
+            free_packers = []
+            self.nested_packers.free_packers = free_packers
+
+        if free_packers:
+            packer = free_packers.pop()
+        else:
+            packer = msgpack.Packer(
+                autoreset=True,
+                default=self.encode_extensions,
+                use_bin_type=True,
+                strict_types=True,
+            )
+
+        try:
+            return packer.pack(data)
+        finally:
+            free_packers.append(packer)
+
+    def unpack_nested(
+        self,
+        data: bytes,
+    ) -> typing.Any:
+        return msgpack.unpackb(
+            packed=data,
+            strict_map_key=False,
+            ext_hook=self.decode_ext_type,
+            raw=False,
+        )
+
+    def encode_task(
+        self,
+        task: objects.Task,
+    ) -> bytes:
+        if task.trace_id is None:
+            encoded_trace_id = b''
+            trace_id_length = -1
+        else:
+            encoded_trace_id = task.trace_id.encode()
+            trace_id_length = len(encoded_trace_id)
+
+        encoded_kwargs = task.get_encoded_kwargs(
+            kwargs_decoder=self.unpack_nested,
+        )
+        if encoded_kwargs is None:
+            encoded_kwargs = self.pack_nested(task.kwargs)
+
+        return b''.join(
+            (
+                task_header_struct.pack(
+                    task.date,
+                    task.run_count,
+                    trace_id_length,
+                ),
+                encoded_trace_id,
+                encoded_kwargs,
+            )
+        )
+
+    def decode_task(
+        self,
+        data: bytes,
+    ) -> objects.Task:
+        date, run_count, trace_id_length = task_header_struct.unpack_from(data)
+
+        kwargs_offset = task_header_struct.size
+        trace_id = None
+        if trace_id_length >= 0:
+            kwargs_offset += trace_id_length
+            trace_id = data[task_header_struct.size:kwargs_offset].decode()
+
+        return objects.Task.from_encoded_kwargs(
+            encoded_kwargs=data[kwargs_offset:],
+            kwargs_decoder=self.unpack_nested,
+            trace_id=trace_id,
+            date=date,
+            run_count=run_count,
+        )
+
+    def decode_ext_type(
+        self,
+        code: int,
+        data: bytes,
+    ) -> typing.Any:
+        if code == TASK_EXT_TYPE:
+            return self.decode_task(data)
+        elif code == DATETIME_EXT_TYPE:
+            return datetime.datetime.fromtimestamp(datetime_struct.unpack(data)[0])
+        elif code == TUPLE_EXT_TYPE:
+            return tuple(self.unpack_nested(data))
+        else:
+            return msgpack.ExtType(code, data)
 
     def decode_extensions(
         self,
@@ -41,17 +157,20 @@ class Serializer(
         obj: typing.Any,
     ) -> typing.Any:
         if type(obj) is datetime.datetime:
-            return {
-                '__datetime__': obj.timestamp(),
-            }
+            return msgpack.ExtType(
+                DATETIME_EXT_TYPE,
+                datetime_struct.pack(obj.timestamp()),
+            )
         elif type(obj) is tuple:
-            return {
-                '__tuple__': list(obj),
-            }
+            return msgpack.ExtType(
+                TUPLE_EXT_TYPE,
+                self.pack_nested(list(obj)),
+            )
         elif type(obj) is objects.Task:
-            return {
-                '__task__': obj.__dict__,
-            }
+            return msgpack.ExtType(
+                TASK_EXT_TYPE,
+                self.encode_task(obj),
+            )
         else:
             raise TypeError(f'unsupported type {type(obj)}')
 
@@ -65,9 +184,14 @@ class Serializer(
         self,
         data: bytes,
     ) -> typing.Any:
-        return msgpack.unpackb(
-            packed=data,
-            strict_map_key=False,
-            object_hook=self.decode_extensions,
-            raw=False,
-        )
+        for legacy_extension_marker in legacy_extension_markers:
+            if legacy_extension_marker in data:
+                return msgpack.unpackb(
+                    packed=data,
+                    strict_map_key=False,
+                    object_hook=self.decode_extensions,
+                    ext_hook=self.decode_ext_type,
+                    raw=False,
+                )
+
+        return self.unpack_nested(data)
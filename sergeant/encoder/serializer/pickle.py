@@ -8,6 +8,7 @@ class Serializer(
     _serializer.Serializer,
 ):
     name: str = 'pickle'
+    id: int = 1
 
     def serialize(
         self,
@@ -1,3 +1,5 @@
 from . import _executor
+from . import asynchronous
+from . import process_pool
 from . import serial
 from . import threaded
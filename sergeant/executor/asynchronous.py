@@ -0,0 +1,412 @@
+import asyncio
+import contextvars
+import signal
+import threading
+import typing
+
+from . import _executor
+from .. import objects
+from .. import worker
+
+
+class AsyncioExecutor(
+    _executor.Executor,
+):
+    def __init__(
+        self,
+        worker_object: worker.AsyncWorker,
+        number_of_concurrent_tasks: int,
+    ) -> None:
+        self.worker_object = worker_object
+        self.number_of_concurrent_tasks = number_of_concurrent_tasks
+        self.current_task: contextvars.ContextVar[typing.Optional[objects.Task]] = contextvars.ContextVar(
+            'current_task',
+            default=None,
+        )
+        self.timed_out_asyncio_tasks: typing.Set[asyncio.Future] = set()
+        self.working_asyncio_tasks: typing.Set[asyncio.Future] = set()
+        self.tasks_to_requeue: typing.List[objects.Task] = []
+
+        self.interrupt_exception: typing.Optional[BaseException] = None
+        self.received_stop_signal = False
+        self.previous_stop_signal_handler: typing.Any = None
+
+    def get_current_task(
+        self,
+    ) -> typing.Optional[objects.Task]:
+        return self.current_task.get()
+
+    def set_current_task(
+        self,
+        task: typing.Optional[objects.Task],
+    ) -> None:
+        self.current_task.set(task)
+
+    def execute_tasks(
+        self,
+        tasks: typing.Iterable[objects.Task],
+    ) -> None:
+        self.execute_task_batches(
+            task_batches=iterate_task_batches(
+                tasks=tasks,
+            ),
+        )
+
+    def execute_task_batches(
+        self,
+        task_batches: typing.AsyncGenerator[typing.List[objects.Task], None],
+    ) -> None:
+        try:
+            asyncio.run(
+                self.execute_task_batches_concurrently(
+                    task_batches=task_batches,
+                ),
+            )
+        finally:
+            if self.interrupt_exception:
+                raise self.interrupt_exception
+
+    async def execute_task_batches_concurrently(
+        self,
+        task_batches: typing.AsyncGenerator[typing.List[objects.Task], None],
+    ) -> None:
+        event_loop = asyncio.get_event_loop()
+        self.add_stop_signal_handler(
+            event_loop=event_loop,
+        )
+        running_futures: typing.Set[asyncio.Future] = set()
+
+        try:
+            async for tasks in task_batches:
+                for task_index, task in enumerate(tasks):
+                    if self.interrupt_exception:
+                        self.tasks_to_requeue += tasks[task_index:]
+
+                        break
+
+                    running_futures.add(
+                        asyncio.ensure_future(
+                            self.execute_task(
+                                task=task,
+                            ),
+                        ),
+                    )
+
+                    if len(running_futures) == self.number_of_concurrent_tasks:
+                        finished, running_futures = await asyncio.wait(
+                            running_futures,
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+
+                if self.interrupt_exception:
+                    break
+        finally:
+            await task_batches.aclose()
+
+            if running_futures:
+                await asyncio.wait(
+                    running_futures,
+                )
+
+            try:
+                await self.requeue_tasks()
+                await self.worker_object.async_acknowledge_pending_tasks()
+            finally:
+                self.remove_stop_signal_handler(
+                    event_loop=event_loop,
+                )
+
+                await self.worker_object.async_broker.close()
+
+    def add_stop_signal_handler(
+        self,
+        event_loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        self.previous_stop_signal_handler = signal.getsignal(signal.SIGTERM)
+        event_loop.add_signal_handler(
+            signal.SIGTERM,
+            self.stop_signal_handler,
+        )
+
+    def remove_stop_signal_handler(
+        self,
+        event_loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        if self.previous_stop_signal_handler is None or self.received_stop_signal:
+            return
+
+        event_loop.remove_signal_handler(
+            signal.SIGTERM,
+        )
+        signal.signal(signal.SIGTERM, self.previous_stop_signal_handler)
+        self.previous_stop_signal_handler = None
+
+    def stop_signal_handler(
+        self,
+    ) -> None:
+        self.worker_object.logger.info(
+            msg='stop signal has been received',
+        )
+        asyncio.get_event_loop().remove_signal_handler(
+            signal.SIGTERM,
+        )
+        self.received_stop_signal = True
+        self.worker_object.received_stop_signal = True
+        self.interrupt_exception = worker.WorkerStop()
+
+        for asyncio_task in self.working_asyncio_tasks:
+            asyncio_task.cancel()
+
+    async def requeue_tasks(
+        self,
+    ) -> None:
+        tasks_to_requeue = self.tasks_to_requeue
+        self.tasks_to_requeue = []
+
+        if not tasks_to_requeue:
+            return
+
+        await self.worker_object.async_broker.push_tasks(
+            task_name=self.worker_object.config.name,
+            tasks=tasks_to_requeue,
+            priority='HIGH',
+        )
+
+        for task in tasks_to_requeue:
+            await self.worker_object.async_acknowledge_task(
+                task=task,
+            )
+
+    async def finish_task(
+        self,
+        task: objects.Task,
+    ) -> None:
+        try:
+            await self.worker_object.async_push_pending_tasks()
+        except Exception as exception:
+            self.worker_object.logger.error(
+                msg=f'could not push tasks: {exception}',
+                extra={
+                    'task': task,
+                },
+            )
+
+            return
+
+        await self.worker_object.async_acknowledge_task(
+            task=task,
+        )
+
+    async def execute_task(
+        self,
+        task: objects.Task,
+    ) -> None:
+        if self.received_stop_signal:
+            self.tasks_to_requeue.append(task)
+
+            return
+
+        task_was_stopped = False
+
+        self.set_current_task(
+            task=task,
+        )
+        self.pre_work(
+            task=task,
+        )
+
+        try:
+            returned_value = await self.execute_work(
+                task=task,
+            )
+        except worker.WorkerTimedout as exception:
+            self.post_work(
+                task=task,
+                success=False,
+                exception=exception,
+            )
+
+            self.worker_object.handle_timeout(
+                task=task,
+            )
+        except worker.WorkerRetry as exception:
+            self.post_work(
+                task=task,
+                success=False,
+                exception=exception,
+            )
+
+            self.worker_object.handle_retry(
+                task=task,
+            )
+        except worker.WorkerMaxRetries as exception:
+            self.post_work(
+                task=task,
+                success=False,
+                exception=exception,
+            )
+
+            self.worker_object.handle_max_retries(
+                task=task,
+            )
+        except worker.WorkerRequeue as exception:
+            self.post_work(
+                task=task,
+                success=False,
+                exception=exception,
+            )
+
+            self.worker_object.handle_requeue(
+                task=task,
+            )
+        except worker.WorkerInterrupt as exception:
+            self.post_work(
+                task=task,
+                success=False,
+                exception=exception,
+            )
+
+            if isinstance(
+                exception,
+                worker.WorkerStop,
+            ):
+                self.worker_object.handle_stop(
+                    task=task,
+                )
+                task_was_stopped = self.received_stop_signal
+
+            self.interrupt_exception = exception
+        except Exception as exception:
+            self.post_work(
+                task=task,
+                success=False,
+                exception=exception,
+            )
+
+            self.worker_object.handle_failure(
+                task=task,
+                exception=exception,
+            )
+        else:
+            self.post_work(
+                task=task,
+                success=True,
+                exception=None,
+            )
+            self.worker_object.handle_success(
+                task=task,
+                returned_value=returned_value,
+            )
+        finally:
+            self.set_current_task(
+                task=None,
+            )
+
+            if task_was_stopped:
+                self.tasks_to_requeue.append(task)
+            else:
+                await self.finish_task(
+                    task=task,
+                )
+
+    async def execute_work(
+        self,
+        task: objects.Task,
+    ) -> typing.Any:
+        asyncio_task = typing.cast(asyncio.Future, asyncio.current_task())
+
+        timeout_handle: typing.Optional[asyncio.TimerHandle] = None
+        timeout = self.worker_object.config.timeouts.timeout
+        if timeout > 0:
+            timeout_handle = asyncio.get_event_loop().call_later(
+                timeout,
+                self.cancel_timed_out_task,
+                asyncio_task,
+            )
+
+        self.working_asyncio_tasks.add(asyncio_task)
+        try:
+            return await self.worker_object.work(
+                task=task,
+            )
+        except asyncio.CancelledError:
+            if asyncio_task in self.timed_out_asyncio_tasks:
+                raise worker.WorkerTimedout()
+
+            if self.received_stop_signal:
+                raise worker.WorkerStop()
+
+            raise
+        finally:
+            self.working_asyncio_tasks.discard(asyncio_task)
+            if timeout_handle is not None:
+                timeout_handle.cancel()
+            self.timed_out_asyncio_tasks.discard(asyncio_task)
+
+    def cancel_timed_out_task(
+        self,
+        asyncio_task: asyncio.Future,
+    ) -> None:
+        self.timed_out_asyncio_tasks.add(asyncio_task)
+        asyncio_task.cancel()
+
+    def pre_work(
+        self,
+        task: objects.Task,
+    ) -> None:
+        try:
+            self.worker_object.pre_work(
+                task=task,
+            )
+        except Exception as exception:
+            self.worker_object.logger.error(
+                msg=f'pre_work has failed: {exception}',
+                extra={
+                    'task': task,
+                },
+            )
+
+        self.worker_object.metrics.work_started(
+            task=task,
+        )
+
+    def post_work(
+        self,
+        task: objects.Task,
+        success: bool,
+        exception: typing.Optional[BaseException] = None,
+    ) -> None:
+        self.worker_object.metrics.work_finished(
+            task=task,
+            outcome=self.worker_object.get_task_outcome(
+                exception=exception,
+            ),
+        )
+
+        try:
+            self.worker_object.post_work(
+                task=task,
+                success=success,
+                exception=exception,
+            )
+        except Exception as exception:
+            self.worker_object.logger.error(
+                msg=f'post_work has failed: {exception}',
+                extra={
+                    'task': task,
+                    'success': success,
+                    'exception': exception,
+                },
+            )
+
+
+async def iterate_task_batches(
+    tasks: typing.Iterable[objects.Task],
+) -> typing.AsyncGenerator[typing.List[objects.Task], None]:
+    for task in tasks:
+        yield [
+            task,
+        ]
@@ -0,0 +1,491 @@
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import time
+import types
+import typing
+
+from . import _executor
+from .. import objects
+from .. import worker
+
+
+class ChildProcess:
+    def __init__(
+        self,
+        process: multiprocessing.process.BaseProcess,
+        connection: multiprocessing.connection.Connection,
+    ) -> None:
+        self.process = process
+        self.connection = connection
+
+        self.task: typing.Optional[objects.Task] = None
+        self.timeout_time: typing.Optional[float] = None
+        self.kill_time: typing.Optional[float] = None
+
+
+class ProcessPoolExecutor(
+    _executor.Executor,
+):
+    def __init__(
+        self,
+        worker_object: worker.Worker,
+        number_of_processes: int,
+    ) -> None:
+        self.worker_object = worker_object
+        self.number_of_processes = number_of_processes
+        self.multiprocessing_context = multiprocessing.get_context('fork')
+
+        self.child_processes: typing.List[ChildProcess] = []
+        self.currently_working = False
+        self.current_task: typing.Optional[objects.Task] = None
+
+        self.interrupt_exception: typing.Optional[BaseException] = None
+
+    def get_current_task(
+        self,
+    ) -> typing.Optional[objects.Task]:
+        return self.current_task
+
+    def set_current_task(
+        self,
+        task: typing.Optional[objects.Task],
+    ) -> None:
+        self.current_task = task
+
+    def sigusr1_handler(
+        self,
+        signal_num: int,
+        frame: typing.Optional[types.FrameType],
+    ) -> None:
+        if self.currently_working:
+            raise worker.WorkerTimedout()
+
+    def start_child_process(
+        self,
+    ) -> ChildProcess:
+        parent_connection, child_connection = self.multiprocessing_context.Pipe()
+        process = self.multiprocessing_context.Process(
+            target=self.child_process_loop,
+            args=(
+                child_connection,
+            ),
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+
+        return ChildProcess(
+            process=process,
+            connection=parent_connection,
+        )
+
+    def stop_child_process(
+        self,
+        child_process: ChildProcess,
+    ) -> None:
+        try:
+            child_process.connection.send(None)
+        except OSError:
+            pass
+
+        child_process.process.join(
+            timeout=self.worker_object.config.timeouts.grace_period,
+        )
+        if child_process.process.is_alive():
+            child_process.process.kill()
+            child_process.process.join()
+
+        child_process.connection.close()
+
+    def replace_child_process(
+        self,
+        child_process: ChildProcess,
+    ) -> None:
+        if child_process.process.is_alive():
+            child_process.process.kill()
+        child_process.process.join()
+        child_process.connection.close()
+
+        self.child_processes[self.child_processes.index(child_process)] = self.start_child_process()
+
+    def child_process_loop(
+        self,
+        connection: multiprocessing.connection.Connection,
+    ) -> None:
+        signal.signal(signal.SIGUSR1, self.sigusr1_handler)
+
+        while True:
+            try:
+                task = connection.recv()
+            except EOFError:
+                return
+
+            if task is None:
+                return
+
+            returned_value, work_exception = self.execute_task_in_child_process(
+                task=task,
+            )
+
+            try:
+                connection.send(
+                    (
+                        returned_value,
+                        work_exception,
+                    )
+                )
+            except Exception as exception:
+                self.worker_object.logger.error(
+                    msg=f'could not send the task result: {exception}',
+                    extra={
+                        'task': task,
+                    },
+                )
+
+                if work_exception is not None:
+                    work_exception = Exception(repr(work_exception))
+
+                connection.send(
+                    (
+                        None,
+                        work_exception,
+                    )
+                )
+
+    def execute_task_in_child_process(
+        self,
+        task: objects.Task,
+    ) -> typing.Tuple[typing.Any, typing.Optional[BaseException]]:
+        self.set_current_task(
+            task=task,
+        )
+        self.pre_work(
+            task=task,
+        )
+
+        returned_value = None
+        work_exception: typing.Optional[BaseException] = None
+        try:
+            returned_value = self.worker_object.work(
+                task=task,
+            )
+        except (
+            worker.WorkerException,
+            Exception,
+        ) as exception:
+            work_exception = exception
+        finally:
+            self.currently_working = False
+
+        self.post_work(
+            task=task,
+            success=work_exception is None,
+            exception=work_exception,
+        )
+        self.set_current_task(
+            task=None,
+        )
+        self.worker_object.flush_outbox()
+
+        return (
+            returned_value,
+            work_exception,
+        )
+
+    def execute_tasks(
+        self,
+        tasks: typing.Iterable[objects.Task],
+    ) -> None:
+        self.child_processes = [
+            self.start_child_process()
+            for i in range(self.number_of_processes)
+        ]
+
+        tasks_iterator = iter(tasks)
+
+        try:
+            while not self.interrupt_exception:
+                idle_child_process = self.get_idle_child_process()
+                if idle_child_process is None:
+                    self.wait_for_results()
+
+                    continue
+
+                task = next(tasks_iterator, None)
+                if task is None:
+                    break
+
+                self.send_task(
+                    child_process=idle_child_process,
+                    task=task,
+                )
+
+            while any(
+                child_process.task is not None
+                for child_process in self.child_processes
+            ):
+                self.wait_for_results()
+        finally:
+            for child_process in self.child_processes:
+                self.stop_child_process(
+                    child_process=child_process,
+                )
+            self.child_processes = []
+
+            if self.interrupt_exception:
+                raise self.interrupt_exception
+
+    def get_idle_child_process(
+        self,
+    ) -> typing.Optional[ChildProcess]:
+        for child_process in self.child_processes:
+            if child_process.task is None:
+                return child_process
+
+        return None
+
+    def send_task(
+        self,
+        child_process: ChildProcess,
+        task: objects.Task,
+    ) -> None:
+        child_process.task = task
+        self.worker_object.metrics.work_started(
+            task=task,
+        )
+        if self.worker_object.config.timeouts.timeout > 0:
+            child_process.timeout_time = time.monotonic() + self.worker_object.config.timeouts.timeout
+            child_process.kill_time = child_process.timeout_time + self.worker_object.config.timeouts.grace_period
+
+        try:
+            child_process.connection.send(task)
+        except OSError:
+            self.handle_child_process_exit(
+                child_process=child_process,
+            )
+
+    def wait_for_results(
+        self,
+    ) -> None:
+        busy_child_processes = [
+            child_process
+            for child_process in self.child_processes
+            if child_process.task is not None
+        ]
+        deadlines = []
+        for child_process in busy_child_processes:
+            if child_process.timeout_time is not None:
+                deadlines.append(child_process.timeout_time)
+            elif child_process.kill_time is not None:
+                deadlines.append(child_process.kill_time)
+
+        if deadlines:
+            wait_timeout: typing.Optional[float] = max(min(deadlines) - time.monotonic(), 0.0)
+        else:
+            wait_timeout = None
+
+        ready_connections = multiprocessing.connection.wait(
+            object_list=[
+                child_process.connection
+                for child_process in busy_child_processes
+            ],
+            timeout=wait_timeout,
+        )
+
+        for child_process in busy_child_processes:
+            if child_process.connection in ready_connections:
+                try:
+                    returned_value, work_exception = child_process.connection.recv()
+                except (
+                    EOFError,
+                    OSError,
+                ):
+                    self.handle_child_process_exit(
+                        child_process=child_process,
+                    )
+                else:
+                    self.handle_result(
+                        child_process=child_process,
+                        returned_value=returned_value,
+                        exception=work_exception,
+                    )
+            else:
+                self.check_child_process_timeout(
+                    child_process=child_process,
+                )
+
+    def check_child_process_timeout(
+        self,
+        child_process: ChildProcess,
+    ) -> None:
+        now = time.monotonic()
+
+        if child_process.timeout_time is not None and now >= child_process.timeout_time:
+            child_process.timeout_time = None
+            try:
+                os.kill(typing.cast(int, child_process.process.pid), signal.SIGUSR1)
+            except ProcessLookupError:
+                pass
+        elif child_process.kill_time is not None and now >= child_process.kill_time:
+            task = typing.cast(objects.Task, child_process.task)
+
+            self.worker_object.logger.error(
+                msg='task has exceeded its grace period, killing its process',
+                extra={
+                    'task': task,
+                },
+            )
+            self.replace_child_process(
+                child_process=child_process,
+            )
+            self.handle_result(
+                child_process=child_process,
+                returned_value=None,
+                exception=worker.WorkerTimedout(),
+            )
+
+    def handle_child_process_exit(
+        self,
+        child_process: ChildProcess,
+    ) -> None:
+        child_process.process.join(
+            timeout=1.0,
+        )
+        exception = ChildProcessError(f'executor process has exited with code {child_process.process.exitcode}')
+
+        self.replace_child_process(
+            child_process=child_process,
+        )
+        self.handle_result(
+            child_process=child_process,
+            returned_value=None,
+            exception=exception,
+        )
+
+    def handle_result(
+        self,
+        child_process: ChildProcess,
+        returned_value: typing.Any,
+        exception: typing.Optional[BaseException],
+    ) -> None:
+        task = typing.cast(objects.Task, child_process.task)
+        child_process.task = None
+        child_process.timeout_time = None
+        child_process.kill_time = None
+        self.worker_object.metrics.work_finished(
+            task=task,
+            outcome=self.worker_object.get_task_outcome(
+                exception=exception,
+            ),
+        )
+
+        self.set_current_task(
+            task=task,
+        )
+
+        try:
+            if exception is None:
+                self.worker_object.handle_success(
+                    task=task,
+                    returned_value=returned_value,
+                )
+            elif isinstance(
+                exception,
+                worker.WorkerTimedout,
+            ):
+                self.worker_object.handle_timeout(
+                    task=task,
+                )
+            elif isinstance(
+                exception,
+                worker.WorkerRetry,
+            ):
+                self.worker_object.handle_retry(
+                    task=task,
+                )
+            elif isinstance(
+                exception,
+                worker.WorkerMaxRetries,
+            ):
+                self.worker_object.handle_max_retries(
+                    task=task,
+                )
+            elif isinstance(
+                exception,
+                worker.WorkerRequeue,
+            ):
+                self.worker_object.handle_requeue(
+                    task=task,
+                )
+            elif isinstance(
+                exception,
+                worker.WorkerInterrupt,
+            ):
+                if isinstance(
+                    exception,
+                    worker.WorkerStop,
+                ):
+                    self.worker_object.handle_stop(
+                        task=task,
+                    )
+
+                self.interrupt_exception = exception
+            elif isinstance(
+                exception,
+                Exception,
+            ):
+                self.worker_object.handle_failure(
+                    task=task,
+                    exception=exception,
+                )
+        except worker.WorkerInterrupt as exception:
+            self.interrupt_exception = exception
+        finally:
+            self.set_current_task(
+                task=None,
+            )
+            self.worker_object.acknowledge_task(
+                task=task,
+            )
+
+    def pre_work(
+        self,
+        task: objects.Task,
+    ) -> None:
+        try:
+            self.worker_object.pre_work(
+                task=task,
+            )
+        except Exception as exception:
+            self.worker_object.logger.error(
+                msg=f'pre_work has failed: {exception}',
+                extra={
+                    'task': task,
+                },
+            )
+
+        self.currently_working = True
+
+    def post_work(
+        self,
+        task: objects.Task,
+        success: bool,
+        exception: typing.Optional[BaseException] = None,
+    ) -> None:
+        try:
+            self.worker_object.post_work(
+                task=task,
+                success=success,
+                exception=exception,
+            )
+        except Exception as exception:
+            self.worker_object.logger.error(
+                msg=f'post_work has failed: {exception}',
+                extra={
+                    'task': task,
+                    'success': success,
+                    'exception': exception,
+                },
+            )
@@ -43,17 +43,22 @@ class SerialExecutor(
         self,
         tasks: typing.Iterable[objects.Task],
     ) -> None:
-        killer_object: typing.Optional[killer.process.Killer] = None
+        killer_object: typing.Optional[typing.Union[killer.process.Killer, killer.shared.DeadlineSlot]] = None
         original_sigusr1_handler = signal.getsignal(signal.SIGUSR1)
 
         try:
             if self.worker_object.config.timeouts.timeout > 0:
-                killer_object = killer.process.Killer(
-                    pid_to_kill=os.getpid(),
-                    sleep_interval=0.1,
+                killer_object = killer.shared.DeadlineSlot.from_environment(
                     timeout=self.worker_object.config.timeouts.timeout,
                     grace_period=self.worker_object.config.timeouts.grace_period,
                 )
+                if killer_object is None:
+                    killer_object = killer.process.Killer(
+                        pid_to_kill=os.getpid(),
+                        sleep_interval=0.1,
+                        timeout=self.worker_object.config.timeouts.timeout,
+                        grace_period=self.worker_object.config.timeouts.grace_period,
+                    )
 
                 signal.signal(signal.SIGUSR1, self.sigusr1_handler)
 
@@ -71,7 +76,7 @@ class SerialExecutor(
     def execute_task(
         self,
         task: objects.Task,
-        killer_object: typing.Optional[killer.process.Killer] = None,
+        killer_object: typing.Optional[typing.Union[killer.process.Killer, killer.shared.DeadlineSlot]] = None,
     ) -> None:
         self.set_current_task(
             task=task,
@@ -165,11 +170,14 @@ class SerialExecutor(
             self.set_current_task(
                 task=None,
             )
+            self.worker_object.acknowledge_task(
+                task=task,
+            )
 
     def pre_work(
         self,
         task: objects.Task,
-        killer_object: typing.Optional[killer.process.Killer] = None,
+        killer_object: typing.Optional[typing.Union[killer.process.Killer, killer.shared.DeadlineSlot]] = None,
     ) -> None:
         try:
             self.worker_object.pre_work(
@@ -183,6 +191,10 @@ class SerialExecutor(
                 },
             )
 
+        self.worker_object.metrics.work_started(
+            task=task,
+        )
+
         if killer_object:
             killer_object.start()
 
@@ -193,13 +205,20 @@ class SerialExecutor(
         task: objects.Task,
         success: bool,
         exception: typing.Optional[BaseException] = None,
-        killer_object: typing.Optional[killer.process.Killer] = None,
+        killer_object: typing.Optional[typing.Union[killer.process.Killer, killer.shared.DeadlineSlot]] = None,
     ) -> None:
         self.currently_working = False
 
         if killer_object:
             killer_object.stop_and_reset()
 
+        self.worker_object.metrics.work_finished(
+            task=task,
+            outcome=self.worker_object.get_task_outcome(
+                exception=exception,
+            ),
+        )
+
         try:
             self.worker_object.post_work(
                 task=task,
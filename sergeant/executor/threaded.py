@@ -41,7 +41,6 @@ class ThreadedExecutor(
         if self.worker_object.config.timeouts.timeout > 0:
             killer_object = killer.thread.Killer(
                 exception=worker.WorkerTimedout,
-                sleep_interval=0.1,
             )
             killer_object.start()
 
@@ -177,6 +176,9 @@ class ThreadedExecutor(
             self.set_current_task(
                 task=None,
             )
+            self.worker_object.acknowledge_task(
+                task=task,
+            )
 
     def pre_work(
         self,
@@ -195,6 +197,10 @@ class ThreadedExecutor(
                 },
             )
 
+        self.worker_object.metrics.work_started(
+            task=task,
+        )
+
         if killer_object:
             killer_object.add(
                 thread_id=threading.get_ident(),
@@ -213,6 +219,13 @@ class ThreadedExecutor(
                 thread_id=threading.get_ident(),
             )
 
+        self.worker_object.metrics.work_finished(
+            task=task,
+            outcome=self.worker_object.get_task_outcome(
+                exception=exception,
+            ),
+        )
+
         try:
             self.worker_object.post_work(
                 task=task,
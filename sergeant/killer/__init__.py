@@ -1,2 +1,4 @@
 from . import process
+from . import shared
 from . import thread
+from . import timer_wheel
@@ -0,0 +1,323 @@
+import mmap
+import os
+import psutil
+import signal
+import struct
+import tempfile
+import threading
+import time
+import typing
+
+import logging
+
+from . import timer_wheel
+
+
+DEADLINE_SLOTS_FD_ENVIRONMENT_VARIABLE = 'SERGEANT_DEADLINE_SLOTS_FD'
+DEADLINE_SLOT_INDEX_ENVIRONMENT_VARIABLE = 'SERGEANT_DEADLINE_SLOT_INDEX'
+
+slot_struct = struct.Struct('<Qdd')
+sequence_struct = struct.Struct('<Q')
+deadlines_struct = struct.Struct('<dd')
+
+
+class DeadlineSlots:
+    def __init__(
+        self,
+        number_of_slots: int,
+        file_descriptor: typing.Optional[int] = None,
+    ) -> None:
+        if file_descriptor is None:
+            file_descriptor, file_path = tempfile.mkstemp(
+                prefix='sergeant_deadline_slots_',
+                dir='/dev/shm' if os.path.isdir('/dev/shm') else None,
+            )
+            os.unlink(file_path)
+            os.ftruncate(file_descriptor, number_of_slots * slot_struct.size)
+
+        self.number_of_slots = number_of_slots
+        self.file_descriptor = file_descriptor
+        self.memory_map = mmap.mmap(
+            file_descriptor,
+            number_of_slots * slot_struct.size,
+        )
+
+    def read(
+        self,
+        slot_index: int,
+    ) -> typing.Optional[typing.Tuple[int, float, float]]:
+        offset = slot_index * slot_struct.size
+
+        for attempt in range(3):
+            sequence, timeout_time, kill_time = slot_struct.unpack_from(self.memory_map, offset)
+            if sequence % 2 == 1:
+                continue
+
+            if sequence_struct.unpack_from(self.memory_map, offset)[0] == sequence:
+                return (
+                    sequence,
+                    timeout_time,
+                    kill_time,
+                )
+
+        return None
+
+    def write(
+        self,
+        slot_index: int,
+        timeout_time: float,
+        kill_time: float,
+    ) -> None:
+        offset = slot_index * slot_struct.size
+        sequence = sequence_struct.unpack_from(self.memory_map, offset)[0]
+
+        sequence_struct.pack_into(self.memory_map, offset, sequence + 1)
+        deadlines_struct.pack_into(self.memory_map, offset + sequence_struct.size, timeout_time, kill_time)
+        sequence_struct.pack_into(self.memory_map, offset, sequence + 2)
+
+    def close(
+        self,
+    ) -> None:
+        try:
+            self.memory_map.close()
+        except Exception:
+            pass
+
+        try:
+            os.close(self.file_descriptor)
+        except OSError:
+            pass
+
+
+class DeadlineSlot:
+    def __init__(
+        self,
+        deadline_slots: DeadlineSlots,
+        slot_index: int,
+        timeout: float,
+        grace_period: float,
+    ) -> None:
+        self.deadline_slots = deadline_slots
+        self.slot_index = slot_index
+        self.timeout = timeout
+        self.grace_period = grace_period
+
+    @classmethod
+    def from_environment(
+        cls,
+        timeout: float,
+        grace_period: float,
+    ) -> typing.Optional['DeadlineSlot']:
+        file_descriptor = os.environ.get(DEADLINE_SLOTS_FD_ENVIRONMENT_VARIABLE)
+        slot_index = os.environ.get(DEADLINE_SLOT_INDEX_ENVIRONMENT_VARIABLE)
+        if file_descriptor is None or slot_index is None:
+            return None
+
+        try:
+            file_size = os.fstat(int(file_descriptor)).st_size
+        except OSError:
+            return None
+
+        return cls(
+            deadline_slots=DeadlineSlots(
+                number_of_slots=file_size // slot_struct.size,
+                file_descriptor=int(file_descriptor),
+            ),
+            slot_index=int(slot_index),
+            timeout=timeout,
+            grace_period=grace_period,
+        )
+
+    def start(
+        self,
+    ) -> None:
+        timeout_time = time.monotonic() + self.timeout
+
+        self.deadline_slots.write(
+            slot_index=self.slot_index,
+            timeout_time=timeout_time,
+            kill_time=timeout_time + self.grace_period,
+        )
+
+    def stop_and_reset(
+        self,
+    ) -> None:
+        self.deadline_slots.write(
+            slot_index=self.slot_index,
+            timeout_time=0.0,
+            kill_time=0.0,
+        )
+
+    def shutdown(
+        self,
+    ) -> None:
+        self.stop_and_reset()
+        self.deadline_slots.memory_map.close()
+
+
+class WatchedProcess:
+    def __init__(
+        self,
+        pid: int,
+    ) -> None:
+        self.pid = pid
+        self.sequence = -1
+        self.timeout_time = 0.0
+        self.kill_time = 0.0
+
+
+class Killer:
+    def __init__(
+        self,
+        deadline_slots: DeadlineSlots,
+        logger: logging.Logger,
+        tick_duration: float = 0.05,
+    ) -> None:
+        self.deadline_slots = deadline_slots
+        self.logger = logger
+        self.tick_duration = tick_duration
+
+        self.timer_wheel = timer_wheel.TimerWheel(
+            tick_duration=tick_duration,
+            start_time=time.monotonic(),
+        )
+        self.watched_processes: typing.Dict[int, WatchedProcess] = {}
+        self.lock = threading.Lock()
+
+        self.shutdown_event = threading.Event()
+        self.kill_thread: typing.Optional[threading.Thread] = None
+
+    def watch(
+        self,
+        slot_index: int,
+        pid: int,
+    ) -> None:
+        with self.lock:
+            self.timer_wheel.remove(
+                key=slot_index,
+            )
+            self.watched_processes[slot_index] = WatchedProcess(
+                pid=pid,
+            )
+
+    def unwatch(
+        self,
+        slot_index: int,
+    ) -> None:
+        with self.lock:
+            self.timer_wheel.remove(
+                key=slot_index,
+            )
+            self.watched_processes.pop(slot_index, None)
+
+    def start(
+        self,
+    ) -> None:
+        self.shutdown_event.clear()
+        self.kill_thread = threading.Thread(
+            target=self.kill_loop,
+            daemon=True,
+        )
+        self.kill_thread.start()
+
+    def shutdown(
+        self,
+    ) -> None:
+        self.shutdown_event.set()
+        if self.kill_thread is not None:
+            self.kill_thread.join()
+            self.kill_thread = None
+
+    def kill_loop(
+        self,
+    ) -> None:
+        while not self.shutdown_event.wait(
+            timeout=self.tick_duration,
+        ):
+            try:
+                self.check_deadlines()
+            except Exception as exception:
+                self.logger.error(
+                    msg=f'killer has failed to check the deadlines: {exception}',
+                )
+
+    def check_deadlines(
+        self,
+    ) -> None:
+        with self.lock:
+            for slot_index, watched_process in self.watched_processes.items():
+                slot = self.deadline_slots.read(
+                    slot_index=slot_index,
+                )
+                if slot is None or slot[0] == watched_process.sequence:
+                    continue
+
+                watched_process.sequence, watched_process.timeout_time, watched_process.kill_time = slot
+                if watched_process.timeout_time > 0.0:
+                    self.timer_wheel.add(
+                        key=slot_index,
+                        deadline=watched_process.timeout_time,
+                    )
+                else:
+                    self.timer_wheel.remove(
+                        key=slot_index,
+                    )
+
+            expired_slot_indices = self.timer_wheel.advance(
+                now=time.monotonic(),
+            )
+            for expired_slot_index in expired_slot_indices:
+                watched_process = self.watched_processes[typing.cast(int, expired_slot_index)]
+
+                if watched_process.timeout_time > 0.0:
+                    watched_process.timeout_time = 0.0
+                    self.timer_wheel.add(
+                        key=expired_slot_index,
+                        deadline=watched_process.kill_time,
+                    )
+                    self.send_timeout_signal(
+                        watched_process=watched_process,
+                    )
+                else:
+                    watched_process.kill_time = 0.0
+                    self.kill_process_and_children(
+                        watched_process=watched_process,
+                    )
+
+    def send_timeout_signal(
+        self,
+        watched_process: WatchedProcess,
+    ) -> None:
+        try:
+            os.kill(watched_process.pid, signal.SIGUSR1)
+        except ProcessLookupError:
+            pass
+        except Exception as exception:
+            self.logger.error(
+                msg=f'sending timeout to worker({watched_process.pid}) raised: {exception}',
+            )
+
+    def kill_process_and_children(
+        self,
+        watched_process: WatchedProcess,
+    ) -> None:
+        self.logger.warning(
+            msg=f'worker({watched_process.pid}) has exceeded its grace period, killing it',
+        )
+
+        try:
+            process_to_kill = psutil.Process(
+                pid=watched_process.pid,
+            )
+            processes_to_kill = process_to_kill.children(
+                recursive=True,
+            )
+        except psutil.NoSuchProcess:
+            return
+
+        processes_to_kill.append(process_to_kill)
+        for process in processes_to_kill:
+            try:
+                process.kill()
+            except psutil.NoSuchProcess:
+                pass
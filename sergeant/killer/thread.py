@@ -1,4 +1,5 @@
 import ctypes
+import heapq
 import threading
 import time
 import typing
@@ -10,38 +11,57 @@ class Killer(
     def __init__(
         self,
         exception: typing.Type[BaseException],
-        sleep_interval: float = 0.1,
     ) -> None:
         super().__init__(
             daemon=True,
         )
 
         self.exception = exception
-        self.sleep_interval = sleep_interval
 
         self.thread_to_end_time: typing.Dict[int, float] = {}
+        self.end_times_heap: typing.List[typing.Tuple[float, int]] = []
         self.enabled = True
         self.started = False
 
         self.finished = threading.Event()
         self.lock = threading.Lock()
+        self.condition = threading.Condition(
+            lock=self.lock,
+        )
 
     def run(
         self,
     ) -> None:
         self.started = True
 
-        while self.enabled:
-            with self.lock:
-                for thread_id, end_time in list(self.thread_to_end_time.items()):
-                    if time.time() > end_time:
-                        del self.thread_to_end_time[thread_id]
-                        self.raise_exception_in_thread(
-                            thread_id=thread_id,
-                            exception=self.exception,
-                        )
+        with self.condition:
+            while self.enabled:
+                while self.end_times_heap:
+                    end_time, thread_id = self.end_times_heap[0]
+                    if self.thread_to_end_time.get(thread_id) == end_time:
+                        break
+
+                    heapq.heappop(self.end_times_heap)
+
+                if not self.end_times_heap:
+                    self.condition.wait()
 
-            time.sleep(self.sleep_interval)
+                    continue
+
+                time_left = self.end_times_heap[0][0] - time.monotonic()
+                if time_left > 0:
+                    self.condition.wait(
+                        timeout=time_left,
+                    )
+
+                    continue
+
+                end_time, thread_id = heapq.heappop(self.end_times_heap)
+                del self.thread_to_end_time[thread_id]
+                self.raise_exception_in_thread(
+                    thread_id=thread_id,
+                    exception=self.exception,
+                )
 
         self.finished.set()
 
@@ -61,24 +81,49 @@ class Killer(
         self,
     ) -> None:
         if self.started:
-            self.enabled = False
+            with self.condition:
+                self.enabled = False
+                self.condition.notify()
+
             self.finished.wait()
 
     def remove(
         self,
         thread_id: int,
     ) -> None:
-        with self.lock:
+        with self.condition:
             if thread_id in self.thread_to_end_time:
                 del self.thread_to_end_time[thread_id]
 
+            if len(self.end_times_heap) > 2 * len(self.thread_to_end_time) + 64:
+                self.end_times_heap = [
+                    (
+                        end_time,
+                        thread_id,
+                    )
+                    for thread_id, end_time in self.thread_to_end_time.items()
+                ]
+                heapq.heapify(self.end_times_heap)
+
     def add(
         self,
         thread_id: int,
         timeout: float,
     ) -> None:
-        with self.lock:
-            self.thread_to_end_time[thread_id] = time.time() + timeout
+        with self.condition:
+            end_time = time.monotonic() + timeout
+
+            self.thread_to_end_time[thread_id] = end_time
+            heapq.heappush(
+                self.end_times_heap,
+                (
+                    end_time,
+                    thread_id,
+                ),
+            )
+
+            if self.end_times_heap[0][1] == thread_id:
+                self.condition.notify()
 
     def __del__(
         self,
@@ -0,0 +1,152 @@
+import math
+import typing
+
+
+class TimerWheel:
+    def __init__(
+        self,
+        tick_duration: float,
+        wheel_size: int = 64,
+        number_of_levels: int = 4,
+        start_time: float = 0.0,
+    ) -> None:
+        self.tick_duration = tick_duration
+        self.wheel_size = wheel_size
+        self.number_of_levels = number_of_levels
+
+        self.levels: typing.List[typing.List[typing.Set[typing.Hashable]]] = [
+            [
+                set()
+                for slot in range(wheel_size)
+            ]
+            for level in range(number_of_levels)
+        ]
+        self.timers: typing.Dict[typing.Hashable, typing.Tuple[int, int, int]] = {}
+        self.expired_keys: typing.List[typing.Hashable] = []
+        self.current_tick = int(start_time / tick_duration)
+
+    def __len__(
+        self,
+    ) -> int:
+        return len(self.timers) + len(self.expired_keys)
+
+    def __contains__(
+        self,
+        key: typing.Hashable,
+    ) -> bool:
+        return key in self.timers or key in self.expired_keys
+
+    def time_to_tick(
+        self,
+        time_point: float,
+    ) -> int:
+        return int(math.ceil(time_point / self.tick_duration))
+
+    def add(
+        self,
+        key: typing.Hashable,
+        deadline: float,
+    ) -> None:
+        self.remove(
+            key=key,
+        )
+
+        expiration_tick = self.time_to_tick(
+            time_point=deadline,
+        )
+        self.place(
+            key=key,
+            expiration_tick=expiration_tick,
+        )
+
+    def place(
+        self,
+        key: typing.Hashable,
+        expiration_tick: int,
+    ) -> None:
+        ticks_left = expiration_tick - self.current_tick
+        if ticks_left <= 0:
+            self.expired_keys.append(key)
+
+            return
+
+        level = 0
+        while level < self.number_of_levels - 1 and ticks_left >= self.wheel_size ** (level + 1):
+            level += 1
+
+        placement_tick = min(
+            expiration_tick,
+            self.current_tick + self.wheel_size ** self.number_of_levels - 1,
+        )
+        slot = (placement_tick // self.wheel_size ** level) % self.wheel_size
+
+        self.levels[level][slot].add(key)
+        self.timers[key] = (
+            level,
+            slot,
+            expiration_tick,
+        )
+
+    def remove(
+        self,
+        key: typing.Hashable,
+    ) -> bool:
+        timer = self.timers.pop(key, None)
+        if timer is not None:
+            level, slot, expiration_tick = timer
+            self.levels[level][slot].discard(key)
+
+            return True
+
+        if key in self.expired_keys:
+            self.expired_keys.remove(key)
+
+            return True
+
+        return False
+
+    def advance(
+        self,
+        now: float,
+    ) -> typing.List[typing.Hashable]:
+        target_tick = int(now / self.tick_duration)
+
+        while self.timers and self.current_tick < target_tick:
+            self.current_tick += 1
+
+            for level in range(self.number_of_levels - 1, 0, -1):
+                if self.current_tick % self.wheel_size ** level == 0:
+                    self.cascade(
+                        level=level,
+                        slot=(self.current_tick // self.wheel_size ** level) % self.wheel_size,
+                    )
+
+            self.cascade(
+                level=0,
+                slot=self.current_tick % self.wheel_size,
+            )
+
+        self.current_tick = max(
+            self.current_tick,
+            target_tick,
+        )
+
+        expired_keys = self.expired_keys
+        self.expired_keys = []
+
+        return expired_keys
+
+    def cascade(
+        self,
+        level: int,
+        slot: int,
+    ) -> None:
+        keys = self.levels[level][slot]
+        self.levels[level][slot] = set()
+
+        for key in keys:
+            timer_level, timer_slot, expiration_tick = self.timers.pop(key)
+            self.place(
+                key=key,
+                expiration_tick=expiration_tick,
+            )
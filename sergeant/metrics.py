@@ -0,0 +1,381 @@
+import bisect
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import typing
+
+import logging
+
+from . import killer
+from . import objects
+
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+HISTOGRAM_NAMES = (
+    'queue_wait_time',
+    'decode_time',
+    'work_time',
+    'handler_time',
+)
+OUTCOMES = (
+    'success',
+    'failure',
+    'timeout',
+    'retry',
+    'max_retries',
+    'requeue',
+    'stop',
+    'respawn',
+)
+SHARED_COUNTERS_FD_ENVIRONMENT_VARIABLE = 'SERGEANT_SHARED_COUNTERS_FD'
+
+counter_struct = struct.Struct('<Q')
+counters_struct = struct.Struct(f'<{len(OUTCOMES)}Q')
+
+
+class Histogram:
+    def __init__(
+        self,
+        buckets: typing.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(
+        self,
+        value: float,
+    ) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(
+        self,
+        histogram: typing.Dict[str, typing.Any],
+    ) -> None:
+        if histogram['buckets'] != self.buckets:
+            raise ValueError('can not merge histograms with different buckets')
+
+        for bucket_index, bucket_count in enumerate(histogram['counts']):
+            self.counts[bucket_index] += bucket_count
+
+        self.sum += histogram['sum']
+        self.count += histogram['count']
+
+    def to_dict(
+        self,
+    ) -> typing.Dict[str, typing.Any]:
+        return {
+            'buckets': list(self.buckets),
+            'counts': list(self.counts),
+            'sum': self.sum,
+            'count': self.count,
+        }
+
+
+class SharedCounters:
+    def __init__(
+        self,
+        number_of_slots: int,
+        file_descriptor: typing.Optional[int] = None,
+    ) -> None:
+        if file_descriptor is None:
+            file_descriptor, file_path = tempfile.mkstemp(
+                prefix='sergeant_shared_counters_',
+                dir='/dev/shm' if os.path.isdir('/dev/shm') else None,
+            )
+            os.unlink(file_path)
+            os.ftruncate(file_descriptor, number_of_slots * counters_struct.size)
+
+        self.number_of_slots = number_of_slots
+        self.file_descriptor = file_descriptor
+        self.memory_map = mmap.mmap(
+            file_descriptor,
+            number_of_slots * counters_struct.size,
+        )
+
+    def read(
+        self,
+        slot_index: int,
+    ) -> typing.Dict[str, int]:
+        return dict(
+            zip(
+                OUTCOMES,
+                counters_struct.unpack_from(self.memory_map, slot_index * counters_struct.size),
+            )
+        )
+
+    def increment(
+        self,
+        slot_index: int,
+        outcome_index: int,
+    ) -> None:
+        offset = slot_index * counters_struct.size + outcome_index * counter_struct.size
+        counter_struct.pack_into(
+            self.memory_map,
+            offset,
+            counter_struct.unpack_from(self.memory_map, offset)[0] + 1,
+        )
+
+    def reset(
+        self,
+        slot_index: int,
+    ) -> None:
+        counters_struct.pack_into(
+            self.memory_map,
+            slot_index * counters_struct.size,
+            *[0] * len(OUTCOMES),
+        )
+
+    def close(
+        self,
+    ) -> None:
+        try:
+            self.memory_map.close()
+        except Exception:
+            pass
+
+        try:
+            os.close(self.file_descriptor)
+        except OSError:
+            pass
+
+
+class SharedCountersSlot:
+    def __init__(
+        self,
+        shared_counters: SharedCounters,
+        slot_index: int,
+    ) -> None:
+        self.shared_counters = shared_counters
+        self.slot_index = slot_index
+
+    @classmethod
+    def from_environment(
+        cls,
+    ) -> typing.Optional['SharedCountersSlot']:
+        file_descriptor = os.environ.get(SHARED_COUNTERS_FD_ENVIRONMENT_VARIABLE)
+        slot_index = os.environ.get(killer.shared.DEADLINE_SLOT_INDEX_ENVIRONMENT_VARIABLE)
+        if file_descriptor is None or slot_index is None:
+            return None
+
+        try:
+            file_size = os.fstat(int(file_descriptor)).st_size
+        except OSError:
+            return None
+
+        return cls(
+            shared_counters=SharedCounters(
+                number_of_slots=file_size // counters_struct.size,
+                file_descriptor=int(file_descriptor),
+            ),
+            slot_index=int(slot_index),
+        )
+
+    def increment(
+        self,
+        outcome: str,
+    ) -> None:
+        if outcome in OUTCOMES:
+            self.shared_counters.increment(
+                slot_index=self.slot_index,
+                outcome_index=OUTCOMES.index(outcome),
+            )
+
+
+class Sink:
+    def export(
+        self,
+        metrics: typing.Dict[str, typing.Any],
+    ) -> None:
+        raise NotImplementedError()
+
+
+class LoggerSink(
+    Sink,
+):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        level: int = logging.INFO,
+    ) -> None:
+        self.logger = logger
+        self.level = level
+
+    def export(
+        self,
+        metrics: typing.Dict[str, typing.Any],
+    ) -> None:
+        self.logger.log(
+            level=self.level,
+            msg='task metrics',
+            extra={
+                'metrics': metrics,
+            },
+        )
+
+
+class Metrics:
+    def __init__(
+        self,
+        enabled: bool = True,
+        buckets: typing.Sequence[float] = DEFAULT_BUCKETS,
+        sinks: typing.Optional[typing.Sequence[Sink]] = None,
+        export_interval: float = 60.0,
+        shared_counters_slot: typing.Optional[SharedCountersSlot] = None,
+    ) -> None:
+        self.enabled = enabled
+        self.buckets = list(buckets)
+        self.sinks = list(sinks) if sinks is not None else []
+        self.export_interval = export_interval
+        self.shared_counters_slot = shared_counters_slot
+
+        self.lock = threading.Lock()
+        self.histograms = {
+            histogram_name: Histogram(
+                buckets=self.buckets,
+            )
+            for histogram_name in HISTOGRAM_NAMES
+        }
+        self.counters = dict.fromkeys(OUTCOMES, 0)
+        self.task_start_times: typing.Dict[int, float] = {}
+        self.next_export_time = time.monotonic() + export_interval
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.histograms[name].observe(value)
+
+    def observe_pulled_tasks(
+        self,
+        tasks: typing.Iterable[objects.Task],
+        decode_time: float,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self.lock:
+            for task in tasks:
+                self.histograms['queue_wait_time'].observe(max(now - task.date, 0.0))
+                self.histograms['decode_time'].observe(decode_time)
+
+    def work_started(
+        self,
+        task: objects.Task,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        self.task_start_times[id(task)] = time.perf_counter()
+
+    def work_finished(
+        self,
+        task: objects.Task,
+        outcome: str,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        work_start_time = self.task_start_times.get(id(task))
+        self.task_start_times[id(task)] = now
+
+        with self.lock:
+            if work_start_time is not None:
+                self.histograms['work_time'].observe(now - work_start_time)
+
+            self.counters[outcome] = self.counters.get(outcome, 0) + 1
+            if self.shared_counters_slot is not None:
+                self.shared_counters_slot.increment(
+                    outcome=outcome,
+                )
+
+    def task_finished(
+        self,
+        task: objects.Task,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        handler_start_time = self.task_start_times.pop(id(task), None)
+        if handler_start_time is None:
+            return
+
+        self.observe(
+            name='handler_time',
+            value=time.perf_counter() - handler_start_time,
+        )
+
+    def to_dict(
+        self,
+    ) -> typing.Dict[str, typing.Any]:
+        with self.lock:
+            return {
+                'histograms': {
+                    histogram_name: histogram.to_dict()
+                    for histogram_name, histogram in self.histograms.items()
+                },
+                'counters': dict(self.counters),
+            }
+
+    def merge(
+        self,
+        metrics: typing.Dict[str, typing.Any],
+    ) -> None:
+        with self.lock:
+            for histogram_name, histogram in metrics.get('histograms', {}).items():
+                if histogram_name not in self.histograms:
+                    self.histograms[histogram_name] = Histogram(
+                        buckets=histogram['buckets'],
+                    )
+
+                self.histograms[histogram_name].merge(
+                    histogram=histogram,
+                )
+
+            for outcome, count in metrics.get('counters', {}).items():
+                self.counters[outcome] = self.counters.get(outcome, 0) + count
+
+    def export_is_due(
+        self,
+    ) -> bool:
+        return self.enabled and bool(self.sinks) and time.monotonic() >= self.next_export_time
+
+    def export(
+        self,
+    ) -> None:
+        self.next_export_time = time.monotonic() + self.export_interval
+
+        metrics = self.to_dict()
+        for sink in self.sinks:
+            sink.export(
+                metrics=metrics,
+            )
@@ -13,3 +13,87 @@ class Task:
         default_factory=lambda: time.time(),
     )
     run_count: int = 0
+
+    @classmethod
+    def from_encoded_kwargs(
+        cls,
+        encoded_kwargs: bytes,
+        kwargs_decoder: typing.Callable[[bytes], typing.Dict[str, typing.Any]],
+        trace_id: typing.Optional[str],
+        date: float,
+        run_count: int,
+    ) -> 'Task':
+        task = cls.__new__(cls)
+        task.trace_id = trace_id
+        task.date = date
+        task.run_count = run_count
+        task.__dict__['encoded_kwargs'] = encoded_kwargs
+        task.__dict__['kwargs_decoder'] = kwargs_decoder
+
+        return task
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> typing.Any:
+        if name == 'kwargs' and 'encoded_kwargs' in self.__dict__:
+            self.kwargs = self.__dict__['kwargs_decoder'](self.__dict__['encoded_kwargs'])
+
+            return self.kwargs
+
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+    def __getstate__(
+        self,
+    ) -> typing.Dict[str, typing.Any]:
+        return {
+            'kwargs': self.kwargs,
+            'trace_id': self.trace_id,
+            'date': self.date,
+            'run_count': self.run_count,
+        }
+
+    def get_encoded_kwargs(
+        self,
+        kwargs_decoder: typing.Callable[[bytes], typing.Dict[str, typing.Any]],
+    ) -> typing.Optional[bytes]:
+        if 'kwargs' in self.__dict__ or self.__dict__.get('kwargs_decoder') != kwargs_decoder:
+            return None
+
+        return self.__dict__.get('encoded_kwargs')
+
+    def set_original_payload(
+        self,
+        payload: bytes,
+    ) -> None:
+        if 'kwargs' not in self.__dict__:
+            self.__dict__['original_payload'] = (
+                payload,
+                self.trace_id,
+                self.date,
+                self.run_count,
+            )
+
+    def get_original_payload(
+        self,
+    ) -> typing.Optional[bytes]:
+        original_payload = self.__dict__.get('original_payload')
+        if original_payload is None or 'kwargs' in self.__dict__:
+            return None
+
+        payload, trace_id, date, run_count = original_payload
+        if trace_id != self.trace_id or date != self.date or run_count != self.run_count:
+            return None
+
+        return payload
+
+    def set_leased_item(
+        self,
+        leased_item: bytes,
+    ) -> None:
+        self.__dict__['leased_item'] = leased_item
+
+    def pop_leased_item(
+        self,
+    ) -> typing.Optional[bytes]:
+        return self.__dict__.pop('leased_item', None)
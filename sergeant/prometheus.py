@@ -0,0 +1,175 @@
+import http.server
+import threading
+import typing
+
+
+class Exposition:
+    def __init__(
+        self,
+    ) -> None:
+        self.lines: typing.List[str] = []
+
+    def add_metric(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+    ) -> None:
+        self.lines.append(f'# HELP {name} {help_text}')
+        self.lines.append(f'# TYPE {name} {metric_type}')
+
+    def add_sample(
+        self,
+        name: str,
+        value: float,
+        labels: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> None:
+        if labels:
+            formatted_labels = ','.join(
+                f'{label_name}="{escape_label_value(str(label_value))}"'
+                for label_name, label_value in labels.items()
+            )
+            self.lines.append(f'{name}{{{formatted_labels}}} {format_value(value)}')
+        else:
+            self.lines.append(f'{name} {format_value(value)}')
+
+    def add_histogram(
+        self,
+        name: str,
+        histogram: typing.Dict[str, typing.Any],
+        labels: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> None:
+        labels = labels if labels is not None else {}
+
+        cumulative_count = 0
+        for bucket, bucket_count in zip(histogram['buckets'], histogram['counts']):
+            cumulative_count += bucket_count
+            self.add_sample(
+                name=f'{name}_bucket',
+                value=cumulative_count,
+                labels=dict(
+                    labels,
+                    le=format_value(bucket),
+                ),
+            )
+
+        self.add_sample(
+            name=f'{name}_bucket',
+            value=histogram['count'],
+            labels=dict(
+                labels,
+                le='+Inf',
+            ),
+        )
+        self.add_sample(
+            name=f'{name}_sum',
+            value=histogram['sum'],
+            labels=labels,
+        )
+        self.add_sample(
+            name=f'{name}_count',
+            value=histogram['count'],
+            labels=labels,
+        )
+
+    def render(
+        self,
+    ) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+def escape_label_value(
+    label_value: str,
+) -> str:
+    return label_value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_value(
+    value: float,
+) -> str:
+    if isinstance(value, int):
+        return str(value)
+
+    return repr(float(value))
+
+
+class MetricsServer:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        collect: typing.Callable[[], str],
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.collect = collect
+
+        self.http_server: typing.Optional[http.server.ThreadingHTTPServer] = None
+        self.serve_thread: typing.Optional[threading.Thread] = None
+
+    def start(
+        self,
+    ) -> None:
+        collect = self.collect
+
+        class RequestHandler(
+            http.server.BaseHTTPRequestHandler,
+        ):
+            def do_GET(
+                self,
+            ) -> None:
+                if self.path.split('?')[0] not in (
+                    '/',
+                    '/metrics',
+                ):
+                    self.send_error(404)
+
+                    return
+
+                try:
+                    body = collect().encode()
+                except Exception as exception:
+                    self.send_error(500, str(exception))
+
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(
+                self,
+                message_format: str,
+                *args: typing.Any,
+            ) -> None:
+                pass
+
+        self.http_server = http.server.ThreadingHTTPServer(
+            (
+                self.host,
+                self.port,
+            ),
+            RequestHandler,
+        )
+        self.http_server.daemon_threads = True
+        self.port = self.http_server.server_address[1]
+
+        self.serve_thread = threading.Thread(
+            target=self.http_server.serve_forever,
+            daemon=True,
+        )
+        self.serve_thread.start()
+
+    def shutdown(
+        self,
+    ) -> None:
+        if self.http_server is not None:
+            self.http_server.shutdown()
+            self.http_server.server_close()
+            self.http_server = None
+
+        if self.serve_thread is not None:
+            self.serve_thread.join()
+            self.serve_thread = None
@@ -114,41 +114,19 @@ def kill_running_background_threads() -> bool:
     return number_of_unkillable_threads == 0
 
 
-if __name__ == '__main__':
-    parser = argparse.ArgumentParser(
-        description='Sergeant Slave',
-    )
-    parser.add_argument(
-        '--child-pipe',
-        help='Pipe fileno to return the potential exception',
-        type=int,
-        required=True,
-        dest='child_pipe',
-    )
-    parser.add_argument(
-        '--worker-class',
-        help='Class name of the worker to spawn',
-        type=str,
-        required=True,
-        dest='worker_class',
-    )
-    parser.add_argument(
-        '--worker-module',
-        help='Module of the worker class',
-        type=str,
-        required=True,
-        dest='worker_module',
-    )
-    args = parser.parse_args()
-
+def run(
+    child_pipe: int,
+    worker_module_name: str,
+    worker_class_name: str,
+) -> None:
     try:
         pipe_obj = multiprocessing.connection.Connection(
-            handle=args.child_pipe,
+            handle=child_pipe,
         )
 
         return_code, summary = work(
-            worker_module_name=args.worker_module,
-            worker_class_name=args.worker_class,
+            worker_module_name=worker_module_name,
+            worker_class_name=worker_class_name,
         )
         if not summary:
             sys.exit(return_code)
@@ -175,3 +153,37 @@ if __name__ == '__main__':
             sys.exit(return_code)
     except KeyboardInterrupt:
         sys.exit(0)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Sergeant Slave',
+    )
+    parser.add_argument(
+        '--child-pipe',
+        help='Pipe fileno to return the potential exception',
+        type=int,
+        required=True,
+        dest='child_pipe',
+    )
+    parser.add_argument(
+        '--worker-class',
+        help='Class name of the worker to spawn',
+        type=str,
+        required=True,
+        dest='worker_class',
+    )
+    parser.add_argument(
+        '--worker-module',
+        help='Module of the worker class',
+        type=str,
+        required=True,
+        dest='worker_module',
+    )
+    args = parser.parse_args()
+
+    run(
+        child_pipe=args.child_pipe,
+        worker_module_name=args.worker_module,
+        worker_class_name=args.worker_class,
+    )
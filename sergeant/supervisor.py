@@ -1,47 +1,101 @@
 import argparse
+import importlib
 import multiprocessing
 import multiprocessing.context
+import os
 import psutil
+import selectors
 import shlex
 import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
 import types
 import typing
 
 import logging
 
+from . import autoscaler
+from . import killer
+from . import metrics
+from . import prometheus
+from . import slave
+from . import zygote
+
 
 class SupervisedWorker:
     def __init__(
         self,
         worker_module_name: str,
         worker_class_name: str,
+        deadline_slots: killer.shared.DeadlineSlots,
+        shared_counters: metrics.SharedCounters,
+        slot_index: int,
+        zygote_obj: typing.Optional[zygote.Zygote] = None,
     ) -> None:
+        self.slot_index = slot_index
+
         pipe = multiprocessing.Pipe()
 
         self.parent_pipe = pipe[0]
         self.child_pipe = pipe[1]
 
-        self.process = subprocess.Popen(
-            args=shlex.split(
-                s=(
-                    f'{sys.executable} -m sergeant.slave '
-                    f'--worker-module={worker_module_name} '
-                    f'--worker-class={worker_class_name} '
-                    f'--child-pipe={self.child_pipe.fileno()} '
-                ),
-            ),
-            pass_fds=(
-                self.child_pipe.fileno(),
-            ),
+        deadline_slots.write(
+            slot_index=slot_index,
+            timeout_time=0.0,
+            kill_time=0.0,
         )
+        shared_counters.reset(
+            slot_index=slot_index,
+        )
+
+        self.process: typing.Union[subprocess.Popen, zygote.ZygoteProcess]
+        if zygote_obj is not None:
+            self.process = zygote_obj.spawn(
+                child_pipe=self.child_pipe,
+                slot_index=slot_index,
+            )
+        else:
+            self.process = subprocess.Popen(
+                args=shlex.split(
+                    s=(
+                        f'{sys.executable} -m sergeant.slave '
+                        f'--worker-module={worker_module_name} '
+                        f'--worker-class={worker_class_name} '
+                        f'--child-pipe={self.child_pipe.fileno()} '
+                    ),
+                ),
+                pass_fds=(
+                    self.child_pipe.fileno(),
+                    deadline_slots.file_descriptor,
+                    shared_counters.file_descriptor,
+                ),
+                env=dict(
+                    os.environ,
+                    **{
+                        killer.shared.DEADLINE_SLOTS_FD_ENVIRONMENT_VARIABLE: str(deadline_slots.file_descriptor),
+                        killer.shared.DEADLINE_SLOT_INDEX_ENVIRONMENT_VARIABLE: str(slot_index),
+                        metrics.SHARED_COUNTERS_FD_ENVIRONMENT_VARIABLE: str(shared_counters.file_descriptor),
+                    },
+                ),
+            )
 
         self.psutil_obj = psutil.Process(
             pid=self.process.pid,
         )
 
+        self.pidfd: typing.Optional[int] = None
+        if zygote_obj is None and hasattr(os, 'pidfd_open'):
+            try:
+                self.pidfd = os.pidfd_open(self.process.pid)
+            except OSError:
+                pass
+
+        self.summary: typing.Optional[typing.Dict[str, typing.Any]] = None
+        self.is_scaling_down = False
+
     def get_rss_memory(
         self,
     ) -> int:
@@ -50,11 +104,19 @@ class SupervisedWorker:
         except psutil.NoSuchProcess:
             return 0
 
+    def receive_summary(
+        self,
+    ) -> None:
+        if self.summary is None and self.parent_pipe.poll():
+            self.summary = self.parent_pipe.recv()
+
     def get_summary(
         self,
     ) -> typing.Dict[str, typing.Any]:
-        if self.parent_pipe.poll():
-            return self.parent_pipe.recv()
+        self.receive_summary()
+
+        if self.summary is not None:
+            return self.summary
         else:
             return {}
 
@@ -67,6 +129,14 @@ class SupervisedWorker:
         except Exception:
             pass
 
+        if self.pidfd is not None:
+            try:
+                os.close(self.pidfd)
+            except OSError:
+                pass
+
+            self.pidfd = None
+
         try:
             self.process.kill()
         except Exception:
@@ -93,14 +163,45 @@ class Supervisor:
         worker_class_name: str,
         concurrent_workers: int,
         max_worker_memory_usage: typing.Optional[int] = None,
+        memory_check_interval: float = 1.0,
+        use_zygote: bool = False,
+        min_workers: typing.Optional[int] = None,
+        max_workers: typing.Optional[int] = None,
+        target_backlog_per_worker: float = 100.0,
+        target_drain_time: typing.Optional[float] = None,
+        scaling_hysteresis: float = 0.2,
+        scaling_cooldown: float = 30.0,
+        scaling_interval: float = 5.0,
+        metrics_port: typing.Optional[int] = None,
+        metrics_host: str = '0.0.0.0',
         logger: typing.Optional[logging.Logger] = None,
     ):
         self.worker_module_name = worker_module_name
         self.worker_class_name = worker_class_name
         self.concurrent_workers = concurrent_workers
         self.max_worker_memory_usage = max_worker_memory_usage
+        self.memory_check_interval = memory_check_interval
+        self.use_zygote = use_zygote
+        self.scaling_interval = scaling_interval
+        self.metrics_port = metrics_port
+        self.metrics_host = metrics_host
+
+        self.autoscaler: typing.Optional[autoscaler.Autoscaler] = None
+        if max_workers is not None:
+            self.autoscaler = autoscaler.Autoscaler(
+                min_workers=min_workers if min_workers is not None else 1,
+                max_workers=max_workers,
+                target_backlog_per_worker=target_backlog_per_worker,
+                target_drain_time=target_drain_time,
+                hysteresis=scaling_hysteresis,
+                cooldown=scaling_cooldown,
+            )
+            self.concurrent_workers = self.autoscaler.clamp(
+                number_of_workers=self.concurrent_workers,
+            )
 
         self.stop_process_has_started = False
+        self.stop_signal_was_sent = False
 
         self.supevisor_process = psutil.Process()
 
@@ -130,6 +231,39 @@ class Supervisor:
             self.logger.setLevel(logging.INFO)
 
         self.current_workers: typing.List[SupervisedWorker] = []
+        self.task_metrics = metrics.Metrics()
+        self.metrics_lock = threading.Lock()
+        self.metrics_server: typing.Optional[prometheus.MetricsServer] = None
+        self.number_of_respawns = 0
+        self.number_of_memory_limit_kills = 0
+        self.worker_exits: typing.Dict[str, int] = {}
+        self.released_workers_task_counters = dict.fromkeys(metrics.OUTCOMES, 0)
+
+        number_of_slots = self.concurrent_workers
+        if self.autoscaler is not None:
+            number_of_slots = self.autoscaler.max_workers
+
+        self.deadline_slots = killer.shared.DeadlineSlots(
+            number_of_slots=number_of_slots,
+        )
+        self.free_slot_indices = list(range(number_of_slots))
+        self.shared_counters = metrics.SharedCounters(
+            number_of_slots=number_of_slots,
+        )
+        self.killer = killer.shared.Killer(
+            deadline_slots=self.deadline_slots,
+            logger=self.logger,
+        )
+
+        self.zygote: typing.Optional[zygote.Zygote] = None
+        self.zygote_file_descriptor: typing.Optional[int] = None
+
+        self.selector: typing.Optional[selectors.BaseSelector] = None
+        self.wakeup_socket: typing.Optional[socket.socket] = None
+        self.wakeup_writer_socket: typing.Optional[socket.socket] = None
+        self.next_memory_check_time = 0.0
+        self.next_scaling_time = 0.0
+        self.queue_worker: typing.Optional[typing.Any] = None
 
         signal.signal(signal.SIGTERM, self.sigterm_handler)
 
@@ -147,34 +281,344 @@ class Supervisor:
     def start(
         self,
     ) -> None:
-        for i in range(self.concurrent_workers):
-            worker = SupervisedWorker(
+        if self.metrics_port is not None:
+            self.metrics_server = prometheus.MetricsServer(
+                host=self.metrics_host,
+                port=self.metrics_port,
+                collect=self.collect_metrics,
+            )
+            self.metrics_server.start()
+            self.logger.info(
+                msg=f'serving metrics on {self.metrics_host}:{self.metrics_server.port}',
+                extra=self.extra_signature,
+            )
+
+        if self.use_zygote:
+            self.zygote = zygote.Zygote(
                 worker_module_name=self.worker_module_name,
                 worker_class_name=self.worker_class_name,
+                deadline_slots=self.deadline_slots,
+                shared_counters=self.shared_counters,
             )
+            self.zygote.start()
+
+        for i in range(self.concurrent_workers):
+            worker = self.spawn_a_worker()
             self.logger.info(
                 msg=f'spawned a new worker at pid: {worker.process.pid}',
                 extra=self.extra_signature,
             )
 
+        self.supervise_loop()
+
+    def spawn_a_worker(
+        self,
+    ) -> SupervisedWorker:
+        if self.zygote is not None and not self.zygote.is_alive():
+            self.restart_zygote()
+
+        worker = SupervisedWorker(
+            worker_module_name=self.worker_module_name,
+            worker_class_name=self.worker_class_name,
+            deadline_slots=self.deadline_slots,
+            shared_counters=self.shared_counters,
+            slot_index=self.free_slot_indices.pop(0),
+            zygote_obj=self.zygote,
+        )
+        self.killer.watch(
+            slot_index=worker.slot_index,
+            pid=worker.process.pid,
+        )
+        with self.metrics_lock:
             self.current_workers.append(worker)
 
-        self.supervise_loop()
+        if self.selector is not None:
+            self.register_worker(
+                worker=worker,
+            )
+
+        return worker
+
+    def release_a_worker(
+        self,
+        worker: SupervisedWorker,
+    ) -> None:
+        if self.selector is not None:
+            self.unregister_worker(
+                worker=worker,
+            )
+
+        worker.kill()
+
+        self.killer.unwatch(
+            slot_index=worker.slot_index,
+        )
+
+        with self.metrics_lock:
+            for outcome, count in self.shared_counters.read(
+                slot_index=worker.slot_index,
+            ).items():
+                self.released_workers_task_counters[outcome] += count
+            self.shared_counters.reset(
+                slot_index=worker.slot_index,
+            )
+
+            self.free_slot_indices.append(worker.slot_index)
+            self.current_workers.remove(worker)
+
+    def register_worker(
+        self,
+        worker: SupervisedWorker,
+    ) -> None:
+        selector = typing.cast(selectors.BaseSelector, self.selector)
+
+        selector.register(
+            fileobj=worker.parent_pipe,
+            events=selectors.EVENT_READ,
+            data=worker,
+        )
+        if worker.pidfd is not None:
+            selector.register(
+                fileobj=worker.pidfd,
+                events=selectors.EVENT_READ,
+                data=worker,
+            )
+
+    def unregister_worker(
+        self,
+        worker: SupervisedWorker,
+    ) -> None:
+        selector = typing.cast(selectors.BaseSelector, self.selector)
+
+        for fileobj in [
+            worker.parent_pipe,
+            worker.pidfd,
+        ]:
+            if fileobj is None:
+                continue
+
+            try:
+                selector.unregister(
+                    fileobj=fileobj,
+                )
+            except (
+                KeyError,
+                ValueError,
+            ):
+                pass
+
+    def register_zygote(
+        self,
+    ) -> None:
+        if self.zygote is None or self.zygote.connection is None:
+            return
+
+        self.zygote_file_descriptor = self.zygote.connection.fileno()
+        typing.cast(selectors.BaseSelector, self.selector).register(
+            fileobj=self.zygote_file_descriptor,
+            events=selectors.EVENT_READ,
+            data=self.zygote,
+        )
+
+    def unregister_zygote(
+        self,
+    ) -> None:
+        if self.zygote_file_descriptor is None:
+            return
+
+        try:
+            typing.cast(selectors.BaseSelector, self.selector).unregister(
+                fileobj=self.zygote_file_descriptor,
+            )
+        except (
+            KeyError,
+            ValueError,
+        ):
+            pass
+
+        self.zygote_file_descriptor = None
+
+    def restart_zygote(
+        self,
+    ) -> None:
+        zygote_obj = typing.cast(zygote.Zygote, self.zygote)
+
+        self.logger.warning(
+            msg='the zygote has exited, starting a new one',
+            extra=self.extra_signature,
+        )
+
+        if self.selector is not None:
+            self.unregister_zygote()
+
+        zygote_obj.start()
+
+        if self.selector is not None:
+            self.register_zygote()
+
+    def init_selector(
+        self,
+    ) -> None:
+        self.selector = selectors.DefaultSelector()
+
+        wakeup_socket, wakeup_writer_socket = socket.socketpair()
+        wakeup_socket.setblocking(False)
+        wakeup_writer_socket.setblocking(False)
+
+        try:
+            signal.set_wakeup_fd(
+                wakeup_writer_socket.fileno(),
+                warn_on_full_buffer=False,
+            )
+            signal.signal(signal.SIGCHLD, self.sigchld_handler)
+        except ValueError:
+            wakeup_socket.close()
+            wakeup_writer_socket.close()
+        else:
+            self.wakeup_socket = wakeup_socket
+            self.wakeup_writer_socket = wakeup_writer_socket
+            self.selector.register(
+                fileobj=self.wakeup_socket,
+                events=selectors.EVENT_READ,
+            )
+
+        self.register_zygote()
+        for worker in self.current_workers:
+            self.register_worker(
+                worker=worker,
+            )
+
+    def close_selector(
+        self,
+    ) -> None:
+        if self.wakeup_socket is not None:
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+            self.wakeup_socket.close()
+            typing.cast(socket.socket, self.wakeup_writer_socket).close()
+            self.wakeup_socket = None
+            self.wakeup_writer_socket = None
+
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+
+    def sigchld_handler(
+        self,
+        signal_num: int,
+        frame: typing.Optional[types.FrameType],
+    ) -> None:
+        pass
+
+    def drain_wakeup_socket(
+        self,
+    ) -> None:
+        wakeup_socket = typing.cast(socket.socket, self.wakeup_socket)
+
+        try:
+            while wakeup_socket.recv(4096):
+                pass
+        except (
+            BlockingIOError,
+            InterruptedError,
+        ):
+            pass
+
+    def wait_for_events(
+        self,
+    ) -> typing.Tuple[bool, typing.List[SupervisedWorker]]:
+        selector = typing.cast(selectors.BaseSelector, self.selector)
+
+        timeout: typing.Optional[float] = None
+        if self.max_worker_memory_usage:
+            timeout = max(self.next_memory_check_time - time.monotonic(), 0.0)
+
+        if self.autoscaler is not None:
+            scaling_timeout = max(self.next_scaling_time - time.monotonic(), 0.0)
+            timeout = min(timeout, scaling_timeout) if timeout is not None else scaling_timeout
+
+        if self.wakeup_socket is None:
+            timeout = min(timeout, 0.5) if timeout is not None else 0.5
+
+        woken_by_signal = self.wakeup_socket is None
+        exited_workers: typing.List[SupervisedWorker] = []
+        for key, events in selector.select(
+            timeout=timeout,
+        ):
+            if key.data is None:
+                self.drain_wakeup_socket()
+                woken_by_signal = True
+
+                continue
+
+            if isinstance(key.data, zygote.Zygote):
+                key.data.receive_messages(
+                    timeout=0.0,
+                )
+                if not key.data.is_alive():
+                    self.unregister_zygote()
+
+                for worker in self.current_workers:
+                    if worker.process.returncode is not None and worker not in exited_workers:
+                        exited_workers.append(worker)
+
+                continue
+
+            worker = key.data
+            if key.fileobj is worker.parent_pipe:
+                try:
+                    worker.receive_summary()
+                except Exception as exception:
+                    self.logger.error(
+                        msg=f'could not receive supervised_worker\'s summary: {exception}',
+                        extra=self.extra_signature,
+                    )
+
+                selector.unregister(
+                    fileobj=worker.parent_pipe,
+                )
+            elif worker not in exited_workers:
+                exited_workers.append(worker)
+
+        return (
+            woken_by_signal,
+            exited_workers,
+        )
 
     def supervise_loop(
         self,
     ) -> None:
+        self.killer.start()
+        self.init_selector()
+        self.next_memory_check_time = time.monotonic() + self.memory_check_interval
+        self.next_scaling_time = time.monotonic() + self.scaling_interval
+
         try:
             while self.current_workers:
-                current_workers = self.current_workers.copy()
-                for worker in current_workers:
-                    self.supervise_worker(
-                        worker=worker,
-                    )
+                woken_by_signal, workers_to_supervise = self.wait_for_events()
+                if woken_by_signal:
+                    workers_to_supervise = self.current_workers.copy()
+
+                for worker in workers_to_supervise:
+                    if worker in self.current_workers:
+                        self.supervise_worker(
+                            worker=worker,
+                        )
+
+                if self.max_worker_memory_usage and time.monotonic() >= self.next_memory_check_time:
+                    self.check_workers_memory()
+                    self.next_memory_check_time = time.monotonic() + self.memory_check_interval
 
-                self.clean_zombies()
+                if self.autoscaler is not None and time.monotonic() >= self.next_scaling_time:
+                    self.scale_workers()
+                    self.next_scaling_time = time.monotonic() + self.scaling_interval
 
-                time.sleep(0.5)
+                if self.stop_process_has_started and not self.stop_signal_was_sent:
+                    self.send_stop_signal()
+
+                if woken_by_signal:
+                    self.clean_zombies()
 
             self.logger.info(
                 msg='no more workers to supervise',
@@ -195,12 +639,54 @@ class Supervisor:
                 )
                 worker.kill()
 
+            self.close_selector()
+            if self.zygote is not None:
+                self.zygote.stop()
+
+            if self.metrics_server is not None:
+                self.metrics_server.shutdown()
+
+            self.killer.shutdown()
+            self.deadline_slots.close()
+            self.shared_counters.close()
+
             self.logger.info(
                 msg='exiting...',
                 extra=self.extra_signature,
             )
             sys.exit(0)
 
+    def check_workers_memory(
+        self,
+    ) -> None:
+        for worker in self.current_workers.copy():
+            if worker.process.poll() is not None:
+                continue
+
+            rss_memory = worker.get_rss_memory()
+            if self.max_worker_memory_usage and rss_memory > self.max_worker_memory_usage:
+                self.logger.warning(
+                    msg=f'worker({worker.process.pid}) exceeded the maximum memory limit: {rss_memory}',
+                    extra=self.extra_signature,
+                )
+                self.number_of_memory_limit_kills += 1
+                self.respawn_a_worker(
+                    worker=worker,
+                )
+
+    def send_stop_signal(
+        self,
+    ) -> None:
+        self.stop_signal_was_sent = True
+
+        for worker in self.current_workers:
+            try:
+                worker.psutil_obj.send_signal(
+                    sig=signal.SIGTERM,
+                )
+            except psutil.NoSuchProcess:
+                pass
+
     def supervise_worker(
         self,
         worker: SupervisedWorker,
@@ -224,6 +710,18 @@ class Supervisor:
                 )
                 worker_summary = {}
 
+            worker_metrics = worker_summary.pop('metrics', None)
+            if worker_metrics:
+                try:
+                    self.task_metrics.merge(
+                        metrics=worker_metrics,
+                    )
+                except Exception as exception:
+                    self.logger.error(
+                        msg=f'could not aggregate worker({worker.process.pid}) metrics: {exception}',
+                        extra=self.extra_signature,
+                    )
+
             extra_signature = self.extra_signature.copy()
             extra_signature['summary'] = worker_summary
 
@@ -237,6 +735,12 @@ class Supervisor:
                         extra=self.extra_signature,
                     )
 
+            try:
+                return_code_name = slave.ReturnCode(worker_return_code).name
+            except ValueError:
+                return_code_name = str(worker_return_code)
+            self.worker_exits[return_code_name] = self.worker_exits.get(return_code_name, 0) + 1
+
             if worker_return_code == 0:
                 self.logger.info(
                     msg=f'worker({worker.process.pid}) has finished successfully',
@@ -276,7 +780,8 @@ class Supervisor:
                     worker=worker,
                 )
 
-                self.stop_process_has_started = True
+                if not worker.is_scaling_down:
+                    self.stop_process_has_started = True
 
                 return
             elif worker_return_code == 6:
@@ -298,34 +803,22 @@ class Supervisor:
                     extra=self.extra_signature,
                 )
 
-            self.respawn_a_worker(
-                worker=worker,
-            )
-        else:
-            if self.max_worker_memory_usage and worker.get_rss_memory() > self.max_worker_memory_usage:
-                self.logger.warning(
-                    msg=f'worker({worker.process.pid}) exceeded the maximum memory limit: {worker.get_rss_memory()}',
-                    extra=self.extra_signature,
+            if worker.is_scaling_down:
+                self.stop_a_worker(
+                    worker=worker,
                 )
+            else:
                 self.respawn_a_worker(
                     worker=worker,
                 )
 
-        if self.stop_process_has_started:
-            try:
-                worker.psutil_obj.send_signal(
-                    sig=signal.SIGTERM,
-                )
-            except psutil.NoSuchProcess:
-                pass
-
     def respawn_a_worker(
         self,
         worker: SupervisedWorker,
     ) -> None:
-        worker.kill()
-
-        self.current_workers.remove(worker)
+        self.release_a_worker(
+            worker=worker,
+        )
 
         if self.stop_process_has_started:
             self.logger.info(
@@ -333,28 +826,222 @@ class Supervisor:
                 extra=self.extra_signature,
             )
         else:
-            new_worker = SupervisedWorker(
-                worker_module_name=self.worker_module_name,
-                worker_class_name=self.worker_class_name,
-            )
+            new_worker = self.spawn_a_worker()
+            self.number_of_respawns += 1
             self.logger.info(
                 msg=f'worker({worker.process.pid}) was respawned as worker({new_worker.process.pid})',
                 extra=self.extra_signature,
             )
-            self.current_workers.append(new_worker)
 
     def stop_a_worker(
         self,
         worker: SupervisedWorker,
     ) -> None:
-        worker.kill()
-
-        self.current_workers.remove(worker)
+        self.release_a_worker(
+            worker=worker,
+        )
         self.logger.info(
             msg=f'worker({worker.process.pid}) has stopped',
             extra=self.extra_signature,
         )
 
+    def get_number_of_enqueued_tasks(
+        self,
+    ) -> int:
+        if self.queue_worker is None:
+            worker_class = getattr(
+                importlib.import_module(
+                    name=self.worker_module_name,
+                ),
+                self.worker_class_name,
+            )
+            queue_worker = worker_class()
+            signal.signal(signal.SIGTERM, self.sigterm_handler)
+
+            queue_worker.init_broker()
+            self.queue_worker = queue_worker
+
+        return self.queue_worker.number_of_enqueued_tasks()
+
+    def scale_workers(
+        self,
+    ) -> None:
+        if self.stop_process_has_started:
+            return
+
+        autoscaler_obj = typing.cast(autoscaler.Autoscaler, self.autoscaler)
+
+        try:
+            number_of_enqueued_tasks = self.get_number_of_enqueued_tasks()
+        except Exception as exception:
+            self.logger.error(
+                msg=f'could not sample the number of enqueued tasks: {exception}',
+                extra=self.extra_signature,
+            )
+
+            return
+
+        active_workers = [
+            worker
+            for worker in self.current_workers
+            if not worker.is_scaling_down
+        ]
+        desired_number_of_workers = autoscaler_obj.get_desired_number_of_workers(
+            number_of_enqueued_tasks=number_of_enqueued_tasks,
+            number_of_workers=len(active_workers),
+            now=time.monotonic(),
+        )
+
+        if desired_number_of_workers > len(active_workers):
+            self.logger.info(
+                msg=f'scaling up from {len(active_workers)} to {desired_number_of_workers} workers, {number_of_enqueued_tasks} tasks are enqueued',
+                extra=self.extra_signature,
+            )
+            for i in range(desired_number_of_workers - len(active_workers)):
+                if not self.free_slot_indices:
+                    break
+
+                worker = self.spawn_a_worker()
+                self.logger.info(
+                    msg=f'spawned a new worker at pid: {worker.process.pid}',
+                    extra=self.extra_signature,
+                )
+        elif desired_number_of_workers < len(active_workers):
+            self.logger.info(
+                msg=f'scaling down from {len(active_workers)} to {desired_number_of_workers} workers, {number_of_enqueued_tasks} tasks are enqueued',
+                extra=self.extra_signature,
+            )
+            for worker in active_workers[desired_number_of_workers:]:
+                worker.is_scaling_down = True
+                try:
+                    worker.psutil_obj.send_signal(
+                        sig=signal.SIGTERM,
+                    )
+                except psutil.NoSuchProcess:
+                    pass
+
+    def collect_metrics(
+        self,
+    ) -> str:
+        with self.metrics_lock:
+            current_workers = self.current_workers.copy()
+            workers_task_counters = {
+                worker.slot_index: self.shared_counters.read(
+                    slot_index=worker.slot_index,
+                )
+                for worker in current_workers
+            }
+            tasks_counters = dict(self.released_workers_task_counters)
+            for worker_task_counters in workers_task_counters.values():
+                for outcome, count in worker_task_counters.items():
+                    tasks_counters[outcome] += count
+
+        exposition = prometheus.Exposition()
+
+        exposition.add_metric(
+            name='sergeant_supervisor_workers',
+            metric_type='gauge',
+            help_text='Number of workers currently supervised',
+        )
+        exposition.add_sample(
+            name='sergeant_supervisor_workers',
+            value=len(current_workers),
+        )
+
+        exposition.add_metric(
+            name='sergeant_supervisor_respawns_total',
+            metric_type='counter',
+            help_text='Number of workers respawned by the supervisor',
+        )
+        exposition.add_sample(
+            name='sergeant_supervisor_respawns_total',
+            value=self.number_of_respawns,
+        )
+
+        exposition.add_metric(
+            name='sergeant_supervisor_memory_limit_kills_total',
+            metric_type='counter',
+            help_text='Number of workers killed for exceeding the maximum memory usage',
+        )
+        exposition.add_sample(
+            name='sergeant_supervisor_memory_limit_kills_total',
+            value=self.number_of_memory_limit_kills,
+        )
+
+        exposition.add_metric(
+            name='sergeant_supervisor_worker_exits_total',
+            metric_type='counter',
+            help_text='Number of worker exits by return code',
+        )
+        for return_code_name, count in sorted(self.worker_exits.items()):
+            exposition.add_sample(
+                name='sergeant_supervisor_worker_exits_total',
+                value=count,
+                labels={
+                    'return_code': return_code_name,
+                },
+            )
+
+        exposition.add_metric(
+            name='sergeant_worker_rss_bytes',
+            metric_type='gauge',
+            help_text='RSS memory of a supervised worker',
+        )
+        for worker in current_workers:
+            exposition.add_sample(
+                name='sergeant_worker_rss_bytes',
+                value=worker.get_rss_memory(),
+                labels={
+                    'pid': worker.process.pid,
+                    'slot': worker.slot_index,
+                },
+            )
+
+        exposition.add_metric(
+            name='sergeant_worker_tasks_total',
+            metric_type='counter',
+            help_text='Number of tasks a running worker has finished by outcome',
+        )
+        for worker in current_workers:
+            for outcome, count in workers_task_counters[worker.slot_index].items():
+                exposition.add_sample(
+                    name='sergeant_worker_tasks_total',
+                    value=count,
+                    labels={
+                        'pid': worker.process.pid,
+                        'slot': worker.slot_index,
+                        'outcome': outcome,
+                    },
+                )
+
+        exposition.add_metric(
+            name='sergeant_tasks_total',
+            metric_type='counter',
+            help_text='Number of tasks all the workers have finished by outcome',
+        )
+        for outcome, count in tasks_counters.items():
+            exposition.add_sample(
+                name='sergeant_tasks_total',
+                value=count,
+                labels={
+                    'outcome': outcome,
+                },
+            )
+
+        for histogram_name, histogram in self.task_metrics.to_dict()['histograms'].items():
+            metric_name = f'sergeant_task_{histogram_name}_seconds'
+            exposition.add_metric(
+                name=metric_name,
+                metric_type='histogram',
+                help_text=f'Task {histogram_name} of the workers that have exited',
+            )
+            exposition.add_histogram(
+                name=metric_name,
+                histogram=histogram,
+            )
+
+        return exposition.render()
+
     def clean_zombies(
         self,
     ) -> None:
@@ -406,6 +1093,89 @@ def main() -> None:
         required=False,
         dest='max_worker_memory_usage',
     )
+    parser.add_argument(
+        '--memory-check-interval',
+        help='Number of seconds between two checks of the workers memory usage',
+        type=float,
+        required=False,
+        default=1.0,
+        dest='memory_check_interval',
+    )
+    parser.add_argument(
+        '--use-zygote',
+        help='Import the worker module once in a zygote process and fork the workers from it',
+        action='store_true',
+        required=False,
+        dest='use_zygote',
+    )
+    parser.add_argument(
+        '--min-workers',
+        help='Minimum number of workers to keep when autoscaling',
+        type=int,
+        required=False,
+        dest='min_workers',
+    )
+    parser.add_argument(
+        '--max-workers',
+        help='Maximum number of workers to scale up to. Enables autoscaling by the queue depth',
+        type=int,
+        required=False,
+        dest='max_workers',
+    )
+    parser.add_argument(
+        '--target-backlog-per-worker',
+        help='Number of enqueued tasks per worker the autoscaler aims for',
+        type=float,
+        required=False,
+        default=100.0,
+        dest='target_backlog_per_worker',
+    )
+    parser.add_argument(
+        '--target-drain-time',
+        help='Number of seconds the autoscaler aims to drain the queue within',
+        type=float,
+        required=False,
+        dest='target_drain_time',
+    )
+    parser.add_argument(
+        '--scaling-hysteresis',
+        help='Fraction the load must deviate from the target before the autoscaler acts',
+        type=float,
+        required=False,
+        default=0.2,
+        dest='scaling_hysteresis',
+    )
+    parser.add_argument(
+        '--scaling-cooldown',
+        help='Minimum number of seconds between two scaling actions',
+        type=float,
+        required=False,
+        default=30.0,
+        dest='scaling_cooldown',
+    )
+    parser.add_argument(
+        '--scaling-interval',
+        help='Number of seconds between two samples of the queue depth',
+        type=float,
+        required=False,
+        default=5.0,
+        dest='scaling_interval',
+    )
+    parser.add_argument(
+        '--metrics-port',
+        help='Port to serve Prometheus metrics on. Metrics are not served when omitted',
+        type=int,
+        required=False,
+        dest='metrics_port',
+    )
+    parser.add_argument(
+        '--metrics-host',
+        help='Host to bind the Prometheus metrics endpoint to',
+        type=str,
+        required=False,
+        default='0.0.0.0',
+        dest='metrics_host',
+    )
     args = parser.parse_args()
 
     supervisor = Supervisor(
@@ -413,6 +1183,17 @@ def main() -> None:
         worker_class_name=args.worker_class,
         concurrent_workers=args.concurrent_workers,
         max_worker_memory_usage=args.max_worker_memory_usage,
+        memory_check_interval=args.memory_check_interval,
+        use_zygote=args.use_zygote,
+        min_workers=args.min_workers,
+        max_workers=args.max_workers,
+        target_backlog_per_worker=args.target_backlog_per_worker,
+        target_drain_time=args.target_drain_time,
+        scaling_hysteresis=args.scaling_hysteresis,
+        scaling_cooldown=args.scaling_cooldown,
+        scaling_interval=args.scaling_interval,
+        metrics_port=args.metrics_port,
+        metrics_host=args.metrics_host,
     )
     supervisor.start()
 
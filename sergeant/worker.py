@@ -1,6 +1,10 @@
+import asyncio
 import datetime
+import functools
+import queue
 import signal
 import sys
+import threading
 import time
 import types
 import typing
@@ -12,6 +16,7 @@ from . import config
 from . import connector
 from . import encoder
 from . import executor
+from . import metrics
 from . import objects
 
 
@@ -36,6 +41,16 @@ class Worker:
             hdlr=logging.NullHandler(),
         )
         self.executor_obj: typing.Optional[executor._executor.Executor] = None
+        self.metrics = metrics.Metrics(
+            enabled=self.config.metrics.enabled,
+            buckets=self.config.metrics.buckets,
+            sinks=self.config.metrics.sinks,
+            export_interval=self.config.metrics.export_interval,
+            shared_counters_slot=metrics.SharedCountersSlot.from_environment(),
+        )
+
+        self.tasks_to_acknowledge: typing.List[objects.Task] = []
+        self.tasks_to_acknowledge_lock = threading.Lock()
 
         self.received_stop_signal = False
 
@@ -105,6 +120,9 @@ class Worker:
         encoder_obj = encoder.encoder.Encoder(
             compressor_name=self.config.encoder.compressor,
             serializer_name=self.config.encoder.serializer,
+            compressor_params=self.config.encoder.compressor_params,
+            compression_threshold=self.config.encoder.compression_threshold,
+            self_describing=self.config.encoder.self_describing,
         )
 
         connector_obj: connector.Connector
@@ -117,15 +135,30 @@ class Worker:
         else:
             raise ValueError(f'connector type {self.config.connector.type} is not supported')
 
-        self.broker = broker.Broker(
-            connector=connector_obj,
-            encoder=encoder_obj,
-        )
+        if self.config.outbox is not None:
+            self.broker = broker.Broker(
+                connector=connector_obj,
+                encoder=encoder_obj,
+                outbox_max_items=self.config.outbox.max_items,
+                outbox_flush_interval=self.config.outbox.flush_interval,
+                metrics=self.metrics,
+            )
+        else:
+            self.broker = broker.Broker(
+                connector=connector_obj,
+                encoder=encoder_obj,
+                metrics=self.metrics,
+            )
 
     def init_executor(
         self,
     ) -> None:
-        if self.config.number_of_threads == 1:
+        if self.config.number_of_processes > 1:
+            self.executor_obj = executor.process_pool.ProcessPoolExecutor(
+                worker_object=self,
+                number_of_processes=self.config.number_of_processes,
+            )
+        elif self.config.number_of_threads == 1:
             self.executor_obj = executor.serial.SerialExecutor(
                 worker_object=self,
             )
@@ -211,10 +244,12 @@ class Worker:
         self,
         number_of_tasks: int,
         task_name: typing.Optional[str] = None,
+        timeout: typing.Optional[float] = None,
     ) -> typing.List[objects.Task]:
         return self.broker.pop_tasks(
             task_name=task_name if task_name else self.config.name,
             number_of_tasks=number_of_tasks,
+            timeout=timeout,
         )
 
     def lock(
@@ -225,10 +260,106 @@ class Worker:
             name=name,
         )
 
-    def iterate_tasks(
+    def flush_outbox(
         self,
-    ) -> typing.Iterable[objects.Task]:
-        time_with_no_tasks = 0
+    ) -> None:
+        try:
+            self.broker.flush_outbox()
+        except Exception as exception:
+            self.logger.error(
+                msg=f'could not flush outbox: {exception}',
+            )
+
+    def export_metrics(
+        self,
+    ) -> None:
+        try:
+            self.metrics.export()
+        except Exception as exception:
+            self.logger.error(
+                msg=f'could not export metrics: {exception}',
+            )
+
+    def get_task_outcome(
+        self,
+        exception: typing.Optional[BaseException],
+    ) -> str:
+        if exception is None:
+            return 'success'
+        elif isinstance(
+            exception,
+            WorkerTimedout,
+        ):
+            return 'timeout'
+        elif isinstance(
+            exception,
+            WorkerRetry,
+        ):
+            return 'retry'
+        elif isinstance(
+            exception,
+            WorkerMaxRetries,
+        ):
+            return 'max_retries'
+        elif isinstance(
+            exception,
+            WorkerRequeue,
+        ):
+            return 'requeue'
+        elif isinstance(
+            exception,
+            WorkerStop,
+        ):
+            return 'stop'
+        elif isinstance(
+            exception,
+            WorkerRespawn,
+        ):
+            return 'respawn'
+        else:
+            return 'failure'
+
+    def acknowledge_task(
+        self,
+        task: objects.Task,
+    ) -> None:
+        self.metrics.task_finished(
+            task=task,
+        )
+
+        if not self.broker.connector.reliable:
+            return
+
+        with self.tasks_to_acknowledge_lock:
+            self.tasks_to_acknowledge.append(task)
+            if len(self.tasks_to_acknowledge) < self.config.tasks_per_transaction:
+                return
+
+        self.acknowledge_pending_tasks()
+
+    def acknowledge_pending_tasks(
+        self,
+    ) -> None:
+        with self.tasks_to_acknowledge_lock:
+            tasks_to_acknowledge = self.tasks_to_acknowledge
+            self.tasks_to_acknowledge = []
+
+        if not tasks_to_acknowledge:
+            return
+
+        try:
+            self.broker.acknowledge_tasks(
+                task_name=self.config.name,
+                tasks=tasks_to_acknowledge,
+            )
+        except Exception as exception:
+            self.logger.error(
+                msg=f'could not acknowledge tasks: {exception}',
+            )
+
+    def pull_task_batches(
+        self,
+    ) -> typing.Generator[typing.List[objects.Task], None, None]:
         run_forever = self.config.max_tasks_per_run == 0
         tasks_left = self.config.max_tasks_per_run
 
@@ -241,50 +372,161 @@ class Worker:
                     tasks_left,
                 )
 
+            self.flush_outbox()
+            self.acknowledge_pending_tasks()
+            if self.metrics.export_is_due():
+                self.export_metrics()
+
             tasks = []
+            waited_for_tasks = False
 
             try:
-                tasks = self.get_next_tasks(
-                    number_of_tasks=number_of_tasks_to_pull,
-                )
+                if self.config.blocking_pop:
+                    tasks = self.get_next_tasks(
+                        number_of_tasks=number_of_tasks_to_pull,
+                        timeout=1.0,
+                    )
+                    waited_for_tasks = True
+                else:
+                    tasks = self.get_next_tasks(
+                        number_of_tasks=number_of_tasks_to_pull,
+                    )
             except Exception as exception:
                 self.logger.error(
                     msg=f'could not pull tasks: {exception}',
                 )
 
             if tasks:
-                time_with_no_tasks = 0
-                iterated_tasks = 0
-
-                try:
-                    for task in tasks:
-                        iterated_tasks += 1
-
-                        yield task
-                finally:
-                    if self.received_stop_signal:
-                        iterated_tasks -= 1
-
-                    if iterated_tasks < len(tasks):
-                        self.push_tasks(
-                            kwargs_list=[
-                                task.kwargs
-                                for task in tasks[iterated_tasks:]
-                            ],
-                            priority='HIGH',
-                        )
-
                 if not run_forever:
                     tasks_left -= len(tasks)
-            else:
+            elif not waited_for_tasks:
                 time.sleep(1)
-                time_with_no_tasks += 1
-                if self.config.starvation and time_with_no_tasks >= self.config.starvation.time_with_no_tasks:
-                    self.handle_starvation(
-                        time_with_no_tasks=time_with_no_tasks,
+
+            yield tasks
+
+    def prefetch_task_batches(
+        self,
+    ) -> typing.Generator[typing.List[objects.Task], None, None]:
+        task_batches_queue: queue.Queue = queue.Queue(
+            maxsize=self.config.prefetch_depth,
+        )
+        stop_prefetching = threading.Event()
+
+        prefetching_thread = threading.Thread(
+            target=self.prefetch_task_batches_loop,
+            kwargs={
+                'task_batches_queue': task_batches_queue,
+                'stop_prefetching': stop_prefetching,
+            },
+            daemon=True,
+        )
+        prefetching_thread.start()
+
+        try:
+            while True:
+                tasks = task_batches_queue.get()
+                if tasks is None:
+                    break
+
+                yield tasks
+        finally:
+            stop_prefetching.set()
+
+            unconsumed_tasks = []
+            while prefetching_thread.is_alive() or not task_batches_queue.empty():
+                try:
+                    tasks = task_batches_queue.get(
+                        timeout=0.1,
+                    )
+                except queue.Empty:
+                    continue
+
+                if tasks is None:
+                    break
+
+                unconsumed_tasks += tasks
+
+            if unconsumed_tasks:
+                self.broker.push_tasks(
+                    task_name=self.config.name,
+                    tasks=unconsumed_tasks,
+                    priority='HIGH',
+                )
+
+                for task in unconsumed_tasks:
+                    self.acknowledge_task(
+                        task=task,
                     )
 
-                continue
+    def prefetch_task_batches_loop(
+        self,
+        task_batches_queue: queue.Queue,
+        stop_prefetching: threading.Event,
+    ) -> None:
+        try:
+            for tasks in self.pull_task_batches():
+                task_batches_queue.put(tasks)
+
+                if stop_prefetching.is_set():
+                    break
+        finally:
+            task_batches_queue.put(None)
+
+    def iterate_tasks(
+        self,
+    ) -> typing.Iterable[objects.Task]:
+        time_with_no_tasks = 0
+
+        task_batches: typing.Generator[typing.List[objects.Task], None, None]
+        if self.config.prefetch_depth > 0:
+            task_batches = self.prefetch_task_batches()
+        else:
+            task_batches = self.pull_task_batches()
+
+        try:
+            for tasks in task_batches:
+                if tasks:
+                    time_with_no_tasks = 0
+                    iterated_tasks = 0
+
+                    try:
+                        for task in tasks:
+                            iterated_tasks += 1
+
+                            yield task
+                    finally:
+                        if self.received_stop_signal:
+                            iterated_tasks -= 1
+
+                        if iterated_tasks < len(tasks):
+                            self.broker.push_tasks(
+                                task_name=self.config.name,
+                                tasks=tasks[iterated_tasks:],
+                                priority='HIGH',
+                            )
+
+                            for task in tasks[iterated_tasks:]:
+                                self.acknowledge_task(
+                                    task=task,
+                                )
+                else:
+                    time_with_no_tasks += 1
+                    if self.config.starvation and time_with_no_tasks >= self.config.starvation.time_with_no_tasks:
+                        self.handle_starvation(
+                            time_with_no_tasks=time_with_no_tasks,
+                        )
+        finally:
+            task_batches.close()
+
+    def execute_tasks(
+        self,
+    ) -> None:
+        if self.executor_obj:
+            self.executor_obj.execute_tasks(
+                tasks=self.iterate_tasks(),
+            )
+        else:
+            raise RuntimeError('executor_obj is not set')
 
     def work_loop(
         self,
@@ -325,12 +567,7 @@ class Worker:
         task_start_process_time = time.process_time()
 
         try:
-            if self.executor_obj:
-                self.executor_obj.execute_tasks(
-                    tasks=self.iterate_tasks(),
-                )
-            else:
-                raise RuntimeError('executor_obj is not set')
+            self.execute_tasks()
         except WorkerRespawn:
             summary['respawn'] = True
         except WorkerStop:
@@ -342,6 +579,9 @@ class Worker:
 
             summary['executor_exception'] = exception
 
+        self.flush_outbox()
+        self.acknowledge_pending_tasks()
+
         try:
             self.finalize()
         except WorkerRespawn:
@@ -366,6 +606,11 @@ class Worker:
             'total_cpu_time': total_cpu_time,
         }
 
+        if self.metrics.enabled:
+            summary['metrics'] = self.metrics.to_dict()
+            if self.metrics.sinks:
+                self.export_metrics()
+
         return summary
 
     def retry(
@@ -730,6 +975,299 @@ class Worker:
         pass
 
 
+class AsyncWorker(
+    Worker,
+):
+    def __init__(
+        self,
+    ) -> None:
+        super().__init__()
+
+        self.tasks_to_push: typing.List[typing.Callable[[], typing.Awaitable[bool]]] = []
+
+    def init_broker(
+        self,
+    ) -> None:
+        super().init_broker()
+
+        async_connector_obj: connector.AsyncConnector
+        if self.config.connector.type == 'mongo':
+            async_connector_obj = connector.asynchronous_mongo.Connector(**self.config.connector.params)
+        elif self.config.connector.type == 'redis':
+            async_connector_obj = connector.asynchronous_redis.Connector(**self.config.connector.params)
+        elif self.config.connector.type == 'local':
+            async_connector_obj = connector.asynchronous_local.Connector(**self.config.connector.params)
+        else:
+            raise ValueError(f'connector type {self.config.connector.type} is not supported')
+
+        self.async_broker = broker.AsyncBroker(
+            connector=async_connector_obj,
+            encoder=self.broker.encoder,
+            metrics=self.metrics,
+        )
+
+    def init_executor(
+        self,
+    ) -> None:
+        self.executor_obj = executor.asynchronous.AsyncioExecutor(
+            worker_object=self,
+            number_of_concurrent_tasks=self.config.number_of_concurrent_tasks,
+        )
+
+    async def async_purge_tasks(
+        self,
+        task_name: typing.Optional[str] = None,
+    ) -> bool:
+        return await self.async_broker.purge_tasks(
+            task_name=task_name if task_name else self.config.name,
+        )
+
+    async def async_number_of_enqueued_tasks(
+        self,
+        task_name: typing.Optional[str] = None,
+        include_delayed: bool = False,
+    ) -> int:
+        return await self.async_broker.number_of_enqueued_tasks(
+            task_name=task_name if task_name else self.config.name,
+            include_delayed=include_delayed,
+        )
+
+    async def async_push_task(
+        self,
+        kwargs: typing.Dict[str, typing.Any],
+        task_name: typing.Optional[str] = None,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+        trace_id: typing.Optional[str] = None,
+    ) -> bool:
+        task = objects.Task(
+            kwargs=kwargs,
+            trace_id=trace_id if trace_id is not None else self.get_trace_id(),
+        )
+
+        return await self.async_broker.push_task(
+            task_name=task_name if task_name else self.config.name,
+            task=task,
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    async def async_push_tasks(
+        self,
+        kwargs_list: typing.Iterable[typing.Dict[str, typing.Any]],
+        task_name: typing.Optional[str] = None,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+        trace_id: typing.Optional[str] = None,
+    ) -> bool:
+        trace_id = trace_id if trace_id is not None else self.get_trace_id()
+        tasks = [
+            objects.Task(
+                kwargs=kwargs,
+                trace_id=trace_id,
+            )
+            for kwargs in kwargs_list
+        ]
+
+        return await self.async_broker.push_tasks(
+            task_name=task_name if task_name else self.config.name,
+            tasks=tasks,
+            priority=priority,
+            consumable_from=consumable_from,
+        )
+
+    def async_lock(
+        self,
+        name: str,
+    ) -> connector.AsyncLock:
+        return self.async_broker.lock(
+            name=name,
+        )
+
+    async def async_get_next_tasks(
+        self,
+        number_of_tasks: int,
+        task_name: typing.Optional[str] = None,
+    ) -> typing.List[objects.Task]:
+        return await self.async_broker.pop_tasks(
+            task_name=task_name if task_name else self.config.name,
+            number_of_tasks=number_of_tasks,
+        )
+
+    async def async_flush_outbox(
+        self,
+    ) -> None:
+        if self.broker.outbox_size > 0:
+            await asyncio.get_event_loop().run_in_executor(
+                None,
+                self.flush_outbox,
+            )
+
+    async def async_export_metrics(
+        self,
+    ) -> None:
+        await asyncio.get_event_loop().run_in_executor(
+            None,
+            self.export_metrics,
+        )
+
+    async def async_acknowledge_task(
+        self,
+        task: objects.Task,
+    ) -> None:
+        self.metrics.task_finished(
+            task=task,
+        )
+
+        if not self.async_broker.connector.reliable:
+            return
+
+        with self.tasks_to_acknowledge_lock:
+            self.tasks_to_acknowledge.append(task)
+            if len(self.tasks_to_acknowledge) < self.config.tasks_per_transaction:
+                return
+
+        await self.async_acknowledge_pending_tasks()
+
+    async def async_acknowledge_pending_tasks(
+        self,
+    ) -> None:
+        with self.tasks_to_acknowledge_lock:
+            tasks_to_acknowledge = self.tasks_to_acknowledge
+            self.tasks_to_acknowledge = []
+
+        if not tasks_to_acknowledge:
+            return
+
+        await self.async_flush_outbox()
+
+        try:
+            await self.async_broker.acknowledge_tasks(
+                task_name=self.config.name,
+                tasks=tasks_to_acknowledge,
+            )
+        except Exception as exception:
+            self.logger.error(
+                msg=f'could not acknowledge tasks: {exception}',
+            )
+
+    async def async_push_pending_tasks(
+        self,
+    ) -> None:
+        tasks_to_push = self.tasks_to_push
+        self.tasks_to_push = []
+
+        try:
+            while tasks_to_push:
+                await tasks_to_push[0]()
+                tasks_to_push.pop(0)
+        except Exception:
+            self.tasks_to_push = tasks_to_push + self.tasks_to_push
+
+            raise
+
+    async def async_iterate_task_batches(
+        self,
+    ) -> typing.AsyncGenerator[typing.List[objects.Task], None]:
+        run_forever = self.config.max_tasks_per_run == 0
+        tasks_left = self.config.max_tasks_per_run
+        time_with_no_tasks = 0
+
+        while tasks_left > 0 or run_forever:
+            if run_forever:
+                number_of_tasks_to_pull = self.config.tasks_per_transaction
+            else:
+                number_of_tasks_to_pull = min(
+                    self.config.tasks_per_transaction,
+                    tasks_left,
+                )
+
+            await self.async_flush_outbox()
+            await self.async_acknowledge_pending_tasks()
+            if self.metrics.export_is_due():
+                await self.async_export_metrics()
+
+            tasks = []
+            try:
+                tasks = await self.async_get_next_tasks(
+                    number_of_tasks=number_of_tasks_to_pull,
+                )
+            except Exception as exception:
+                self.logger.error(
+                    msg=f'could not pull tasks: {exception}',
+                )
+
+            if tasks:
+                time_with_no_tasks = 0
+                if not run_forever:
+                    tasks_left -= len(tasks)
+            else:
+                time_with_no_tasks += 1
+                if self.config.starvation and time_with_no_tasks >= self.config.starvation.time_with_no_tasks:
+                    self.handle_starvation(
+                        time_with_no_tasks=time_with_no_tasks,
+                    )
+
+                await asyncio.sleep(1)
+
+            yield tasks
+
+    def execute_tasks(
+        self,
+    ) -> None:
+        if isinstance(self.executor_obj, executor.asynchronous.AsyncioExecutor):
+            self.executor_obj.execute_task_batches(
+                task_batches=self.async_iterate_task_batches(),
+            )
+        else:
+            raise RuntimeError('executor_obj is not set')
+
+    def retry(
+        self,
+        task: objects.Task,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> None:
+        if self.config.max_retries > 0 and self.config.max_retries <= task.run_count:
+            raise WorkerMaxRetries()
+        else:
+            self.tasks_to_push.append(
+                functools.partial(
+                    self.async_broker.retry,
+                    task_name=self.config.name,
+                    task=task,
+                    priority=priority,
+                    consumable_from=consumable_from,
+                ),
+            )
+
+            raise WorkerRetry()
+
+    def requeue(
+        self,
+        task: objects.Task,
+        priority: str = 'NORMAL',
+        consumable_from: typing.Optional[float] = None,
+    ) -> None:
+        self.tasks_to_push.append(
+            functools.partial(
+                self.async_broker.requeue,
+                task_name=self.config.name,
+                task=task,
+                priority=priority,
+                consumable_from=consumable_from,
+            ),
+        )
+
+        raise WorkerRequeue()
+
+    async def work(
+        self,
+        task: objects.Task,
+    ) -> typing.Any:
+        pass
+
+
 class WorkerException(
     BaseException,
 ):
@@ -0,0 +1,425 @@
+import argparse
+import importlib
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.reduction
+import os
+import shlex
+import signal
+import socket
+import subprocess
+import sys
+import time
+import traceback
+import types
+import typing
+
+from . import killer
+from . import metrics
+from . import slave
+
+
+class ZygoteProcess:
+    def __init__(
+        self,
+        zygote: 'Zygote',
+        pid: int,
+    ) -> None:
+        self.zygote = zygote
+        self.pid = pid
+        self.returncode: typing.Optional[int] = None
+
+    def poll(
+        self,
+    ) -> typing.Optional[int]:
+        if self.returncode is None:
+            self.zygote.receive_messages(
+                timeout=0.0,
+            )
+
+        return self.returncode
+
+    def wait(
+        self,
+        timeout: typing.Optional[float] = None,
+    ) -> int:
+        end_time = time.monotonic() + timeout if timeout is not None else None
+
+        while self.returncode is None:
+            if end_time is None:
+                self.zygote.receive_messages(
+                    timeout=None,
+                )
+            else:
+                time_left = end_time - time.monotonic()
+                if time_left <= 0:
+                    raise subprocess.TimeoutExpired(
+                        cmd=f'zygote worker {self.pid}',
+                        timeout=typing.cast(float, timeout),
+                    )
+
+                self.zygote.receive_messages(
+                    timeout=time_left,
+                )
+
+        return self.returncode
+
+    def kill(
+        self,
+    ) -> None:
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+
+class Zygote:
+    def __init__(
+        self,
+        worker_module_name: str,
+        worker_class_name: str,
+        deadline_slots: killer.shared.DeadlineSlots,
+        shared_counters: metrics.SharedCounters,
+    ) -> None:
+        self.worker_module_name = worker_module_name
+        self.worker_class_name = worker_class_name
+        self.deadline_slots = deadline_slots
+        self.shared_counters = shared_counters
+
+        self.process: typing.Optional[subprocess.Popen] = None
+        self.connection: typing.Optional[multiprocessing.connection.Connection] = None
+        self.processes: typing.Dict[int, ZygoteProcess] = {}
+
+    def start(
+        self,
+    ) -> None:
+        parent_connection, child_connection = multiprocessing.Pipe()
+
+        self.process = subprocess.Popen(
+            args=shlex.split(
+                s=(
+                    f'{sys.executable} -m sergeant.zygote '
+                    f'--worker-module={self.worker_module_name} '
+                    f'--worker-class={self.worker_class_name} '
+                    f'--control-pipe={child_connection.fileno()} '
+                ),
+            ),
+            pass_fds=(
+                child_connection.fileno(),
+                self.deadline_slots.file_descriptor,
+                self.shared_counters.file_descriptor,
+            ),
+            env=dict(
+                os.environ,
+                **{
+                    killer.shared.DEADLINE_SLOTS_FD_ENVIRONMENT_VARIABLE: str(self.deadline_slots.file_descriptor),
+                    metrics.SHARED_COUNTERS_FD_ENVIRONMENT_VARIABLE: str(self.shared_counters.file_descriptor),
+                },
+            ),
+        )
+        child_connection.close()
+
+        self.connection = parent_connection
+
+    def is_alive(
+        self,
+    ) -> bool:
+        return self.connection is not None
+
+    def spawn(
+        self,
+        child_pipe: multiprocessing.connection.Connection,
+        slot_index: int,
+    ) -> ZygoteProcess:
+        if self.connection is None or self.process is None:
+            raise RuntimeError('the zygote is not running')
+
+        try:
+            self.connection.send(slot_index)
+            multiprocessing.reduction.send_handle(
+                self.connection,
+                child_pipe.fileno(),
+                self.process.pid,
+            )
+        except OSError:
+            self.handle_zygote_exit()
+
+        spawned_pid = None
+        while spawned_pid is None:
+            if self.connection is None:
+                raise RuntimeError('the zygote has exited while spawning a worker')
+
+            spawned_pid = self.receive_messages(
+                timeout=None,
+            )
+
+        zygote_process = ZygoteProcess(
+            zygote=self,
+            pid=spawned_pid,
+        )
+        self.processes[zygote_process.pid] = zygote_process
+
+        return zygote_process
+
+    def receive_messages(
+        self,
+        timeout: typing.Optional[float],
+    ) -> typing.Optional[int]:
+        if self.connection is None:
+            return None
+
+        spawned_pid = None
+        try:
+            if not self.connection.poll(timeout):
+                return None
+
+            while True:
+                message = self.connection.recv()
+                if message[0] == 'spawned':
+                    spawned_pid = message[1]
+                elif message[0] == 'exited':
+                    zygote_process = self.processes.pop(message[1], None)
+                    if zygote_process is not None:
+                        zygote_process.returncode = message[2]
+
+                if not self.connection.poll():
+                    return spawned_pid
+        except (
+            EOFError,
+            OSError,
+        ):
+            self.handle_zygote_exit()
+
+        return spawned_pid
+
+    def handle_zygote_exit(
+        self,
+    ) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+        if self.process is not None:
+            try:
+                self.process.wait(
+                    timeout=1.0,
+                )
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+        for zygote_process in self.processes.values():
+            zygote_process.kill()
+            zygote_process.returncode = -signal.SIGKILL
+
+        self.processes = {}
+
+    def stop(
+        self,
+    ) -> None:
+        if self.connection is not None:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+
+        self.handle_zygote_exit()
+
+
+def sigchld_handler(
+    signal_num: int,
+    frame: typing.Optional[types.FrameType],
+) -> None:
+    pass
+
+
+def reap_workers(
+    connection: multiprocessing.connection.Connection,
+) -> None:
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+
+        if pid == 0:
+            return
+
+        if os.WIFSIGNALED(status):
+            return_code = -os.WTERMSIG(status)
+        else:
+            return_code = os.WEXITSTATUS(status)
+
+        connection.send(
+            (
+                'exited',
+                pid,
+                return_code,
+            )
+        )
+
+
+def fork_worker(
+    connection: multiprocessing.connection.Connection,
+    wakeup_sockets: typing.List[socket.socket],
+    child_pipe: int,
+    slot_index: int,
+    worker_module_name: str,
+    worker_class_name: str,
+) -> int:
+    pid = os.fork()
+    if pid != 0:
+        return pid
+
+    return_code = slave.ReturnCode.WORKER_EXITED_ABNORMALLY.value
+    try:
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+        connection.close()
+        for wakeup_socket in wakeup_sockets:
+            wakeup_socket.close()
+
+        os.environ[killer.shared.DEADLINE_SLOT_INDEX_ENVIRONMENT_VARIABLE] = str(slot_index)
+
+        slave.run(
+            child_pipe=child_pipe,
+            worker_module_name=worker_module_name,
+            worker_class_name=worker_class_name,
+        )
+    except SystemExit as exception:
+        if exception.code is None:
+            return_code = 0
+        elif isinstance(exception.code, int):
+            return_code = exception.code
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        for stream in [
+            sys.stdout,
+            sys.stderr,
+        ]:
+            try:
+                stream.flush()
+            except Exception:
+                pass
+
+        os._exit(return_code)
+
+
+def serve(
+    connection: multiprocessing.connection.Connection,
+    worker_module_name: str,
+    worker_class_name: str,
+) -> None:
+    try:
+        importlib.import_module(
+            name=worker_module_name,
+        )
+    except Exception:
+        pass
+
+    wakeup_socket, wakeup_writer_socket = socket.socketpair()
+    wakeup_socket.setblocking(False)
+    wakeup_writer_socket.setblocking(False)
+
+    signal.set_wakeup_fd(
+        wakeup_writer_socket.fileno(),
+        warn_on_full_buffer=False,
+    )
+    signal.signal(signal.SIGCHLD, sigchld_handler)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    while True:
+        ready_objects = multiprocessing.connection.wait(
+            object_list=[
+                connection,
+                wakeup_socket,
+            ],
+        )
+
+        if wakeup_socket in ready_objects:
+            try:
+                while wakeup_socket.recv(4096):
+                    pass
+            except (
+                BlockingIOError,
+                InterruptedError,
+            ):
+                pass
+
+        reap_workers(
+            connection=connection,
+        )
+
+        if connection in ready_objects:
+            try:
+                slot_index = connection.recv()
+            except EOFError:
+                return
+
+            if slot_index is None:
+                return
+
+            child_pipe = multiprocessing.reduction.recv_handle(connection)
+            pid = fork_worker(
+                connection=connection,
+                wakeup_sockets=[
+                    wakeup_socket,
+                    wakeup_writer_socket,
+                ],
+                child_pipe=child_pipe,
+                slot_index=slot_index,
+                worker_module_name=worker_module_name,
+                worker_class_name=worker_class_name,
+            )
+            os.close(child_pipe)
+
+            connection.send(
+                (
+                    'spawned',
+                    pid,
+                )
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Sergeant Zygote',
+    )
+    parser.add_argument(
+        '--control-pipe',
+        help='Pipe fileno to receive spawn requests on',
+        type=int,
+        required=True,
+        dest='control_pipe',
+    )
+    parser.add_argument(
+        '--worker-class',
+        help='Class name of the worker to spawn',
+        type=str,
+        required=True,
+        dest='worker_class',
+    )
+    parser.add_argument(
+        '--worker-module',
+        help='Module of the worker class',
+        type=str,
+        required=True,
+        dest='worker_module',
+    )
+    args = parser.parse_args()
+
+    serve(
+        connection=multiprocessing.connection.Connection(
+            handle=args.control_pipe,
+        ),
+        worker_module_name=args.worker_module,
+        worker_class_name=args.worker_class,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -458,6 +458,235 @@ class BrokerTestCase(
                 second=0,
             )
 
+    def test_outbox(
+        self,
+    ):
+        test_broker = sergeant.broker.Broker(
+            connector=self.test_broker.connector,
+            encoder=self.test_broker.encoder,
+            outbox_max_items=3,
+            outbox_flush_interval=60.0,
+        )
+        test_broker.purge_tasks(
+            task_name='test_task',
+        )
+
+        test_broker.push_task(
+            task_name='test_task',
+            task=self.tasks[0],
+        )
+        test_broker.retry(
+            task_name='test_task',
+            task=sergeant.objects.Task(
+                kwargs=self.tasks[1].kwargs,
+            ),
+            priority='HIGH',
+        )
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=True,
+            ),
+            second=0,
+        )
+
+        test_broker.requeue(
+            task_name='test_task',
+            task=self.tasks[2],
+        )
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=True,
+            ),
+            second=3,
+        )
+        self.assertEqual(
+            first=test_broker.outbox,
+            second={},
+        )
+
+        test_broker.push_task(
+            task_name='test_task',
+            task=self.tasks[3],
+            consumable_from=time.time() + 60,
+        )
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=True,
+            ),
+            second=3,
+        )
+        test_broker.flush_outbox()
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=True,
+            ),
+            second=4,
+        )
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=False,
+            ),
+            second=3,
+        )
+
+        tasks = test_broker.pop_tasks(
+            task_name='test_task',
+            number_of_tasks=3,
+        )
+        self.assertEqual(
+            first=sorted(task.kwargs['param'] for task in tasks),
+            second=[
+                0,
+                1,
+                2,
+            ],
+        )
+
+        test_broker.purge_tasks(
+            task_name='test_task',
+        )
+
+    def test_outbox_flush_interval(
+        self,
+    ):
+        test_broker = sergeant.broker.Broker(
+            connector=self.test_broker.connector,
+            encoder=self.test_broker.encoder,
+            outbox_max_items=100,
+            outbox_flush_interval=0.2,
+        )
+        test_broker.purge_tasks(
+            task_name='test_task',
+        )
+
+        test_broker.push_task(
+            task_name='test_task',
+            task=self.tasks[0],
+        )
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=True,
+            ),
+            second=0,
+        )
+
+        time.sleep(0.5)
+
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=True,
+            ),
+            second=1,
+        )
+        self.assertEqual(
+            first=test_broker.outbox,
+            second={},
+        )
+
+        test_broker.purge_tasks(
+            task_name='test_task',
+        )
+
+    def test_outbox_flush_failure(
+        self,
+    ):
+        test_broker = sergeant.broker.Broker(
+            connector=self.test_broker.connector,
+            encoder=self.test_broker.encoder,
+            outbox_max_items=1,
+            outbox_flush_interval=60.0,
+        )
+        test_broker.purge_tasks(
+            task_name='test_task',
+        )
+
+        with unittest.mock.patch.object(
+            test_broker.connector,
+            'queue_push_bulk',
+            side_effect=ConnectionError(),
+        ):
+            self.assertTrue(
+                expr=test_broker.retry(
+                    task_name='test_task',
+                    task=sergeant.objects.Task(
+                        kwargs=self.tasks[0].kwargs,
+                    ),
+                ),
+            )
+            self.assertEqual(
+                first=test_broker.outbox_size,
+                second=1,
+            )
+            with self.assertRaises(
+                expected_exception=ConnectionError,
+            ):
+                test_broker.flush_outbox()
+
+        test_broker.flush_outbox()
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=True,
+            ),
+            second=1,
+        )
+
+        test_broker.purge_tasks(
+            task_name='test_task',
+        )
+
+    def test_outbox_delayed_tasks_grouping(
+        self,
+    ):
+        test_broker = sergeant.broker.Broker(
+            connector=self.test_broker.connector,
+            encoder=self.test_broker.encoder,
+            outbox_max_items=100,
+            outbox_flush_interval=10.0,
+        )
+        test_broker.purge_tasks(
+            task_name='test_task',
+        )
+
+        consumable_from = (time.time() // 10 + 2) * 10
+        for i in range(3):
+            test_broker.push_task(
+                task_name='test_task',
+                task=self.tasks[i],
+                consumable_from=consumable_from + 1 + i,
+            )
+
+        self.assertEqual(
+            first=list(test_broker.outbox),
+            second=[
+                (
+                    'test_task',
+                    'NORMAL',
+                    consumable_from + 10,
+                ),
+            ],
+        )
+
+        test_broker.flush_outbox()
+        self.assertEqual(
+            first=test_broker.number_of_enqueued_tasks(
+                task_name='test_task',
+                include_delayed=True,
+            ),
+            second=3,
+        )
+
+        test_broker.purge_tasks(
+            task_name='test_task',
+        )
+
     def test_get_set_key(
         self,
     ):
@@ -517,6 +746,69 @@ class BrokerTestCase(
                 obj=test_key_value,
             )
 
+    def test_get_set_keys(
+        self,
+    ):
+        for test_broker in self.test_brokers:
+            key_names = [
+                f'key_name_{i}'
+                for i in range(5)
+            ]
+            test_broker.delete_keys(
+                names=key_names,
+            )
+            self.assertEqual(
+                first=test_broker.get_keys(
+                    names=key_names,
+                ),
+                second=dict.fromkeys(key_names),
+            )
+
+            number_of_new_keys = test_broker.set_keys(
+                values={
+                    key_name: {
+                        'key_name': key_name,
+                    }
+                    for key_name in key_names
+                },
+            )
+            self.assertEqual(
+                first=number_of_new_keys,
+                second=5,
+            )
+            self.assertEqual(
+                first=test_broker.get_keys(
+                    names=key_names,
+                ),
+                second={
+                    key_name: {
+                        'key_name': key_name,
+                    }
+                    for key_name in key_names
+                },
+            )
+            self.assertEqual(
+                first=test_broker.get_key(
+                    name=key_names[0],
+                ),
+                second={
+                    'key_name': key_names[0],
+                },
+            )
+
+            self.assertEqual(
+                first=test_broker.delete_keys(
+                    names=key_names,
+                ),
+                second=5,
+            )
+            self.assertEqual(
+                first=test_broker.get_keys(
+                    names=[],
+                ),
+                second={},
+            )
+
     def test_lock(
         self,
     ):
@@ -571,6 +863,89 @@ class BrokerTestCase(
             )
             lock.release()
 
+    def test_lazy_retry_and_requeue(
+        self,
+    ):
+        for test_broker in self.test_brokers:
+            if test_broker.encoder.serializer.name != 'msgpack':
+                continue
+
+            test_broker.purge_tasks(
+                task_name='test_task',
+            )
+            test_broker.push_task(
+                task_name='test_task',
+                task=sergeant.objects.Task(
+                    kwargs={
+                        'nested': {
+                            'values': list(range(10)),
+                        },
+                    },
+                    trace_id='trace',
+                ),
+                priority='NORMAL',
+            )
+            task_one = test_broker.pop_tasks(
+                task_name='test_task',
+                number_of_tasks=1,
+            )[0]
+            original_payload = task_one.get_original_payload()
+            self.assertIsNotNone(
+                obj=original_payload,
+            )
+
+            with unittest.mock.patch.object(
+                target=test_broker.encoder,
+                attribute='encode',
+                wraps=test_broker.encoder.encode,
+            ) as encode:
+                test_broker.requeue(
+                    task_name='test_task',
+                    task=task_one,
+                )
+                encode.assert_not_called()
+
+            task_one = test_broker.pop_tasks(
+                task_name='test_task',
+                number_of_tasks=1,
+            )[0]
+            self.assertEqual(
+                first=task_one.get_original_payload(),
+                second=original_payload,
+            )
+
+            test_broker.retry(
+                task_name='test_task',
+                task=task_one,
+            )
+            self.assertNotIn(
+                member='kwargs',
+                container=task_one.__dict__,
+            )
+            task_one = test_broker.pop_tasks(
+                task_name='test_task',
+                number_of_tasks=1,
+            )[0]
+            self.assertEqual(
+                first=task_one.run_count,
+                second=1,
+            )
+            self.assertEqual(
+                first=task_one.trace_id,
+                second='trace',
+            )
+            self.assertEqual(
+                first=task_one.kwargs,
+                second={
+                    'nested': {
+                        'values': list(range(10)),
+                    },
+                },
+            )
+            self.assertIsNone(
+                obj=task_one.get_original_payload(),
+            )
+
 
 class RedisSingleServerBrokerTestCase(
     BrokerTestCase,
@@ -0,0 +1,428 @@
+import asyncio
+import time
+import unittest
+
+import sergeant.connector
+
+
+class AsyncConnectorTestCase(
+    unittest.TestCase,
+):
+    __test__ = False
+
+    test_queue_name = 'test_async_queue_name'
+    test_queue_item = b'test_queue_item'
+    test_queue_items = [
+        b'test_queue_item_1',
+        b'test_queue_item_2',
+        b'test_queue_item_3',
+        b'test_queue_item_4',
+        b'test_queue_item_5',
+    ]
+
+    test_key_name = 'test_async_key'
+    test_key_value = b'test_value'
+
+    def create_connector(
+        self,
+    ) -> sergeant.connector.AsyncConnector:
+        raise NotImplementedError()
+
+    def run_coroutine(
+        self,
+        coroutine_function,
+    ):
+        async def run_with_connector():
+            connector = self.create_connector()
+            try:
+                return await coroutine_function(connector)
+            finally:
+                await connector.close()
+
+        return asyncio.run(run_with_connector())
+
+    def test_key(
+        self,
+    ):
+        async def test(
+            connector,
+        ):
+            await connector.key_delete(
+                key=self.test_key_name,
+            )
+            self.assertIsNone(
+                obj=await connector.key_get(
+                    key=self.test_key_name,
+                ),
+            )
+
+            self.assertTrue(
+                expr=await connector.key_set(
+                    key=self.test_key_name,
+                    value=self.test_key_value,
+                ),
+            )
+            self.assertFalse(
+                expr=await connector.key_set(
+                    key=self.test_key_name,
+                    value=self.test_key_value,
+                ),
+            )
+            self.assertEqual(
+                first=await connector.key_get(
+                    key=self.test_key_name,
+                ),
+                second=self.test_key_value,
+            )
+
+            self.assertTrue(
+                expr=await connector.key_delete(
+                    key=self.test_key_name,
+                ),
+            )
+            self.assertFalse(
+                expr=await connector.key_delete(
+                    key=self.test_key_name,
+                ),
+            )
+
+        self.run_coroutine(test)
+
+    def test_key_bulk(
+        self,
+    ):
+        items = {
+            f'{self.test_key_name}_{i}': f'value_{i}'.encode()
+            for i in range(20)
+        }
+
+        async def test(
+            connector,
+        ):
+            await connector.key_delete_bulk(
+                keys=list(items.keys()),
+            )
+
+            self.assertEqual(
+                first=await connector.key_set_bulk(
+                    items=items,
+                ),
+                second=20,
+            )
+            self.assertEqual(
+                first=await connector.key_get_bulk(
+                    keys=list(items.keys()) + [
+                        'missing_key',
+                    ],
+                ),
+                second=list(items.values()) + [
+                    None,
+                ],
+            )
+            self.assertEqual(
+                first=await connector.key_delete_bulk(
+                    keys=list(items.keys()),
+                ),
+                second=20,
+            )
+
+        self.run_coroutine(test)
+
+    def test_queue(
+        self,
+    ):
+        async def test(
+            connector,
+        ):
+            await connector.queue_delete(
+                queue_name=self.test_queue_name,
+            )
+            self.assertIsNone(
+                obj=await connector.queue_pop(
+                    queue_name=self.test_queue_name,
+                ),
+            )
+
+            await connector.queue_push(
+                queue_name=self.test_queue_name,
+                item=self.test_queue_item,
+            )
+            self.assertEqual(
+                first=await connector.queue_length(
+                    queue_name=self.test_queue_name,
+                    include_delayed=False,
+                ),
+                second=1,
+            )
+            self.assertEqual(
+                first=await connector.queue_pop(
+                    queue_name=self.test_queue_name,
+                ),
+                second=self.test_queue_item,
+            )
+
+            await connector.queue_push_bulk(
+                queue_name=self.test_queue_name,
+                items=self.test_queue_items,
+            )
+            await connector.queue_push(
+                queue_name=self.test_queue_name,
+                item=self.test_queue_item,
+                consumable_from=time.time() + 60,
+            )
+            self.assertEqual(
+                first=await connector.queue_length(
+                    queue_name=self.test_queue_name,
+                    include_delayed=False,
+                ),
+                second=len(self.test_queue_items),
+            )
+            self.assertEqual(
+                first=await connector.queue_length(
+                    queue_name=self.test_queue_name,
+                    include_delayed=True,
+                ),
+                second=len(self.test_queue_items) + 1,
+            )
+
+            items = await connector.queue_pop_bulk(
+                queue_name=self.test_queue_name,
+                number_of_items=len(self.test_queue_items) + 1,
+            )
+            self.assertCountEqual(
+                first=items,
+                second=self.test_queue_items,
+            )
+
+            self.assertTrue(
+                expr=await connector.queue_delete(
+                    queue_name=self.test_queue_name,
+                ),
+            )
+            self.assertEqual(
+                first=await connector.queue_length(
+                    queue_name=self.test_queue_name,
+                    include_delayed=True,
+                ),
+                second=0,
+            )
+
+        self.run_coroutine(test)
+
+    def test_lock(
+        self,
+    ):
+        async def test(
+            connector,
+        ):
+            lock = connector.lock(
+                name='test_async_lock',
+            )
+            await lock.release()
+
+            self.assertFalse(
+                expr=await lock.is_locked(),
+            )
+            self.assertTrue(
+                expr=await lock.acquire(),
+            )
+            self.assertTrue(
+                expr=await lock.is_locked(),
+            )
+
+            other_lock = connector.lock(
+                name='test_async_lock',
+            )
+            self.assertFalse(
+                expr=await other_lock.acquire(
+                    timeout=0.2,
+                    check_interval=0.1,
+                ),
+            )
+
+            self.assertTrue(
+                expr=await lock.set_ttl(
+                    ttl=10,
+                ),
+            )
+            self.assertIn(
+                member=await lock.get_ttl(),
+                container=[
+                    9,
+                    10,
+                ],
+            )
+
+            self.assertTrue(
+                expr=await lock.release(),
+            )
+            self.assertFalse(
+                expr=await lock.is_locked(),
+            )
+
+        self.run_coroutine(test)
+
+
+class AsyncRedisSingleServerConnectorTestCase(
+    AsyncConnectorTestCase,
+):
+    __test__ = True
+
+    def create_connector(
+        self,
+    ) -> sergeant.connector.AsyncConnector:
+        return sergeant.connector.asynchronous_redis.Connector(
+            nodes=[
+                {
+                    'host': 'localhost',
+                    'port': 6379,
+                    'password': None,
+                    'database': 0,
+                },
+            ]
+        )
+
+
+class AsyncRedisMultipleServersConnectorTestCase(
+    AsyncConnectorTestCase,
+):
+    __test__ = True
+
+    def create_connector(
+        self,
+    ) -> sergeant.connector.AsyncConnector:
+        return sergeant.connector.asynchronous_redis.Connector(
+            nodes=[
+                {
+                    'host': 'localhost',
+                    'port': 6379,
+                    'password': None,
+                    'database': 0,
+                },
+                {
+                    'host': 'localhost',
+                    'port': 6380,
+                    'password': None,
+                    'database': 0,
+                },
+            ]
+        )
+
+    def test_queue_acknowledge_bulk(
+        self,
+    ):
+        async def test():
+            connector = sergeant.connector.asynchronous_redis.Connector(
+                nodes=[
+                    {
+                        'host': 'localhost',
+                        'port': 6379,
+                        'password': None,
+                        'database': 0,
+                    },
+                    {
+                        'host': 'localhost',
+                        'port': 6380,
+                        'password': None,
+                        'database': 0,
+                    },
+                ],
+                visibility_timeout=60.0,
+            )
+            try:
+                await connector.queue_delete(
+                    queue_name=self.test_queue_name,
+                )
+                for item in self.test_queue_items:
+                    await connector.queue_push(
+                        queue_name=self.test_queue_name,
+                        item=item,
+                    )
+
+                items = await connector.queue_pop_bulk(
+                    queue_name=self.test_queue_name,
+                    number_of_items=len(self.test_queue_items),
+                )
+                self.assertCountEqual(
+                    first=items,
+                    second=self.test_queue_items,
+                )
+                self.assertCountEqual(
+                    first={
+                        item.node_index
+                        for item in items
+                    },
+                    second=[
+                        0,
+                        1,
+                    ],
+                )
+
+                self.assertTrue(
+                    expr=await connector.queue_acknowledge_bulk(
+                        queue_name=self.test_queue_name,
+                        items=items,
+                    ),
+                )
+                self.assertFalse(
+                    expr=await connector.queue_acknowledge_bulk(
+                        queue_name=self.test_queue_name,
+                        items=items,
+                    ),
+                )
+                for connection in connector.connections:
+                    self.assertEqual(
+                        first=await connection.zcard(
+                            f'{self.test_queue_name}.processing',
+                        ),
+                        second=0,
+                    )
+            finally:
+                await connector.queue_delete(
+                    queue_name=self.test_queue_name,
+                )
+                await connector.close()
+
+        asyncio.run(test())
+
+
+class AsyncMongoSingleServerConnectorTestCase(
+    AsyncConnectorTestCase,
+):
+    __test__ = True
+
+    def create_connector(
+        self,
+    ) -> sergeant.connector.AsyncConnector:
+        sergeant.connector.mongo.Connector(
+            nodes=[
+                {
+                    'host': 'localhost',
+                    'port': 27017,
+                    'replica_set': 'test_replica_set_one',
+                },
+            ],
+        )
+
+        return sergeant.connector.asynchronous_mongo.Connector(
+            nodes=[
+                {
+                    'host': 'localhost',
+                    'port': 27017,
+                    'replica_set': 'test_replica_set_one',
+                },
+            ],
+        )
+
+
+class AsyncLocalConnectorTestCase(
+    AsyncConnectorTestCase,
+):
+    __test__ = True
+
+    def create_connector(
+        self,
+    ) -> sergeant.connector.AsyncConnector:
+        return sergeant.connector.asynchronous_local.Connector(
+            file_path='/tmp/test_async_local_connector.sqlite3',
+        )
@@ -1,3 +1,5 @@
+import multiprocessing
+import threading
 import time
 import unittest
 import unittest.mock
@@ -5,6 +7,28 @@ import unittest.mock
 import sergeant.connector
 
 
+def pop_all_items(
+    file_path,
+    queue_name,
+    results_queue,
+):
+    connector = sergeant.connector.local.Connector(
+        file_path=file_path,
+    )
+    popped_items = []
+    while True:
+        items = connector.queue_pop_bulk(
+            queue_name=queue_name,
+            number_of_items=10,
+        )
+        if not items:
+            break
+
+        popped_items += items
+
+    results_queue.put(popped_items)
+
+
 class ConnectorTestCase(
     unittest.TestCase,
 ):
@@ -87,6 +111,85 @@ class ConnectorTestCase(
             key=self.test_key_name,
         )
 
+    def test_key_bulk(
+        self,
+    ):
+        keys = [
+            f'{self.test_key_name}_{i}'
+            for i in range(10)
+        ]
+        self.connector.key_delete_bulk(
+            keys=keys,
+        )
+        self.assertEqual(
+            first=self.connector.key_get_bulk(
+                keys=keys,
+            ),
+            second=[None] * 10,
+        )
+
+        number_of_new_keys = self.connector.key_set_bulk(
+            items={
+                key: self.test_key_value
+                for key in keys[:5]
+            },
+        )
+        self.assertEqual(
+            first=number_of_new_keys,
+            second=5,
+        )
+
+        number_of_new_keys = self.connector.key_set_bulk(
+            items={
+                key: key.encode()
+                for key in keys
+            },
+        )
+        self.assertEqual(
+            first=number_of_new_keys,
+            second=5,
+        )
+        self.assertEqual(
+            first=self.connector.key_get_bulk(
+                keys=keys,
+            ),
+            second=[
+                key.encode()
+                for key in keys
+            ],
+        )
+        self.assertEqual(
+            first=self.connector.key_get(
+                key=keys[0],
+            ),
+            second=keys[0].encode(),
+        )
+
+        number_of_deleted_keys = self.connector.key_delete_bulk(
+            keys=keys[:3],
+        )
+        self.assertEqual(
+            first=number_of_deleted_keys,
+            second=3,
+        )
+        self.assertEqual(
+            first=self.connector.key_get_bulk(
+                keys=keys,
+            ),
+            second=[None] * 3 + [
+                key.encode()
+                for key in keys[3:]
+            ],
+        )
+
+        number_of_deleted_keys = self.connector.key_delete_bulk(
+            keys=keys,
+        )
+        self.assertEqual(
+            first=number_of_deleted_keys,
+            second=7,
+        )
+
     def test_queue(
         self,
     ):
@@ -246,6 +349,73 @@ class ConnectorTestCase(
             second=[],
         )
 
+    def test_queue_pop_bulk_blocking(
+        self,
+    ):
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+
+        before = time.time()
+        items = self.connector.queue_pop_bulk_blocking(
+            queue_name=self.test_queue_name,
+            number_of_items=10,
+            timeout=0.5,
+        )
+        after = time.time()
+        self.assertEqual(
+            first=items,
+            second=[],
+        )
+        self.assertGreaterEqual(
+            a=after - before,
+            b=0.4,
+        )
+
+        self.connector.queue_push_bulk(
+            queue_name=self.test_queue_name,
+            items=self.test_queue_items,
+            priority='NORMAL',
+        )
+        items = self.connector.queue_pop_bulk_blocking(
+            queue_name=self.test_queue_name,
+            number_of_items=len(self.test_queue_items),
+            timeout=5.0,
+        )
+        self.assertEqual(
+            first=items,
+            second=self.test_queue_items,
+        )
+
+        push_timer = threading.Timer(
+            interval=0.2,
+            function=self.connector.queue_push,
+            kwargs={
+                'queue_name': self.test_queue_name,
+                'item': self.test_queue_item,
+                'priority': 'NORMAL',
+            },
+        )
+        push_timer.start()
+        before = time.time()
+        items = self.connector.queue_pop_bulk_blocking(
+            queue_name=self.test_queue_name,
+            number_of_items=10,
+            timeout=5.0,
+        )
+        after = time.time()
+        push_timer.join()
+        self.assertEqual(
+            first=items,
+            second=[
+                self.test_queue_item,
+            ],
+        )
+        self.assertLess(
+            a=after - before,
+            b=1.0,
+        )
+
     def test_queue_priorities(
         self,
     ):
@@ -716,6 +886,425 @@ class RedisMultipleServersConnectorTestCase(
             ]
         )
 
+    def test_queue_pop_bulk_from_every_node(
+        self,
+    ):
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+        self.connector.connections[0].queue_push_bulk(
+            queue_name=self.test_queue_name,
+            items=self.test_queue_items[:3],
+        )
+        self.connector.connections[1].queue_push_bulk(
+            queue_name=self.test_queue_name,
+            items=self.test_queue_items[3:6],
+            consumable_from=time.time() - 1,
+        )
+        self.connector.connections[1].queue_push_bulk(
+            queue_name=self.test_queue_name,
+            items=self.test_queue_items[6:],
+            consumable_from=time.time() + 60,
+        )
+
+        for _ in range(self.connector.number_of_connections):
+            self.assertCountEqual(
+                first=self.connector.queue_pop_bulk(
+                    queue_name=self.test_queue_name,
+                    number_of_items=10,
+                ),
+                second=self.test_queue_items[:6],
+            )
+            self.assertEqual(
+                first=self.connector.queue_pop_bulk(
+                    queue_name=self.test_queue_name,
+                    number_of_items=10,
+                ),
+                second=[],
+            )
+            self.connector.connections[1].queue_push_bulk(
+                queue_name=self.test_queue_name,
+                items=self.test_queue_items[:3],
+            )
+            self.connector.connections[0].queue_push_bulk(
+                queue_name=self.test_queue_name,
+                items=self.test_queue_items[3:6],
+                consumable_from=time.time() - 1,
+            )
+
+        self.assertEqual(
+            first=self.connector.queue_length(
+                queue_name=self.test_queue_name,
+                include_delayed=True,
+            ),
+            second=len(self.test_queue_items),
+        )
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+
+    def test_execute_in_parallel(
+        self,
+    ):
+        self.connector.queue_length(
+            queue_name=self.test_queue_name,
+            include_delayed=True,
+        )
+        executor = self.connector.executor
+        self.assertIsNotNone(
+            obj=executor,
+        )
+        self.connector.queue_length(
+            queue_name=self.test_queue_name,
+            include_delayed=True,
+        )
+        self.assertIs(
+            self.connector.executor,
+            executor,
+        )
+
+        def raise_exception():
+            raise ValueError('node failure')
+
+        first_future, second_future = self.connector.execute_in_parallel(
+            functions=[
+                raise_exception,
+                lambda: 1,
+            ],
+        )
+        self.assertIsInstance(
+            first_future.exception(),
+            ValueError,
+        )
+        self.assertEqual(
+            first=second_future.result(),
+            second=1,
+        )
+
+
+class RedisConsistentHashingConnectorTestCase(
+    ConnectorTestCase,
+):
+    __test__ = True
+
+    nodes = [
+        {
+            'host': 'localhost',
+            'port': 6379,
+            'password': None,
+            'database': 0,
+        },
+        {
+            'host': 'localhost',
+            'port': 6380,
+            'password': None,
+            'database': 0,
+        },
+    ]
+
+    def setUp(
+        self,
+    ):
+        self.connector = sergeant.connector.redis.Connector(
+            nodes=self.nodes,
+            key_placement='consistent_hashing',
+        )
+
+    def test_key_migrate(
+        self,
+    ):
+        keys = [
+            f'{self.test_key_name}_{i}'
+            for i in range(100)
+        ]
+        self.connector.key_delete_bulk(
+            keys=keys,
+        )
+
+        single_node_connector = sergeant.connector.redis.Connector(
+            nodes=self.nodes[:1],
+            key_placement='consistent_hashing',
+        )
+        single_node_connector.key_set_bulk(
+            items={
+                key: key.encode()
+                for key in keys
+            },
+        )
+
+        moved_keys = [
+            key
+            for key in keys
+            if self.connector.key_placement.get_node_index(
+                key=key,
+            ) == 1
+        ]
+        self.assertGreater(
+            a=len(moved_keys),
+            b=0,
+        )
+        self.assertLess(
+            a=len(moved_keys),
+            b=len(keys),
+        )
+        self.assertEqual(
+            first=self.connector.key_get_bulk(
+                keys=moved_keys,
+            ),
+            second=[None] * len(moved_keys),
+        )
+
+        self.assertEqual(
+            first=self.connector.key_migrate(
+                batch_size=10,
+            ),
+            second=len(moved_keys),
+        )
+        self.assertEqual(
+            first=self.connector.key_get_bulk(
+                keys=keys,
+            ),
+            second=[
+                key.encode()
+                for key in keys
+            ],
+        )
+        self.assertEqual(
+            first=self.connector.key_migrate(),
+            second=0,
+        )
+
+        self.connector.key_delete_bulk(
+            keys=keys,
+        )
+
+
+class RedisReliableConnectorTestCase(
+    ConnectorTestCase,
+):
+    __test__ = True
+
+    def setUp(
+        self,
+    ):
+        self.connector = sergeant.connector.redis.Connector(
+            nodes=[
+                {
+                    'host': 'localhost',
+                    'port': 6379,
+                    'password': None,
+                    'database': 0,
+                },
+                {
+                    'host': 'localhost',
+                    'port': 6380,
+                    'password': None,
+                    'database': 0,
+                },
+            ],
+            visibility_timeout=1.0,
+        )
+
+    def test_queue_acknowledge_bulk(
+        self,
+    ):
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+        self.connector.queue_push_bulk(
+            queue_name=self.test_queue_name,
+            items=self.test_queue_items[:2],
+        )
+
+        items = self.connector.queue_pop_bulk(
+            queue_name=self.test_queue_name,
+            number_of_items=2,
+        )
+        self.assertCountEqual(
+            first=items,
+            second=self.test_queue_items[:2],
+        )
+        self.assertEqual(
+            first=self.connector.queue_pop_bulk(
+                queue_name=self.test_queue_name,
+                number_of_items=2,
+            ),
+            second=[],
+        )
+
+        self.assertTrue(
+            expr=self.connector.queue_acknowledge_bulk(
+                queue_name=self.test_queue_name,
+                items=items[:1],
+            ),
+        )
+
+        time.sleep(1.1)
+
+        redelivered_items = self.connector.queue_pop_bulk(
+            queue_name=self.test_queue_name,
+            number_of_items=2,
+        )
+        self.assertEqual(
+            first=redelivered_items,
+            second=items[1:],
+        )
+        self.assertFalse(
+            expr=self.connector.queue_acknowledge_bulk(
+                queue_name=self.test_queue_name,
+                items=items[1:],
+            ),
+        )
+        self.assertTrue(
+            expr=self.connector.queue_acknowledge_bulk(
+                queue_name=self.test_queue_name,
+                items=redelivered_items,
+            ),
+        )
+        self.assertFalse(
+            expr=self.connector.queue_acknowledge_bulk(
+                queue_name=self.test_queue_name,
+                items=redelivered_items,
+            ),
+        )
+
+        time.sleep(1.1)
+
+        self.assertEqual(
+            first=self.connector.queue_pop_bulk(
+                queue_name=self.test_queue_name,
+                number_of_items=2,
+            ),
+            second=[],
+        )
+
+    def test_queue_acknowledge_bulk_after_requeue(
+        self,
+    ):
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+        self.connector.queue_push(
+            queue_name=self.test_queue_name,
+            item=self.test_queue_item,
+        )
+
+        first_lease = self.connector.queue_pop(
+            queue_name=self.test_queue_name,
+        )
+        self.connector.queue_push(
+            queue_name=self.test_queue_name,
+            item=first_lease,
+            priority='HIGH',
+        )
+        second_lease = self.connector.queue_pop(
+            queue_name=self.test_queue_name,
+        )
+        self.assertEqual(
+            first=second_lease,
+            second=self.test_queue_item,
+        )
+        self.assertNotEqual(
+            first=(
+                first_lease.node_index,
+                first_lease.lease_id,
+            ),
+            second=(
+                second_lease.node_index,
+                second_lease.lease_id,
+            ),
+        )
+
+        self.assertTrue(
+            expr=self.connector.queue_acknowledge_bulk(
+                queue_name=self.test_queue_name,
+                items=[
+                    first_lease,
+                ],
+            ),
+        )
+        self.assertEqual(
+            first=sum(
+                connection.zcard(
+                    name=f'{self.test_queue_name}.processing',
+                )
+                for connection in self.connector.connections
+            ),
+            second=1,
+        )
+
+        time.sleep(1.1)
+
+        self.assertEqual(
+            first=self.connector.queue_pop_bulk(
+                queue_name=self.test_queue_name,
+                number_of_items=2,
+            ),
+            second=[
+                self.test_queue_item,
+            ],
+        )
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+
+    def test_queue_acknowledge_bulk_on_leasing_node(
+        self,
+    ):
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+        for connection in self.connector.connections:
+            connection.queue_push_bulk(
+                queue_name=self.test_queue_name,
+                items=[
+                    self.test_queue_item,
+                ],
+            )
+
+        leased_items = self.connector.queue_pop_bulk(
+            queue_name=self.test_queue_name,
+            number_of_items=2,
+        )
+        self.assertEqual(
+            first=sorted(
+                leased_item.node_index
+                for leased_item in leased_items
+            ),
+            second=[
+                0,
+                1,
+            ],
+        )
+
+        with unittest.mock.patch.object(
+            self.connector.connections[1 - leased_items[0].node_index],
+            'queue_acknowledge_bulk',
+        ) as other_node_queue_acknowledge_bulk:
+            self.assertTrue(
+                expr=self.connector.queue_acknowledge_bulk(
+                    queue_name=self.test_queue_name,
+                    items=leased_items[:1],
+                ),
+            )
+            other_node_queue_acknowledge_bulk.assert_not_called()
+
+        self.assertEqual(
+            first=[
+                connection.zcard(
+                    name=f'{self.test_queue_name}.processing',
+                )
+                for connection in self.connector.connections
+            ],
+            second=[
+                0 if node_index == leased_items[0].node_index else 1
+                for node_index in range(2)
+            ],
+        )
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+
 
 class MongoSingleServerConnectorTestCase(
     ConnectorTestCase,
@@ -771,3 +1360,70 @@ class LocalConnectorTestCase(
         self.connector = sergeant.connector.local.Connector(
             file_path='/tmp/test.sqlite3',
         )
+
+    def test_connection_per_thread(
+        self,
+    ):
+        connections = []
+        thread = threading.Thread(
+            target=lambda: connections.append(self.connector.connection),
+        )
+        thread.start()
+        thread.join()
+
+        self.assertIs(
+            self.connector.connection,
+            self.connector.connection,
+        )
+        self.assertIsNot(
+            connections[0],
+            self.connector.connection,
+        )
+        self.assertEqual(
+            first=self.connector.connection.execute('PRAGMA journal_mode;').fetchone()[0],
+            second='wal',
+        )
+
+    def test_queue_pop_bulk_multiple_processes(
+        self,
+    ):
+        self.connector.queue_delete(
+            queue_name=self.test_queue_name,
+        )
+        items = [
+            f'item_{i}'.encode()
+            for i in range(1000)
+        ]
+        self.connector.queue_push_bulk(
+            queue_name=self.test_queue_name,
+            items=items,
+        )
+
+        results_queue = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=pop_all_items,
+                kwargs={
+                    'file_path': '/tmp/test.sqlite3',
+                    'queue_name': self.test_queue_name,
+                    'results_queue': results_queue,
+                },
+            )
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+
+        popped_items = []
+        for _ in processes:
+            popped_items += results_queue.get(
+                timeout=30,
+            )
+
+        for process in processes:
+            process.join()
+
+        self.assertEqual(
+            first=sorted(popped_items),
+            second=sorted(items),
+        )
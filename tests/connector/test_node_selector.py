@@ -0,0 +1,359 @@
+import time
+import unittest
+
+import sergeant.connector
+
+
+class RoundRobinNodeSelectorTestCase(
+    unittest.TestCase,
+):
+    def test_rotation(
+        self,
+    ):
+        selector = sergeant.connector.node_selector.RoundRobinNodeSelector(
+            number_of_nodes=3,
+        )
+        selector.current_node_index = 1
+
+        self.assertEqual(
+            first=selector.get_push_node_indices(),
+            second=[
+                1,
+            ],
+        )
+        self.assertEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                2,
+                0,
+                1,
+            ],
+        )
+        self.assertEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                0,
+                1,
+                2,
+            ],
+        )
+
+
+class CreateNodeSelectorTestCase(
+    unittest.TestCase,
+):
+    def test_create_node_selector(
+        self,
+    ):
+        selector = sergeant.connector.node_selector.create_node_selector(
+            node_selection='round_robin',
+            number_of_nodes=3,
+        )
+        self.assertIsInstance(
+            selector,
+            sergeant.connector.node_selector.RoundRobinNodeSelector,
+        )
+        self.assertEqual(
+            first=selector.number_of_nodes,
+            second=3,
+        )
+
+        selector = sergeant.connector.node_selector.create_node_selector(
+            node_selection='health_aware',
+            number_of_nodes=2,
+            node_selection_params={
+                'failure_threshold': 5,
+            },
+        )
+        self.assertIsInstance(
+            selector,
+            sergeant.connector.node_selector.HealthAwareNodeSelector,
+        )
+        self.assertEqual(
+            first=selector.failure_threshold,
+            second=5,
+        )
+
+        with self.assertRaises(
+            expected_exception=ValueError,
+        ):
+            sergeant.connector.node_selector.create_node_selector(
+                node_selection='random',
+                number_of_nodes=2,
+            )
+
+
+class HealthAwareNodeSelectorTestCase(
+    unittest.TestCase,
+):
+    def test_latency(
+        self,
+    ):
+        selector = sergeant.connector.node_selector.HealthAwareNodeSelector(
+            number_of_nodes=2,
+            latency_smoothing=0.5,
+        )
+        selector.record_latency(
+            node_index=0,
+            latency=0.001,
+        )
+        selector.record_latency(
+            node_index=0,
+            latency=0.003,
+        )
+        selector.record_latency(
+            node_index=1,
+            latency=0.1,
+        )
+        self.assertAlmostEqual(
+            first=selector.latencies[0],
+            second=0.002,
+        )
+
+        first_push_node_indices = [
+            selector.get_push_node_indices()[0]
+            for i in range(1000)
+        ]
+        self.assertGreater(
+            a=first_push_node_indices.count(0),
+            b=900,
+        )
+
+    def test_circuit_breaker(
+        self,
+    ):
+        selector = sergeant.connector.node_selector.HealthAwareNodeSelector(
+            number_of_nodes=2,
+            failure_threshold=2,
+            circuit_breaker_timeout=0.2,
+        )
+        selector.record_failure(
+            node_index=1,
+        )
+        self.assertCountEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                0,
+                1,
+            ],
+        )
+
+        selector.record_failure(
+            node_index=1,
+        )
+        self.assertEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                0,
+            ],
+        )
+        self.assertEqual(
+            first=selector.get_push_node_indices(),
+            second=[
+                0,
+            ],
+        )
+
+        time.sleep(0.2)
+        self.assertCountEqual(
+            first=selector.get_push_node_indices(),
+            second=[
+                0,
+                1,
+            ],
+        )
+
+        selector.record_failure(
+            node_index=1,
+        )
+        self.assertEqual(
+            first=selector.get_push_node_indices(),
+            second=[
+                0,
+            ],
+        )
+
+        selector.record_latency(
+            node_index=1,
+            latency=0.001,
+        )
+        self.assertCountEqual(
+            first=selector.get_push_node_indices(),
+            second=[
+                0,
+                1,
+            ],
+        )
+
+    def test_empty_pops_and_queue_lengths(
+        self,
+    ):
+        selector = sergeant.connector.node_selector.HealthAwareNodeSelector(
+            number_of_nodes=3,
+            empty_pop_backoff=0.2,
+        )
+        selector.record_pop(
+            node_index=0,
+            queue_name='queue',
+            number_of_items=0,
+        )
+        self.assertCountEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                1,
+                2,
+            ],
+        )
+        self.assertCountEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='other_queue',
+            ),
+            second=[
+                0,
+                1,
+                2,
+            ],
+        )
+
+        selector.record_queue_length(
+            node_index=1,
+            queue_name='queue',
+            queue_length=10,
+        )
+        selector.record_queue_length(
+            node_index=2,
+            queue_name='queue',
+            queue_length=20,
+        )
+        self.assertEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                2,
+                1,
+            ],
+        )
+
+        selector.record_pop(
+            node_index=2,
+            queue_name='queue',
+            number_of_items=15,
+        )
+        self.assertEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                1,
+                2,
+            ],
+        )
+
+        selector.record_push(
+            node_index=0,
+            queue_name='queue',
+            number_of_items=30,
+        )
+        self.assertEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                0,
+                1,
+                2,
+            ],
+        )
+
+        selector.record_queue_length(
+            node_index=0,
+            queue_name='queue',
+            queue_length=0,
+        )
+        selector.record_queue_length(
+            node_index=1,
+            queue_name='queue',
+            queue_length=0,
+        )
+        selector.record_queue_length(
+            node_index=2,
+            queue_name='queue',
+            queue_length=0,
+        )
+        self.assertCountEqual(
+            first=selector.get_pop_node_indices(
+                queue_name='queue',
+            ),
+            second=[
+                0,
+                1,
+                2,
+            ],
+        )
+
+    def test_redis_failed_node(
+        self,
+    ):
+        connector = sergeant.connector.redis.Connector(
+            nodes=[
+                {
+                    'host': 'localhost',
+                    'port': 6379,
+                    'password': None,
+                    'database': 0,
+                },
+                {
+                    'host': 'localhost',
+                    'port': 6399,
+                    'password': None,
+                    'database': 0,
+                },
+            ],
+            node_selection='health_aware',
+            node_selection_params={
+                'failure_threshold': 1,
+            },
+        )
+        connector.connections[0].queue_delete(
+            queue_name='test_queue',
+        )
+        connector.node_selector.latencies[0] = 1.0
+
+        for i in range(10):
+            self.assertTrue(
+                expr=connector.queue_push(
+                    queue_name='test_queue',
+                    item=f'item_{i}'.encode(),
+                ),
+            )
+
+        self.assertGreater(
+            a=connector.node_selector.circuit_open_until[1],
+            b=time.monotonic(),
+        )
+        self.assertCountEqual(
+            first=connector.queue_pop_bulk(
+                queue_name='test_queue',
+                number_of_items=10,
+            ),
+            second=[
+                f'item_{i}'.encode()
+                for i in range(10)
+            ],
+        )
+        self.assertIsNone(
+            obj=connector.queue_pop(
+                queue_name='test_queue',
+            ),
+        )
@@ -0,0 +1,123 @@
+import unittest
+
+import sergeant.connector
+
+
+class PlacementTestCase(
+    unittest.TestCase,
+):
+    node_names = [
+        f'localhost:{port}/0'
+        for port in range(6379, 6383)
+    ]
+    keys = [
+        f'key_{i}'
+        for i in range(10000)
+    ]
+
+    def test_modulo_placement(
+        self,
+    ):
+        key_placement = sergeant.connector.placement.ModuloPlacement(
+            node_names=self.node_names,
+        )
+        for key in self.keys:
+            node_index = key_placement.get_node_index(
+                key=key,
+            )
+            self.assertGreaterEqual(
+                a=node_index,
+                b=0,
+            )
+            self.assertLess(
+                a=node_index,
+                b=len(self.node_names),
+            )
+
+    def test_consistent_hashing_placement_distribution(
+        self,
+    ):
+        key_placement = sergeant.connector.placement.ConsistentHashingPlacement(
+            node_names=self.node_names,
+        )
+        number_of_keys_per_node = [0] * len(self.node_names)
+        for key in self.keys:
+            number_of_keys_per_node[
+                key_placement.get_node_index(
+                    key=key,
+                )
+            ] += 1
+
+        expected_number_of_keys_per_node = len(self.keys) / len(self.node_names)
+        for number_of_keys in number_of_keys_per_node:
+            self.assertGreater(
+                a=number_of_keys,
+                b=expected_number_of_keys_per_node * 0.8,
+            )
+            self.assertLess(
+                a=number_of_keys,
+                b=expected_number_of_keys_per_node * 1.2,
+            )
+
+    def test_consistent_hashing_placement_node_addition(
+        self,
+    ):
+        key_placement = sergeant.connector.placement.ConsistentHashingPlacement(
+            node_names=self.node_names[:3],
+        )
+        extended_key_placement = sergeant.connector.placement.ConsistentHashingPlacement(
+            node_names=self.node_names,
+        )
+
+        number_of_moved_keys = 0
+        for key in self.keys:
+            node_index = key_placement.get_node_index(
+                key=key,
+            )
+            new_node_index = extended_key_placement.get_node_index(
+                key=key,
+            )
+            if node_index != new_node_index:
+                self.assertEqual(
+                    first=new_node_index,
+                    second=3,
+                )
+                number_of_moved_keys += 1
+
+        self.assertLess(
+            a=number_of_moved_keys,
+            b=len(self.keys) * 0.35,
+        )
+
+    def test_create_placement(
+        self,
+    ):
+        self.assertIsInstance(
+            sergeant.connector.placement.create_placement(
+                key_placement='modulo',
+                node_names=self.node_names,
+            ),
+            sergeant.connector.placement.ModuloPlacement,
+        )
+
+        key_placement = sergeant.connector.placement.create_placement(
+            key_placement='consistent_hashing',
+            node_names=self.node_names,
+            virtual_nodes=10,
+        )
+        self.assertIsInstance(
+            key_placement,
+            sergeant.connector.placement.ConsistentHashingPlacement,
+        )
+        self.assertEqual(
+            first=len(key_placement.ring_hashes),
+            second=len(self.node_names) * 10,
+        )
+
+        with self.assertRaises(
+            expected_exception=ValueError,
+        ):
+            sergeant.connector.placement.create_placement(
+                key_placement='random',
+                node_names=self.node_names,
+            )
@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 import sergeant.encoder.compressor
@@ -67,3 +68,119 @@ class CompressorsTestCase(
             first=uncompressed_object,
             second=self.obj_to_compress,
         )
+
+    def test_zstd(
+        self,
+    ):
+        compressed_object = sergeant.encoder.compressor.zstd.Compressor().compress(
+            data=self.obj_to_compress,
+        )
+        uncompressed_object = sergeant.encoder.compressor.zstd.Compressor().decompress(
+            data=compressed_object,
+        )
+
+        self.assertEqual(
+            first=uncompressed_object,
+            second=self.obj_to_compress,
+        )
+
+    def test_zstd_dictionary(
+        self,
+    ):
+        samples = [
+            f'{{"user_id": {i}, "action": "crawl", "url": "https://example.com/page/{i * 7}"}}'.encode()
+            for i in range(1000)
+        ]
+        dictionary = sergeant.encoder.compressor.zstd.Compressor.train_dictionary(
+            samples=samples,
+            dictionary_size=4096,
+        )
+        compressor_with_dictionary = sergeant.encoder.compressor.zstd.Compressor(
+            dictionary=dictionary,
+        )
+        compressor_without_dictionary = sergeant.encoder.compressor.zstd.Compressor()
+
+        compressed_object = compressor_with_dictionary.compress(
+            data=samples[0],
+        )
+        self.assertLess(
+            a=len(compressed_object),
+            b=len(
+                compressor_without_dictionary.compress(
+                    data=samples[0],
+                )
+            ),
+        )
+        self.assertEqual(
+            first=sergeant.encoder.compressor.zstd.Compressor(
+                dictionary=dictionary,
+            ).decompress(
+                data=compressed_object,
+            ),
+            second=samples[0],
+        )
+
+    def test_lz4(
+        self,
+    ):
+        compressor = sergeant.encoder.compressor.lz4.Compressor()
+        for obj_to_compress in [
+            self.obj_to_compress,
+            b'',
+            self.obj_to_compress,
+        ]:
+            compressed_object = compressor.compress(
+                data=obj_to_compress,
+            )
+            uncompressed_object = sergeant.encoder.compressor.lz4.Compressor().decompress(
+                data=compressed_object,
+            )
+
+            self.assertEqual(
+                first=uncompressed_object,
+                second=obj_to_compress,
+            )
+            self.assertEqual(
+                first=compressor.decompress(
+                    data=compressed_object,
+                ),
+                second=obj_to_compress,
+            )
+
+    def test_contexts_per_thread(
+        self,
+    ):
+        for compressor in [
+            sergeant.encoder.compressor.lz4.Compressor(),
+            sergeant.encoder.compressor.zstd.Compressor(),
+        ]:
+            results = []
+
+            def compress_and_decompress(
+                compressor=compressor,
+            ):
+                for i in range(100):
+                    obj_to_compress = self.obj_to_compress[i:]
+                    results.append(
+                        compressor.decompress(
+                            data=compressor.compress(
+                                data=obj_to_compress,
+                            ),
+                        ) == obj_to_compress
+                    )
+
+            threads = [
+                threading.Thread(
+                    target=compress_and_decompress,
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(
+                first=results,
+                second=[True] * 400,
+            )
@@ -50,3 +50,152 @@ class EncoderTestCase(
                     first=decoded,
                     second=self.obj_to_encode,
                 )
+
+    def test_compression_threshold(
+        self,
+    ):
+        encoder_obj = sergeant.encoder.encoder.Encoder(
+            compressor_name='zlib',
+            serializer_name='msgpack',
+            compression_threshold=32,
+        )
+
+        small_object = {
+            'a': 1,
+        }
+        encoded = encoder_obj.encode(
+            data=small_object,
+        )
+        self.assertEqual(
+            first=encoded[:1],
+            second=sergeant.encoder.encoder.UNCOMPRESSED_FLAG,
+        )
+        self.assertEqual(
+            first=encoded[1:],
+            second=encoder_obj.serializer.serialize(
+                data=small_object,
+            ),
+        )
+        self.assertEqual(
+            first=encoder_obj.decode(
+                data=encoded,
+            ),
+            second=small_object,
+        )
+
+        encoded = encoder_obj.encode(
+            data=self.obj_to_encode,
+        )
+        self.assertEqual(
+            first=encoded[:1],
+            second=sergeant.encoder.encoder.COMPRESSED_FLAG,
+        )
+        self.assertEqual(
+            first=encoder_obj.decode(
+                data=encoded,
+            ),
+            second=self.obj_to_encode,
+        )
+
+    def test_compressor_params(
+        self,
+    ):
+        encoder_obj = sergeant.encoder.encoder.Encoder(
+            compressor_name='zstd',
+            serializer_name='pickle',
+            compressor_params={
+                'level': 10,
+            },
+        )
+        self.assertEqual(
+            first=encoder_obj.compressor.level,
+            second=10,
+        )
+        self.assertEqual(
+            first=encoder_obj.decode(
+                data=encoder_obj.encode(
+                    data=self.obj_to_encode,
+                ),
+            ),
+            second=self.obj_to_encode,
+        )
+
+    def test_self_describing(
+        self,
+    ):
+        legacy_encoder = sergeant.encoder.encoder.Encoder(
+            compressor_name='gzip',
+            serializer_name='pickle',
+        )
+        producer_encoder = sergeant.encoder.encoder.Encoder(
+            compressor_name='gzip',
+            serializer_name='pickle',
+            self_describing=True,
+        )
+        consumer_encoder = sergeant.encoder.encoder.Encoder(
+            compressor_name='zstd',
+            serializer_name='msgpack',
+            compression_threshold=1024,
+            self_describing=True,
+        )
+
+        encoded = producer_encoder.encode(
+            data=self.obj_to_encode,
+        )
+        self.assertEqual(
+            first=encoded[:3],
+            second=b''.join(
+                (
+                    sergeant.encoder.encoder.HEADER_MAGIC,
+                    bytes(
+                        (
+                            sergeant.encoder.serializer.pickle.Serializer.id,
+                            sergeant.encoder.compressor.gzip.Compressor.id,
+                        )
+                    ),
+                )
+            ),
+        )
+
+        for encoded in [
+            encoded,
+            legacy_encoder.encode(
+                data=self.obj_to_encode,
+            ),
+            consumer_encoder.encode(
+                data=self.obj_to_encode,
+            ),
+        ]:
+            for encoder_obj in [
+                producer_encoder,
+                legacy_encoder,
+            ]:
+                self.assertEqual(
+                    first=encoder_obj.decode(
+                        data=encoded,
+                    ),
+                    second=self.obj_to_encode,
+                )
+
+        encoded = consumer_encoder.encode(
+            data=self.obj_to_encode,
+        )
+        self.assertEqual(
+            first=encoded[2],
+            second=sergeant.encoder.encoder.NO_COMPRESSOR_ID,
+        )
+        self.assertEqual(
+            first=consumer_encoder.decode(
+                data=producer_encoder.encode(
+                    data=self.obj_to_encode,
+                ),
+            ),
+            second=self.obj_to_encode,
+        )
+
+        with self.assertRaises(
+            expected_exception=ValueError,
+        ):
+            consumer_encoder.decode(
+                data=b'\xc1\xff\x00',
+            )
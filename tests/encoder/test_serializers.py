@@ -1,7 +1,10 @@
 import datetime
+import msgpack
+import pickle
 import unittest
 
 import sergeant.encoder.serializer
+import sergeant.objects
 
 
 class SerializersTestCase(
@@ -55,6 +58,188 @@ class SerializersTestCase(
                 data=Exception(),
             )
 
+    def test_msgpack_task(
+        self,
+    ):
+        serializer_obj = sergeant.encoder.serializer.msgpack.Serializer()
+        for trace_id in [
+            None,
+            '',
+            'trace \u00AE',
+        ]:
+            task = sergeant.objects.Task(
+                kwargs={
+                    'a': {
+                        'b': [
+                            1,
+                            {
+                                'c': (
+                                    1,
+                                    datetime.datetime(2020, 1, 1, 12, 30),
+                                ),
+                            },
+                        ],
+                    },
+                    'd': b'bytes',
+                },
+                trace_id=trace_id,
+                date=1600000000.25,
+                run_count=3,
+            )
+            serialized_task = serializer_obj.serialize(
+                data=task,
+            )
+            self.assertNotIn(
+                member=b'__task__',
+                container=serialized_task,
+            )
+            self.assertEqual(
+                first=serializer_obj.unserialize(
+                    data=serialized_task,
+                ),
+                second=task,
+            )
+
+        self.assertEqual(
+            first=serializer_obj.unserialize(
+                data=serializer_obj.serialize(
+                    data=[
+                        task,
+                        task,
+                    ],
+                ),
+            ),
+            second=[
+                task,
+                task,
+            ],
+        )
+
+    def test_msgpack_lazy_kwargs(
+        self,
+    ):
+        serializer_obj = sergeant.encoder.serializer.msgpack.Serializer()
+        serialized_task = serializer_obj.serialize(
+            data=sergeant.objects.Task(
+                kwargs={
+                    'a': [
+                        1,
+                        2,
+                    ],
+                },
+                date=1600000000.0,
+            ),
+        )
+
+        task = serializer_obj.unserialize(
+            data=serialized_task,
+        )
+        self.assertNotIn(
+            member='kwargs',
+            container=task.__dict__,
+        )
+        task.run_count += 1
+        reserialized_task = serializer_obj.serialize(
+            data=task,
+        )
+        self.assertNotIn(
+            member='kwargs',
+            container=task.__dict__,
+        )
+        self.assertEqual(
+            first=reserialized_task[-len(serialized_task) + 20:],
+            second=serialized_task[-len(serialized_task) + 20:],
+        )
+
+        self.assertEqual(
+            first=task.kwargs,
+            second={
+                'a': [
+                    1,
+                    2,
+                ],
+            },
+        )
+        task.kwargs['a'].append(3)
+        self.assertEqual(
+            first=serializer_obj.unserialize(
+                data=serializer_obj.serialize(
+                    data=task,
+                ),
+            ).kwargs,
+            second={
+                'a': [
+                    1,
+                    2,
+                    3,
+                ],
+            },
+        )
+
+        unpickled_task = pickle.loads(
+            pickle.dumps(
+                serializer_obj.unserialize(
+                    data=serialized_task,
+                ),
+            ),
+        )
+        self.assertEqual(
+            first=unpickled_task,
+            second=sergeant.objects.Task(
+                kwargs={
+                    'a': [
+                        1,
+                        2,
+                    ],
+                },
+                date=1600000000.0,
+            ),
+        )
+
+    def test_msgpack_legacy_payloads(
+        self,
+    ):
+        legacy_serialized_task = msgpack.packb(
+            {
+                '__task__': {
+                    'kwargs': {
+                        'a': {
+                            '__datetime__': datetime.datetime(2020, 1, 1).timestamp(),
+                        },
+                        'b': {
+                            '__tuple__': [
+                                1,
+                                2,
+                            ],
+                        },
+                    },
+                    'trace_id': None,
+                    'date': 1600000000.0,
+                    'run_count': 1,
+                },
+            },
+            use_bin_type=True,
+        )
+
+        serializer_obj = sergeant.encoder.serializer.msgpack.Serializer()
+        self.assertEqual(
+            first=serializer_obj.unserialize(
+                data=legacy_serialized_task,
+            ),
+            second=sergeant.objects.Task(
+                kwargs={
+                    'a': datetime.datetime(2020, 1, 1),
+                    'b': (
+                        1,
+                        2,
+                    ),
+                },
+                trace_id=None,
+                date=1600000000.0,
+                run_count=1,
+            ),
+        )
+
     def test_pickle(
         self,
     ):
@@ -0,0 +1,748 @@
+import asyncio
+import os
+import signal
+import time
+import unittest
+import unittest.mock
+
+import sergeant.config
+import sergeant.executor
+import sergeant.worker
+
+
+class AsynchronousTestCase(
+    unittest.TestCase,
+):
+    def setUp(
+        self,
+    ):
+        async def work_method(
+            task,
+        ):
+            return True
+
+        async def close_method():
+            pass
+
+        async def acknowledge_task_method(
+            task,
+        ):
+            pass
+
+        async def acknowledge_pending_tasks_method():
+            pass
+
+        async def push_pending_tasks_method():
+            pass
+
+        async def push_tasks_method(
+            task_name,
+            tasks,
+            priority,
+        ):
+            return True
+
+        self.worker = unittest.mock.MagicMock()
+        self.worker.config = sergeant.config.WorkerConfig(
+            name='test_worker',
+            connector=sergeant.config.Connector(
+                type='',
+                params={},
+            ),
+            timeouts=sergeant.config.Timeouts(
+                timeout=1.0,
+            )
+        )
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=work_method,
+        )
+        self.worker.async_broker.close = unittest.mock.MagicMock(
+            side_effect=close_method,
+        )
+        self.worker.async_broker.push_tasks = unittest.mock.MagicMock(
+            side_effect=push_tasks_method,
+        )
+        self.worker.async_acknowledge_task = unittest.mock.MagicMock(
+            side_effect=acknowledge_task_method,
+        )
+        self.worker.async_acknowledge_pending_tasks = unittest.mock.MagicMock(
+            side_effect=acknowledge_pending_tasks_method,
+        )
+        self.worker.async_push_pending_tasks = unittest.mock.MagicMock(
+            side_effect=push_pending_tasks_method,
+        )
+        self.worker.pre_work = unittest.mock.MagicMock()
+        self.worker.post_work = unittest.mock.MagicMock()
+
+        self.worker.handle_success = unittest.mock.MagicMock()
+        self.worker.handle_timeout = unittest.mock.MagicMock()
+        self.worker.handle_failure = unittest.mock.MagicMock()
+        self.worker.handle_retry = unittest.mock.MagicMock()
+        self.worker.handle_max_retries = unittest.mock.MagicMock()
+        self.worker.handle_requeue = unittest.mock.MagicMock()
+
+        self.exception = Exception('some exception')
+
+    def test_get_set_current_task(
+        self,
+    ):
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        self.assertIsNone(
+            obj=asyncio_executor.get_current_task(),
+        )
+
+        current_tasks = []
+
+        async def work_method(
+            task,
+        ):
+            await asyncio.sleep(0.01)
+            current_tasks.append(asyncio_executor.get_current_task())
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=work_method,
+        )
+
+        other_task = sergeant.objects.Task()
+        asyncio_executor.number_of_concurrent_tasks = 2
+        asyncio_executor.execute_tasks(
+            tasks=[
+                task,
+                other_task,
+            ],
+        )
+        self.assertCountEqual(
+            first=current_tasks,
+            second=[
+                task,
+                other_task,
+            ],
+        )
+        self.assertIsNone(
+            obj=asyncio_executor.get_current_task(),
+        )
+
+    def test_pre_work(
+        self,
+    ):
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        asyncio_executor.pre_work(
+            task=task,
+        )
+        self.worker.pre_work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.logger.error.assert_not_called()
+
+        self.worker.pre_work.side_effect = Exception('exception message')
+        asyncio_executor.pre_work(
+            task=task,
+        )
+        self.worker.logger.error.assert_called_once_with(
+            msg='pre_work has failed: exception message',
+            extra={
+                'task': task,
+            },
+        )
+
+    def test_post_work(
+        self,
+    ):
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        asyncio_executor.post_work(
+            task=task,
+            success=True,
+            exception=None,
+        )
+        self.worker.post_work.assert_called_once_with(
+            task=task,
+            success=True,
+            exception=None,
+        )
+        self.worker.logger.error.assert_not_called()
+
+        exception = Exception('exception message')
+        self.worker.post_work.side_effect = exception
+        asyncio_executor.post_work(
+            task=task,
+            success=True,
+            exception=None,
+        )
+        self.worker.logger.error.assert_called_once_with(
+            msg='post_work has failed: exception message',
+            extra={
+                'task': task,
+                'success': True,
+                'exception': exception,
+            },
+        )
+
+    def test_success(
+        self,
+    ):
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        asyncio_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.pre_work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.post_work.assert_called_once_with(
+            task=task,
+            success=True,
+            exception=None,
+        )
+        self.worker.handle_success.assert_called_once_with(
+            task=task,
+            returned_value=True,
+        )
+        self.worker.async_push_pending_tasks.assert_called_once_with()
+        self.worker.async_acknowledge_task.assert_called_once_with(
+            task=task,
+        )
+        self.worker.async_acknowledge_pending_tasks.assert_called_once_with()
+        self.worker.async_broker.push_tasks.assert_not_called()
+        self.worker.async_broker.close.assert_called_once_with()
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+        self.worker.handle_retry.assert_not_called()
+        self.worker.handle_max_retries.assert_not_called()
+        self.worker.handle_requeue.assert_not_called()
+
+    def test_success_many_tasks(
+        self,
+    ):
+        async def work_method(
+            task,
+        ):
+            await asyncio.sleep(0.2)
+
+            return True
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=work_method,
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=100,
+        )
+
+        task = sergeant.objects.Task()
+        start_time = time.time()
+        asyncio_executor.execute_tasks(
+            tasks=[task] * 100,
+        )
+        self.assertLess(
+            a=time.time() - start_time,
+            b=2.0,
+        )
+        self.assertEqual(
+            first=self.worker.work.call_count,
+            second=100,
+        )
+        self.assertEqual(
+            first=self.worker.pre_work.call_count,
+            second=100,
+        )
+        self.assertEqual(
+            first=self.worker.post_work.call_count,
+            second=100,
+        )
+        self.assertEqual(
+            first=self.worker.handle_success.call_count,
+            second=100,
+        )
+
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+        self.worker.handle_retry.assert_not_called()
+        self.worker.handle_max_retries.assert_not_called()
+        self.worker.handle_requeue.assert_not_called()
+
+    def test_number_of_concurrent_tasks(
+        self,
+    ):
+        running_tasks = []
+        max_running_tasks = []
+
+        async def work_method(
+            task,
+        ):
+            running_tasks.append(task)
+            max_running_tasks.append(len(running_tasks))
+            await asyncio.sleep(0.01)
+            running_tasks.remove(task)
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=work_method,
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=5,
+        )
+
+        asyncio_executor.execute_tasks(
+            tasks=[
+                sergeant.objects.Task()
+                for i in range(50)
+            ],
+        )
+        self.assertEqual(
+            first=max(max_running_tasks),
+            second=5,
+        )
+        self.assertEqual(
+            first=self.worker.handle_success.call_count,
+            second=50,
+        )
+
+    def test_failure(
+        self,
+    ):
+        async def raise_exception_work_method(
+            task,
+        ):
+            raise self.exception
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=raise_exception_work_method,
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        asyncio_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.pre_work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.post_work.assert_called_once_with(
+            task=task,
+            success=False,
+            exception=self.exception,
+        )
+        self.worker.handle_failure.assert_called_once_with(
+            task=task,
+            exception=self.exception,
+        )
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+        self.worker.handle_retry.assert_not_called()
+        self.worker.handle_max_retries.assert_not_called()
+        self.worker.handle_requeue.assert_not_called()
+
+    def test_timeout(
+        self,
+    ):
+        async def timeout_work_method(
+            task,
+        ):
+            while True:
+                await asyncio.sleep(0.1)
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=timeout_work_method,
+        )
+        self.worker.config = self.worker.config.replace(
+            timeouts=sergeant.config.Timeouts(
+                timeout=0.3,
+            ),
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        asyncio_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.pre_work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.post_work.assert_called_once()
+        self.assertEqual(
+            first=self.worker.post_work.call_args[1]['task'],
+            second=task,
+        )
+        self.assertFalse(
+            expr=self.worker.post_work.call_args[1]['success'],
+        )
+        self.assertIsInstance(
+            obj=self.worker.post_work.call_args[1]['exception'],
+            cls=sergeant.worker.WorkerTimedout,
+        )
+        self.worker.handle_timeout.assert_called_once_with(
+            task=task,
+        )
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_retry.assert_not_called()
+        self.worker.handle_max_retries.assert_not_called()
+        self.worker.handle_requeue.assert_not_called()
+
+    def test_timeout_multiple_tasks(
+        self,
+    ):
+        async def timeout_work_method(
+            task,
+        ):
+            while True:
+                await asyncio.sleep(0.1)
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=timeout_work_method,
+        )
+        self.worker.config = self.worker.config.replace(
+            timeouts=sergeant.config.Timeouts(
+                timeout=0.3,
+            ),
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=10,
+        )
+
+        task = sergeant.objects.Task()
+        start_time = time.time()
+        asyncio_executor.execute_tasks(
+            tasks=[task] * 10,
+        )
+        self.assertLess(
+            a=time.time() - start_time,
+            b=1.0,
+        )
+        self.assertEqual(
+            first=self.worker.work.call_count,
+            second=10,
+        )
+        self.assertEqual(
+            first=self.worker.post_work.call_count,
+            second=10,
+        )
+        self.assertEqual(
+            first=self.worker.handle_timeout.call_count,
+            second=10,
+        )
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_failure.assert_not_called()
+
+    def test_on_retry(
+        self,
+    ):
+        async def retry_work_method(
+            task,
+        ):
+            raise sergeant.worker.WorkerRetry()
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=retry_work_method,
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        asyncio_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.post_work.assert_called_once()
+        self.assertIsInstance(
+            obj=self.worker.post_work.call_args[1]['exception'],
+            cls=sergeant.worker.WorkerRetry,
+        )
+        self.worker.handle_retry.assert_called_once_with(
+            task=task,
+        )
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+        self.worker.handle_max_retries.assert_not_called()
+        self.worker.handle_requeue.assert_not_called()
+
+    def test_on_max_retries(
+        self,
+    ):
+        async def max_retries_work_method(
+            task,
+        ):
+            raise sergeant.worker.WorkerMaxRetries()
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=max_retries_work_method,
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        asyncio_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.post_work.assert_called_once()
+        self.assertIsInstance(
+            obj=self.worker.post_work.call_args[1]['exception'],
+            cls=sergeant.worker.WorkerMaxRetries,
+        )
+        self.worker.handle_max_retries.assert_called_once_with(
+            task=task,
+        )
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+        self.worker.handle_retry.assert_not_called()
+        self.worker.handle_requeue.assert_not_called()
+
+    def test_requeue(
+        self,
+    ):
+        async def requeue_work_method(
+            task,
+        ):
+            raise sergeant.worker.WorkerRequeue()
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=requeue_work_method,
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        asyncio_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.post_work.assert_called_once()
+        self.assertIsInstance(
+            obj=self.worker.post_work.call_args[1]['exception'],
+            cls=sergeant.worker.WorkerRequeue,
+        )
+        self.worker.handle_requeue.assert_called_once_with(
+            task=task,
+        )
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+        self.worker.handle_retry.assert_not_called()
+        self.worker.handle_max_retries.assert_not_called()
+
+    def test_stop(
+        self,
+    ):
+        async def stop_work_method(
+            task,
+        ):
+            sergeant.worker.Worker.stop(None)
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=stop_work_method,
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        with self.assertRaises(
+            expected_exception=sergeant.worker.WorkerStop,
+        ):
+            asyncio_executor.execute_tasks(
+                tasks=[task] * 10,
+            )
+        self.worker.work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.post_work.assert_called_once()
+        self.assertIsInstance(
+            obj=self.worker.post_work.call_args[1]['exception'],
+            cls=sergeant.worker.WorkerStop,
+        )
+        self.worker.handle_stop.assert_called_once_with(
+            task=task,
+        )
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+        self.worker.handle_retry.assert_not_called()
+        self.worker.handle_max_retries.assert_not_called()
+        self.worker.handle_requeue.assert_not_called()
+
+    def test_stop_signal(
+        self,
+    ):
+        started_tasks = []
+
+        async def long_work_method(
+            task,
+        ):
+            started_tasks.append(task)
+            if len(started_tasks) == 3:
+                asyncio.get_event_loop().call_later(
+                    0.2,
+                    os.kill,
+                    os.getpid(),
+                    signal.SIGTERM,
+                )
+
+            await asyncio.sleep(10)
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=long_work_method,
+        )
+        self.worker.config = self.worker.config.replace(
+            timeouts=sergeant.config.Timeouts(
+                timeout=0.0,
+            ),
+        )
+        self.addCleanup(
+            signal.signal,
+            signal.SIGTERM,
+            signal.getsignal(signal.SIGTERM),
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=3,
+        )
+
+        tasks = [
+            sergeant.objects.Task(
+                kwargs={
+                    'task': i,
+                },
+            )
+            for i in range(10)
+        ]
+        start_time = time.time()
+        with self.assertRaises(
+            expected_exception=sergeant.worker.WorkerStop,
+        ):
+            asyncio_executor.execute_tasks(
+                tasks=tasks,
+            )
+        self.assertLess(
+            a=time.time() - start_time,
+            b=1.0,
+        )
+        self.assertEqual(
+            first=self.worker.work.call_count,
+            second=3,
+        )
+        self.assertEqual(
+            first=self.worker.handle_stop.call_count,
+            second=3,
+        )
+        for call in self.worker.post_work.call_args_list:
+            self.assertIsInstance(
+                obj=call[1]['exception'],
+                cls=sergeant.worker.WorkerStop,
+            )
+        self.worker.async_broker.push_tasks.assert_called_once()
+        self.assertEqual(
+            first=self.worker.async_broker.push_tasks.call_args[1]['priority'],
+            second='HIGH',
+        )
+        self.assertCountEqual(
+            first=self.worker.async_broker.push_tasks.call_args[1]['tasks'],
+            second=tasks[:3],
+        )
+        self.assertEqual(
+            first=self.worker.async_acknowledge_task.call_count,
+            second=3,
+        )
+        self.worker.async_push_pending_tasks.assert_not_called()
+        self.worker.async_broker.close.assert_called_once_with()
+        self.assertTrue(
+            expr=self.worker.received_stop_signal,
+        )
+        self.assertEqual(
+            first=signal.getsignal(signal.SIGTERM),
+            second=signal.SIG_DFL,
+        )
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+
+    def test_respawn(
+        self,
+    ):
+        async def respawn_work_method(
+            task,
+        ):
+            sergeant.worker.Worker.respawn(None)
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=respawn_work_method,
+        )
+
+        asyncio_executor = sergeant.executor.asynchronous.AsyncioExecutor(
+            worker_object=self.worker,
+            number_of_concurrent_tasks=1,
+        )
+
+        task = sergeant.objects.Task()
+        with self.assertRaises(
+            expected_exception=sergeant.worker.WorkerRespawn,
+        ):
+            asyncio_executor.execute_tasks(
+                tasks=[task],
+            )
+        self.worker.work.assert_called_once_with(
+            task=task,
+        )
+        self.worker.post_work.assert_called_once()
+        self.assertIsInstance(
+            obj=self.worker.post_work.call_args[1]['exception'],
+            cls=sergeant.worker.WorkerRespawn,
+        )
+        self.worker.handle_stop.assert_not_called()
+        self.worker.handle_success.assert_not_called()
+        self.worker.handle_failure.assert_not_called()
+        self.worker.handle_timeout.assert_not_called()
+        self.worker.handle_retry.assert_not_called()
+        self.worker.handle_max_retries.assert_not_called()
+        self.worker.handle_requeue.assert_not_called()
@@ -0,0 +1,485 @@
+import multiprocessing
+import os
+import time
+import unittest
+import unittest.mock
+
+import sergeant.config
+import sergeant.executor
+import sergeant.objects
+import sergeant.worker
+
+
+class ProcessPoolTestCase(
+    unittest.TestCase,
+):
+    def setUp(
+        self,
+    ):
+        self.worker = unittest.mock.MagicMock()
+        self.worker.config = sergeant.config.WorkerConfig(
+            name='test_worker',
+            connector=sergeant.config.Connector(
+                type='',
+                params={},
+            ),
+            timeouts=sergeant.config.Timeouts(
+                timeout=1.0,
+                grace_period=0.5,
+            )
+        )
+        self.worker.work = unittest.mock.MagicMock(
+            return_value=True,
+        )
+
+        self.work_counter = multiprocessing.Value('i', 0)
+
+        self.exception = Exception('some exception')
+
+    def count_work(
+        self,
+    ):
+        with self.work_counter.get_lock():
+            self.work_counter.value += 1
+
+    def assert_only_handler_called(
+        self,
+        handler_name,
+    ):
+        for other_handler_name in [
+            'handle_success',
+            'handle_timeout',
+            'handle_failure',
+            'handle_retry',
+            'handle_max_retries',
+            'handle_requeue',
+            'handle_stop',
+        ]:
+            if other_handler_name != handler_name:
+                getattr(self.worker, other_handler_name).assert_not_called()
+
+    def test_get_current_task(
+        self,
+    ):
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=2,
+        )
+
+        task = sergeant.objects.Task()
+        self.assertIsNone(
+            obj=process_pool_executor.get_current_task(),
+        )
+
+        process_pool_executor.set_current_task(
+            task=task,
+        )
+        self.assertEqual(
+            first=process_pool_executor.get_current_task(),
+            second=task,
+        )
+
+    def test_success(
+        self,
+    ):
+        def work_method(
+            task,
+        ):
+            self.count_work()
+
+            return os.getpid()
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=work_method,
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=2,
+        )
+
+        task = sergeant.objects.Task()
+        process_pool_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.assertEqual(
+            first=self.work_counter.value,
+            second=1,
+        )
+        self.worker.handle_success.assert_called_once()
+        self.assertEqual(
+            first=self.worker.handle_success.call_args[1]['task'],
+            second=task,
+        )
+        self.assertNotEqual(
+            first=self.worker.handle_success.call_args[1]['returned_value'],
+            second=os.getpid(),
+        )
+        self.worker.acknowledge_task.assert_called_once_with(
+            task=task,
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_success',
+        )
+        self.assertEqual(
+            first=process_pool_executor.child_processes,
+            second=[],
+        )
+
+    def test_success_many_tasks(
+        self,
+    ):
+        def work_method(
+            task,
+        ):
+            self.count_work()
+            time.sleep(0.01)
+
+            return True
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=work_method,
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=4,
+        )
+
+        task = sergeant.objects.Task()
+        process_pool_executor.execute_tasks(
+            tasks=[task] * 100,
+        )
+        self.assertEqual(
+            first=self.work_counter.value,
+            second=100,
+        )
+        self.assertEqual(
+            first=self.worker.handle_success.call_count,
+            second=100,
+        )
+        self.assertEqual(
+            first=self.worker.acknowledge_task.call_count,
+            second=100,
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_success',
+        )
+
+    def test_concurrency(
+        self,
+    ):
+        def work_method(
+            task,
+        ):
+            time.sleep(0.3)
+
+            return True
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=work_method,
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=4,
+        )
+
+        task = sergeant.objects.Task()
+        start_time = time.time()
+        process_pool_executor.execute_tasks(
+            tasks=[task] * 4,
+        )
+        self.assertLess(
+            a=time.time() - start_time,
+            b=1.0,
+        )
+        self.assertEqual(
+            first=self.worker.handle_success.call_count,
+            second=4,
+        )
+
+    def test_failure(
+        self,
+    ):
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=self.exception,
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        process_pool_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.handle_failure.assert_called_once()
+        self.assertEqual(
+            first=self.worker.handle_failure.call_args[1]['task'],
+            second=task,
+        )
+        self.assertIsInstance(
+            obj=self.worker.handle_failure.call_args[1]['exception'],
+            cls=Exception,
+        )
+        self.assertEqual(
+            first=str(self.worker.handle_failure.call_args[1]['exception']),
+            second='some exception',
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_failure',
+        )
+
+    def test_timeout(
+        self,
+    ):
+        def timeout_work_method(
+            task,
+        ):
+            while True:
+                time.sleep(0.1)
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=timeout_work_method,
+        )
+        self.worker.config = self.worker.config.replace(
+            timeouts=sergeant.config.Timeouts(
+                timeout=0.3,
+                grace_period=5.0,
+            ),
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        start_time = time.time()
+        process_pool_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.assertLess(
+            a=time.time() - start_time,
+            b=2.0,
+        )
+        self.worker.handle_timeout.assert_called_once_with(
+            task=task,
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_timeout',
+        )
+
+    def test_timeout_grace_period_kill(
+        self,
+    ):
+        def ignore_timeout_work_method(
+            task,
+        ):
+            while True:
+                try:
+                    time.sleep(0.1)
+                except sergeant.worker.WorkerTimedout:
+                    pass
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=ignore_timeout_work_method,
+        )
+        self.worker.config = self.worker.config.replace(
+            timeouts=sergeant.config.Timeouts(
+                timeout=0.3,
+                grace_period=0.3,
+            ),
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        process_pool_executor.execute_tasks(
+            tasks=[task] * 2,
+        )
+        self.assertEqual(
+            first=self.worker.handle_timeout.call_count,
+            second=2,
+        )
+        self.assertEqual(
+            first=self.worker.acknowledge_task.call_count,
+            second=2,
+        )
+        self.worker.logger.error.assert_called_with(
+            msg='task has exceeded its grace period, killing its process',
+            extra={
+                'task': task,
+            },
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_timeout',
+        )
+
+    def test_child_process_exit(
+        self,
+    ):
+        def exit_work_method(
+            task,
+        ):
+            os._exit(3)
+
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=exit_work_method,
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        process_pool_executor.execute_tasks(
+            tasks=[task] * 2,
+        )
+        self.assertEqual(
+            first=self.worker.handle_failure.call_count,
+            second=2,
+        )
+        self.assertIsInstance(
+            obj=self.worker.handle_failure.call_args[1]['exception'],
+            cls=ChildProcessError,
+        )
+        self.assertEqual(
+            first=str(self.worker.handle_failure.call_args[1]['exception']),
+            second='executor process has exited with code 3',
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_failure',
+        )
+
+    def test_retry(
+        self,
+    ):
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=sergeant.worker.WorkerRetry(),
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        process_pool_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.handle_retry.assert_called_once_with(
+            task=task,
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_retry',
+        )
+
+    def test_max_retries(
+        self,
+    ):
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=sergeant.worker.WorkerMaxRetries(),
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        process_pool_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.handle_max_retries.assert_called_once_with(
+            task=task,
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_max_retries',
+        )
+
+    def test_requeue(
+        self,
+    ):
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=sergeant.worker.WorkerRequeue(),
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        process_pool_executor.execute_tasks(
+            tasks=[task],
+        )
+        self.worker.handle_requeue.assert_called_once_with(
+            task=task,
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_requeue',
+        )
+
+    def test_stop(
+        self,
+    ):
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=sergeant.worker.WorkerStop(),
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        with self.assertRaises(
+            expected_exception=sergeant.worker.WorkerStop,
+        ):
+            process_pool_executor.execute_tasks(
+                tasks=[task] * 2,
+            )
+
+        self.worker.handle_stop.assert_called_once_with(
+            task=task,
+        )
+        self.worker.acknowledge_task.assert_called_once_with(
+            task=task,
+        )
+        self.assert_only_handler_called(
+            handler_name='handle_stop',
+        )
+
+    def test_respawn(
+        self,
+    ):
+        self.worker.work = unittest.mock.MagicMock(
+            side_effect=sergeant.worker.WorkerRespawn(),
+        )
+
+        process_pool_executor = sergeant.executor.process_pool.ProcessPoolExecutor(
+            worker_object=self.worker,
+            number_of_processes=1,
+        )
+
+        task = sergeant.objects.Task()
+        with self.assertRaises(
+            expected_exception=sergeant.worker.WorkerRespawn,
+        ):
+            process_pool_executor.execute_tasks(
+                tasks=[task],
+            )
+
+        self.worker.acknowledge_task.assert_called_once_with(
+            task=task,
+        )
+        self.assert_only_handler_called(
+            handler_name=None,
+        )
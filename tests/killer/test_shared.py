@@ -0,0 +1,303 @@
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import unittest
+import unittest.mock
+
+import sergeant.killer.shared
+
+
+class DeadlineSlotsTestCase(
+    unittest.TestCase,
+):
+    def test_read_write(
+        self,
+    ):
+        deadline_slots = sergeant.killer.shared.DeadlineSlots(
+            number_of_slots=4,
+        )
+
+        self.assertEqual(
+            first=deadline_slots.read(
+                slot_index=2,
+            ),
+            second=(
+                0,
+                0.0,
+                0.0,
+            ),
+        )
+
+        deadline_slots.write(
+            slot_index=2,
+            timeout_time=10.0,
+            kill_time=15.0,
+        )
+        self.assertEqual(
+            first=deadline_slots.read(
+                slot_index=2,
+            ),
+            second=(
+                2,
+                10.0,
+                15.0,
+            ),
+        )
+        self.assertEqual(
+            first=deadline_slots.read(
+                slot_index=1,
+            ),
+            second=(
+                0,
+                0.0,
+                0.0,
+            ),
+        )
+
+        deadline_slots.close()
+
+    def test_deadline_slot_from_environment(
+        self,
+    ):
+        deadline_slots = sergeant.killer.shared.DeadlineSlots(
+            number_of_slots=4,
+        )
+
+        with unittest.mock.patch.dict(
+            in_dict=os.environ,
+            clear=True,
+        ):
+            self.assertIsNone(
+                obj=sergeant.killer.shared.DeadlineSlot.from_environment(
+                    timeout=1.0,
+                    grace_period=2.0,
+                ),
+            )
+
+        with unittest.mock.patch.dict(
+            in_dict=os.environ,
+            values={
+                sergeant.killer.shared.DEADLINE_SLOTS_FD_ENVIRONMENT_VARIABLE: str(deadline_slots.file_descriptor),
+                sergeant.killer.shared.DEADLINE_SLOT_INDEX_ENVIRONMENT_VARIABLE: '3',
+            },
+        ):
+            deadline_slot = sergeant.killer.shared.DeadlineSlot.from_environment(
+                timeout=1.0,
+                grace_period=2.0,
+            )
+
+        self.assertIsNotNone(
+            obj=deadline_slot,
+        )
+        self.assertEqual(
+            first=deadline_slot.deadline_slots.number_of_slots,
+            second=4,
+        )
+
+        deadline_slot.start()
+        sequence, timeout_time, kill_time = deadline_slots.read(
+            slot_index=3,
+        )
+        self.assertAlmostEqual(
+            first=timeout_time,
+            second=time.monotonic() + 1.0,
+            delta=0.1,
+        )
+        self.assertAlmostEqual(
+            first=kill_time,
+            second=timeout_time + 2.0,
+        )
+
+        deadline_slot.stop_and_reset()
+        self.assertEqual(
+            first=deadline_slots.read(
+                slot_index=3,
+            ),
+            second=(
+                4,
+                0.0,
+                0.0,
+            ),
+        )
+
+        deadline_slot.shutdown()
+        deadline_slots.close()
+
+
+class KillerTestCase(
+    unittest.TestCase,
+):
+    def setUp(
+        self,
+    ):
+        self.deadline_slots = sergeant.killer.shared.DeadlineSlots(
+            number_of_slots=2,
+        )
+        self.logger = unittest.mock.MagicMock()
+        self.killer = sergeant.killer.shared.Killer(
+            deadline_slots=self.deadline_slots,
+            logger=self.logger,
+            tick_duration=0.02,
+        )
+        self.killer.start()
+
+    def tearDown(
+        self,
+    ):
+        self.killer.shutdown()
+        self.deadline_slots.close()
+
+    def start_process(
+        self,
+        target,
+        slot_index,
+        timeout,
+        grace_period,
+    ):
+        process = multiprocessing.get_context('fork').Process(
+            target=target,
+            kwargs={
+                'deadline_slot': sergeant.killer.shared.DeadlineSlot(
+                    deadline_slots=self.deadline_slots,
+                    slot_index=slot_index,
+                    timeout=timeout,
+                    grace_period=grace_period,
+                ),
+            },
+            daemon=True,
+        )
+        process.start()
+        self.killer.watch(
+            slot_index=slot_index,
+            pid=process.pid,
+        )
+
+        return process
+
+    def test_timeout(
+        self,
+    ):
+        process = self.start_process(
+            target=sleep_and_exit_on_timeout,
+            slot_index=0,
+            timeout=0.5,
+            grace_period=5.0,
+        )
+
+        time.sleep(0.3)
+        self.assertTrue(
+            expr=process.is_alive(),
+        )
+        process.join(
+            timeout=1.0,
+        )
+        self.assertFalse(
+            expr=process.is_alive(),
+        )
+        self.assertEqual(
+            first=process.exitcode,
+            second=10,
+        )
+
+    def test_grace_period_kill(
+        self,
+    ):
+        process = self.start_process(
+            target=sleep_and_ignore_timeout,
+            slot_index=1,
+            timeout=0.3,
+            grace_period=0.3,
+        )
+
+        time.sleep(0.45)
+        self.assertTrue(
+            expr=process.is_alive(),
+        )
+        process.join(
+            timeout=1.0,
+        )
+        self.assertEqual(
+            first=process.exitcode,
+            second=-signal.SIGKILL,
+        )
+        self.logger.warning.assert_called_once_with(
+            msg=f'worker({process.pid}) has exceeded its grace period, killing it',
+        )
+
+    def test_stop_and_reset(
+        self,
+    ):
+        process = self.start_process(
+            target=finish_before_timeout,
+            slot_index=0,
+            timeout=0.3,
+            grace_period=0.3,
+        )
+
+        process.join(
+            timeout=2.0,
+        )
+        self.assertEqual(
+            first=process.exitcode,
+            second=0,
+        )
+        self.assertEqual(
+            first=len(self.killer.timer_wheel),
+            second=0,
+        )
+
+    def test_unwatch(
+        self,
+    ):
+        process = self.start_process(
+            target=sleep_and_exit_on_timeout,
+            slot_index=0,
+            timeout=0.3,
+            grace_period=0.3,
+        )
+        self.killer.unwatch(
+            slot_index=0,
+        )
+
+        time.sleep(1.0)
+        self.assertTrue(
+            expr=process.is_alive(),
+        )
+
+        process.kill()
+        process.join()
+
+
+def sleep_and_exit_on_timeout(
+    deadline_slot,
+):
+    signal.signal(
+        signalnum=signal.SIGUSR1,
+        handler=lambda signal_num, frame: sys.exit(10),
+    )
+    deadline_slot.start()
+    time.sleep(30)
+
+
+def sleep_and_ignore_timeout(
+    deadline_slot,
+):
+    signal.signal(
+        signalnum=signal.SIGUSR1,
+        handler=lambda signal_num, frame: True,
+    )
+    deadline_slot.start()
+    time.sleep(30)
+
+
+def finish_before_timeout(
+    deadline_slot,
+):
+    for i in range(10):
+        deadline_slot.start()
+        time.sleep(0.1)
+        deadline_slot.stop_and_reset()
+
+    time.sleep(0.5)
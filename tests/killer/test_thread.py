@@ -111,6 +111,129 @@ class KillerTestCase(
         self.thread_enabled = False
         thread.join()
 
+    def test_precision(
+        self,
+    ):
+        thread = threading.Thread(
+            target=self.thread_function,
+        )
+        thread.start()
+
+        killer = sergeant.killer.thread.Killer(
+            exception=ExceptionTest,
+        )
+        killer.start()
+
+        start_time = time.monotonic()
+        killer.add(
+            thread_id=thread.ident,
+            timeout=0.15,
+        )
+        thread.join(
+            timeout=1.0,
+        )
+        self.assertFalse(
+            expr=thread.is_alive(),
+        )
+        self.assertAlmostEqual(
+            first=time.monotonic() - start_time,
+            second=0.15,
+            delta=0.06,
+        )
+
+        killer.stop()
+
+    def test_multiple_threads(
+        self,
+    ):
+        threads = [
+            threading.Thread(
+                target=self.thread_function,
+            )
+            for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+
+        killer = sergeant.killer.thread.Killer(
+            exception=ExceptionTest,
+        )
+        killer.start()
+        killer.add(
+            thread_id=threads[0].ident,
+            timeout=5.0,
+        )
+        killer.add(
+            thread_id=threads[1].ident,
+            timeout=0.2,
+        )
+        killer.add(
+            thread_id=threads[2].ident,
+            timeout=0.3,
+        )
+        killer.remove(
+            thread_id=threads[2].ident,
+        )
+
+        threads[1].join(
+            timeout=1.0,
+        )
+        self.assertFalse(
+            expr=threads[1].is_alive(),
+        )
+        time.sleep(0.2)
+        self.assertTrue(
+            expr=threads[0].is_alive(),
+        )
+        self.assertTrue(
+            expr=threads[2].is_alive(),
+        )
+        self.assertEqual(
+            first=list(killer.thread_to_end_time),
+            second=[
+                threads[0].ident,
+            ],
+        )
+
+        killer.remove(
+            thread_id=threads[0].ident,
+        )
+        killer.stop()
+        self.thread_enabled = False
+        for thread in threads:
+            thread.join()
+
+    def test_lazy_deletion(
+        self,
+    ):
+        killer = sergeant.killer.thread.Killer(
+            exception=ExceptionTest,
+        )
+        killer.start()
+
+        for i in range(1000):
+            killer.add(
+                thread_id=1,
+                timeout=60.0,
+            )
+            killer.remove(
+                thread_id=1,
+            )
+
+        self.assertEqual(
+            first=killer.thread_to_end_time,
+            second={},
+        )
+        self.assertLessEqual(
+            a=len(killer.end_times_heap),
+            b=65,
+        )
+
+        killer.stop()
+        self.assertTrue(
+            expr=killer.finished.is_set(),
+        )
+
 
 class ExceptionTest(
     Exception,
@@ -0,0 +1,222 @@
+import random
+import unittest
+
+import sergeant.killer.timer_wheel
+
+
+class TimerWheelTestCase(
+    unittest.TestCase,
+):
+    def test_add_and_advance(
+        self,
+    ):
+        timer_wheel = sergeant.killer.timer_wheel.TimerWheel(
+            tick_duration=0.1,
+        )
+
+        timer_wheel.add(
+            key='first',
+            deadline=0.5,
+        )
+        timer_wheel.add(
+            key='second',
+            deadline=1.0,
+        )
+        self.assertEqual(
+            first=len(timer_wheel),
+            second=2,
+        )
+        self.assertIn(
+            member='first',
+            container=timer_wheel,
+        )
+
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=0.4,
+            ),
+            second=[],
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=0.5,
+            ),
+            second=[
+                'first',
+            ],
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=0.9,
+            ),
+            second=[],
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=1.2,
+            ),
+            second=[
+                'second',
+            ],
+        )
+        self.assertEqual(
+            first=len(timer_wheel),
+            second=0,
+        )
+
+    def test_remove(
+        self,
+    ):
+        timer_wheel = sergeant.killer.timer_wheel.TimerWheel(
+            tick_duration=0.1,
+        )
+
+        timer_wheel.add(
+            key='first',
+            deadline=0.5,
+        )
+        self.assertTrue(
+            expr=timer_wheel.remove(
+                key='first',
+            ),
+        )
+        self.assertFalse(
+            expr=timer_wheel.remove(
+                key='first',
+            ),
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=1.0,
+            ),
+            second=[],
+        )
+
+    def test_add_replaces_deadline(
+        self,
+    ):
+        timer_wheel = sergeant.killer.timer_wheel.TimerWheel(
+            tick_duration=0.1,
+        )
+
+        timer_wheel.add(
+            key='first',
+            deadline=0.5,
+        )
+        timer_wheel.add(
+            key='first',
+            deadline=2.0,
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=1.0,
+            ),
+            second=[],
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=2.0,
+            ),
+            second=[
+                'first',
+            ],
+        )
+
+    def test_past_deadline(
+        self,
+    ):
+        timer_wheel = sergeant.killer.timer_wheel.TimerWheel(
+            tick_duration=0.1,
+            start_time=10.0,
+        )
+
+        timer_wheel.add(
+            key='first',
+            deadline=5.0,
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=10.0,
+            ),
+            second=[
+                'first',
+            ],
+        )
+
+    def test_cascading(
+        self,
+    ):
+        timer_wheel = sergeant.killer.timer_wheel.TimerWheel(
+            tick_duration=1.0,
+            wheel_size=4,
+            number_of_levels=3,
+        )
+
+        random_generator = random.Random(1)
+        deadlines = {
+            key: float(random_generator.randint(1, 200))
+            for key in range(100)
+        }
+        for key, deadline in deadlines.items():
+            timer_wheel.add(
+                key=key,
+                deadline=deadline,
+            )
+
+        for now in range(1, 201):
+            expired_keys = timer_wheel.advance(
+                now=float(now),
+            )
+            self.assertCountEqual(
+                first=expired_keys,
+                second=[
+                    key
+                    for key, deadline in deadlines.items()
+                    if deadline == now
+                ],
+            )
+
+        self.assertEqual(
+            first=len(timer_wheel),
+            second=0,
+        )
+
+    def test_advance_over_many_ticks(
+        self,
+    ):
+        timer_wheel = sergeant.killer.timer_wheel.TimerWheel(
+            tick_duration=0.01,
+            wheel_size=8,
+            number_of_levels=2,
+        )
+
+        timer_wheel.add(
+            key='first',
+            deadline=3.0,
+        )
+        timer_wheel.add(
+            key='second',
+            deadline=1000.0,
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=5.0,
+            ),
+            second=[
+                'first',
+            ],
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=999.0,
+            ),
+            second=[],
+        )
+        self.assertEqual(
+            first=timer_wheel.advance(
+                now=1000.0,
+            ),
+            second=[
+                'second',
+            ],
+        )
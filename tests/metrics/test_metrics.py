@@ -0,0 +1,285 @@
+import time
+import unittest
+import unittest.mock
+
+import sergeant.metrics
+import sergeant.objects
+
+
+class HistogramTestCase(
+    unittest.TestCase,
+):
+    def test_observe(
+        self,
+    ):
+        histogram = sergeant.metrics.Histogram(
+            buckets=[
+                0.1,
+                1.0,
+            ],
+        )
+        for value in [
+            0.05,
+            0.1,
+            0.5,
+            2.0,
+        ]:
+            histogram.observe(value)
+
+        histogram_dict = histogram.to_dict()
+        self.assertEqual(
+            first=histogram_dict['counts'],
+            second=[
+                2,
+                1,
+                1,
+            ],
+        )
+        self.assertEqual(
+            first=histogram_dict['count'],
+            second=4,
+        )
+        self.assertAlmostEqual(
+            first=histogram_dict['sum'],
+            second=2.65,
+        )
+
+    def test_merge(
+        self,
+    ):
+        histogram = sergeant.metrics.Histogram(
+            buckets=[
+                0.1,
+                1.0,
+            ],
+        )
+        histogram.observe(0.5)
+        histogram.merge(
+            histogram={
+                'buckets': [
+                    0.1,
+                    1.0,
+                ],
+                'counts': [
+                    1,
+                    2,
+                    3,
+                ],
+                'sum': 10.0,
+                'count': 6,
+            },
+        )
+        self.assertEqual(
+            first=histogram.counts,
+            second=[
+                1,
+                3,
+                3,
+            ],
+        )
+        self.assertEqual(
+            first=histogram.count,
+            second=7,
+        )
+        self.assertEqual(
+            first=histogram.sum,
+            second=10.5,
+        )
+
+        with self.assertRaises(
+            expected_exception=ValueError,
+        ):
+            histogram.merge(
+                histogram={
+                    'buckets': [
+                        1.0,
+                    ],
+                    'counts': [
+                        0,
+                        0,
+                    ],
+                    'sum': 0.0,
+                    'count': 0,
+                },
+            )
+
+
+class MetricsTestCase(
+    unittest.TestCase,
+):
+    def test_task_lifecycle(
+        self,
+    ):
+        metrics = sergeant.metrics.Metrics()
+        task = sergeant.objects.Task(
+            date=time.time() - 2.0,
+        )
+
+        metrics.observe_pulled_tasks(
+            tasks=[
+                task,
+            ],
+            decode_time=0.0001,
+        )
+        metrics.work_started(
+            task=task,
+        )
+        time.sleep(0.02)
+        metrics.work_finished(
+            task=task,
+            outcome='success',
+        )
+        metrics.task_finished(
+            task=task,
+        )
+
+        metrics_dict = metrics.to_dict()
+        self.assertEqual(
+            first=metrics_dict['counters']['success'],
+            second=1,
+        )
+        self.assertEqual(
+            first=metrics_dict['counters']['failure'],
+            second=0,
+        )
+        for histogram_name in sergeant.metrics.HISTOGRAM_NAMES:
+            self.assertEqual(
+                first=metrics_dict['histograms'][histogram_name]['count'],
+                second=1,
+            )
+
+        self.assertGreaterEqual(
+            a=metrics_dict['histograms']['queue_wait_time']['sum'],
+            b=2.0,
+        )
+        self.assertGreaterEqual(
+            a=metrics_dict['histograms']['work_time']['sum'],
+            b=0.02,
+        )
+        self.assertEqual(
+            first=metrics.task_start_times,
+            second={},
+        )
+
+    def test_disabled(
+        self,
+    ):
+        metrics = sergeant.metrics.Metrics(
+            enabled=False,
+        )
+        task = sergeant.objects.Task()
+
+        metrics.work_started(
+            task=task,
+        )
+        metrics.work_finished(
+            task=task,
+            outcome='failure',
+        )
+        metrics.task_finished(
+            task=task,
+        )
+
+        self.assertEqual(
+            first=metrics.to_dict()['counters']['failure'],
+            second=0,
+        )
+        self.assertEqual(
+            first=metrics.task_start_times,
+            second={},
+        )
+        self.assertFalse(
+            expr=metrics.export_is_due(),
+        )
+
+    def test_merge(
+        self,
+    ):
+        worker_metrics = sergeant.metrics.Metrics()
+        for outcome in [
+            'success',
+            'success',
+            'retry',
+        ]:
+            task = sergeant.objects.Task()
+            worker_metrics.work_started(
+                task=task,
+            )
+            worker_metrics.work_finished(
+                task=task,
+                outcome=outcome,
+            )
+            worker_metrics.task_finished(
+                task=task,
+            )
+
+        aggregated_metrics = sergeant.metrics.Metrics()
+        aggregated_metrics.merge(
+            metrics=worker_metrics.to_dict(),
+        )
+        aggregated_metrics.merge(
+            metrics=worker_metrics.to_dict(),
+        )
+
+        metrics_dict = aggregated_metrics.to_dict()
+        self.assertEqual(
+            first=metrics_dict['counters']['success'],
+            second=4,
+        )
+        self.assertEqual(
+            first=metrics_dict['counters']['retry'],
+            second=2,
+        )
+        self.assertEqual(
+            first=metrics_dict['histograms']['work_time']['count'],
+            second=6,
+        )
+
+    def test_export(
+        self,
+    ):
+        sink = unittest.mock.MagicMock()
+        metrics = sergeant.metrics.Metrics(
+            sinks=[
+                sink,
+            ],
+            export_interval=0.1,
+        )
+        self.assertFalse(
+            expr=metrics.export_is_due(),
+        )
+
+        time.sleep(0.1)
+        self.assertTrue(
+            expr=metrics.export_is_due(),
+        )
+
+        metrics.export()
+        sink.export.assert_called_once_with(
+            metrics=metrics.to_dict(),
+        )
+        self.assertFalse(
+            expr=metrics.export_is_due(),
+        )
+
+    def test_logger_sink(
+        self,
+    ):
+        logger = unittest.mock.MagicMock()
+        sink = sergeant.metrics.LoggerSink(
+            logger=logger,
+        )
+        sink.export(
+            metrics={
+                'counters': {},
+            },
+        )
+        logger.log.assert_called_once_with(
+            level=20,
+            msg='task metrics',
+            extra={
+                'metrics': {
+                    'counters': {},
+                },
+            },
+        )
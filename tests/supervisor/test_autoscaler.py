@@ -0,0 +1,335 @@
+import os
+import signal
+import threading
+import unittest
+import unittest.mock
+
+import sergeant.autoscaler
+import sergeant.supervisor
+
+
+class AutoscalerTestCase(
+    unittest.TestCase,
+):
+    def test_invalid_limits(
+        self,
+    ):
+        with self.assertRaises(
+            expected_exception=ValueError,
+        ):
+            sergeant.autoscaler.Autoscaler(
+                min_workers=0,
+                max_workers=4,
+                target_backlog_per_worker=10,
+            )
+
+        with self.assertRaises(
+            expected_exception=ValueError,
+        ):
+            sergeant.autoscaler.Autoscaler(
+                min_workers=4,
+                max_workers=2,
+                target_backlog_per_worker=10,
+            )
+
+    def test_clamp(
+        self,
+    ):
+        autoscaler = sergeant.autoscaler.Autoscaler(
+            min_workers=2,
+            max_workers=4,
+            target_backlog_per_worker=10,
+            cooldown=100.0,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=0,
+                number_of_workers=6,
+                now=0.0,
+            ),
+            second=4,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=0,
+                number_of_workers=1,
+                now=1.0,
+            ),
+            second=2,
+        )
+
+    def test_scale_up_by_backlog(
+        self,
+    ):
+        autoscaler = sergeant.autoscaler.Autoscaler(
+            min_workers=1,
+            max_workers=8,
+            target_backlog_per_worker=10,
+            cooldown=0.0,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=55,
+                number_of_workers=2,
+                now=0.0,
+            ),
+            second=6,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=1000,
+                number_of_workers=6,
+                now=1.0,
+            ),
+            second=8,
+        )
+
+    def test_hysteresis(
+        self,
+    ):
+        autoscaler = sergeant.autoscaler.Autoscaler(
+            min_workers=1,
+            max_workers=8,
+            target_backlog_per_worker=10,
+            hysteresis=0.2,
+            cooldown=0.0,
+        )
+        for now, number_of_enqueued_tasks in enumerate(
+            [
+                23,
+                17,
+                20,
+            ]
+        ):
+            self.assertEqual(
+                first=autoscaler.get_desired_number_of_workers(
+                    number_of_enqueued_tasks=number_of_enqueued_tasks,
+                    number_of_workers=2,
+                    now=float(now),
+                ),
+                second=2,
+            )
+
+    def test_scale_down_one_at_a_time(
+        self,
+    ):
+        autoscaler = sergeant.autoscaler.Autoscaler(
+            min_workers=1,
+            max_workers=8,
+            target_backlog_per_worker=10,
+            cooldown=0.0,
+        )
+        number_of_workers = 4
+        for now in range(3):
+            number_of_workers = autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=0,
+                number_of_workers=number_of_workers,
+                now=float(now),
+            )
+            self.assertEqual(
+                first=number_of_workers,
+                second=3 - now,
+            )
+
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=0,
+                number_of_workers=1,
+                now=3.0,
+            ),
+            second=1,
+        )
+
+    def test_scale_down_keeps_remaining_workers_under_target(
+        self,
+    ):
+        autoscaler = sergeant.autoscaler.Autoscaler(
+            min_workers=1,
+            max_workers=8,
+            target_backlog_per_worker=10,
+            hysteresis=0.2,
+            cooldown=0.0,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=15,
+                number_of_workers=2,
+                now=0.0,
+            ),
+            second=2,
+        )
+
+    def test_cooldown(
+        self,
+    ):
+        autoscaler = sergeant.autoscaler.Autoscaler(
+            min_workers=1,
+            max_workers=8,
+            target_backlog_per_worker=10,
+            cooldown=10.0,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=40,
+                number_of_workers=1,
+                now=0.0,
+            ),
+            second=4,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=0,
+                number_of_workers=4,
+                now=5.0,
+            ),
+            second=4,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=0,
+                number_of_workers=4,
+                now=10.0,
+            ),
+            second=3,
+        )
+
+    def test_scale_up_by_drain_time(
+        self,
+    ):
+        autoscaler = sergeant.autoscaler.Autoscaler(
+            min_workers=2,
+            max_workers=8,
+            target_backlog_per_worker=1000,
+            target_drain_time=10.0,
+            cooldown=0.0,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=500,
+                number_of_workers=2,
+                now=0.0,
+            ),
+            second=2,
+        )
+        self.assertEqual(
+            first=autoscaler.get_desired_number_of_workers(
+                number_of_enqueued_tasks=495,
+                number_of_workers=2,
+                now=1.0,
+            ),
+            second=8,
+        )
+
+
+class SupervisorAutoscalingTestCase(
+    unittest.TestCase,
+):
+    def tearDown(
+        self,
+    ):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    def test_scale_up_and_down(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_long_running',
+            worker_class_name='Worker',
+            concurrent_workers=1,
+            min_workers=1,
+            max_workers=3,
+            target_backlog_per_worker=10,
+            scaling_hysteresis=0.0,
+            scaling_cooldown=0.0,
+            scaling_interval=0.2,
+            logger=unittest.mock.MagicMock(),
+        )
+
+        numbers_of_workers = []
+        enqueued_tasks_samples = [
+            100,
+            100,
+            100,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+        ]
+
+        def get_number_of_enqueued_tasks():
+            numbers_of_workers.append(
+                len(
+                    [
+                        worker
+                        for worker in supervisor.current_workers
+                        if not worker.is_scaling_down
+                    ]
+                )
+            )
+            if enqueued_tasks_samples:
+                return enqueued_tasks_samples.pop(0)
+
+            os.kill(os.getpid(), signal.SIGTERM)
+
+            return 0
+
+        supervisor.get_number_of_enqueued_tasks = get_number_of_enqueued_tasks
+
+        stop_timer = threading.Timer(
+            interval=20.0,
+            function=os.kill,
+            args=(
+                os.getpid(),
+                signal.SIGTERM,
+            ),
+        )
+        stop_timer.start()
+        try:
+            with self.assertRaises(
+                expected_exception=SystemExit,
+            ):
+                supervisor.start()
+        finally:
+            stop_timer.cancel()
+
+        self.assertEqual(
+            first=numbers_of_workers[:3],
+            second=[
+                1,
+                3,
+                3,
+            ],
+        )
+        self.assertIn(
+            member=1,
+            container=numbers_of_workers[3:],
+        )
+
+        info_messages = [
+            call[1]['msg']
+            for call in supervisor.logger.info.call_args_list
+        ]
+        self.assertIn(
+            member='scaling up from 1 to 3 workers, 100 tasks are enqueued',
+            container=info_messages,
+        )
+        self.assertIn(
+            member='scaling down from 3 to 2 workers, 0 tasks are enqueued',
+            container=info_messages,
+        )
+        self.assertIn(
+            member='scaling down from 2 to 1 workers, 0 tasks are enqueued',
+            container=info_messages,
+        )
+        self.assertEqual(
+            first=len(
+                [
+                    info_message
+                    for info_message in info_messages
+                    if info_message.endswith('has stopped')
+                ]
+            ),
+            second=3,
+        )
@@ -0,0 +1,230 @@
+import os
+import signal
+import threading
+import time
+import unittest
+import unittest.mock
+import urllib.request
+
+import sergeant.metrics
+import sergeant.prometheus
+import sergeant.supervisor
+
+
+class ExpositionTestCase(
+    unittest.TestCase,
+):
+    def test_render(
+        self,
+    ):
+        exposition = sergeant.prometheus.Exposition()
+        exposition.add_metric(
+            name='sergeant_tasks_total',
+            metric_type='counter',
+            help_text='Number of tasks',
+        )
+        exposition.add_sample(
+            name='sergeant_tasks_total',
+            value=3,
+            labels={
+                'outcome': 'success',
+                'note': 'a "quoted"\\value\n',
+            },
+        )
+        exposition.add_metric(
+            name='sergeant_task_work_time_seconds',
+            metric_type='histogram',
+            help_text='Task work time',
+        )
+        exposition.add_histogram(
+            name='sergeant_task_work_time_seconds',
+            histogram={
+                'buckets': [
+                    0.1,
+                    1.0,
+                ],
+                'counts': [
+                    1,
+                    2,
+                    3,
+                ],
+                'sum': 12.5,
+                'count': 6,
+            },
+        )
+
+        self.assertEqual(
+            first=exposition.render(),
+            second=(
+                '# HELP sergeant_tasks_total Number of tasks\n'
+                '# TYPE sergeant_tasks_total counter\n'
+                'sergeant_tasks_total{outcome="success",note="a \\"quoted\\"\\\\value\\n"} 3\n'
+                '# HELP sergeant_task_work_time_seconds Task work time\n'
+                '# TYPE sergeant_task_work_time_seconds histogram\n'
+                'sergeant_task_work_time_seconds_bucket{le="0.1"} 1\n'
+                'sergeant_task_work_time_seconds_bucket{le="1.0"} 3\n'
+                'sergeant_task_work_time_seconds_bucket{le="+Inf"} 6\n'
+                'sergeant_task_work_time_seconds_sum 12.5\n'
+                'sergeant_task_work_time_seconds_count 6\n'
+            ),
+        )
+
+
+class SharedCountersTestCase(
+    unittest.TestCase,
+):
+    def test_shared_counters(
+        self,
+    ):
+        shared_counters = sergeant.metrics.SharedCounters(
+            number_of_slots=2,
+        )
+        try:
+            with unittest.mock.patch.dict(
+                in_dict=os.environ,
+                values={
+                    sergeant.metrics.SHARED_COUNTERS_FD_ENVIRONMENT_VARIABLE: str(os.dup(shared_counters.file_descriptor)),
+                    sergeant.killer.shared.DEADLINE_SLOT_INDEX_ENVIRONMENT_VARIABLE: '1',
+                },
+            ):
+                shared_counters_slot = sergeant.metrics.SharedCountersSlot.from_environment()
+
+            self.assertIsNotNone(
+                obj=shared_counters_slot,
+            )
+            for outcome in [
+                'success',
+                'success',
+                'failure',
+                'unknown',
+            ]:
+                shared_counters_slot.increment(
+                    outcome=outcome,
+                )
+            shared_counters_slot.shared_counters.close()
+
+            self.assertEqual(
+                first=shared_counters.read(
+                    slot_index=1,
+                ),
+                second=dict(
+                    dict.fromkeys(sergeant.metrics.OUTCOMES, 0),
+                    success=2,
+                    failure=1,
+                ),
+            )
+            self.assertEqual(
+                first=shared_counters.read(
+                    slot_index=0,
+                ),
+                second=dict.fromkeys(sergeant.metrics.OUTCOMES, 0),
+            )
+
+            shared_counters.reset(
+                slot_index=1,
+            )
+            self.assertEqual(
+                first=shared_counters.read(
+                    slot_index=1,
+                ),
+                second=dict.fromkeys(sergeant.metrics.OUTCOMES, 0),
+            )
+        finally:
+            shared_counters.close()
+
+    def test_missing_environment(
+        self,
+    ):
+        with unittest.mock.patch.dict(
+            in_dict=os.environ,
+            clear=True,
+        ):
+            self.assertIsNone(
+                obj=sergeant.metrics.SharedCountersSlot.from_environment(),
+            )
+
+
+class SupervisorMetricsTestCase(
+    unittest.TestCase,
+):
+    def tearDown(
+        self,
+    ):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    def test_scrape(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_long_running',
+            worker_class_name='Worker',
+            concurrent_workers=2,
+            metrics_port=0,
+            metrics_host='127.0.0.1',
+            logger=unittest.mock.MagicMock(),
+        )
+        supervisor.released_workers_task_counters['success'] = 5
+
+        scrapes = []
+
+        def scrape():
+            try:
+                while supervisor.metrics_server is None or len(supervisor.current_workers) < 2:
+                    time.sleep(0.05)
+
+                supervisor.shared_counters.increment(
+                    slot_index=supervisor.current_workers[0].slot_index,
+                    outcome_index=sergeant.metrics.OUTCOMES.index('success'),
+                )
+
+                with urllib.request.urlopen(
+                    url=f'http://127.0.0.1:{supervisor.metrics_server.port}/metrics',
+                    timeout=5,
+                ) as response:
+                    scrapes.append(
+                        (
+                            response.headers['Content-Type'],
+                            response.read().decode(),
+                        )
+                    )
+            finally:
+                os.kill(os.getpid(), signal.SIGTERM)
+
+        scrape_thread = threading.Thread(
+            target=scrape,
+        )
+        scrape_thread.start()
+        with self.assertRaises(
+            expected_exception=SystemExit,
+        ):
+            supervisor.start()
+        scrape_thread.join()
+
+        self.assertEqual(
+            first=len(scrapes),
+            second=1,
+        )
+        content_type, body = scrapes[0]
+        self.assertEqual(
+            first=content_type,
+            second='text/plain; version=0.0.4; charset=utf-8',
+        )
+
+        first_worker_pid = body.split('sergeant_worker_rss_bytes{pid="')[1].split('"')[0]
+        for sample in [
+            'sergeant_supervisor_workers 2',
+            'sergeant_supervisor_respawns_total 0',
+            'sergeant_supervisor_memory_limit_kills_total 0',
+            f'sergeant_worker_tasks_total{{pid="{first_worker_pid}",slot="0",outcome="success"}} 1',
+            'sergeant_tasks_total{outcome="success"} 6',
+            'sergeant_tasks_total{outcome="failure"} 0',
+            'sergeant_task_work_time_seconds_bucket{le="+Inf"} 0',
+            'sergeant_task_work_time_seconds_count 0',
+        ]:
+            self.assertIn(
+                member=f'\n{sample}\n',
+                container=body,
+            )
+        self.assertIsNone(
+            obj=supervisor.metrics_server.http_server,
+        )
@@ -0,0 +1,203 @@
+import os
+import signal
+import threading
+import time
+import unittest
+import unittest.mock
+
+import sergeant.supervisor
+
+
+class SupervisorSuperviseLoopTestCase(
+    unittest.TestCase,
+):
+    def tearDown(
+        self,
+    ):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    def run_supervisor(
+        self,
+        supervisor,
+        stop_after=None,
+    ):
+        if stop_after is not None:
+            stop_timer = threading.Timer(
+                interval=stop_after,
+                function=os.kill,
+                args=(
+                    os.getpid(),
+                    signal.SIGTERM,
+                ),
+            )
+            stop_timer.start()
+
+        start_time = time.monotonic()
+        with self.assertRaises(
+            expected_exception=SystemExit,
+        ):
+            supervisor.start()
+
+        return time.monotonic() - start_time
+
+    def get_info_messages(
+        self,
+        supervisor,
+    ):
+        return [
+            call[1]['msg']
+            for call in supervisor.logger.info.call_args_list
+        ]
+
+    def test_stop_requested_by_workers(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_stop',
+            worker_class_name='Worker',
+            concurrent_workers=2,
+            logger=unittest.mock.MagicMock(),
+        )
+        self.run_supervisor(
+            supervisor=supervisor,
+        )
+
+        info_messages = self.get_info_messages(
+            supervisor=supervisor,
+        )
+        self.assertEqual(
+            first=len(
+                [
+                    info_message
+                    for info_message in info_messages
+                    if info_message.endswith('has stopped')
+                ]
+            ),
+            second=2,
+        )
+        self.assertIn(
+            member='no more workers to supervise',
+            container=info_messages,
+        )
+        self.assertEqual(
+            first=supervisor.current_workers,
+            second=[],
+        )
+        self.assertIsNone(
+            obj=supervisor.selector,
+        )
+        self.assertEqual(
+            first=signal.getsignal(signal.SIGCHLD),
+            second=signal.SIG_DFL,
+        )
+
+    def test_sigterm(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_long_running',
+            worker_class_name='Worker',
+            concurrent_workers=2,
+            logger=unittest.mock.MagicMock(),
+        )
+        elapsed_time = self.run_supervisor(
+            supervisor=supervisor,
+            stop_after=2.0,
+        )
+        self.assertLess(
+            a=elapsed_time,
+            b=10.0,
+        )
+
+        info_messages = self.get_info_messages(
+            supervisor=supervisor,
+        )
+        self.assertIn(
+            member='SIGTERM was received, triggering a stopping process',
+            container=info_messages,
+        )
+        self.assertIn(
+            member='no more workers to supervise',
+            container=info_messages,
+        )
+
+    def test_respawn_on_exit(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_respawn',
+            worker_class_name='Worker',
+            concurrent_workers=1,
+            logger=unittest.mock.MagicMock(),
+        )
+
+        select_timeouts = []
+        original_init_selector = supervisor.init_selector
+
+        def init_selector():
+            original_init_selector()
+            original_select = supervisor.selector.select
+
+            def select(
+                timeout=None,
+            ):
+                select_timeouts.append(timeout)
+
+                return original_select(
+                    timeout=timeout,
+                )
+
+            supervisor.selector.select = select
+
+        supervisor.init_selector = init_selector
+        self.run_supervisor(
+            supervisor=supervisor,
+            stop_after=3.0,
+        )
+
+        respawn_messages = [
+            info_message
+            for info_message in self.get_info_messages(
+                supervisor=supervisor,
+            )
+            if 'was respawned as' in info_message
+        ]
+        self.assertGreater(
+            a=len(respawn_messages),
+            b=0,
+        )
+        self.assertEqual(
+            first=set(select_timeouts),
+            second={
+                None,
+            },
+        )
+
+    def test_memory_check_interval(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_long_running',
+            worker_class_name='Worker',
+            concurrent_workers=1,
+            max_worker_memory_usage=1,
+            memory_check_interval=0.5,
+            logger=unittest.mock.MagicMock(),
+        )
+        self.run_supervisor(
+            supervisor=supervisor,
+            stop_after=1.8,
+        )
+
+        memory_warnings = [
+            call
+            for call in supervisor.logger.warning.call_args_list
+            if 'exceeded the maximum memory limit' in call[1]['msg']
+        ]
+        self.assertIn(
+            member=len(memory_warnings),
+            container=[
+                2,
+                3,
+            ],
+        )
@@ -838,3 +838,66 @@ class SupervisorSuperviseWorkerTestCase(
         )
 
         supervisor.stop_a_worker.assert_called_once()
+
+    def test_worker_timeout(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_timeout',
+            worker_class_name='Worker',
+            concurrent_workers=1,
+            logger=unittest.mock.MagicMock(),
+        )
+        supervisor.supervise_loop = unittest.mock.MagicMock()
+        supervisor.respawn_a_worker = unittest.mock.MagicMock()
+        supervisor.stop_a_worker = unittest.mock.MagicMock()
+        supervisor.killer.start()
+        supervisor.start()
+        supervisor.current_workers[0].process.wait(10)
+        supervisor.supervise_worker(supervisor.current_workers[0])
+        supervisor.killer.shutdown()
+
+        self.assertEqual(
+            first=list(supervisor.killer.watched_processes),
+            second=[
+                supervisor.current_workers[0].slot_index,
+            ],
+        )
+
+        second_log = supervisor.logger.info.call_args_list[1]
+        self.assertEqual(
+            first=second_log[1]['msg'],
+            second=f'worker({supervisor.current_workers[0].process.pid}) has requested to stop',
+        )
+        self.assertEqual(
+            first=second_log[1]['extra']['summary']['return_code'],
+            second=5,
+        )
+        supervisor.logger.warning.assert_not_called()
+        supervisor.stop_a_worker.assert_called_once()
+
+    def test_worker_timeout_unkillable(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_timeout_unkillable',
+            worker_class_name='Worker',
+            concurrent_workers=1,
+            logger=unittest.mock.MagicMock(),
+        )
+        supervisor.supervise_loop = unittest.mock.MagicMock()
+        supervisor.respawn_a_worker = unittest.mock.MagicMock()
+        supervisor.killer.start()
+        supervisor.start()
+        supervisor.current_workers[0].process.wait(10)
+        supervisor.supervise_worker(supervisor.current_workers[0])
+        supervisor.killer.shutdown()
+
+        self.assertEqual(
+            first=supervisor.current_workers[0].process.returncode,
+            second=-9,
+        )
+        supervisor.logger.warning.assert_called_once_with(
+            msg=f'worker({supervisor.current_workers[0].process.pid}) has exceeded its grace period, killing it',
+        )
+        supervisor.respawn_a_worker.assert_called_once()
@@ -0,0 +1,191 @@
+import os
+import signal
+import threading
+import unittest
+import unittest.mock
+
+import sergeant.killer
+import sergeant.metrics
+import sergeant.slave
+import sergeant.supervisor
+import sergeant.zygote
+
+
+class ZygoteTestCase(
+    unittest.TestCase,
+):
+    def setUp(
+        self,
+    ):
+        self.deadline_slots = sergeant.killer.shared.DeadlineSlots(
+            number_of_slots=4,
+        )
+        self.shared_counters = sergeant.metrics.SharedCounters(
+            number_of_slots=4,
+        )
+
+    def tearDown(
+        self,
+    ):
+        self.deadline_slots.close()
+        self.shared_counters.close()
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    def test_spawn(
+        self,
+    ):
+        zygote = sergeant.zygote.Zygote(
+            worker_module_name='tests.supervisor.workers.worker_successful_execution',
+            worker_class_name='Worker',
+            deadline_slots=self.deadline_slots,
+            shared_counters=self.shared_counters,
+        )
+        zygote.start()
+
+        try:
+            worker = sergeant.supervisor.SupervisedWorker(
+                worker_module_name='tests.supervisor.workers.worker_successful_execution',
+                worker_class_name='Worker',
+                deadline_slots=self.deadline_slots,
+                shared_counters=self.shared_counters,
+                slot_index=0,
+                zygote_obj=zygote,
+            )
+            self.assertNotEqual(
+                first=worker.process.pid,
+                second=zygote.process.pid,
+            )
+            self.assertIsNone(
+                obj=worker.pidfd,
+            )
+            self.assertEqual(
+                first=worker.process.wait(
+                    timeout=10,
+                ),
+                second=sergeant.slave.ReturnCode.WORKER_EXITED_NORMALLY.value,
+            )
+            self.assertEqual(
+                first=worker.get_summary()['return_code'],
+                second=sergeant.slave.ReturnCode.WORKER_EXITED_NORMALLY.value,
+            )
+            worker.kill()
+        finally:
+            zygote.stop()
+
+        self.assertFalse(
+            expr=zygote.is_alive(),
+        )
+
+    def test_zygote_exit(
+        self,
+    ):
+        zygote = sergeant.zygote.Zygote(
+            worker_module_name='tests.supervisor.workers.worker_long_running',
+            worker_class_name='Worker',
+            deadline_slots=self.deadline_slots,
+            shared_counters=self.shared_counters,
+        )
+        zygote.start()
+
+        try:
+            worker = sergeant.supervisor.SupervisedWorker(
+                worker_module_name='tests.supervisor.workers.worker_long_running',
+                worker_class_name='Worker',
+                deadline_slots=self.deadline_slots,
+                shared_counters=self.shared_counters,
+                slot_index=0,
+                zygote_obj=zygote,
+            )
+
+            zygote.process.kill()
+            self.assertEqual(
+                first=worker.process.wait(
+                    timeout=10,
+                ),
+                second=-signal.SIGKILL,
+            )
+            self.assertFalse(
+                expr=zygote.is_alive(),
+            )
+            worker.kill()
+        finally:
+            zygote.stop()
+
+    def test_supervisor_restarts_zygote(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_long_running',
+            worker_class_name='Worker',
+            concurrent_workers=1,
+            use_zygote=True,
+            logger=unittest.mock.MagicMock(),
+        )
+
+        original_init_selector = supervisor.init_selector
+
+        def init_selector():
+            original_init_selector()
+            threading.Timer(
+                interval=1.0,
+                function=supervisor.zygote.process.kill,
+            ).start()
+            threading.Timer(
+                interval=3.0,
+                function=os.kill,
+                args=(
+                    os.getpid(),
+                    signal.SIGTERM,
+                ),
+            ).start()
+
+        supervisor.init_selector = init_selector
+        with self.assertRaises(
+            expected_exception=SystemExit,
+        ):
+            supervisor.start()
+
+        supervisor.logger.warning.assert_any_call(
+            msg='the zygote has exited, starting a new one',
+            extra=supervisor.extra_signature,
+        )
+        self.assertFalse(
+            expr=supervisor.zygote.is_alive(),
+        )
+
+    def test_supervisor_stop_requested_by_workers(
+        self,
+    ):
+        supervisor = sergeant.supervisor.Supervisor(
+            worker_module_name='tests.supervisor.workers.worker_stop',
+            worker_class_name='Worker',
+            concurrent_workers=2,
+            use_zygote=True,
+            logger=unittest.mock.MagicMock(),
+        )
+        with self.assertRaises(
+            expected_exception=SystemExit,
+        ):
+            supervisor.start()
+
+        info_messages = [
+            call[1]['msg']
+            for call in supervisor.logger.info.call_args_list
+        ]
+        self.assertEqual(
+            first=len(
+                [
+                    info_message
+                    for info_message in info_messages
+                    if info_message.endswith('has stopped')
+                ]
+            ),
+            second=2,
+        )
+        self.assertIn(
+            member='no more workers to supervise',
+            container=info_messages,
+        )
+        self.assertFalse(
+            expr=supervisor.zygote.is_alive(),
+        )
@@ -1,3 +1,7 @@
+import asyncio
+import os
+import signal
+import time
 import unittest
 import unittest.mock
 
@@ -185,3 +189,307 @@ class WorkerBrokerTestCase(
             first=lock.get_ttl(),
             second=30,
         )
+
+    def test_acknowledge_tasks(
+        self,
+    ):
+        worker = sergeant.worker.Worker()
+        worker.config = sergeant.config.WorkerConfig(
+            name='some_worker',
+            connector=sergeant.config.Connector(
+                type='redis',
+                params={
+                    'nodes': [
+                        {
+                            'host': 'localhost',
+                            'port': 6379,
+                            'password': None,
+                            'database': 0,
+                        },
+                    ],
+                    'visibility_timeout': 60.0,
+                },
+            ),
+            tasks_per_transaction=2,
+        )
+        worker.init_broker()
+
+        worker.purge_tasks()
+        worker.push_tasks(
+            kwargs_list=[
+                {
+                    'task': 1,
+                },
+                {
+                    'task': 2,
+                },
+            ],
+        )
+        tasks = worker.get_next_tasks(
+            number_of_tasks=2,
+        )
+        self.assertEqual(
+            first=len(tasks),
+            second=2,
+        )
+        processing_queue_length = worker.broker.connector.connections[0].zcard(
+            name='some_worker.processing',
+        )
+        self.assertEqual(
+            first=processing_queue_length,
+            second=2,
+        )
+
+        worker.acknowledge_task(
+            task=tasks[0],
+        )
+        processing_queue_length = worker.broker.connector.connections[0].zcard(
+            name='some_worker.processing',
+        )
+        self.assertEqual(
+            first=processing_queue_length,
+            second=2,
+        )
+
+        worker.acknowledge_task(
+            task=tasks[1],
+        )
+        processing_queue_length = worker.broker.connector.connections[0].zcard(
+            name='some_worker.processing',
+        )
+        self.assertEqual(
+            first=processing_queue_length,
+            second=0,
+        )
+        self.assertIsNone(
+            obj=tasks[0].pop_leased_item(),
+        )
+        self.assertIsNone(
+            obj=tasks[1].pop_leased_item(),
+        )
+
+        worker.purge_tasks()
+
+    def test_async_worker(
+        self,
+    ):
+        class AsyncWorker(
+            sergeant.worker.AsyncWorker,
+        ):
+            async def work(
+                self,
+                task,
+            ):
+                await asyncio.sleep(0.1)
+
+                if task.kwargs['task'] < 10:
+                    await self.async_push_task(
+                        kwargs={
+                            'task': task.kwargs['task'] + 10,
+                        },
+                        task_name='other_worker',
+                    )
+                else:
+                    self.retry(
+                        task=task,
+                    )
+
+        worker = AsyncWorker()
+        worker.config = sergeant.config.WorkerConfig(
+            name='some_async_worker',
+            connector=sergeant.config.Connector(
+                type='redis',
+                params={
+                    'nodes': [
+                        {
+                            'host': 'localhost',
+                            'port': 6379,
+                            'password': None,
+                            'database': 0,
+                        },
+                    ],
+                },
+            ),
+            max_tasks_per_run=20,
+            tasks_per_transaction=20,
+            number_of_concurrent_tasks=20,
+            max_retries=1,
+        )
+        worker.init_broker()
+        worker.init_executor()
+        self.assertIsInstance(
+            obj=worker.async_broker,
+            cls=sergeant.broker.AsyncBroker,
+        )
+        self.assertIsInstance(
+            obj=worker.executor_obj,
+            cls=sergeant.executor.asynchronous.AsyncioExecutor,
+        )
+
+        worker.purge_tasks()
+        worker.purge_tasks(
+            task_name='other_worker',
+        )
+        worker.push_tasks(
+            kwargs_list=[
+                {
+                    'task': i,
+                }
+                for i in range(10)
+            ],
+        )
+        worker.push_tasks(
+            kwargs_list=[
+                {
+                    'task': i,
+                }
+                for i in range(10, 20)
+            ],
+        )
+
+        start_time = time.time()
+        summary = worker.work_loop()
+        self.assertLess(
+            a=time.time() - start_time,
+            b=1.0,
+        )
+        self.assertIsNone(
+            obj=summary['executor_exception'],
+        )
+        self.assertEqual(
+            first=worker.number_of_enqueued_tasks(
+                task_name='other_worker',
+            ),
+            second=10,
+        )
+        self.assertEqual(
+            first=worker.number_of_enqueued_tasks(),
+            second=10,
+        )
+        self.assertEqual(
+            first=sorted(
+                task.run_count
+                for task in worker.get_next_tasks(
+                    number_of_tasks=10,
+                )
+            ),
+            second=[1] * 10,
+        )
+
+        self.assertEqual(
+            first=asyncio.run(
+                worker.async_number_of_enqueued_tasks(
+                    task_name='other_worker',
+                ),
+            ),
+            second=10,
+        )
+        worker.purge_tasks(
+            task_name='other_worker',
+        )
+
+    def test_async_worker_stop_signal(
+        self,
+    ):
+        class AsyncWorker(
+            sergeant.worker.AsyncWorker,
+        ):
+            async def work(
+                self,
+                task,
+            ):
+                if task.kwargs['task'] == 0:
+                    asyncio.get_event_loop().call_later(
+                        0.5,
+                        os.kill,
+                        os.getpid(),
+                        signal.SIGTERM,
+                    )
+                elif task.kwargs['task'] < 5:
+                    self.retry(
+                        task=task,
+                    )
+
+                await asyncio.sleep(10)
+
+        self.addCleanup(
+            signal.signal,
+            signal.SIGTERM,
+            signal.getsignal(signal.SIGTERM),
+        )
+
+        worker = AsyncWorker()
+        worker.config = sergeant.config.WorkerConfig(
+            name='some_async_worker',
+            connector=sergeant.config.Connector(
+                type='redis',
+                params={
+                    'nodes': [
+                        {
+                            'host': 'localhost',
+                            'port': 6379,
+                            'password': None,
+                            'database': 0,
+                        },
+                    ],
+                    'visibility_timeout': 60.0,
+                },
+            ),
+            tasks_per_transaction=20,
+            number_of_concurrent_tasks=10,
+        )
+        worker.init_broker()
+        worker.init_executor()
+
+        worker.purge_tasks()
+        worker.push_tasks(
+            kwargs_list=[
+                {
+                    'task': i,
+                }
+                for i in range(20)
+            ],
+        )
+
+        start_time = time.time()
+        summary = worker.work_loop()
+        self.assertLess(
+            a=time.time() - start_time,
+            b=2.0,
+        )
+        self.assertTrue(
+            expr=summary['stop'],
+        )
+        self.assertTrue(
+            expr=worker.received_stop_signal,
+        )
+        self.assertEqual(
+            first=worker.number_of_enqueued_tasks(),
+            second=20,
+        )
+        self.assertEqual(
+            first=worker.broker.connector.connections[0].zcard(
+                name='some_async_worker.processing',
+            ),
+            second=0,
+        )
+        self.assertEqual(
+            first=sorted(
+                (
+                    task.kwargs['task'],
+                    task.run_count,
+                )
+                for task in worker.get_next_tasks(
+                    number_of_tasks=20,
+                )
+            ),
+            second=[
+                (
+                    i,
+                    1 if 0 < i < 5 else 0,
+                )
+                for i in range(20)
+            ],
+        )
+
+        worker.purge_tasks()
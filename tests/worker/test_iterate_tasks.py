@@ -1,3 +1,4 @@
+import time
 import unittest
 import unittest.mock
 
@@ -255,3 +256,125 @@ class WorkerIterateTasksTestCase(
                 first=self.worker.get_next_tasks.call_count,
                 second=10,
             )
+
+    def test_iterate_tasks_blocking_pop(
+        self,
+    ):
+        self.worker.get_next_tasks = unittest.mock.MagicMock()
+        self.worker.get_next_tasks.side_effect = [
+            [],
+            [],
+            [
+                self.task_one,
+            ],
+        ]
+        self.worker.config = self.worker.config.replace(
+            max_tasks_per_run=1,
+            tasks_per_transaction=1,
+            blocking_pop=True,
+        )
+
+        with unittest.mock.patch(
+            target='time.sleep',
+        ) as sleep_mock:
+            self.assertEqual(
+                first=list(self.worker.iterate_tasks()),
+                second=[
+                    self.task_one,
+                ],
+            )
+            sleep_mock.assert_not_called()
+
+        self.assertEqual(
+            first=self.worker.get_next_tasks.call_count,
+            second=3,
+        )
+        for get_next_task_call in self.worker.get_next_tasks.call_args_list:
+            self.assertEqual(
+                first=get_next_task_call[1]['timeout'],
+                second=1.0,
+            )
+
+    def test_iterate_tasks_prefetch(
+        self,
+    ):
+        self.worker.get_next_tasks = unittest.mock.MagicMock()
+        self.worker.get_next_tasks.side_effect = [
+            [
+                self.task_one,
+            ],
+            [
+                self.task_two,
+            ],
+            [
+                self.task_three,
+            ],
+        ]
+        self.worker.config = self.worker.config.replace(
+            max_tasks_per_run=3,
+            tasks_per_transaction=1,
+            prefetch_depth=2,
+        )
+        self.assertEqual(
+            first=list(self.worker.iterate_tasks()),
+            second=[
+                self.task_one,
+                self.task_two,
+                self.task_three,
+            ],
+        )
+        self.assertEqual(
+            first=self.worker.get_next_tasks.call_count,
+            second=3,
+        )
+        self.worker.broker.push_tasks.assert_not_called()
+
+    def test_iterate_tasks_prefetch_requeue_on_close(
+        self,
+    ):
+        self.worker.get_next_tasks = unittest.mock.MagicMock()
+        self.worker.get_next_tasks.side_effect = [
+            [
+                self.task_one,
+            ],
+            [
+                self.task_two,
+            ],
+            [
+                self.task_three,
+            ],
+        ] + [
+            [],
+        ] * 10
+        self.worker.config = self.worker.config.replace(
+            max_tasks_per_run=0,
+            tasks_per_transaction=1,
+            prefetch_depth=2,
+        )
+
+        iterator = self.worker.iterate_tasks()
+        first_task = next(iterator)
+        self.assertEqual(
+            first=first_task,
+            second=self.task_one,
+        )
+
+        time.sleep(0.2)
+        iterator.close()
+
+        self.worker.broker.push_tasks.assert_called_once()
+        push_tasks_call = self.worker.broker.push_tasks.call_args
+        self.assertEqual(
+            first=[
+                task.kwargs
+                for task in push_tasks_call[1]['tasks']
+            ],
+            second=[
+                self.task_two.kwargs,
+                self.task_three.kwargs,
+            ],
+        )
+        self.assertEqual(
+            first=push_tasks_call[1]['priority'],
+            second='HIGH',
+        )
@@ -0,0 +1,133 @@
+import tempfile
+import unittest
+import unittest.mock
+
+import sergeant.config
+import sergeant.worker
+
+
+class MetricsWorker(
+    sergeant.worker.Worker,
+):
+    def generate_config(
+        self,
+    ) -> sergeant.config.WorkerConfig:
+        return sergeant.config.WorkerConfig(
+            name='metrics_worker',
+            connector=sergeant.config.Connector(
+                type='local',
+                params={
+                    'file_path': f'{tempfile.gettempdir()}/sergeant_metrics_test.sqlite3',
+                },
+            ),
+            max_tasks_per_run=4,
+            metrics=sergeant.config.Metrics(
+                sinks=[
+                    unittest.mock.MagicMock(),
+                ],
+            ),
+        )
+
+    def work(
+        self,
+        task,
+    ):
+        if task.kwargs['outcome'] == 'failure':
+            raise Exception('failed')
+        elif task.kwargs['outcome'] == 'retry':
+            self.retry(
+                task=task,
+            )
+
+
+class WorkerMetricsTestCase(
+    unittest.TestCase,
+):
+    def test_work_loop_metrics(
+        self,
+    ):
+        worker = MetricsWorker()
+        worker.init_broker()
+        worker.init_executor()
+        worker.purge_tasks()
+        worker.push_tasks(
+            kwargs_list=[
+                {
+                    'outcome': 'success',
+                },
+                {
+                    'outcome': 'success',
+                },
+                {
+                    'outcome': 'failure',
+                },
+                {
+                    'outcome': 'retry',
+                },
+            ],
+        )
+
+        summary = worker.work_loop()
+        worker.purge_tasks()
+
+        self.assertEqual(
+            first=summary['metrics']['counters'],
+            second={
+                'success': 2,
+                'failure': 1,
+                'timeout': 0,
+                'retry': 1,
+                'max_retries': 0,
+                'requeue': 0,
+                'stop': 0,
+                'respawn': 0,
+            },
+        )
+        for histogram_name in [
+            'queue_wait_time',
+            'decode_time',
+            'work_time',
+            'handler_time',
+        ]:
+            self.assertEqual(
+                first=summary['metrics']['histograms'][histogram_name]['count'],
+                second=4,
+            )
+
+        self.assertEqual(
+            first=worker.metrics.task_start_times,
+            second={},
+        )
+        worker.config.metrics.sinks[0].export.assert_called_once_with(
+            metrics=summary['metrics'],
+        )
+
+    def test_disabled_metrics(
+        self,
+    ):
+        worker = MetricsWorker()
+        worker.config = worker.config.replace(
+            metrics=sergeant.config.Metrics(
+                enabled=False,
+            ),
+        )
+        worker.metrics.enabled = False
+        worker.init_broker()
+        worker.init_executor()
+        worker.purge_tasks()
+        worker.push_task(
+            kwargs={
+                'outcome': 'success',
+            },
+        )
+        worker.config = worker.config.replace(
+            max_tasks_per_run=1,
+        )
+
+        summary = worker.work_loop()
+        worker.purge_tasks()
+
+        self.assertNotIn(
+            member='metrics',
+            container=summary,
+        )